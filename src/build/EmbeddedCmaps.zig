@@ -0,0 +1,70 @@
+//! EmbeddedCmaps generates the cmap snapshots of the embedded fonts
+//! (see src/font/embedded_cmaps.zig) from the fonts that are actually
+//! embedded, so they can't get out of date.
+const EmbeddedCmaps = @This();
+
+const std = @import("std");
+
+/// The "cmapgen" exe.
+exe: *std.Build.Step.Compile,
+
+/// The output path for the cmap snapshots. This is null until
+/// the font dependencies have been fetched.
+output: ?std.Build.LazyPath,
+
+pub fn init(b: *std.Build) !EmbeddedCmaps {
+    const exe = b.addExecutable(.{
+        .name = "cmapgen",
+        .root_module = b.createModule(.{
+            .root_source_file = b.path("src/cmapgen.zig"),
+            .target = b.graph.host,
+            .strip = false,
+            .omit_frame_pointer = false,
+            .unwind_tables = .sync,
+        }),
+    });
+
+    const output: ?std.Build.LazyPath = output: {
+        const jb_mono_dep = b.lazyDependency("jetbrains_mono", .{});
+        const nf_symbols_dep = b.lazyDependency("nerd_fonts_symbols_only", .{});
+        const jb_mono = jb_mono_dep orelse break :output null;
+        const nf_symbols = nf_symbols_dep orelse break :output null;
+
+        // The names match the declarations in src/font/embedded.zig.
+        const run = b.addRunArtifact(exe);
+        run.addPrefixedFileArg(
+            "variable=",
+            jb_mono.path("fonts/variable/JetBrainsMono[wght].ttf"),
+        );
+        run.addPrefixedFileArg(
+            "variable_italic=",
+            jb_mono.path("fonts/variable/JetBrainsMono-Italic[wght].ttf"),
+        );
+        run.addPrefixedFileArg(
+            "symbols_nerd_font=",
+            nf_symbols.path("SymbolsNerdFont-Regular.ttf"),
+        );
+        run.addPrefixedFileArg(
+            "emoji_text=",
+            b.path("src/font/res/NotoEmoji-Regular.ttf"),
+        );
+
+        // Generated Zig files have to end with .zig
+        const wf = b.addWriteFiles();
+        break :output wf.addCopyFile(run.captureStdOut(), "cmaps.zig");
+    };
+
+    return .{
+        .exe = exe,
+        .output = output,
+    };
+}
+
+/// Add the "cmap_tables" import.
+pub fn addImport(self: *const EmbeddedCmaps, step: *std.Build.Step.Compile) void {
+    const output = self.output orelse return;
+    output.addStepDependencies(&step.step);
+    step.root_module.addAnonymousImport("cmap_tables", .{
+        .root_source_file = output,
+    });
+}
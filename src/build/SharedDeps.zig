@@ -7,6 +7,7 @@ const Config = @import("Config.zig");
 const HelpStrings = @import("HelpStrings.zig");
 const MetallibStep = @import("MetallibStep.zig");
 const UnicodeTables = @import("UnicodeTables.zig");
+const EmbeddedCmaps = @import("EmbeddedCmaps.zig");
 const GhosttyFrameData = @import("GhosttyFrameData.zig");
 const DistResource = @import("GhosttyDist.zig").Resource;
 
@@ -16,6 +17,7 @@ options: *std.Build.Step.Options,
 help_strings: HelpStrings,
 metallib: ?*MetallibStep,
 unicode_tables: UnicodeTables,
+embedded_cmaps: EmbeddedCmaps,
 framedata: GhosttyFrameData,
 uucode_tables: std.Build.LazyPath,
 
@@ -35,6 +37,7 @@ pub fn init(b: *std.Build, cfg: *const Config) !SharedDeps {
         .config = cfg,
         .help_strings = try .init(b, cfg),
         .unicode_tables = try .init(b, uucode_tables),
+        .embedded_cmaps = try .init(b),
         .framedata = try .init(b),
         .uucode_tables = uucode_tables,
 
@@ -547,6 +550,7 @@ pub fn add(
 
     self.help_strings.addImport(step);
     self.unicode_tables.addImport(step);
+    self.embedded_cmaps.addImport(step);
     self.framedata.addImport(step);
 
     return static_libs;
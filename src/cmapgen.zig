@@ -0,0 +1,54 @@
+//! This program is used to generate the cmap snapshots of the fonts that
+//! Ghostty embeds, see font/embedded_cmaps.zig. The faces are given as
+//! NAME=PATH arguments and the snapshots are written to stdout as a Zig
+//! file with one array of runs per face.
+
+const std = @import("std");
+const sfnt = @import("font/opentype/sfnt.zig");
+const Cmap = @import("font/opentype/cmap.zig").Cmap;
+const Snapshot = @import("font/embedded_cmaps.zig").Snapshot;
+
+pub fn main() !void {
+    var arena_state = std.heap.ArenaAllocator.init(std.heap.page_allocator);
+    defer arena_state.deinit();
+    const alloc = arena_state.allocator();
+
+    var buf: [4096]u8 = undefined;
+    var stdout = std.fs.File.stdout().writer(&buf);
+    const writer = &stdout.interface;
+    try writer.writeAll(
+        \\//! This file is auto-generated. Do not edit.
+        \\
+        \\pub fn Snapshots(comptime Run: type) type {
+        \\    return struct {
+        \\
+    );
+
+    const args = try std.process.argsAlloc(alloc);
+    for (args[1..]) |arg| {
+        const sep = std.mem.indexOfScalar(u8, arg, '=') orelse
+            return error.InvalidArgument;
+        const name = arg[0..sep];
+        const path = arg[sep + 1 ..];
+
+        const data = try std.fs.cwd().readFileAlloc(alloc, path, 64 * 1024 * 1024);
+        const font = try sfnt.SFNT.init(data, alloc);
+        const cmap = try Cmap.init(font.getTable("cmap") orelse
+            return error.MissingCmapTable);
+        const snapshot = try Snapshot.init(alloc, cmap);
+
+        try writer.print("pub const {s}: [{}]Run = .{{", .{ name, snapshot.runs.len });
+        try snapshot.writeZig(writer);
+        try writer.writeAll("};\n");
+    }
+
+    try writer.writeAll(
+        \\    };
+        \\}
+        \\
+    );
+    // Use flush instead of end because stdout is a pipe when captured by
+    // the build system, and pipes cannot be truncated (Windows returns
+    // INVALID_PARAMETER, Linux returns EINVAL).
+    try writer.flush();
+}
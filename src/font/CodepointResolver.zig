@@ -28,6 +28,8 @@ const RenderOptions = font.face.RenderOptions;
 const SpriteFace = font.SpriteFace;
 const Style = font.Style;
 
+const nerd_font_codepoints = @import("nerd_font_codepoints.zig");
+
 const log = std.log.scoped(.font_codepoint_resolver);
 
 /// The underlying collection of fonts. This will be modified as
@@ -58,6 +60,12 @@ descriptor_cache: DescriptorCache = .{},
 /// terminal rendering will look wrong.
 sprite: ?SpriteFace = null,
 
+/// The index of the embedded Symbols Nerd Font face in the collection, if
+/// it was added. Private use codepoints that it has a glyph for, and that
+/// no explicitly configured face has, go straight to this face instead of
+/// probing the other fallback faces.
+nerd_font: ?Collection.Index = null,
+
 pub fn deinit(self: *CodepointResolver, alloc: Allocator) void {
     self.collection.deinit(alloc);
     self.descriptor_cache.deinit(alloc);
@@ -98,22 +106,27 @@ pub fn deinit(self: *CodepointResolver, alloc: Allocator) void {
 ///   3. If this is a sprite codepoint (such as an underline), then the
 ///      sprite font always is the result.
 ///
-///   4. If the exact style and presentation request can be satisfied by
+///   4. If the style is regular, this is a private use codepoint that the
+///      embedded Symbols Nerd Font has a glyph for, and none of the explicitly
+///      configured (non-fallback) faces have it, then the Nerd Font face is
+///      the result.
+///
+///   5. If the exact style and presentation request can be satisfied by
 ///      one of our loaded fonts, we return that value. We search loaded
 ///      fonts in the order they're added to the group, so the caller must
 ///      set the priority order.
 ///
-///   5. If the style isn't regular, we restart this process at this point
+///   6. If the style isn't regular, we restart this process at this point
 ///      but with the regular style. This lets us fall back to regular with
 ///      our loaded fonts before trying a fallback. We'd rather show a regular
 ///      version of a codepoint from a loaded font than find a new font in
 ///      the correct style because styles in other fonts often change
 ///      metrics like glyph widths.
 ///
-///   6. If the style is regular, and font discovery is enabled, we look
+///   7. If the style is regular, and font discovery is enabled, we look
 ///      for a fallback font to satisfy our request.
 ///
-///   7. Finally, as a last resort, we fall back to restarting this whole
+///   8. Finally, as a last resort, we fall back to restarting this whole
 ///      process with a regular font face satisfying ANY presentation for
 ///      the codepoint. If this fails, we return null.
 ///
@@ -156,6 +169,16 @@ pub fn getIndex(
             .text,
     };
 
+    // Nerd Font icons are common in prompts, and mostly live in private
+    // use areas that few other fonts cover, so if no explicitly configured
+    // face has one we go straight to the embedded Nerd Font face.
+    if (self.nerd_font) |nf_idx| nerd_font: {
+        if (style != .regular or !isPrivateUse(cp)) break :nerd_font;
+        if (!nerd_font_codepoints.hasCodepoint(@intCast(cp))) break :nerd_font;
+        if (self.collection.getIndexExplicit(cp, style, p_mode)) |value| return value;
+        if (self.collection.hasCodepoint(nf_idx, cp, p_mode)) return nf_idx;
+    }
+
     // If we can find the exact value, then return that.
     if (self.collection.getIndex(cp, style, p_mode)) |value| return value;
 
@@ -227,6 +250,17 @@ pub fn getIndex(
     return self.collection.getIndex(cp, .regular, .{ .any = {} });
 }
 
+/// Returns true if the codepoint is in one of the private use areas.
+fn isPrivateUse(cp: u32) bool {
+    return switch (cp) {
+        0xE000...0xF8FF,
+        0xF0000...0xFFFFD,
+        0x100000...0x10FFFD,
+        => true,
+        else => false,
+    };
+}
+
 /// Checks if the codepoint is in the map of codepoint overrides,
 /// finds the override font, and returns it.
 fn getIndexCodepointOverride(
@@ -532,6 +566,62 @@ test "getIndex disabled font style" {
     }
 }
 
+test "getIndex Nerd Font codepoint" {
+    const testing = std.testing;
+    const alloc = testing.allocator;
+
+    var lib = try Library.init(alloc);
+    defer lib.deinit();
+
+    var c = Collection.init();
+    c.load_options = .{ .library = lib };
+
+    {
+        errdefer c.deinit(alloc);
+        inline for (.{
+            .{ font.embedded.regular, false },
+            .{ font.embedded.test_nerd_font, true },
+            .{ font.embedded.symbols_nerd_font, true },
+        }) |entry| {
+            _ = try c.add(alloc, try .init(
+                lib,
+                entry[0],
+                .{ .size = .{ .points = 12, .xdpi = 96, .ydpi = 96 } },
+            ), .{
+                .style = .regular,
+                .fallback = entry[1],
+                .size_adjustment = .none,
+            });
+        }
+    }
+
+    var r: CodepointResolver = .{ .collection = c };
+    defer r.deinit(alloc);
+
+    // Without the Nerd Font index we find the first fallback with the glyph.
+    {
+        const idx = r.getIndex(alloc, 0xE700, .regular, null).?;
+        try testing.expectEqual(Style.regular, idx.style);
+        try testing.expectEqual(@as(Collection.Index.IndexInt, 1), idx.idx);
+    }
+
+    r.nerd_font = .{ .style = .regular, .idx = 2 };
+
+    // With it, Nerd Font codepoints go straight to the Nerd Font face.
+    {
+        const idx = r.getIndex(alloc, 0xE700, .regular, null).?;
+        try testing.expectEqual(Style.regular, idx.style);
+        try testing.expectEqual(@as(Collection.Index.IndexInt, 2), idx.idx);
+    }
+
+    // Other codepoints are unaffected.
+    {
+        const idx = r.getIndex(alloc, 'A', .regular, null).?;
+        try testing.expectEqual(Style.regular, idx.style);
+        try testing.expectEqual(@as(Collection.Index.IndexInt, 0), idx.idx);
+    }
+}
+
 test "getIndex box glyph" {
     const testing = std.testing;
     const alloc = testing.allocator;
@@ -28,6 +28,7 @@ const Library = font.Library;
 const Metrics = font.Metrics;
 const Presentation = font.Presentation;
 const Style = font.Style;
+const CmapSnapshot = font.embedded_cmaps.Snapshot;
 
 const log = std.log.scoped(.font_collection);
 
@@ -88,6 +89,9 @@ pub const AddOptions = struct {
     size_adjustment: SizeAdjustment,
     /// Whether this is a fallback face.
     fallback: bool,
+    /// The cmap snapshot of the face, if it is one of the embedded
+    /// fonts listed in embedded_cmaps.zig.
+    cmap: ?*const CmapSnapshot = null,
 };
 
 pub const AddError =
@@ -143,6 +147,7 @@ pub fn add(
             .face = .{ .loaded = owned_face },
             .fallback = opts.fallback,
             .scale_factor = .{ .scale = scale_factor },
+            .cmap = opts.cmap,
         },
     });
 
@@ -181,6 +186,7 @@ pub fn addDeferred(
             .face = .{ .deferred = face },
             .fallback = opts.fallback,
             .scale_factor = .{ .adjustment = opts.size_adjustment },
+            .cmap = opts.cmap,
         },
     });
 
@@ -292,6 +298,31 @@ pub fn getIndex(
     return null;
 }
 
+/// Like getIndex, but only considers explicit (non-fallback) faces.
+pub fn getIndexExplicit(
+    self: *const Collection,
+    cp: u32,
+    style: Style,
+    p_mode: PresentationMode,
+) ?Index {
+    var i: usize = 0;
+    var it = self.faces.get(style).constIterator(0);
+    while (it.next()) |entry_or_alias| {
+        const entry = entry_or_alias.getConstEntry();
+        if (!entry.fallback and entry.hasCodepoint(cp, p_mode)) {
+            return .{
+                .style = style,
+                .idx = @intCast(i),
+            };
+        }
+
+        i += 1;
+    }
+
+    // Not found
+    return null;
+}
+
 /// Check if a specific font index has a specific codepoint. This does not
 /// necessarily force the font to load. The presentation value "p" will
 /// verify the Emoji representation matches if it is non-null. If "p" is
@@ -776,6 +807,10 @@ pub const Entry = struct {
         scale: f64,
     } = .{ .scale = 1.0 },
 
+    /// The snapshot of the cmap of this face, which is consulted
+    /// instead of the cmap of the face itself.
+    cmap: ?*const CmapSnapshot = null,
+
     pub fn deinit(self: *Entry) void {
         switch (self.face) {
             inline .deferred, .loaded => |*v| v.deinit(),
@@ -805,6 +840,12 @@ pub const Entry = struct {
         cp: u32,
         p_mode: PresentationMode,
     ) bool {
+        // If the snapshot knows the face has no glyph
+        // we don't need to ask the face at all.
+        if (self.cmap) |cmap| {
+            if (cmap.glyphIndex(cp) == null) return false;
+        }
+
         return mode: switch (p_mode) {
             .default => |p| if (self.fallback)
                 // Fallback fonts require explicit presentation matching.
@@ -817,7 +858,7 @@ pub const Entry = struct {
                 .deferred => |v| v.hasCodepoint(cp, p),
 
                 .loaded => |face| explicit: {
-                    const index = face.glyphIndex(cp) orelse break :explicit false;
+                    const index = self.glyphIndex(face, cp) orelse break :explicit false;
                     break :explicit switch (p) {
                         .text => !face.isColorGlyph(index),
                         .emoji => face.isColorGlyph(index),
@@ -828,10 +869,17 @@ pub const Entry = struct {
             .any => switch (self.face) {
                 .deferred => |v| v.hasCodepoint(cp, null),
 
-                .loaded => |face| face.glyphIndex(cp) != null,
+                .loaded => |face| self.glyphIndex(face, cp) != null,
             },
         };
     }
+
+    /// Get the glyph index of the given codepoint in the loaded face,
+    /// from the cmap snapshot if there is one.
+    fn glyphIndex(self: Entry, face: Face, cp: u32) ?u32 {
+        if (self.cmap) |cmap| return cmap.glyphIndex(cp);
+        return face.glyphIndex(cp);
+    }
 };
 
 pub const EntryOrAlias = union(enum) {
@@ -1185,6 +1233,46 @@ test "hasCodepoint emoji default graphical" {
     // TODO(fontmem): test explicit/implicit
 }
 
+test "hasCodepoint cmap snapshot" {
+    const testing = std.testing;
+    const alloc = testing.allocator;
+    const testFont = font.embedded.symbols_nerd_font;
+
+    var lib = try Library.init(alloc);
+    defer lib.deinit();
+
+    var c = init();
+    defer c.deinit(alloc);
+    c.load_options = .{ .library = lib };
+
+    const face_opts: font.face.Options = .{
+        .size = .{ .points = 12, .xdpi = 96, .ydpi = 96 },
+    };
+    const idx = try c.add(alloc, try .init(lib, testFont, face_opts), .{
+        .style = .regular,
+        .fallback = false,
+        .size_adjustment = .none,
+    });
+    const snapshot_idx = try c.add(alloc, try .init(lib, testFont, face_opts), .{
+        .style = .regular,
+        .fallback = false,
+        .size_adjustment = .none,
+        .cmap = &font.embedded_cmaps.symbols_nerd_font,
+    });
+
+    // The snapshot agrees with the face, for codepoints
+    // it has a glyph for and for codepoints it doesn't.
+    const face = try c.getFace(idx);
+    const entry = try c.getEntry(snapshot_idx);
+    for ([_]u32{ 'A', 0xA0, 0xFF, 0x2500, 0x257F, 0xE0B0, 0xF0001, 0x3042, 0x1F978 }) |cp| {
+        try testing.expectEqual(face.glyphIndex(cp), entry.glyphIndex(face.*, cp));
+        try testing.expectEqual(
+            c.hasCodepoint(idx, cp, .{ .any = {} }),
+            c.hasCodepoint(snapshot_idx, cp, .{ .any = {} }),
+        );
+    }
+}
+
 test "metrics" {
     const testing = std.testing;
     const alloc = testing.allocator;
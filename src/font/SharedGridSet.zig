@@ -130,7 +130,7 @@ pub fn ref(
         // Build our collection. This is the expensive operation that
         // involves finding fonts, loading them (maybe, some are deferred),
         // etc.
-        var c = try self.collection(&key, font_size, config);
+        var c, const nerd_font = try self.collection(&key, font_size, config);
         errdefer c.deinit(self.alloc);
 
         // Setup our enabled/disabled styles
@@ -145,6 +145,7 @@ pub fn ref(
             .styles = styles,
             .discover = try self.discover(),
             .codepoint_map = key.codepoint_map,
+            .nerd_font = nerd_font,
         };
     });
     errdefer grid.deinit(self.alloc);
@@ -153,13 +154,14 @@ pub fn ref(
 }
 
 /// Builds the Collection for the given configuration key and
-/// initial font size.
+/// initial font size. Also returns the index of the embedded
+/// Symbols Nerd Font face in the collection.
 fn collection(
     self: *SharedGridSet,
     key: *const Key,
     size: DesiredSize,
     config: *const DerivedConfig,
-) !Collection {
+) !struct { Collection, Collection.Index } {
     // A quick note on memory management:
     // - font_lib is owned by the SharedGridSet
     // - metric_modifiers is owned by the key which is freed only when
@@ -268,6 +270,7 @@ fn collection(
             .style = .regular,
             .fallback = true,
             .size_adjustment = font.default_fallback_adjustment,
+            .cmap = &font.embedded_cmaps.variable,
         },
     );
     try (try c.getFace(try c.add(
@@ -281,6 +284,7 @@ fn collection(
             .style = .bold,
             .fallback = true,
             .size_adjustment = font.default_fallback_adjustment,
+            .cmap = &font.embedded_cmaps.variable,
         },
     ))).setVariations(
         &.{.{ .id = .init("wght"), .value = 700 }},
@@ -297,6 +301,7 @@ fn collection(
             .style = .italic,
             .fallback = true,
             .size_adjustment = font.default_fallback_adjustment,
+            .cmap = &font.embedded_cmaps.variable_italic,
         },
     );
     try (try c.getFace(try c.add(
@@ -310,6 +315,7 @@ fn collection(
             .style = .bold_italic,
             .fallback = true,
             .size_adjustment = font.default_fallback_adjustment,
+            .cmap = &font.embedded_cmaps.variable_italic,
         },
     ))).setVariations(
         &.{.{ .id = .init("wght"), .value = 700 }},
@@ -317,7 +323,7 @@ fn collection(
     );
 
     // Nerd-font symbols fallback.
-    _ = try c.add(
+    const nerd_font = try c.add(
         self.alloc,
         try .init(
             self.font_lib,
@@ -329,6 +335,7 @@ fn collection(
             .fallback = true,
             // No size adjustment for the symbols font.
             .size_adjustment = .none,
+            .cmap = &font.embedded_cmaps.symbols_nerd_font,
         },
     );
 
@@ -382,11 +389,12 @@ fn collection(
                 .fallback = true,
                 // No size adjustment for emojis.
                 .size_adjustment = .none,
+                .cmap = &font.embedded_cmaps.emoji_text,
             },
         );
     }
 
-    return c;
+    return .{ c, nerd_font };
 }
 
 /// Decrement the ref count for the given key. If the ref count is zero,
@@ -0,0 +1,208 @@
+//! SymbolConstraints reads the glyph constraints of a symbol font that were
+//! precomputed by symbol_font_analyzer.py, so that symbol fonts other than the
+//! embedded Symbols Nerd Font can be scaled and aligned the same way. The data
+//! is validated once in `init` and used in place afterwards, so it can come
+//! straight from a memory map. See symbol_font_analyzer.py for the format.
+//!
+//! Nothing loads these files at runtime yet. Applying them to the faces
+//! loaded for `font-codepoint-map` is left for a follow-up.
+const SymbolConstraints = @This();
+
+const std = @import("std");
+const Constraint = @import("face.zig").RenderOptions.Constraint;
+
+pub const magic = "GSFC";
+pub const version = 1;
+
+const header_size = 48;
+const range_size = 12;
+const constraint_size = 80;
+
+pub const Error = error{
+    /// The data doesn't start with a symbol constraints header.
+    InvalidHeader,
+    /// The data was written by an incompatible version of the analyzer.
+    UnsupportedVersion,
+    /// The data is truncated or has trailing bytes.
+    InvalidSize,
+    /// The codepoint ranges aren't sorted, or refer to missing constraints.
+    InvalidRange,
+    /// A constraint has an out of range field.
+    InvalidConstraint,
+};
+
+/// The sorted, non-overlapping (start, end, constraint index) ranges.
+ranges: []const u8,
+
+/// The deduplicated constraints, as fixed-size records.
+constraints: []const u8,
+
+/// The SHA-256 digest of the analyzed font file.
+digest: *const [32]u8,
+
+/// Validate `data` and wrap it. The data must outlive the result.
+pub fn init(data: []const u8) Error!SymbolConstraints {
+    if (data.len < header_size or !std.mem.eql(u8, data[0..4], magic)) {
+        return error.InvalidHeader;
+    }
+    if (std.mem.readInt(u32, data[4..8], .little) != version) {
+        return error.UnsupportedVersion;
+    }
+
+    const range_count = std.mem.readInt(u32, data[8..12], .little);
+    const constraint_count = std.mem.readInt(u32, data[12..16], .little);
+    const ranges_end = std.math.add(
+        usize,
+        header_size,
+        std.math.mul(usize, range_count, range_size) catch return error.InvalidSize,
+    ) catch return error.InvalidSize;
+    const constraints_offset = std.mem.alignForward(usize, ranges_end, 8);
+    const constraints_size = std.math.mul(
+        usize,
+        constraint_count,
+        constraint_size,
+    ) catch return error.InvalidSize;
+    if (data.len < constraints_offset or
+        data.len - constraints_offset != constraints_size)
+    {
+        return error.InvalidSize;
+    }
+
+    const self: SymbolConstraints = .{
+        .ranges = data[header_size..ranges_end],
+        .constraints = data[constraints_offset..],
+        .digest = data[16..48],
+    };
+
+    var next: u32 = 0;
+    for (0..range_count) |i| {
+        const range = self.ranges[i * range_size ..][0..range_size];
+        const start = std.mem.readInt(u32, range[0..4], .little);
+        const end = std.mem.readInt(u32, range[4..8], .little);
+        const index = std.mem.readInt(u32, range[8..12], .little);
+        if (start < next or
+            start > end or
+            end > std.math.maxInt(u21) or
+            index >= constraint_count)
+        {
+            return error.InvalidRange;
+        }
+        next = end + 1;
+    }
+
+    for (0..constraint_count) |i| {
+        const c = self.constraints[i * constraint_size ..][0..constraint_size];
+        if (c[0] >= enumLen(Constraint.Size) or
+            c[1] >= enumLen(Constraint.Align) or
+            c[2] >= enumLen(Constraint.Align) or
+            c[3] >= enumLen(Constraint.Height) or
+            c[4] > std.math.maxInt(u2) or
+            c[5] > 1)
+        {
+            return error.InvalidConstraint;
+        }
+    }
+
+    return self;
+}
+
+/// The SHA-256 digest of the font file the constraints were computed for,
+/// to check that they belong to the font that is actually loaded.
+pub fn fontDigest(self: SymbolConstraints) *const [32]u8 {
+    return self.digest;
+}
+
+/// Get the constraint of the provided codepoint, if it has one.
+pub fn get(self: SymbolConstraints, cp: u21) ?Constraint {
+    var lo: usize = 0;
+    var hi: usize = self.ranges.len / range_size;
+    while (lo < hi) {
+        const mid = lo + (hi - lo) / 2;
+        const range = self.ranges[mid * range_size ..][0..range_size];
+        if (cp < std.mem.readInt(u32, range[0..4], .little)) {
+            hi = mid;
+        } else if (cp > std.mem.readInt(u32, range[4..8], .little)) {
+            lo = mid + 1;
+        } else {
+            return self.decodeConstraint(std.mem.readInt(u32, range[8..12], .little));
+        }
+    }
+    return null;
+}
+
+fn decodeConstraint(self: SymbolConstraints, index: usize) Constraint {
+    const c = self.constraints[index * constraint_size ..][0..constraint_size];
+    return .{
+        .size = @enumFromInt(c[0]),
+        .align_vertical = @enumFromInt(c[1]),
+        .align_horizontal = @enumFromInt(c[2]),
+        .height = @enumFromInt(c[3]),
+        .max_constraint_width = @intCast(c[4]),
+        .pad_top = readFloat(c[8..16]),
+        .pad_left = readFloat(c[16..24]),
+        .pad_right = readFloat(c[24..32]),
+        .pad_bottom = readFloat(c[32..40]),
+        .relative_width = readFloat(c[40..48]),
+        .relative_height = readFloat(c[48..56]),
+        .relative_x = readFloat(c[56..64]),
+        .relative_y = readFloat(c[64..72]),
+        .max_xy_ratio = if (c[5] != 0) readFloat(c[72..80]) else null,
+    };
+}
+
+fn readFloat(bytes: *const [8]u8) f64 {
+    return @bitCast(std.mem.readInt(u64, bytes, .little));
+}
+
+fn enumLen(comptime E: type) usize {
+    return @typeInfo(E).@"enum".fields.len;
+}
+
+test "SymbolConstraints" {
+    const testing = std.testing;
+
+    // One range, 0xE0B0...0xE0B3, mapping to a single constraint, which
+    // starts at 64 after padding the 60 bytes of header and range.
+    var data: [144]u8 = @splat(0);
+    @memcpy(data[0..4], magic);
+    std.mem.writeInt(u32, data[4..8], version, .little);
+    std.mem.writeInt(u32, data[8..12], 1, .little);
+    std.mem.writeInt(u32, data[12..16], 1, .little);
+    @memset(data[16..48], 0xAB);
+    std.mem.writeInt(u32, data[48..52], 0xE0B0, .little);
+    std.mem.writeInt(u32, data[52..56], 0xE0B3, .little);
+    std.mem.writeInt(u32, data[56..60], 0, .little);
+    data[64..70].* = .{ 4, 3, 1, 0, 1, 1 };
+    std.mem.writeInt(u64, data[104..112], @bitCast(@as(f64, 0.5)), .little);
+    std.mem.writeInt(u64, data[136..144], @bitCast(@as(f64, 1.25)), .little);
+
+    {
+        const constraints: SymbolConstraints = try .init(&data);
+        const digest: [32]u8 = @splat(0xAB);
+        try testing.expectEqualSlices(u8, &digest, constraints.fontDigest());
+        try testing.expect(constraints.get(0xE0AF) == null);
+        try testing.expect(constraints.get(0xE0B4) == null);
+
+        const c = constraints.get(0xE0B2).?;
+        try testing.expectEqual(Constraint.Size.stretch, c.size);
+        try testing.expectEqual(Constraint.Align.center, c.align_vertical);
+        try testing.expectEqual(Constraint.Align.start, c.align_horizontal);
+        try testing.expectEqual(Constraint.Height.cell, c.height);
+        try testing.expectEqual(1, c.max_constraint_width);
+        try testing.expectEqual(0.5, c.relative_width);
+        try testing.expectEqual(1.25, c.max_xy_ratio.?);
+    }
+
+    // Invalid data is rejected.
+    try testing.expectError(error.InvalidSize, init(data[0..140]));
+
+    data[64] = 5;
+    try testing.expectError(error.InvalidConstraint, init(&data));
+    data[64] = 4;
+
+    std.mem.writeInt(u32, data[56..60], 1, .little);
+    try testing.expectError(error.InvalidRange, init(&data));
+
+    data[0] = 'X';
+    try testing.expectError(error.InvalidHeader, init(&data));
+}
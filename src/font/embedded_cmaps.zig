@@ -0,0 +1,143 @@
+//! Snapshots of the codepoint to glyph index mapping (cmap) of the fonts
+//! that Ghostty embeds and always adds to a collection (see SharedGridSet):
+//! JetBrains Mono, the Symbols Nerd Font and the text emoji font.
+//!
+//! These fonts are fixed at build time, so their cmaps are read once by
+//! the `cmapgen` program as part of the build and turned into sorted runs.
+//! Collection consults the snapshot of a face instead of the face's own
+//! cmap, so resolving the codepoints of the first frame doesn't go through
+//! the font tables of each face one codepoint at a time.
+
+const std = @import("std");
+const Allocator = std.mem.Allocator;
+const opentype = @import("opentype.zig");
+
+/// The largest Unicode codepoint.
+const max_codepoint = 0x10FFFF;
+
+/// The codepoint to glyph index mapping of a face.
+pub const Snapshot = struct {
+    /// Sorted runs of consecutive codepoints that
+    /// map to consecutive glyph indexes.
+    runs: []const Run,
+
+    pub const Run = struct {
+        start: u21,
+        end: u21,
+        /// The glyph index of `start`.
+        glyph: u32,
+    };
+
+    /// Take a snapshot of the provided cmap. The runs are
+    /// allocated with `alloc` and owned by the caller.
+    pub fn init(alloc: Allocator, cmap: opentype.Cmap) Allocator.Error!Snapshot {
+        var runs: std.ArrayList(Run) = .empty;
+        errdefer runs.deinit(alloc);
+
+        var it = cmap.ranges();
+        while (it.next()) |range| {
+            if (range[0] > max_codepoint) break;
+            for (range[0]..@min(range[1], max_codepoint) + 1) |i| {
+                const cp: u21 = @intCast(i);
+                const glyph = cmap.glyphIndex(cp) orelse continue;
+                if (runs.items.len > 0) {
+                    const last = &runs.items[runs.items.len - 1];
+                    if (last.end + 1 == cp and last.glyph + (cp - last.start) == glyph) {
+                        last.end = cp;
+                        continue;
+                    }
+                }
+                try runs.append(alloc, .{ .start = cp, .end = cp, .glyph = glyph });
+            }
+        }
+
+        return .{ .runs = try runs.toOwnedSlice(alloc) };
+    }
+
+    pub fn deinit(self: Snapshot, alloc: Allocator) void {
+        alloc.free(self.runs);
+    }
+
+    /// Returns the glyph index of the provided codepoint,
+    /// or null if the face has no glyph for it.
+    pub fn glyphIndex(self: *const Snapshot, cp: u32) ?u32 {
+        var lo: usize = 0;
+        var hi: usize = self.runs.len;
+        while (lo < hi) {
+            const mid = lo + (hi - lo) / 2;
+            const run = self.runs[mid];
+            if (cp < run.start) {
+                hi = mid;
+            } else if (cp > run.end) {
+                lo = mid + 1;
+            } else {
+                return run.glyph + (cp - run.start);
+            }
+        }
+        return null;
+    }
+
+    /// Write the runs as the body of a Zig array of `Run`.
+    pub fn writeZig(self: *const Snapshot, writer: *std.Io.Writer) !void {
+        for (self.runs) |run| try writer.print(
+            ".{{.start=0x{x},.end=0x{x},.glyph={}}},",
+            .{ run.start, run.end, run.glyph },
+        );
+    }
+};
+
+// These are only available after running the `cmapgen` generator as
+// part of the Ghostty build.zig process, but due to Zig's lazy analysis
+// we can still reference them here.
+const generated = @import("cmap_tables").Snapshots(Snapshot.Run);
+
+pub const variable: Snapshot = .{ .runs = &generated.variable };
+pub const variable_italic: Snapshot = .{ .runs = &generated.variable_italic };
+pub const symbols_nerd_font: Snapshot = .{ .runs = &generated.symbols_nerd_font };
+pub const emoji_text: Snapshot = .{ .runs = &generated.emoji_text };
+
+test "snapshot" {
+    const testing = std.testing;
+    const alloc = testing.allocator;
+    const test_font = @import("embedded.zig").jetbrains_mono;
+
+    const font = try opentype.sfnt.SFNT.init(test_font, alloc);
+    defer font.deinit(alloc);
+    const cmap = try opentype.Cmap.init(font.getTable("cmap").?);
+
+    const snapshot = try Snapshot.init(alloc, cmap);
+    defer snapshot.deinit(alloc);
+
+    for (0..max_codepoint + 1) |cp| {
+        try testing.expectEqual(cmap.glyphIndex(@intCast(cp)), snapshot.glyphIndex(@intCast(cp)));
+    }
+}
+
+test "snapshots match the embedded faces" {
+    const testing = std.testing;
+    const alloc = testing.allocator;
+    const font = @import("main.zig");
+
+    var lib = try font.Library.init(alloc);
+    defer lib.deinit();
+
+    const faces = [_]struct { []const u8, *const Snapshot }{
+        .{ font.embedded.variable, &variable },
+        .{ font.embedded.variable_italic, &variable_italic },
+        .{ font.embedded.symbols_nerd_font, &symbols_nerd_font },
+        .{ font.embedded.emoji_text, &emoji_text },
+    };
+    for (faces) |entry| {
+        const data, const snapshot = entry;
+        var face = try font.Face.init(lib, data, .{
+            .size = .{ .points = 12, .xdpi = 96, .ydpi = 96 },
+        });
+        defer face.deinit();
+
+        for (0..max_codepoint + 1) |cp| {
+            // UTF-16 can't encode surrogates, so CoreText can't look them up.
+            if (cp >= 0xD800 and cp <= 0xDFFF) continue;
+            try testing.expectEqual(face.glyphIndex(@intCast(cp)), snapshot.glyphIndex(@intCast(cp)));
+        }
+    }
+}
@@ -0,0 +1,301 @@
+"""
+This file precomputes the inputs of `FaceMetrics` (see Metrics.zig) for the
+fonts embedded with Ghostty (see embedded.zig), and emits them as a Zig table,
+embedded_metrics.zig, so they can be compared with what FreeType derives from
+the OS/2, hhea and post tables and the sample glyphs at runtime.
+
+The metrics are resolved with the same rules as `getMetrics` in
+face/freetype.zig:
+- the vertical metrics come from hhea or OS/2, preferring the typo metrics if
+  USE_TYPO_METRICS is set,
+- degenerate underline and strikethrough metrics are left out,
+- the cap and x heights come from OS/2 version 2 or later, or else are
+  measured from the "H" and "x" glyphs,
+- the cell width is the largest advance of the printable ASCII glyphs and the
+  ASCII height is the height of their combined bounding box,
+- the IC width is the advance of "水", unless its outline is wider than that.
+
+Values are in font units, `Preset.faceMetrics` scales them to a size. Outlines
+are measured unhinted, and for variable fonts at their default instance. That
+is why Ghostty doesn't load faces from these presets. Hinting is on by default,
+and hinted advances and outlines are fitted to the pixel grid differently at
+each size. For example, JetBrains Mono at 13 px per em has an ASCII height of
+14 px unhinted and 15.5 px hinted, which no table in font units can express.
+Also, the faces that set the cell metrics, JetBrains Mono and the Symbols Nerd
+Font, are build dependencies that aren't vendored in res/. So the table isn't
+committed. Each preset records the SHA-256 of its font, and the test in the
+generated file checks those against the bytes that are actually embedded.
+
+The faces are given as NAME=PATH, where NAME is the declaration in embedded.zig
+and PATH a copy of the font it embeds, e.g.
+
+    python embedded_metrics_codegen.py \\
+        variable=JetBrainsMono[wght].ttf \\
+        variable_italic=JetBrainsMono-Italic[wght].ttf \\
+        symbols_nerd_font=SymbolsNerdFont-Regular.ttf
+
+The table is only written if its content changed, so that Zig's build cache
+isn't invalidated needlessly.
+
+This script requires Python 3.12 or greater and the `fontTools` python module,
+and has to live next to nerd_font_codegen.py.
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib import TTFont
+from pathlib import Path
+from typing import NamedTuple
+
+from nerd_font_codegen import write_if_changed
+
+OUTPUT_PATH = Path(__file__).with_name("embedded_metrics.zig")
+EMBEDDED_PATH = Path(__file__).with_name("embedded.zig")
+
+# The CJK water ideograph, which `getMetrics` measures for the IC width.
+IC_CODEPOINT = 0x6C34
+
+
+class Preset(NamedTuple):
+    """The inputs of `FaceMetrics` for a face, in font units."""
+
+    sha256: bytes
+    units_per_em: int
+    cell_width: float
+    ascent: float
+    descent: float
+    line_gap: float
+    underline_position: float | None
+    underline_thickness: float | None
+    strikethrough_position: float | None
+    strikethrough_thickness: float | None
+    cap_height: float | None
+    ex_height: float | None
+    ascii_height: float | None
+    ic_width: float | None
+
+
+def vertical_metrics(font: TTFont) -> tuple[int, int, int]:
+    """The ascent, descent and line gap the FreeType face would use, in font
+    units, see `getMetrics` in face/freetype.zig."""
+    hhea = font["hhea"]
+    os2 = font["OS/2"] if "OS/2" in font else None
+    if os2 is None:
+        return hhea.ascent, hhea.descent, hhea.lineGap
+    if os2.fsSelection & (1 << 7):
+        # USE_TYPO_METRICS
+        return os2.sTypoAscender, os2.sTypoDescender, os2.sTypoLineGap
+    if hhea.ascent != 0 or hhea.descent != 0:
+        return hhea.ascent, hhea.descent, hhea.lineGap
+    if os2.sTypoAscender != 0 or os2.sTypoDescender != 0:
+        return os2.sTypoAscender, os2.sTypoDescender, os2.sTypoLineGap
+    return os2.usWinAscent, -os2.usWinDescent, 0
+
+
+def stroke_metrics(position: int, thickness: int) -> tuple[float | None, float | None]:
+    """Leave out degenerate underline or strikethrough metrics, like
+    `getMetrics` does."""
+    if thickness == 0:
+        return (None if position == 0 else position), None
+    return position, thickness
+
+
+def measure_preset(font_path: Path) -> Preset:
+    with TTFont(font_path, lazy=True) as font:
+        cmap = font.getBestCmap()
+        glyph_set = font.getGlyphSet()
+        hmtx = font["hmtx"]
+
+        def bounds(cp: int) -> tuple[float, float, float, float] | None:
+            """The outline bounds of the glyph of `cp`, (0, 0, 0, 0) for a
+            glyph without outline, or None if the font has no glyph for it."""
+            if cp not in cmap:
+                return None
+            pen = BoundsPen(glyph_set)
+            glyph_set[cmap[cp]].draw(pen)
+            return pen.bounds or (0, 0, 0, 0)
+
+        ascii_advance = 0
+        ascii_top = ascii_bottom = 0.0
+        for cp in range(ord(" "), 127):
+            if (b := bounds(cp)) is not None:
+                ascii_advance = max(ascii_advance, hmtx[cmap[cp]][0])
+                ascii_top = max(ascii_top, b[3])
+                ascii_bottom = min(ascii_bottom, b[1])
+
+        os2 = font["OS/2"] if "OS/2" in font else None
+        if os2 is not None and os2.version >= 2:
+            cap_height, ex_height = os2.sCapHeight, os2.sxHeight
+        else:
+            cap_height, ex_height = (
+                None if (b := bounds(ord(c))) is None else b[3] - b[1] for c in "Hx"
+            )
+
+        ic_width = None
+        if (b := bounds(IC_CODEPOINT)) is not None:
+            advance = hmtx[cmap[IC_CODEPOINT]][0]
+            # The advances of glyphs butchered by the nerd fonts patcher can
+            # be narrower than their outlines.
+            if b[2] - b[0] <= advance:
+                ic_width = advance
+
+        post = font["post"]
+        return Preset(
+            hashlib.sha256(font_path.read_bytes()).digest(),
+            font["head"].unitsPerEm,
+            ascii_advance or font["hhea"].advanceWidthMax,
+            *vertical_metrics(font),
+            *stroke_metrics(post.underlinePosition, post.underlineThickness),
+            *(
+                (None, None)
+                if os2 is None
+                else stroke_metrics(os2.yStrikeoutPosition, os2.yStrikeoutSize)
+            ),
+            cap_height,
+            ex_height,
+            ascii_top - ascii_bottom if ascii_top > ascii_bottom else None,
+            ic_width,
+        )
+
+
+ZIG_MODULE_HEADER = """//! This is a generated file, produced by embedded_metrics_codegen.py
+//! DO NOT EDIT BY HAND!
+//!
+//! This file provides the inputs of `FaceMetrics` for the embedded fonts,
+//! so that they don't have to be derived from the font tables at runtime.
+
+const std = @import("std");
+const FaceMetrics = @import("Metrics.zig").FaceMetrics;
+
+/// The inputs of `FaceMetrics` for a face, in font units. Outlines are
+/// measured unhinted, and for variable fonts at their default instance.
+pub const Preset = struct {
+    /// The SHA-256 digest of the font file, to check that
+    /// the preset belongs to the face it is used for.
+    sha256: [32]u8,
+    units_per_em: u16,
+    cell_width: f64,
+    ascent: f64,
+    descent: f64,
+    line_gap: f64,
+    underline_position: ?f64,
+    underline_thickness: ?f64,
+    strikethrough_position: ?f64,
+    strikethrough_thickness: ?f64,
+    cap_height: ?f64,
+    ex_height: ?f64,
+    ascii_height: ?f64,
+    ic_width: ?f64,
+
+    /// Get the `FaceMetrics` of the face at `px_per_em` pixels per em.
+    pub fn faceMetrics(self: Preset, px_per_em: f64) FaceMetrics {
+        const px_per_unit = px_per_em / @as(f64, @floatFromInt(self.units_per_em));
+        return .{
+            .px_per_em = px_per_em,
+            .cell_width = self.cell_width * px_per_unit,
+            .ascent = self.ascent * px_per_unit,
+            .descent = self.descent * px_per_unit,
+            .line_gap = self.line_gap * px_per_unit,
+            .underline_position = scale(self.underline_position, px_per_unit),
+            .underline_thickness = scale(self.underline_thickness, px_per_unit),
+            .strikethrough_position = scale(self.strikethrough_position, px_per_unit),
+            .strikethrough_thickness = scale(self.strikethrough_thickness, px_per_unit),
+            .cap_height = scale(self.cap_height, px_per_unit),
+            .ex_height = scale(self.ex_height, px_per_unit),
+            .ascii_height = scale(self.ascii_height, px_per_unit),
+            .ic_width = scale(self.ic_width, px_per_unit),
+        };
+    }
+
+    fn scale(value: ?f64, px_per_unit: f64) ?f64 {
+        return if (value) |v| v * px_per_unit else null;
+    }
+};
+"""
+
+
+def zig_value(value: bytes | int | float | None) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bytes):
+        return '"' + "".join(f"\\x{b:02x}" for b in value) + '".*'
+    if isinstance(value, float) and value.is_integer():
+        # Measured bounds are floats, but keep them in the same format as
+        # the values read from the font tables.
+        return repr(int(value))
+    return repr(value)
+
+
+def emit_zig_module(presets: dict[str, Preset]) -> str:
+    zig = ZIG_MODULE_HEADER
+    for name, preset in presets.items():
+        zig += f"\npub const {name}: Preset = .{{\n"
+        for field, value in preset._asdict().items():
+            zig += f"    .{field} = {zig_value(value)},\n"
+        zig += "};\n"
+
+    zig += """
+test {
+    const embedded = @import("embedded.zig");
+    const Sha256 = std.crypto.hash.sha2.Sha256;
+    var digest: [Sha256.digest_length]u8 = undefined;
+"""
+    for name in presets:
+        zig += f"""
+    Sha256.hash(embedded.{name}, &digest, .{{}});
+    try std.testing.expectEqualSlices(u8, &{name}.sha256, &digest);
+"""
+    return zig + "}\n"
+
+
+def embedded_names() -> set[str]:
+    """The names of the fonts declared in embedded.zig."""
+    return set(
+        re.findall(
+            r"^pub const (\w+) = @embedFile",
+            EMBEDDED_PATH.read_text(encoding="utf-8"),
+            re.MULTILINE,
+        )
+    )
+
+
+def parse_face(value: str) -> tuple[str, Path]:
+    name, sep, path = value.partition("=")
+    if not sep or not name.isidentifier():
+        raise argparse.ArgumentTypeError(f"expected NAME=PATH, got {value!r}")
+    return name, Path(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precompute the face metrics of the embedded fonts."
+    )
+    parser.add_argument(
+        "faces",
+        nargs="+",
+        type=parse_face,
+        metavar="NAME=PATH",
+        help="the name of a font in embedded.zig and the path to a copy of it",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=OUTPUT_PATH,
+        help="where to write the Zig table (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    embedded = embedded_names()
+    unknown = [name for name, _ in args.faces if name not in embedded]
+    if unknown:
+        sys.exit(f"Error: {', '.join(unknown)} not declared in {EMBEDDED_PATH.name}")
+
+    presets = {name: measure_preset(path) for name, path in args.faces}
+    if write_if_changed(args.output, emit_zig_module(presets)):
+        print(f"Info: Wrote {len(presets)} presets to {args.output}")
+    else:
+        print(f"Info: {args.output} is up to date")
@@ -8,6 +8,7 @@ pub const Atlas = @import("Atlas.zig");
 pub const Backend = @import("backend.zig").Backend;
 pub const discovery = @import("discovery.zig");
 pub const embedded = @import("embedded.zig");
+pub const embedded_cmaps = @import("embedded_cmaps.zig");
 pub const face = @import("face.zig");
 pub const CodepointMap = @import("CodepointMap.zig");
 pub const CodepointResolver = @import("CodepointResolver.zig");
@@ -25,6 +26,7 @@ pub const SharedGridSet = @import("SharedGridSet.zig");
 pub const sprite = @import("sprite.zig");
 pub const Sprite = sprite.Sprite;
 pub const SpriteFace = sprite.Face;
+pub const SymbolConstraints = @import("SymbolConstraints.zig");
 pub const Descriptor = discovery.Descriptor;
 pub const Discover = discovery.Discover;
 pub const Library = library.Library;
@@ -6,2769 +6,3453 @@
 
 const Constraint = @import("face.zig").RenderOptions.Constraint;
 
+/// How the glyph for a codepoint should be constrained when rendering.
+/// Symbols are classified consistently with `isSymbol` in renderer/cell.zig.
+pub const SymbolClass = union(enum) {
+    /// Not a symbol, the glyph is rendered unconstrained.
+    none,
+    /// A symbol without a Nerd Font constraint, which
+    /// is constrained to fit inside its cell(s).
+    symbol,
+    /// A Nerd Font glyph, with the constraint from the nerd fonts patcher.
+    nerd_font: Constraint,
+
+    /// The constraint to render a glyph of this class with.
+    pub fn constraint(self: SymbolClass) Constraint {
+        return switch (self) {
+            .none => .none,
+            .symbol => .{ .size = .fit },
+            .nerd_font => |c| c,
+        };
+    }
+};
+
 /// Get the constraints for the provided codepoint.
 pub fn getConstraint(cp: u21) ?Constraint {
-    return switch (cp) {
-        0x2630,
-        => .{
-            .size = .cover,
-            .height = .icon,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .pad_left = 0.05,
-            .pad_right = 0.05,
-            .pad_top = 0.05,
-            .pad_bottom = 0.05,
-        },
-        0x276c...0x276d,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7142857142857143,
-            .relative_height = 0.8910614525139665,
-            .relative_x = 0.1428571428571428,
-            .relative_y = 0.0349162011173184,
-            .pad_top = 0.15,
-            .pad_bottom = 0.15,
-        },
-        0x276e...0x276f,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9885714285714285,
-            .relative_height = 0.8910614525139665,
-            .relative_x = 0.0057142857142857,
-            .relative_y = 0.0125698324022346,
-            .pad_top = 0.15,
-            .pad_bottom = 0.15,
-        },
-        0x2770...0x2771,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .pad_top = 0.15,
-            .pad_bottom = 0.15,
-        },
-        0xe0a0...0xe0a3,
-        0xe0cf,
-        => .{
-            .size = .fit_cover1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-        },
-        0xe0b0,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.03,
-            .pad_right = -0.03,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0b1,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0b2,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.03,
-            .pad_right = -0.03,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0b3,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0b4,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.03,
-            .pad_right = -0.03,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.59,
-        },
-        0xe0b5,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .max_xy_ratio = 0.5,
-        },
-        0xe0b6,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.03,
-            .pad_right = -0.03,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.59,
-        },
-        0xe0b7,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .max_xy_ratio = 0.5,
-        },
-        0xe0b8,
-        0xe0bc,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xe0b9,
-        0xe0bd,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-        },
-        0xe0ba,
-        0xe0be,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xe0bb,
-        0xe0bf,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-        },
-        0xe0c0,
-        0xe0c8,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xe0c1,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-        },
-        0xe0c2,
-        0xe0ca,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xe0c3,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-        },
-        0xe0c4,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-            .max_xy_ratio = 0.86,
-        },
-        0xe0c5,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-            .max_xy_ratio = 0.86,
-        },
-        0xe0c6,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-            .max_xy_ratio = 0.78,
-        },
-        0xe0c7,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-            .max_xy_ratio = 0.78,
-        },
-        0xe0cc,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.01,
-            .pad_right = -0.01,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.85,
-        },
-        0xe0cd,
-        => .{
-            .size = .stretch,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .max_xy_ratio = 0.865,
-        },
-        0xe0ce,
-        0xe0d0...0xe0d1,
-        => .{
-            .size = .fit_cover1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-        },
-        0xe0d2,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.01,
-            .pad_right = -0.01,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0d4,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.01,
-            .pad_right = -0.01,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0d6,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe0d7,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-            .max_xy_ratio = 0.7,
-        },
-        0xe300,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8984375000000000,
-            .relative_y = 0.0986328125000000,
-        },
-        0xe301,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8798828125000000,
-            .relative_y = 0.1171875000000000,
-        },
-        0xe302,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7646484375000000,
-            .relative_y = 0.2314453125000000,
-        },
-        0xe303,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8789062500000000,
-            .relative_y = 0.1171875000000000,
-        },
-        0xe304,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9755859375000000,
-            .relative_y = 0.0244140625000000,
-        },
-        0xe305,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9960937500000000,
-            .relative_y = 0.0019531250000000,
-        },
-        0xe306,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9863281250000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe307,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9951171875000000,
-            .relative_y = 0.0039062500000000,
-        },
-        0xe308,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9785156250000000,
-            .relative_y = 0.0195312500000000,
-        },
-        0xe309,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9736328125000000,
-            .relative_y = 0.0214843750000000,
-        },
-        0xe30a,
-        0xe35f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9648437500000000,
-            .relative_y = 0.0302734375000000,
-        },
-        0xe30b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8437500000000000,
-            .relative_y = 0.1513671875000000,
-        },
-        0xe30c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8027343750000000,
-            .relative_y = 0.1835937500000000,
-        },
-        0xe30d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7753906250000000,
-            .relative_y = 0.1083984375000000,
-        },
-        0xe30e,
-        0xe365,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9833984375000000,
-            .relative_y = 0.0166015625000000,
-        },
-        0xe30f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9716796875000000,
-            .relative_y = 0.0263671875000000,
-        },
-        0xe310,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6621093750000000,
-            .relative_y = 0.0986328125000000,
-        },
-        0xe311,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6425781250000000,
-            .relative_y = 0.1171875000000000,
-        },
-        0xe312,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5322265625000000,
-            .relative_y = 0.2314453125000000,
-        },
-        0xe313,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6416015625000000,
-            .relative_y = 0.1181640625000000,
-        },
-        0xe314,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7382812500000000,
-            .relative_y = 0.0195312500000000,
-        },
-        0xe315,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6787109375000000,
-            .relative_y = 0.1357421875000000,
-        },
-        0xe316,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7480468750000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe317,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7529296875000000,
-            .relative_y = 0.0048828125000000,
-        },
-        0xe318,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7314453125000000,
-            .relative_y = 0.0263671875000000,
-        },
-        0xe319,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7402343750000000,
-            .relative_y = 0.0195312500000000,
-        },
-        0xe31a,
-        0xe35e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7294921875000000,
-            .relative_y = 0.0283203125000000,
-        },
-        0xe31b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6074218750000000,
-            .relative_y = 0.1503906250000000,
-        },
-        0xe31c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7363281250000000,
-            .relative_y = 0.0224609375000000,
-        },
-        0xe31d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7460937500000000,
-            .relative_y = 0.0126953125000000,
-        },
-        0xe31e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.2675781250000000,
-            .relative_y = 0.3310546875000000,
-        },
-        0xe31f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7363281250000000,
-            .relative_y = 0.0986328125000000,
-        },
-        0xe320,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7177734375000000,
-            .relative_y = 0.1171875000000000,
-        },
-        0xe321,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8085937500000000,
-            .relative_y = 0.0253906250000000,
-        },
-        0xe322,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7509765625000000,
-            .relative_y = 0.0839843750000000,
-        },
-        0xe323,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8281250000000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe324,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8349609375000000,
-        },
-        0xe325,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8154296875000000,
-            .relative_y = 0.0214843750000000,
-        },
-        0xe326,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8144531250000000,
-            .relative_y = 0.0195312500000000,
-        },
-        0xe327,
-        0xe361,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8076171875000000,
-            .relative_y = 0.0273437500000000,
-        },
-        0xe328,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6845703125000000,
-            .relative_y = 0.1503906250000000,
-        },
-        0xe329,
-        0xe367,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8173828125000000,
-            .relative_y = 0.0175781250000000,
-        },
-        0xe32a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8105468750000000,
-            .relative_y = 0.0263671875000000,
-        },
-        0xe32b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5175781250000000,
-            .relative_y = 0.2421875000000000,
-        },
-        0xe32c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6992187500000000,
-            .relative_y = 0.1005859375000000,
-        },
-        0xe32d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6787109375000000,
-            .relative_y = 0.1201171875000000,
-        },
-        0xe32e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5654296875000000,
-            .relative_y = 0.2324218750000000,
-        },
-        0xe32f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7714843750000000,
-            .relative_y = 0.0273437500000000,
-        },
-        0xe330,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7148437500000000,
-            .relative_y = 0.0830078125000000,
-        },
-        0xe331,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7919921875000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe332,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7871093750000000,
-            .relative_y = 0.0126953125000000,
-        },
-        0xe333,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7714843750000000,
-            .relative_y = 0.0263671875000000,
-        },
-        0xe334,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7773437500000000,
-            .relative_y = 0.0195312500000000,
-        },
-        0xe335,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7714843750000000,
-            .relative_y = 0.0283203125000000,
-        },
-        0xe336,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6503906250000000,
-            .relative_y = 0.1503906250000000,
-        },
-        0xe337,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7753906250000000,
-            .relative_y = 0.0234375000000000,
-        },
-        0xe338,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7792968750000000,
-            .relative_y = 0.0185546875000000,
-        },
-        0xe339,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8445945945945946,
-        },
-        0xe33a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5283203125000000,
-            .relative_y = 0.2324218750000000,
-        },
-        0xe33b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5449218750000000,
-            .relative_y = 0.2148437500000000,
-        },
-        0xe33c...0xe33d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5273437500000000,
-            .relative_y = 0.2324218750000000,
-        },
-        0xe33e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.3293918918918919,
-            .relative_y = 0.6706081081081081,
-        },
-        0xe33f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5200000000000000,
-            .relative_y = 0.2707692307692308,
-        },
-        0xe340,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8307692307692308,
-            .relative_y = 0.0861538461538462,
-        },
-        0xe341,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8327702702702703,
-            .relative_y = 0.0050675675675676,
-        },
-        0xe344,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5307692307692308,
-            .relative_y = 0.2092307692307692,
-        },
-        0xe345,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5332112630208333,
-            .relative_y = 0.2040934244791667,
-        },
-        0xe347,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8307692307692308,
-            .relative_y = 0.1246153846153846,
-        },
-        0xe349,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5307967032967034,
-            .relative_y = 0.2615384615384616,
-        },
-        0xe34c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8659995118379302,
-            .relative_y = 0.1340004881620698,
-        },
-        0xe34d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9890163534293386,
-            .relative_y = 0.0002440810349036,
-        },
-        0xe34f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5751953125000000,
-            .relative_y = 0.1142578125000000,
-        },
-        0xe351,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6533203125000000,
-            .relative_y = 0.1328125000000000,
-        },
-        0xe352,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5215384615384615,
-            .relative_y = 0.2846153846153846,
-        },
-        0xe353,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8308012820512821,
-            .relative_y = 0.1230448717948718,
-        },
-        0xe354...0xe356,
-        0xe358...0xe359,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9935233160621761,
-            .relative_y = 0.0025906735751295,
-        },
-        0xe357,
-        0xe3a9,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9961139896373057,
-        },
-        0xe35a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9935233160621761,
-            .relative_y = 0.0012953367875648,
-        },
-        0xe35b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9987046632124352,
-            .relative_y = 0.0012953367875648,
-        },
-        0xe360,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7695312500000000,
-            .relative_y = 0.0302734375000000,
-        },
-        0xe362,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9902343750000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe363,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7900390625000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe364,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8251953125000000,
-            .relative_y = 0.0097656250000000,
-        },
-        0xe366,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7832031250000000,
-            .relative_y = 0.0166015625000000,
-        },
-        0xe369,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4902343750000000,
-            .relative_y = 0.2548828125000000,
-        },
-        0xe36b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9333658774713205,
-            .relative_y = 0.0266048328044911,
-        },
-        0xe36c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7076171875000000,
-            .relative_y = 0.1083984375000000,
-        },
-        0xe36d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8427734375000000,
-            .relative_y = 0.0625000000000000,
-        },
-        0xe36e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7529721467391304,
-            .relative_y = 0.0956606657608696,
-        },
-        0xe36f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6835937500000000,
-            .relative_y = 0.1250000000000000,
-        },
-        0xe370,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8642578125000000,
-            .relative_y = 0.0625000000000000,
-        },
-        0xe371,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6103515625000000,
-            .relative_y = 0.1933593750000000,
-        },
-        0xe372,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7949218750000000,
-            .relative_y = 0.0576171875000000,
-        },
-        0xe373,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8652343750000000,
-            .relative_y = 0.0058593750000000,
-        },
-        0xe374,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.3154296875000000,
-            .relative_y = 0.2861328125000000,
-        },
-        0xe375,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6772460937500000,
-            .relative_y = 0.1303710937500000,
-        },
-        0xe376,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6992187500000000,
-            .relative_y = 0.1337890625000000,
-        },
-        0xe377,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7314453125000000,
-            .relative_y = 0.1552734375000000,
-        },
-        0xe378,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7314453125000000,
-            .relative_y = 0.1542968750000000,
-        },
-        0xe379,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5751953125000000,
-            .relative_y = 0.1826171875000000,
-        },
-        0xe37a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5263671875000000,
-            .relative_y = 0.2285156250000000,
-        },
-        0xe37b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5751953125000000,
-            .relative_y = 0.1835937500000000,
-        },
-        0xe37d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9003906250000000,
-            .relative_y = 0.0957031250000000,
-        },
-        0xe37e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6015625000000000,
-            .relative_y = 0.2324218750000000,
-        },
-        0xe37f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5200000000000000,
-            .relative_y = 0.2784615384615385,
-        },
-        0xe380,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5200000000000000,
-            .relative_y = 0.2630769230769231,
-        },
-        0xe38e...0xe391,
-        0xe394,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4990253411306043,
-            .relative_height = 0.9987012987012988,
-            .relative_x = 0.4996751137102014,
-        },
-        0xe392...0xe393,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4996751137102014,
-            .relative_height = 0.9987012987012988,
-            .relative_x = 0.4990253411306043,
-        },
-        0xe395,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5471085120207927,
-            .relative_height = 0.9987012987012988,
-            .relative_x = 0.4515919428200130,
-        },
-        0xe396,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5945419103313840,
-            .relative_height = 0.9987012987012988,
-            .relative_x = 0.4041585445094217,
-        },
-        0xe397,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6426250812215725,
-            .relative_x = 0.3573749187784275,
-        },
-        0xe398,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6900584795321637,
-            .relative_x = 0.3099415204678362,
-        },
-        0xe399,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7381416504223521,
-            .relative_x = 0.2618583495776478,
-        },
-        0xe39a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7855750487329435,
-            .relative_x = 0.2144249512670565,
-        },
-        0xe39b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9987004548408057,
-            .relative_height = 0.9987012987012988,
-        },
-        0xe39c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8323586744639376,
-            .relative_height = 0.9935064935064936,
-        },
-        0xe39d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7855750487329435,
-            .relative_height = 0.9948051948051948,
-        },
-        0xe39e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7381416504223521,
-            .relative_height = 0.9961038961038962,
-        },
-        0xe39f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6907082521117609,
-            .relative_height = 0.9961038961038962,
-        },
-        0xe3a0,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6426250812215725,
-            .relative_height = 0.9961038961038962,
-        },
-        0xe3a1,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5945419103313840,
-            .relative_height = 0.9974025974025974,
-        },
-        0xe3a2...0xe3a3,
-        0xe3a5,
-        0xe3a7...0xe3a8,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4990253411306043,
-            .relative_height = 0.9987012987012988,
-        },
-        0xe3a4,
-        0xe3a6,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4996751137102014,
-            .relative_height = 0.9987012987012988,
-        },
-        0xe3aa,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9902343750000000,
-            .relative_y = 0.0078125000000000,
-        },
-        0xe3ab,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7900390625000000,
-            .relative_y = 0.0058593750000000,
-        },
-        0xe3ac,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8251953125000000,
-            .relative_y = 0.0078125000000000,
-        },
-        0xe3ad,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7519531250000000,
-            .relative_y = 0.0068359375000000,
-        },
-        0xe3ae,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6152343750000000,
-            .relative_y = 0.2324218750000000,
-        },
-        0xe3af,
-        0xe3b3,
-        0xe3b5...0xe3bb,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9986072423398329,
-            .relative_y = 0.0013927576601671,
-        },
-        0xe3b0...0xe3b2,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9958217270194986,
-            .relative_y = 0.0041782729805014,
-        },
-        0xe3c1,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6590187942396876,
-            .relative_y = 0.1349768123016842,
-        },
-        0xe3c2,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7939956065413717,
-        },
-        0x23fb...0x23fe,
-        0x2665,
-        0x26a1,
-        0x2b58,
-        0xe000...0xe00a,
-        0xe200...0xe2a9,
-        0xe342...0xe343,
-        0xe346,
-        0xe348,
-        0xe34a...0xe34b,
-        0xe34e,
-        0xe350,
-        0xe35c...0xe35d,
-        0xe368,
-        0xe36a,
-        0xe37c,
-        0xe381...0xe38d,
-        0xe3b4,
-        0xe3bc...0xe3c0,
-        0xe3c3...0xe3e3,
-        0xe5fa...0xe6b8,
-        0xe700...0xe8ef,
-        0xea60,
-        0xea62...0xea7c,
-        0xea7e...0xea88,
-        0xea8a...0xea8c,
-        0xea8f...0xea98,
-        0xeaa3...0xeab3,
-        0xeab8...0xeac7,
-        0xeac9,
-        0xeacc...0xead3,
-        0xead7...0xeb09,
-        0xeb0b...0xeb42,
-        0xeb44...0xeb4e,
-        0xeb50...0xeb6d,
-        0xeb72...0xeb89,
-        0xeb8b...0xeb99,
-        0xeb9b...0xebd4,
-        0xebd7...0xec06,
-        0xec08...0xec0a,
-        0xec0d...0xec1e,
-        0xed00...0xedff,
-        0xee0c...0xefce,
-        0xf000...0xf004,
-        0xf006...0xf025,
-        0xf028...0xf02a,
-        0xf02c...0xf030,
-        0xf034,
-        0xf036...0xf043,
-        0xf045,
-        0xf047,
-        0xf053...0xf05f,
-        0xf062,
-        0xf064...0xf076,
-        0xf079...0xf07d,
-        0xf07f...0xf088,
-        0xf08a...0xf0a3,
-        0xf0a6...0xf0d6,
-        0xf0db,
-        0xf0df...0xf0ff,
-        0xf108...0xf12f,
-        0xf131...0xf140,
-        0xf142...0xf152,
-        0xf155,
-        0xf15a...0xf174,
-        0xf176,
-        0xf179...0xf181,
-        0xf183...0xf220,
-        0xf223,
-        0xf22e...0xf254,
-        0xf259,
-        0xf25c...0xf381,
-        0xf400...0xf415,
-        0xf417...0xf423,
-        0xf425...0xf430,
-        0xf435...0xf437,
-        0xf439...0xf43d,
-        0xf43f...0xf442,
-        0xf446...0xf449,
-        0xf44c...0xf45b,
-        0xf45d...0xf45f,
-        0xf462...0xf466,
-        0xf468...0xf46b,
-        0xf46d...0xf46f,
-        0xf471...0xf475,
-        0xf477...0xf479,
-        0xf47f...0xf48a,
-        0xf48c...0xf492,
-        0xf494...0xf499,
-        0xf49b...0xf4c2,
-        0xf4c4...0xf4ee,
-        0xf4f3...0xf51c,
-        0xf51e...0xf533,
-        0xf0001...0xf1af0,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-        },
-        0xea61,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7513020833333334,
-            .relative_height = 0.9291573452647278,
-            .relative_x = 0.0846354166666667,
-            .relative_y = 0.0708426547352722,
-        },
-        0xea7d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8394854586129754,
-            .relative_height = 0.8751387347391787,
-            .relative_x = 0.0917225950782998,
-            .relative_y = 0.0416204217536071,
-        },
-        0xea99,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9395973154362416,
-            .relative_height = 0.4778024417314096,
-            .relative_x = 0.0302013422818792,
-            .relative_y = 0.2269700332963374,
-        },
-        0xea9a,
-        0xeaa1,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7673378076062640,
-            .relative_height = 0.8523862375138734,
-            .relative_x = 0.1526845637583893,
-            .relative_y = 0.0754716981132075,
-        },
-        0xea9b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8590604026845637,
-            .relative_height = 0.7613762486126526,
-            .relative_x = 0.0721476510067114,
-            .relative_y = 0.0871254162042175,
-        },
-        0xea9c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8590604026845637,
-            .relative_height = 0.7574916759156493,
-            .relative_x = 0.0721476510067114,
-            .relative_y = 0.0832408435072142,
-        },
-        0xea9d,
-        0xeaa0,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4082774049217002,
-            .relative_height = 0.5077691453940066,
-            .relative_x = 0.2863534675615212,
-            .relative_y = 0.2763596004439512,
-        },
-        0xea9e...0xea9f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5117449664429530,
-            .relative_height = 0.4051054384017758,
-            .relative_x = 0.2136465324384788,
-            .relative_y = 0.3068812430632630,
-        },
-        0xeaa2,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8061116965226555,
-            .relative_height = 0.9438247156716689,
-            .relative_x = 0.0679662802950474,
-            .relative_y = 0.0147523709167545,
-        },
-        0xeab4,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9945482866043613,
-            .relative_height = 0.5264797507788161,
-            .relative_y = 0.2024922118380062,
-        },
-        0xeab5,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5264797507788161,
-            .relative_height = 0.9945482866043613,
-            .relative_x = 0.2024922118380062,
-            .relative_y = 0.0054517133956386,
-        },
-        0xeab6,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5264797507788161,
-            .relative_height = 0.9945482866043613,
-            .relative_x = 0.2710280373831775,
-        },
-        0xeab7,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9945482866043613,
-            .relative_height = 0.5264797507788161,
-            .relative_x = 0.0054517133956386,
-            .relative_y = 0.2710280373831775,
-        },
-        0xead4...0xead5,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7069825436408977,
-            .relative_x = 0.1483790523690773,
-        },
-        0xead6,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8780760626398211,
-            .relative_y = 0.0687919463087248,
-        },
-        0xeb43,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7335766423357665,
-            .relative_height = 0.9996188152778837,
-            .relative_x = 0.1991657977059437,
-            .relative_y = 0.0003811847221163,
-        },
-        0xeb6e,
-        0xeb71,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4954604409857328,
-            .relative_y = 0.2522697795071336,
-        },
-        0xeb6f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4973958333333333,
-            .relative_x = 0.2493489583333333,
-        },
-        0xeb70,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4973958333333333,
-            .relative_height = 0.9961089494163424,
-            .relative_x = 0.2493489583333333,
-            .relative_y = 0.0038910505836576,
-        },
-        0xeb8a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.3468834688346883,
-            .relative_height = 0.3353615785256410,
-            .relative_x = 0.2642276422764228,
-            .relative_y = 0.3313050881410256,
-        },
-        0xeb9a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8740779768177028,
-            .relative_height = 0.9438247156716689,
-            .relative_x = 0.0679662802950474,
-            .relative_y = 0.0147523709167545,
-        },
-        0xebd5,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9322210636079249,
-            .relative_height = 0.9318897917604415,
-            .relative_y = 0.0681102082395584,
-        },
-        0xebd6,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9996446423917936,
-            .relative_y = 0.0003553576082064,
-        },
-        0xec07,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.3495911047345768,
-            .relative_height = 0.3355179398148149,
-            .relative_x = 0.2615335565120357,
-            .relative_y = 0.3311487268518519,
-        },
-        0xec0b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9327424400417101,
-            .relative_height = 0.9996188152778837,
-            .relative_y = 0.0003811847221163,
-        },
-        0xec0c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8008342022940563,
-            .relative_x = 0.1991657977059437,
-        },
-        0xee00,
-        0xee03,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .end,
-            .align_vertical = .center1,
-            .relative_width = 0.8681172291296625,
-            .relative_height = 0.8626692456479691,
-            .relative_x = 0.1314387211367673,
-            .relative_y = 0.0686653771760155,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xee01,
-        0xee04,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8626692456479691,
-            .relative_y = 0.0686653771760155,
-            .pad_left = -0.05,
-            .pad_right = -0.05,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xee02,
-        0xee05,
-        => .{
-            .size = .stretch,
-            .max_constraint_width = 1,
-            .align_horizontal = .start,
-            .align_vertical = .center1,
-            .relative_width = 0.8685612788632326,
-            .relative_height = 0.8626692456479691,
-            .relative_y = 0.0686653771760155,
-            .pad_left = -0.025,
-            .pad_right = -0.025,
-            .pad_top = -0.005,
-            .pad_bottom = -0.005,
-        },
-        0xee06,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7059415911379657,
-            .relative_height = 0.2234524408656266,
-            .relative_x = 0.1470292044310171,
-            .relative_y = 0.7765475591343735,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xee07,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5000000000000000,
-            .relative_height = 0.7498741821841973,
-            .relative_x = 0.5000000000000000,
-            .relative_y = 0.2501258178158027,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xee08,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6299093655589124,
-            .relative_height = 0.8535480624056366,
-            .relative_x = 0.3700906344410876,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xee09,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4997483643683945,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xee0a,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6299093655589124,
-            .relative_height = 0.8535480624056366,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xee0b,
-        => .{
-            .size = .cover,
-            .max_constraint_width = 1,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5000000000000000,
-            .relative_height = 0.7498741821841973,
-            .relative_y = 0.2501258178158027,
-            .pad_left = 0.015,
-            .pad_right = 0.015,
-            .pad_top = 0.015,
-            .pad_bottom = 0.015,
-        },
-        0xf005,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9999664113932554,
-            .relative_y = 0.0000335886067446,
-        },
-        0xf026...0xf027,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9786184354605580,
-            .relative_y = 0.0103951316192896,
-        },
-        0xf02b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9758052740827267,
-            .relative_y = 0.0238869355863696,
-        },
-        0xf031...0xf033,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9987922705314010,
-            .relative_y = 0.0006038647342995,
-        },
-        0xf035,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9989935587761675,
-            .relative_y = 0.0004025764895330,
-        },
-        0xf044,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9925925925925926,
-        },
-        0xf046,
-        0xf153...0xf154,
-        0xf158,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8751322751322751,
-            .relative_y = 0.0624338624338624,
-        },
-        0xf048,
-        0xf04a,
-        0xf04e,
-        0xf051,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8577706898990622,
-            .relative_y = 0.0711892586341537,
-        },
-        0xf049,
-        0xf050,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8579450878868969,
-            .relative_y = 0.0710148606463189,
-        },
-        0xf04b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9997041418532618,
-            .relative_y = 0.0002958581467381,
-        },
-        0xf04c...0xf04d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8572940020656472,
-            .relative_y = 0.0713404035569438,
-        },
-        0xf04f,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7138835298072554,
-            .relative_y = 0.1433479295317200,
-        },
-        0xf052,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9999748091795350,
-        },
-        0xf060...0xf061,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8567975830815709,
-            .relative_y = 0.0719033232628399,
-        },
-        0xf063,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9987915407854985,
-            .relative_y = 0.0006042296072508,
-        },
-        0xf077,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5700483091787439,
-            .relative_y = 0.2862318840579710,
-        },
-        0xf078,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5700483091787439,
-            .relative_y = 0.1437198067632850,
-        },
-        0xf07e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4989429175475687,
-            .relative_y = 0.2505285412262157,
-        },
-        0xf089,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9998488512696494,
-            .relative_y = 0.0001511487303507,
-        },
-        0xf0a4...0xf0a5,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7502645502645503,
-            .relative_y = 0.1248677248677249,
-        },
-        0xf0d7,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4281400966183575,
-            .relative_y = 0.2053140096618357,
-        },
-        0xf0d8,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.4281400966183575,
-            .relative_y = 0.3472222222222222,
-        },
-        0xf0d9,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7140772371750631,
-            .relative_y = 0.1333462732919255,
-        },
-        0xf0da,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7140396210163651,
-            .relative_y = 0.1333838894506235,
-        },
-        0xf0dc,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-        },
-        0xf0dd,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .relative_height = 0.4275362318840580,
-            .relative_y = 0.0012077294685990,
-        },
-        0xf0de,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .relative_height = 0.4287439613526570,
-            .relative_y = 0.5712560386473430,
-        },
-        0xf100...0xf101,
-        0xf104...0xf105,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8573155985489722,
-            .relative_y = 0.0713422007255139,
-        },
-        0xf102,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9286577992744861,
-            .relative_y = 0.0713422007255139,
-        },
-        0xf103,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9286577992744861,
-        },
-        0xf106...0xf107,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.5000000000000000,
-            .relative_y = 0.2853688029020556,
-        },
-        0xf130,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9998602571268865,
-        },
-        0xf141,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.2593984962406015,
-            .relative_y = 0.3696741854636592,
-        },
-        0xf156,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8752505446623093,
-            .relative_y = 0.0623155929038282,
-        },
-        0xf157,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8756468797564688,
-            .relative_y = 0.0624338624338624,
-        },
-        0xf159,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8756067947646895,
-            .relative_y = 0.0623492063492063,
-        },
-        0xf175,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9989423585404548,
-            .relative_y = 0.0005288207297726,
-        },
-        0xf177...0xf178,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6250661025912215,
-            .relative_y = 0.1877313590692755,
-        },
-        0xf182,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9998046921689268,
-        },
-        0xf221,
-        0xf224...0xf226,
-        0xf228,
-        0xf22a,
-        0xf22c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9994854643684076,
-        },
-        0xf222,
-        0xf227,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.8746819883943630,
-            .relative_y = 0.0624017379870223,
-        },
-        0xf229,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9370837263813853,
-            .relative_y = 0.0624017379870223,
-        },
-        0xf22b,
-        0xf22d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6874767744332962,
-            .relative_y = 0.1560043449675557,
-        },
-        0xf255...0xf256,
-        0xf25a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9993997599039616,
-        },
-        0xf257,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7810124049619848,
-            .relative_y = 0.0935945806894186,
-        },
-        0xf258,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.7498142113988452,
-            .relative_y = 0.1247927742525582,
-        },
-        0xf25b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.9975006099019084,
-        },
-        0xf416,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_height = 0.6090604026845637,
-            .relative_y = 0.2119686800894855,
-        },
-        0xf424,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5019531250000000,
-            .relative_height = 0.5755033557046980,
-            .relative_x = 0.2480468750000000,
-            .relative_y = 0.2108501118568233,
-        },
-        0xf431,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6240234375000000,
-            .relative_height = 0.7695749440715883,
-            .relative_x = 0.2031250000000000,
-            .relative_y = 0.1420581655480984,
-        },
-        0xf432,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6718750000000000,
-            .relative_height = 0.7147651006711410,
-            .relative_x = 0.1875000000000000,
-            .relative_y = 0.1610738255033557,
-        },
-        0xf433,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6240234375000000,
-            .relative_height = 0.7695749440715883,
-            .relative_x = 0.2041015625000000,
-            .relative_y = 0.0883668903803132,
-        },
-        0xf434,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6718750000000000,
-            .relative_height = 0.7147651006711410,
-            .relative_x = 0.1406250000000000,
-            .relative_y = 0.1599552572706935,
-        },
-        0xf438,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.2436523437500000,
-            .relative_height = 0.4560546875000000,
-            .relative_x = 0.3813476562500000,
-            .relative_y = 0.2719726562500000,
-        },
-        0xf43e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5029296875000000,
-            .relative_height = 0.5755033557046980,
-            .relative_x = 0.2500000000000000,
-            .relative_y = 0.2136465324384788,
-        },
-        0xf443,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7500000000000000,
-            .relative_x = 0.1250000000000000,
-        },
-        0xf444...0xf445,
-        0xf4c3,
-        0xf51d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5000000000000000,
-            .relative_height = 0.5000000000000000,
-            .relative_x = 0.2500000000000000,
-            .relative_y = 0.2500000000000000,
-        },
-        0xf44a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.2436523437500000,
-            .relative_height = 0.4560546875000000,
-            .relative_x = 0.3750000000000000,
-            .relative_y = 0.2719726562500000,
-        },
-        0xf44b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4560546875000000,
-            .relative_height = 0.2436523437500000,
-            .relative_x = 0.2719726562500000,
-            .relative_y = 0.3188476562500000,
-        },
-        0xf45c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5019531250000000,
-            .relative_height = 0.5749440715883669,
-            .relative_x = 0.2480468750000000,
-            .relative_y = 0.2114093959731544,
-        },
-        0xf460,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.3593750000000000,
-            .relative_height = 0.6240234375000000,
-            .relative_x = 0.3750000000000000,
-            .relative_y = 0.1884765625000000,
-        },
-        0xf461,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6237816764132553,
-            .relative_height = 0.9988851727982163,
-            .relative_x = 0.1881091617933723,
-        },
-        0xf467,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5639648437500000,
-            .relative_height = 0.5649414062500000,
-            .relative_x = 0.2187500000000000,
-            .relative_y = 0.2177734375000000,
-        },
-        0xf46c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5039062500000000,
-            .relative_height = 0.5771812080536913,
-            .relative_x = 0.2490234375000000,
-            .relative_y = 0.2091722595078300,
-        },
-        0xf470,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9926757812500000,
-            .relative_height = 0.2690429687500000,
-            .relative_y = 0.6865234375000000,
-        },
-        0xf476,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8732325694783033,
-            .relative_x = 0.0633837152608484,
-        },
-        0xf47a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.5843079922027290,
-            .relative_height = 0.9509476031215162,
-            .relative_x = 0.2066276803118908,
-            .relative_y = 0.0234113712374582,
-        },
-        0xf47b...0xf47c,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.6250000000000000,
-            .relative_height = 0.3593750000000000,
-            .relative_x = 0.1875000000000000,
-            .relative_y = 0.3281250000000000,
-        },
-        0xf47d,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.3593750000000000,
-            .relative_height = 0.6240234375000000,
-            .relative_x = 0.2656250000000000,
-            .relative_y = 0.1875000000000000,
-        },
-        0xf47e,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.4560546875000000,
-            .relative_height = 0.2436523437500000,
-            .relative_x = 0.2719726562500000,
-            .relative_y = 0.3750000000000000,
-        },
-        0xf48b,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7187500000000000,
-            .relative_height = 0.0937500000000000,
-            .relative_x = 0.1250000000000000,
-            .relative_y = 0.4687500000000000,
-        },
-        0xf493,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8313840155945419,
-            .relative_height = 0.9509476031215162,
-            .relative_x = 0.0843079922027290,
-            .relative_y = 0.0234113712374582,
-        },
-        0xf49a,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.8727450024378351,
-            .relative_x = 0.0633837152608484,
-        },
-        0xf4ef,
-        0xf4f2,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.7142857142857143,
-            .relative_x = 0.1428571428571428,
-        },
-        0xf4f0,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9642857142857143,
-            .relative_height = 0.7407407407407407,
-            .relative_y = 0.1111111111111111,
-        },
-        0xf4f1,
-        => .{
-            .size = .fit_cover1,
-            .height = .icon,
-            .align_horizontal = .center1,
-            .align_vertical = .center1,
-            .relative_width = 0.9642857142857143,
-            .relative_height = 0.7407407407407407,
-            .relative_x = 0.0357142857142857,
-            .relative_y = 0.1111111111111111,
-        },
-        else => null,
+    return switch (getSymbolClass(cp)) {
+        .none, .symbol => null,
+        .nerd_font => |c| c,
     };
 }
+
+/// Get the symbol class of the provided codepoint.
+pub fn getSymbolClass(cp: u21) SymbolClass {
+    const high = cp >> 8;
+    if (high >= stage1.len) return .none;
+    const block: usize = stage1[high];
+    return classes[stage2[block * 256 + (cp & 0xFF)]];
+}
+
+/// Deduplicated pool of symbol classes, indexed by `stage2`.
+const classes = [_]SymbolClass{
+    .none,
+    .symbol,
+    .{ .nerd_font = .{
+        .size = .cover,
+        .height = .icon,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .pad_left = 0.05,
+        .pad_right = 0.05,
+        .pad_top = 0.05,
+        .pad_bottom = 0.05,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7142857142857143,
+        .relative_height = 0.8910614525139665,
+        .relative_x = 0.1428571428571428,
+        .relative_y = 0.0349162011173184,
+        .pad_top = 0.15,
+        .pad_bottom = 0.15,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9885714285714285,
+        .relative_height = 0.8910614525139665,
+        .relative_x = 0.0057142857142857,
+        .relative_y = 0.0125698324022346,
+        .pad_top = 0.15,
+        .pad_bottom = 0.15,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .pad_top = 0.15,
+        .pad_bottom = 0.15,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.03,
+        .pad_right = -0.03,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.03,
+        .pad_right = -0.03,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.03,
+        .pad_right = -0.03,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.59,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .max_xy_ratio = 0.5,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.03,
+        .pad_right = -0.03,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.59,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .max_xy_ratio = 0.5,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+        .max_xy_ratio = 0.86,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+        .max_xy_ratio = 0.86,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+        .max_xy_ratio = 0.78,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+        .max_xy_ratio = 0.78,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.01,
+        .pad_right = -0.01,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.85,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .max_xy_ratio = 0.865,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.01,
+        .pad_right = -0.01,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.01,
+        .pad_right = -0.01,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+        .max_xy_ratio = 0.7,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8984375000000000,
+        .relative_y = 0.0986328125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8798828125000000,
+        .relative_y = 0.1171875000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7646484375000000,
+        .relative_y = 0.2314453125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8789062500000000,
+        .relative_y = 0.1171875000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9755859375000000,
+        .relative_y = 0.0244140625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9960937500000000,
+        .relative_y = 0.0019531250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9863281250000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9951171875000000,
+        .relative_y = 0.0039062500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9785156250000000,
+        .relative_y = 0.0195312500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9736328125000000,
+        .relative_y = 0.0214843750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9648437500000000,
+        .relative_y = 0.0302734375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8437500000000000,
+        .relative_y = 0.1513671875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8027343750000000,
+        .relative_y = 0.1835937500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7753906250000000,
+        .relative_y = 0.1083984375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9833984375000000,
+        .relative_y = 0.0166015625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9716796875000000,
+        .relative_y = 0.0263671875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6621093750000000,
+        .relative_y = 0.0986328125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6425781250000000,
+        .relative_y = 0.1171875000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5322265625000000,
+        .relative_y = 0.2314453125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6416015625000000,
+        .relative_y = 0.1181640625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7382812500000000,
+        .relative_y = 0.0195312500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6787109375000000,
+        .relative_y = 0.1357421875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7480468750000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7529296875000000,
+        .relative_y = 0.0048828125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7314453125000000,
+        .relative_y = 0.0263671875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7402343750000000,
+        .relative_y = 0.0195312500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7294921875000000,
+        .relative_y = 0.0283203125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6074218750000000,
+        .relative_y = 0.1503906250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7363281250000000,
+        .relative_y = 0.0224609375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7460937500000000,
+        .relative_y = 0.0126953125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.2675781250000000,
+        .relative_y = 0.3310546875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7363281250000000,
+        .relative_y = 0.0986328125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7177734375000000,
+        .relative_y = 0.1171875000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8085937500000000,
+        .relative_y = 0.0253906250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7509765625000000,
+        .relative_y = 0.0839843750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8281250000000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8349609375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8154296875000000,
+        .relative_y = 0.0214843750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8144531250000000,
+        .relative_y = 0.0195312500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8076171875000000,
+        .relative_y = 0.0273437500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6845703125000000,
+        .relative_y = 0.1503906250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8173828125000000,
+        .relative_y = 0.0175781250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8105468750000000,
+        .relative_y = 0.0263671875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5175781250000000,
+        .relative_y = 0.2421875000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6992187500000000,
+        .relative_y = 0.1005859375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6787109375000000,
+        .relative_y = 0.1201171875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5654296875000000,
+        .relative_y = 0.2324218750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7714843750000000,
+        .relative_y = 0.0273437500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7148437500000000,
+        .relative_y = 0.0830078125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7919921875000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7871093750000000,
+        .relative_y = 0.0126953125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7714843750000000,
+        .relative_y = 0.0263671875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7773437500000000,
+        .relative_y = 0.0195312500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7714843750000000,
+        .relative_y = 0.0283203125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6503906250000000,
+        .relative_y = 0.1503906250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7753906250000000,
+        .relative_y = 0.0234375000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7792968750000000,
+        .relative_y = 0.0185546875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8445945945945946,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5283203125000000,
+        .relative_y = 0.2324218750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5449218750000000,
+        .relative_y = 0.2148437500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5273437500000000,
+        .relative_y = 0.2324218750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.3293918918918919,
+        .relative_y = 0.6706081081081081,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5200000000000000,
+        .relative_y = 0.2707692307692308,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8307692307692308,
+        .relative_y = 0.0861538461538462,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8327702702702703,
+        .relative_y = 0.0050675675675676,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5307692307692308,
+        .relative_y = 0.2092307692307692,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5332112630208333,
+        .relative_y = 0.2040934244791667,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8307692307692308,
+        .relative_y = 0.1246153846153846,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5307967032967034,
+        .relative_y = 0.2615384615384616,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8659995118379302,
+        .relative_y = 0.1340004881620698,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9890163534293386,
+        .relative_y = 0.0002440810349036,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5751953125000000,
+        .relative_y = 0.1142578125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6533203125000000,
+        .relative_y = 0.1328125000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5215384615384615,
+        .relative_y = 0.2846153846153846,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8308012820512821,
+        .relative_y = 0.1230448717948718,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9935233160621761,
+        .relative_y = 0.0025906735751295,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9961139896373057,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9935233160621761,
+        .relative_y = 0.0012953367875648,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9987046632124352,
+        .relative_y = 0.0012953367875648,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7695312500000000,
+        .relative_y = 0.0302734375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9902343750000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7900390625000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8251953125000000,
+        .relative_y = 0.0097656250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7832031250000000,
+        .relative_y = 0.0166015625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4902343750000000,
+        .relative_y = 0.2548828125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9333658774713205,
+        .relative_y = 0.0266048328044911,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7076171875000000,
+        .relative_y = 0.1083984375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8427734375000000,
+        .relative_y = 0.0625000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7529721467391304,
+        .relative_y = 0.0956606657608696,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6835937500000000,
+        .relative_y = 0.1250000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8642578125000000,
+        .relative_y = 0.0625000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6103515625000000,
+        .relative_y = 0.1933593750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7949218750000000,
+        .relative_y = 0.0576171875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8652343750000000,
+        .relative_y = 0.0058593750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.3154296875000000,
+        .relative_y = 0.2861328125000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6772460937500000,
+        .relative_y = 0.1303710937500000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6992187500000000,
+        .relative_y = 0.1337890625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7314453125000000,
+        .relative_y = 0.1552734375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7314453125000000,
+        .relative_y = 0.1542968750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5751953125000000,
+        .relative_y = 0.1826171875000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5263671875000000,
+        .relative_y = 0.2285156250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5751953125000000,
+        .relative_y = 0.1835937500000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9003906250000000,
+        .relative_y = 0.0957031250000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6015625000000000,
+        .relative_y = 0.2324218750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5200000000000000,
+        .relative_y = 0.2784615384615385,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5200000000000000,
+        .relative_y = 0.2630769230769231,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4990253411306043,
+        .relative_height = 0.9987012987012988,
+        .relative_x = 0.4996751137102014,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4996751137102014,
+        .relative_height = 0.9987012987012988,
+        .relative_x = 0.4990253411306043,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5471085120207927,
+        .relative_height = 0.9987012987012988,
+        .relative_x = 0.4515919428200130,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5945419103313840,
+        .relative_height = 0.9987012987012988,
+        .relative_x = 0.4041585445094217,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6426250812215725,
+        .relative_x = 0.3573749187784275,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6900584795321637,
+        .relative_x = 0.3099415204678362,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7381416504223521,
+        .relative_x = 0.2618583495776478,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7855750487329435,
+        .relative_x = 0.2144249512670565,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9987004548408057,
+        .relative_height = 0.9987012987012988,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8323586744639376,
+        .relative_height = 0.9935064935064936,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7855750487329435,
+        .relative_height = 0.9948051948051948,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7381416504223521,
+        .relative_height = 0.9961038961038962,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6907082521117609,
+        .relative_height = 0.9961038961038962,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6426250812215725,
+        .relative_height = 0.9961038961038962,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5945419103313840,
+        .relative_height = 0.9974025974025974,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4990253411306043,
+        .relative_height = 0.9987012987012988,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4996751137102014,
+        .relative_height = 0.9987012987012988,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9902343750000000,
+        .relative_y = 0.0078125000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7900390625000000,
+        .relative_y = 0.0058593750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8251953125000000,
+        .relative_y = 0.0078125000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7519531250000000,
+        .relative_y = 0.0068359375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6152343750000000,
+        .relative_y = 0.2324218750000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9986072423398329,
+        .relative_y = 0.0013927576601671,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9958217270194986,
+        .relative_y = 0.0041782729805014,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6590187942396876,
+        .relative_y = 0.1349768123016842,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7939956065413717,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7513020833333334,
+        .relative_height = 0.9291573452647278,
+        .relative_x = 0.0846354166666667,
+        .relative_y = 0.0708426547352722,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8394854586129754,
+        .relative_height = 0.8751387347391787,
+        .relative_x = 0.0917225950782998,
+        .relative_y = 0.0416204217536071,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9395973154362416,
+        .relative_height = 0.4778024417314096,
+        .relative_x = 0.0302013422818792,
+        .relative_y = 0.2269700332963374,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7673378076062640,
+        .relative_height = 0.8523862375138734,
+        .relative_x = 0.1526845637583893,
+        .relative_y = 0.0754716981132075,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8590604026845637,
+        .relative_height = 0.7613762486126526,
+        .relative_x = 0.0721476510067114,
+        .relative_y = 0.0871254162042175,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8590604026845637,
+        .relative_height = 0.7574916759156493,
+        .relative_x = 0.0721476510067114,
+        .relative_y = 0.0832408435072142,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4082774049217002,
+        .relative_height = 0.5077691453940066,
+        .relative_x = 0.2863534675615212,
+        .relative_y = 0.2763596004439512,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5117449664429530,
+        .relative_height = 0.4051054384017758,
+        .relative_x = 0.2136465324384788,
+        .relative_y = 0.3068812430632630,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8061116965226555,
+        .relative_height = 0.9438247156716689,
+        .relative_x = 0.0679662802950474,
+        .relative_y = 0.0147523709167545,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9945482866043613,
+        .relative_height = 0.5264797507788161,
+        .relative_y = 0.2024922118380062,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5264797507788161,
+        .relative_height = 0.9945482866043613,
+        .relative_x = 0.2024922118380062,
+        .relative_y = 0.0054517133956386,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5264797507788161,
+        .relative_height = 0.9945482866043613,
+        .relative_x = 0.2710280373831775,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9945482866043613,
+        .relative_height = 0.5264797507788161,
+        .relative_x = 0.0054517133956386,
+        .relative_y = 0.2710280373831775,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7069825436408977,
+        .relative_x = 0.1483790523690773,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8780760626398211,
+        .relative_y = 0.0687919463087248,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7335766423357665,
+        .relative_height = 0.9996188152778837,
+        .relative_x = 0.1991657977059437,
+        .relative_y = 0.0003811847221163,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4954604409857328,
+        .relative_y = 0.2522697795071336,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4973958333333333,
+        .relative_x = 0.2493489583333333,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4973958333333333,
+        .relative_height = 0.9961089494163424,
+        .relative_x = 0.2493489583333333,
+        .relative_y = 0.0038910505836576,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.3468834688346883,
+        .relative_height = 0.3353615785256410,
+        .relative_x = 0.2642276422764228,
+        .relative_y = 0.3313050881410256,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8740779768177028,
+        .relative_height = 0.9438247156716689,
+        .relative_x = 0.0679662802950474,
+        .relative_y = 0.0147523709167545,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9322210636079249,
+        .relative_height = 0.9318897917604415,
+        .relative_y = 0.0681102082395584,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9996446423917936,
+        .relative_y = 0.0003553576082064,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.3495911047345768,
+        .relative_height = 0.3355179398148149,
+        .relative_x = 0.2615335565120357,
+        .relative_y = 0.3311487268518519,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9327424400417101,
+        .relative_height = 0.9996188152778837,
+        .relative_y = 0.0003811847221163,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8008342022940563,
+        .relative_x = 0.1991657977059437,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .end,
+        .align_vertical = .center1,
+        .relative_width = 0.8681172291296625,
+        .relative_height = 0.8626692456479691,
+        .relative_x = 0.1314387211367673,
+        .relative_y = 0.0686653771760155,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8626692456479691,
+        .relative_y = 0.0686653771760155,
+        .pad_left = -0.05,
+        .pad_right = -0.05,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .stretch,
+        .max_constraint_width = 1,
+        .align_horizontal = .start,
+        .align_vertical = .center1,
+        .relative_width = 0.8685612788632326,
+        .relative_height = 0.8626692456479691,
+        .relative_y = 0.0686653771760155,
+        .pad_left = -0.025,
+        .pad_right = -0.025,
+        .pad_top = -0.005,
+        .pad_bottom = -0.005,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7059415911379657,
+        .relative_height = 0.2234524408656266,
+        .relative_x = 0.1470292044310171,
+        .relative_y = 0.7765475591343735,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5000000000000000,
+        .relative_height = 0.7498741821841973,
+        .relative_x = 0.5000000000000000,
+        .relative_y = 0.2501258178158027,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6299093655589124,
+        .relative_height = 0.8535480624056366,
+        .relative_x = 0.3700906344410876,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4997483643683945,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6299093655589124,
+        .relative_height = 0.8535480624056366,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .cover,
+        .max_constraint_width = 1,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5000000000000000,
+        .relative_height = 0.7498741821841973,
+        .relative_y = 0.2501258178158027,
+        .pad_left = 0.015,
+        .pad_right = 0.015,
+        .pad_top = 0.015,
+        .pad_bottom = 0.015,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9999664113932554,
+        .relative_y = 0.0000335886067446,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9786184354605580,
+        .relative_y = 0.0103951316192896,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9758052740827267,
+        .relative_y = 0.0238869355863696,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9987922705314010,
+        .relative_y = 0.0006038647342995,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9989935587761675,
+        .relative_y = 0.0004025764895330,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9925925925925926,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8751322751322751,
+        .relative_y = 0.0624338624338624,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8577706898990622,
+        .relative_y = 0.0711892586341537,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8579450878868969,
+        .relative_y = 0.0710148606463189,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9997041418532618,
+        .relative_y = 0.0002958581467381,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8572940020656472,
+        .relative_y = 0.0713404035569438,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7138835298072554,
+        .relative_y = 0.1433479295317200,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9999748091795350,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8567975830815709,
+        .relative_y = 0.0719033232628399,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9987915407854985,
+        .relative_y = 0.0006042296072508,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5700483091787439,
+        .relative_y = 0.2862318840579710,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5700483091787439,
+        .relative_y = 0.1437198067632850,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4989429175475687,
+        .relative_y = 0.2505285412262157,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9998488512696494,
+        .relative_y = 0.0001511487303507,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7502645502645503,
+        .relative_y = 0.1248677248677249,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4281400966183575,
+        .relative_y = 0.2053140096618357,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.4281400966183575,
+        .relative_y = 0.3472222222222222,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7140772371750631,
+        .relative_y = 0.1333462732919255,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7140396210163651,
+        .relative_y = 0.1333838894506235,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .relative_height = 0.4275362318840580,
+        .relative_y = 0.0012077294685990,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .relative_height = 0.4287439613526570,
+        .relative_y = 0.5712560386473430,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8573155985489722,
+        .relative_y = 0.0713422007255139,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9286577992744861,
+        .relative_y = 0.0713422007255139,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9286577992744861,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.5000000000000000,
+        .relative_y = 0.2853688029020556,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9998602571268865,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.2593984962406015,
+        .relative_y = 0.3696741854636592,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8752505446623093,
+        .relative_y = 0.0623155929038282,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8756468797564688,
+        .relative_y = 0.0624338624338624,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8756067947646895,
+        .relative_y = 0.0623492063492063,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9989423585404548,
+        .relative_y = 0.0005288207297726,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6250661025912215,
+        .relative_y = 0.1877313590692755,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9998046921689268,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9994854643684076,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.8746819883943630,
+        .relative_y = 0.0624017379870223,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9370837263813853,
+        .relative_y = 0.0624017379870223,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6874767744332962,
+        .relative_y = 0.1560043449675557,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9993997599039616,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7810124049619848,
+        .relative_y = 0.0935945806894186,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.7498142113988452,
+        .relative_y = 0.1247927742525582,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.9975006099019084,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_height = 0.6090604026845637,
+        .relative_y = 0.2119686800894855,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5019531250000000,
+        .relative_height = 0.5755033557046980,
+        .relative_x = 0.2480468750000000,
+        .relative_y = 0.2108501118568233,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6240234375000000,
+        .relative_height = 0.7695749440715883,
+        .relative_x = 0.2031250000000000,
+        .relative_y = 0.1420581655480984,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6718750000000000,
+        .relative_height = 0.7147651006711410,
+        .relative_x = 0.1875000000000000,
+        .relative_y = 0.1610738255033557,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6240234375000000,
+        .relative_height = 0.7695749440715883,
+        .relative_x = 0.2041015625000000,
+        .relative_y = 0.0883668903803132,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6718750000000000,
+        .relative_height = 0.7147651006711410,
+        .relative_x = 0.1406250000000000,
+        .relative_y = 0.1599552572706935,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.2436523437500000,
+        .relative_height = 0.4560546875000000,
+        .relative_x = 0.3813476562500000,
+        .relative_y = 0.2719726562500000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5029296875000000,
+        .relative_height = 0.5755033557046980,
+        .relative_x = 0.2500000000000000,
+        .relative_y = 0.2136465324384788,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7500000000000000,
+        .relative_x = 0.1250000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5000000000000000,
+        .relative_height = 0.5000000000000000,
+        .relative_x = 0.2500000000000000,
+        .relative_y = 0.2500000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.2436523437500000,
+        .relative_height = 0.4560546875000000,
+        .relative_x = 0.3750000000000000,
+        .relative_y = 0.2719726562500000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4560546875000000,
+        .relative_height = 0.2436523437500000,
+        .relative_x = 0.2719726562500000,
+        .relative_y = 0.3188476562500000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5019531250000000,
+        .relative_height = 0.5749440715883669,
+        .relative_x = 0.2480468750000000,
+        .relative_y = 0.2114093959731544,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.3593750000000000,
+        .relative_height = 0.6240234375000000,
+        .relative_x = 0.3750000000000000,
+        .relative_y = 0.1884765625000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6237816764132553,
+        .relative_height = 0.9988851727982163,
+        .relative_x = 0.1881091617933723,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5639648437500000,
+        .relative_height = 0.5649414062500000,
+        .relative_x = 0.2187500000000000,
+        .relative_y = 0.2177734375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5039062500000000,
+        .relative_height = 0.5771812080536913,
+        .relative_x = 0.2490234375000000,
+        .relative_y = 0.2091722595078300,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9926757812500000,
+        .relative_height = 0.2690429687500000,
+        .relative_y = 0.6865234375000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8732325694783033,
+        .relative_x = 0.0633837152608484,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.5843079922027290,
+        .relative_height = 0.9509476031215162,
+        .relative_x = 0.2066276803118908,
+        .relative_y = 0.0234113712374582,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.6250000000000000,
+        .relative_height = 0.3593750000000000,
+        .relative_x = 0.1875000000000000,
+        .relative_y = 0.3281250000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.3593750000000000,
+        .relative_height = 0.6240234375000000,
+        .relative_x = 0.2656250000000000,
+        .relative_y = 0.1875000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.4560546875000000,
+        .relative_height = 0.2436523437500000,
+        .relative_x = 0.2719726562500000,
+        .relative_y = 0.3750000000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7187500000000000,
+        .relative_height = 0.0937500000000000,
+        .relative_x = 0.1250000000000000,
+        .relative_y = 0.4687500000000000,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8313840155945419,
+        .relative_height = 0.9509476031215162,
+        .relative_x = 0.0843079922027290,
+        .relative_y = 0.0234113712374582,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.8727450024378351,
+        .relative_x = 0.0633837152608484,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.7142857142857143,
+        .relative_x = 0.1428571428571428,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9642857142857143,
+        .relative_height = 0.7407407407407407,
+        .relative_y = 0.1111111111111111,
+    } },
+    .{ .nerd_font = .{
+        .size = .fit_cover1,
+        .height = .icon,
+        .align_horizontal = .center1,
+        .align_vertical = .center1,
+        .relative_width = 0.9642857142857143,
+        .relative_height = 0.7407407407407407,
+        .relative_x = 0.0357142857142857,
+        .relative_y = 0.1111111111111111,
+    } },
+};
+
+/// Maps the high bits of a codepoint to its block in `stage2`.
+const stage1 = [_]u8{
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 1, 0, 2, 3, 0, 4, 5, 0, 0, 0, 6, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    7, 8, 9, 10, 8, 11, 12, 13, 14, 8, 15, 16, 17, 13, 18, 19,
+    20, 21, 22, 23, 24, 25, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 8, 0, 8, 8, 8, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    27, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 13,
+    13, 13, 13, 13, 13, 13, 13, 13, 13, 13, 28, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 29,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 29,
+};
+
+/// Blocks of 256 indices in to `classes`.
+const stage2 = [_]u16{
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 166, 166, 166, 166, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 3, 4, 4,
+    5, 5, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 166, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    6, 6, 6, 6, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 15, 16, 17, 18,
+    19, 20, 21, 22, 23, 24, 25, 26, 19, 1, 21, 1, 27, 28, 29, 6,
+    29, 29, 30, 1, 31, 1, 32, 33, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49,
+    50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65,
+    66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81,
+    82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 94, 95, 96,
+    97, 98, 166, 166, 99, 100, 166, 101, 166, 102, 166, 166, 103, 104, 166, 105,
+    166, 106, 107, 108, 109, 109, 109, 110, 109, 109, 111, 112, 166, 166, 60, 44,
+    113, 73, 114, 115, 116, 48, 117, 75, 166, 118, 166, 119, 120, 121, 122, 123,
+    124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 166, 136, 137, 138,
+    139, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 140, 140,
+    140, 140, 141, 141, 140, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152,
+    153, 154, 155, 155, 156, 155, 156, 155, 155, 110, 157, 158, 159, 160, 161, 162,
+    163, 163, 163, 162, 166, 162, 162, 162, 162, 162, 162, 162, 166, 166, 166, 166,
+    166, 164, 165, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    166, 167, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 168, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 1, 166, 166, 166, 1, 1, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 169, 170, 171, 172, 173, 174, 174,
+    173, 170, 175, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 176, 177, 178, 179, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 1, 166, 1, 1, 166, 166, 166, 166,
+    166, 166, 166, 166, 180, 180, 181, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 182, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 183, 184,
+    185, 183, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 186, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 187, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 188, 189, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 190, 166, 166, 166, 191, 192, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    193, 194, 195, 193, 194, 195, 196, 197, 198, 199, 200, 201, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    166, 166, 166, 166, 166, 202, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 203, 203, 166, 166, 166, 204, 166, 166, 166, 166,
+    166, 205, 205, 205, 166, 206, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 207, 166, 208, 166, 209, 210, 209, 211, 212, 212, 209, 213,
+    210, 209, 214, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    215, 215, 166, 216, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 217, 218, 166, 166, 166, 166, 166, 219, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 220, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 221, 221, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 222, 223, 224, 225, 166, 226, 227, 228, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    229, 229, 230, 231, 229, 229, 232, 232, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    233, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 234, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 208, 208, 166, 235, 236, 208, 237, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 238, 166, 239, 239, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 240, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 241, 242, 166, 241, 241, 241, 242, 241, 243, 241, 244, 241, 244, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 245, 245, 246, 247, 166, 245, 248, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 249, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 250, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 251, 252, 253, 254, 166, 166, 166, 255, 166, 166, 166, 166, 166, 256, 166,
+    166, 166, 166, 257, 258, 258, 166, 166, 166, 166, 259, 260, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 261, 166, 166, 166,
+    262, 263, 166, 166, 166, 166, 166, 264, 166, 166, 166, 166, 265, 166, 166, 166,
+    266, 166, 166, 166, 166, 166, 267, 166, 166, 166, 268, 269, 269, 270, 271, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 272, 166, 166, 166, 166,
+    166, 166, 166, 273, 166, 166, 166, 166, 166, 166, 274, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 258, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 275,
+    276, 277, 275, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 258, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166, 166,
+    166, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0,
+};
+
+/// Whether the glyph for the provided codepoint may be constrained to
+/// two cells. This is true for symbols, except for Nerd Font glyphs whose
+/// constraint limits them to a single cell anyway.
+pub fn mayBeDoubleWidth(cp: u21) bool {
+    const high = cp >> 8;
+    if (high >= double_width_stage1.len) return false;
+    const block = double_width_blocks[double_width_stage1[high]];
+    const word = block[(cp >> 6) & 0b11];
+    return ((word >> @as(u6, @truncate(cp))) & 1) != 0;
+}
+
+/// Maps the high bits of a codepoint to its block in `double_width_blocks`.
+const double_width_stage1 = [_]u8{
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 1, 0, 0, 2, 0, 3, 4, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 6, 0, 6, 6, 6, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 9,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6,
+    6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 6, 9,
+};
+
+/// Distinct blocks of 256 bits, least significant bit first.
+const double_width_blocks = [_][4]u64{
+    .{ 0x0000000000000000, 0x0000000000000000, 0x0000000000000000, 0x0000000000000000 },
+    .{ 0x0000000000000000, 0x0000000000000000, 0xffffffffffff0000, 0xffffffffffffffff },
+    .{ 0x0000000000000000, 0xffffffff00000000, 0xffffffffffffffff, 0xffffffffffffffff },
+    .{ 0xfffeffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff },
+    .{ 0xffffffffffffffff, 0xfffc0fffffffffff, 0xffffffffffffffff, 0x0000000000000000 },
+    .{ 0xffffffffffffffff, 0xffffffffffffffff, 0x0000ffffffffffff, 0xffffffffff2bffff },
+    .{ 0xffffffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff },
+    .{ 0xfffffffffffff000, 0xffffffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff },
+    .{ 0xffffffffffffffff, 0x000000000000ffff, 0xffffffffffffffff, 0xffffffffffffffff },
+    .{ 0xffffffffffffffff, 0xffffffffffffffff, 0xffffffffffffffff, 0x3fffffffffffffff },
+};
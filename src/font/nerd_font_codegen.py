@@ -10,20 +10,122 @@ be safe and not malicious or anything.
 This script requires Python 3.12 or greater, requires that the `fontTools`
 python module is installed, and requires that the path to a copy of the
 SymbolsNerdFont (not Mono!) font is passed as the first argument to it.
+
+Besides the constraints, the generated `getSymbolClass` classifies every other
+symbol codepoint too, so that the renderer needs a single lookup per cell, and
+`mayBeDoubleWidth` is a bitmap of the symbols that may be constrained to two
+cells, which lets the renderer skip most of `constraintWidth`.
+
+By default `getSymbolClass` is emitted as a two-level page table over a
+deduplicated pool of constraints, which makes the lookup O(1). Pass
+`--backend=switch` to instead emit a switch over codepoint ranges, or
+`--backend=blob` to write the ranges and constraints to nerd_font_attributes.bin
+and emit only a small decoder that embeds it. Built with Zig 0.15.2 on x86_64
+Linux, as a program looking up every codepoint with `getSymbolClass` and
+`mayBeDoubleWidth`, the backends compare as follows:
+
+    backend  ReleaseFast size  Debug size  lookup (ReleaseFast)
+    switch   +45.1 KB          +265.0 KB   16-33 ns
+    table    +49.2 KB          +138.0 KB   4-5 ns
+    blob     +32.8 KB          +54.9 KB    18 ns
+
+Sizes are the growth of the text and data segments over the same program
+without the lookups, and lookup times include the loop. Build times were
+within noise of each other on one core, except for the switch in ReleaseFast,
+which took 0.2 to 0.9 seconds longer than the others. All three give the same
+class for every codepoint.
+
+Pass `--bounds` to also write nerd_font_bounds.zig, a table of the outline
+bounding boxes of every Symbols Nerd Font glyph in font units. This is only a
+tool for inspecting the glyphs. The table isn't committed and nothing reads it,
+so the renderer still measures the outline of each glyph it constrains. Using
+it at render time would need a table generated from the exact Symbols Nerd
+Font that the build fetches. It could then only stand in for glyphs of that
+face, while the same codepoints from any other font still need measuring.
+
+Measured glyph bounds are cached in nerd_font_glyph_bounds.sqlite3 next to this
+script, keyed by the digest of the font, so reruns against the same font don't
+draw any outlines. The cache is shared with symbol_font_analyzer.py and
+nerd_font_constraint_sim.py, and keeps the bounds of the BOUNDS_CACHE_FONTS
+most recently measured fonts. Pass `--no-cache` to bypass it.
+
+Each run records the digests of its inputs and outputs, and the attributes it
+computed per patch set, in nerd_font_codegen.stamp.json. If nothing changed
+since, a rerun exits right away; otherwise only the patch sets whose
+definition or codepoint table changed are recomputed. Pass `--force` to
+regenerate everything.
+
+Pass `--fast-bounds` to use the bounding boxes stored in the glyf table (or the
+control boxes of CFF outlines) instead of drawing every outline. These include
+off-curve points, so they can be much larger than the exact bounds, by up to 82
+units in the Nerd Font patched fonts in src/font/res. That changes the generated
+constraints, so fast bounds are not safe for the committed output, and exact
+bounds stay the default. `--check-bounds` reports the differences for the given
+font and the fonts in src/font/res, and fails if a stored box lies inside its
+outline by more than FAST_BOUNDS_TOLERANCE.
+
+If NumPy is installed, the extents and relative metrics of each scale group
+are computed in vectorized passes. `--check-vectorized` checks that this gives
+exactly the same attributes as the plain Python fallback for the given font, and
+`nerd_font_codegen_bench.py --check` checks it on a synthetic font.
+
+Pass `--watch` to keep running after generating, and regenerate whenever
+font-patcher.py, the Symbols Nerd Font or a symbol font changes. Between runs
+the open fonts, extracted patch sets, codepoint tables, measured glyph bounds,
+per patch set attributes and emitted switch arms are kept in memory, so only
+what depends on the changed file is redone.
 """
 
+import argparse
 import ast
-import sys
+import cProfile
+import hashlib
+import importlib.util
+import io
+import json
+import marshal
 import math
+import os
+import resource
+import sqlite3
+import struct
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from fontTools.ttLib import TTFont, TTLibError
-from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib.ttGlyphSet import _TTGlyphSet
+from fontTools.pens.boundsPen import BoundsPen, ControlBoundsPen
+from abc import ABC, abstractmethod
 from collections import defaultdict
-from contextlib import suppress
+from contextlib import closing, contextmanager, suppress
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Literal, TypedDict, cast
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    TypedDict,
+    cast,
+)
 from urllib.request import urlretrieve
 
+try:
+    import numpy as np
+except ImportError:
+    # Optional, the relative metrics of scale groups are computed in plain
+    # Python without it.
+    np = None
+
 type PatchSetAttributes = dict[Literal["default"] | int, PatchSetAttributeEntry]
 type AttributeHash = tuple[
     str | None,
@@ -38,6 +140,9 @@ type AttributeHash = tuple[
     float,
 ]
 type ResolvedSymbol = PatchSetAttributes | PatchSetScaleRules | int | None
+type ZigConstraint = dict[str, str | int | float]
+type GlyphBounds = tuple[float, float, float, float]
+type BoundsMode = Literal["exact", "fast"]
 
 
 class PatchSetScaleRules(TypedDict):
@@ -68,6 +173,84 @@ class PatchSet(TypedDict):
     Attributes: PatchSetAttributes
 
 
+class PhaseRecord(TypedDict):
+    phase: str
+    wall: float
+    cpu: float
+    peak_rss: int
+
+
+class Profiler:
+    """Records the wall time, CPU time (including that of worker processes) and
+    the peak RSS so far of named phases of a run, when enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.records: list[PhaseRecord] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        wall = time.perf_counter()
+        cpu = cpu_time()
+        try:
+            yield
+        finally:
+            self.records.append(
+                {
+                    "phase": name,
+                    "wall": time.perf_counter() - wall,
+                    "cpu": cpu_time() - cpu,
+                    "peak_rss": peak_rss(),
+                }
+            )
+
+    def report(self) -> str:
+        """Format the records as a table, slowest phase first. Phases that ran
+        more than once, like patch sets sharing a name, are added up."""
+        totals: dict[str, tuple[int, float, float, int]] = {}
+        for r in self.records:
+            calls, wall, cpu, rss = totals.get(r["phase"], (0, 0.0, 0.0, 0))
+            totals[r["phase"]] = (
+                calls + 1,
+                wall + r["wall"],
+                cpu + r["cpu"],
+                max(rss, r["peak_rss"]),
+            )
+
+        width = max(map(len, totals), default=0)
+        s = (
+            f"{'phase':<{width}}  {'calls':>5}  {'wall (ms)':>10}  "
+            f"{'cpu (ms)':>10}  {'peak rss (MiB)':>14}\n"
+        )
+        for phase, (calls, wall, cpu, rss) in sorted(
+            totals.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            s += (
+                f"{phase:<{width}}  {calls:>5}  {wall * 1000:>10.1f}  "
+                f"{cpu * 1000:>10.1f}  {rss / 2**20:>14.1f}\n"
+            )
+        return s
+
+
+def cpu_time() -> float:
+    """CPU time of this process and of its terminated child processes."""
+    children = os.times()
+    return time.process_time() + children.children_user + children.children_system
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process so far, in bytes."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+profiler = Profiler()
+
+
 class PatchSetExtractor(ast.NodeVisitor):
     def __init__(self) -> None:
         self.symbol_table: dict[str, ast.expr] = {}
@@ -174,6 +357,55 @@ def extract_patch_set_values(source_code: str) -> tuple[list[PatchSet], str]:
     return extractor.patch_set_values, extractor.nf_version
 
 
+# The patch sets extracted from the font patcher by the last run, along with the
+# digest of the patcher they were extracted from.
+PATCH_SETS_CACHE_PATH = Path(__file__).with_name("nerd_font_patch_sets.marshal")
+
+
+def load_patch_sets(
+    patcher_path: Path, cache_path: Path | None = None
+) -> tuple[list[PatchSet], str]:
+    """Extract the patch sets and Nerd Fonts version from the font patcher at
+    `patcher_path`. If `cache_path` is given, the result is stored there, and
+    reused as long as the patcher is unchanged."""
+    source = patcher_path.read_bytes()
+    digest = hashlib.sha256(source).hexdigest()
+    if cache_path is not None:
+        with suppress(OSError, EOFError, ValueError, TypeError):
+            cached_digest, patch_sets, nf_version = marshal.loads(
+                cache_path.read_bytes()
+            )
+            if cached_digest == digest:
+                patch_sets = [
+                    map_scale_groups(entry, lambda group: range(*group))
+                    for entry in patch_sets
+                ]
+                return patch_sets, nf_version
+
+    patch_sets, nf_version = extract_patch_set_values(source.decode("utf-8"))
+    if cache_path is not None:
+        # Marshal doesn't support ranges, so store them as tuples.
+        stored = [
+            map_scale_groups(entry, lambda group: (group.start, group.stop, group.step))
+            for entry in patch_sets
+        ]
+        write_if_changed(cache_path, marshal.dumps((digest, stored, nf_version)))
+    return patch_sets, nf_version
+
+
+def map_scale_groups(
+    entry: PatchSet, convert: Callable[[Any], Any]
+) -> PatchSet:
+    """Copy a patch set, converting its scale groups that aren't lists."""
+    if entry["ScaleRules"] is None:
+        return entry
+    groups = [
+        group if isinstance(group, list) else convert(group)
+        for group in entry["ScaleRules"]["ScaleGroups"]
+    ]
+    return entry | {"ScaleRules": entry["ScaleRules"] | {"ScaleGroups": groups}}
+
+
 def parse_alignment(val: str) -> str | None:
     return {
         "l": ".start",
@@ -216,7 +448,8 @@ def coalesce_codepoints_to_ranges(codepoints: list[int]) -> list[tuple[int, int]
     return ranges
 
 
-def emit_zig_entry_multikey(codepoints: list[int], attr: PatchSetAttributeEntry) -> str:
+def attr_to_constraint(attr: PatchSetAttributeEntry) -> ZigConstraint:
+    """Map font_patcher attributes to the non-default fields of a Constraint."""
     align = parse_alignment(attr.get("align", ""))
     valign = parse_alignment(attr.get("valign", ""))
     stretch = attr.get("stretch", "")
@@ -231,13 +464,7 @@ def emit_zig_entry_multikey(codepoints: list[int], attr: PatchSetAttributeEntry)
     xy_ratio = params.get("xy-ratio", -1.0)
     y_padding = params.get("ypadding", 0.0)
 
-    ranges = coalesce_codepoints_to_ranges(codepoints)
-    keys = "\n".join(
-        f"        {start:#x}...{end:#x}," if start != end else f"        {start:#x},"
-        for start, end in ranges
-    )
-
-    s = f"{keys}\n        => .{{\n"
+    c: ZigConstraint = {}
 
     # This maps the font_patcher stretch rules to a Constrain instance
     # NOTE: some comments in font_patcher indicate that only x or y
@@ -245,11 +472,11 @@ def emit_zig_entry_multikey(codepoints: list[int], attr: PatchSetAttributeEntry)
     # support it until we have to.
     if "pa" in stretch:
         if "!" in stretch or overlap:
-            s += "            .size = .cover,\n"
+            c["size"] = ".cover"
         else:
-            s += "            .size = .fit_cover1,\n"
+            c["size"] = ".fit_cover1"
     elif "xy" in stretch:
-        s += "            .size = .stretch,\n"
+        c["size"] = ".stretch"
     else:
         print(f"Warning: Unknown stretch rule {stretch}")
 
@@ -257,61 +484,831 @@ def emit_zig_entry_multikey(codepoints: list[int], attr: PatchSetAttributeEntry)
     # full cell height, not just the icon height,
     # even when the constraint width is 1
     if "^" not in stretch:
-        s += "            .height = .icon,\n"
+        c["height"] = ".icon"
 
     # There are two cases where we want to limit the constraint width to 1:
     # - If there's a `1` in the stretch mode string.
     # - If the stretch mode is not `pa` and there's not an explicit `2`.
     if "1" in stretch or ("pa" not in stretch and "2" not in stretch):
-        s += "            .max_constraint_width = 1,\n"
+        c["max_constraint_width"] = 1
 
     if align is not None:
-        s += f"            .align_horizontal = {align},\n"
+        c["align_horizontal"] = align
     if valign is not None:
-        s += f"            .align_vertical = {valign},\n"
+        c["align_vertical"] = valign
 
     if relative_width != 1.0:
-        s += f"            .relative_width = {relative_width:.16f},\n"
+        c["relative_width"] = relative_width
     if relative_height != 1.0:
-        s += f"            .relative_height = {relative_height:.16f},\n"
+        c["relative_height"] = relative_height
     if relative_x != 0.0:
-        s += f"            .relative_x = {relative_x:.16f},\n"
+        c["relative_x"] = relative_x
     if relative_y != 0.0:
-        s += f"            .relative_y = {relative_y:.16f},\n"
+        c["relative_y"] = relative_y
 
     # `overlap` and `ypadding` are mutually exclusive,
     # this is asserted in the nerd fonts patcher itself.
     if overlap:
         pad = -overlap / 2
-        s += f"            .pad_left = {pad},\n"
-        s += f"            .pad_right = {pad},\n"
+        c["pad_left"] = pad
+        c["pad_right"] = pad
         # In the nerd fonts patcher, overlap values
         # are capped at 0.01 in the vertical direction.
         v_pad = -min(0.01, overlap) / 2
-        s += f"            .pad_top = {v_pad},\n"
-        s += f"            .pad_bottom = {v_pad},\n"
+        c["pad_top"] = v_pad
+        c["pad_bottom"] = v_pad
     elif y_padding:
-        s += f"            .pad_top = {y_padding / 2},\n"
-        s += f"            .pad_bottom = {y_padding / 2},\n"
+        c["pad_top"] = y_padding / 2
+        c["pad_bottom"] = y_padding / 2
 
     if xy_ratio > 0:
-        s += f"            .max_xy_ratio = {xy_ratio},\n"
+        c["max_xy_ratio"] = xy_ratio
+
+    return c
+
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """Replace the file at `path` with `content`, unless it already has exactly
+    that content, so that its mtime (and with it Zig's build cache) is left
+    alone. The file is replaced atomically, so that it's never left truncated.
+    Returns whether the file was written."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    with suppress(OSError):
+        if path.read_bytes() == data:
+            return False
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return True
+
+
+def format_zig_float(value: float, precision: int | None = None) -> str:
+    """Format a float for Zig, with a fixed number of decimals if `precision` is
+    given and as the shortest round-tripping representation otherwise. Negative
+    zero is written as zero, so that the output doesn't depend on the order of
+    operations that produced it."""
+    if value == 0:
+        value = 0.0
+    return repr(value) if precision is None else f"{value:.{precision}f}"
+
+
+def format_zig_constraint(c: ZigConstraint, indent: str) -> str:
+    """Format a constraint as a Zig struct literal at the given indentation."""
+    s = ".{\n"
+    for field, value in c.items():
+        if field.startswith("relative_"):
+            value = format_zig_float(value, 16)
+        elif isinstance(value, float):
+            value = format_zig_float(value)
+        s += f"{indent}    .{field} = {value},\n"
+    return s + f"{indent}}}"
+
+
+def emit_zig_switch_arm(codepoints: list[int], constraint: ZigConstraint) -> str:
+    ranges = coalesce_codepoints_to_ranges(codepoints)
+    keys = "\n".join(
+        f"        {start:#x}...{end:#x}," if start != end else f"        {start:#x},"
+        for start, end in ranges
+    )
+    return f"{keys}\n        => .{{ .nerd_font = {format_zig_constraint(constraint, '        ')} }},"
+
+
+# Codepoint ranges classified as symbols by `is_symbol` in
+# src/build/uucode_config.zig, which backs `isSymbol` in the renderer:
+# the private use areas, and a handful of symbol blocks. Keep in sync!
+SYMBOL_RANGES: list[tuple[int, int]] = [
+    (0x2190, 0x21FF),  # Arrows
+    (0x2460, 0x24FF),  # Enclosed Alphanumerics
+    (0x2600, 0x26FF),  # Miscellaneous Symbols
+    (0x2700, 0x27BF),  # Dingbats
+    (0xE000, 0xF8FF),  # Private Use Area
+    (0x1F100, 0x1F1FF),  # Enclosed Alphanumeric Supplement
+    (0x1F300, 0x1F5FF),  # Miscellaneous Symbols and Pictographs
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F680, 0x1F6FF),  # Transport and Map Symbols
+    (0xF0000, 0xFFFFD),  # Supplementary Private Use Area-A
+    (0x100000, 0x10FFFD),  # Supplementary Private Use Area-B
+]
 
-    s += "        },"
+
+def symbol_codepoints(exclude: set[int]) -> list[int]:
+    """All symbol codepoints, except the excluded (Nerd Font) ones."""
+    return [
+        cp
+        for start, end in SYMBOL_RANGES
+        for cp in range(start, end + 1)
+        if cp not in exclude
+    ]
+
+
+# Emitted switch arms by their codepoints and the repr of their constraint, or
+# ".symbol" for the arm of the remaining symbols.
+type SwitchArmMemo = dict[tuple[tuple[int, ...], str], str]
+
+
+def emit_zig_switch(
+    groups: list[tuple[list[int], ZigConstraint]],
+    memo: SwitchArmMemo | None = None,
+) -> str:
+    """Emit `getSymbolClass` as a switch. Arms found in `memo` are reused, and
+    afterwards it holds the arms of this switch, so that rerunning with a few
+    changed groups only emits their arms."""
+    used: SwitchArmMemo = {}
+    for codepoints, c in groups:
+        key = (tuple(codepoints), repr(c))
+        if memo and key in memo:
+            used[key] = memo[key]
+        else:
+            used[key] = emit_zig_switch_arm(codepoints, c)
+    constrained = tuple(sorted(cp for codepoints, _ in groups for cp in codepoints))
+    key = (constrained, ".symbol")
+    if memo and key in memo:
+        used[key] = memo[key]
+    else:
+        symbols = symbol_codepoints(set(constrained))
+        used[key] = (
+            "\n".join(
+                (
+                    f"        {start:#x}...{end:#x},"
+                    if start != end
+                    else f"        {start:#x},"
+                )
+                for start, end in coalesce_codepoints_to_ranges(symbols)
+            )
+            + "\n        => .symbol,"
+        )
+    if memo is not None:
+        memo.clear()
+        memo.update(used)
+    arms = list(used.values())
+    return (
+        """/// Get the symbol class of the provided codepoint.
+pub fn getSymbolClass(cp: u21) SymbolClass {
+    return switch (cp) {
+"""
+        + "\n".join(arms)
+        + "\n        else => .none,\n    };\n}\n"
+    )
+
+
+def format_zig_array(values: list[int] | list[str], per_line: int = 16) -> str:
+    """Format the body of a Zig array literal."""
+    return "".join(
+        "    " + ", ".join(str(v) for v in values[i : i + per_line]) + ",\n"
+        for i in range(0, len(values), per_line)
+    )
+
+
+def emit_zig_table(groups: list[tuple[list[int], ZigConstraint]]) -> str:
+    """Emit a two-level page table mapping codepoints to a pool of classes.
+
+    The codepoint space is split in to blocks of 256 codepoints. `stage1`
+    maps the high bits of a codepoint to one of the distinct blocks in
+    `stage2`, which holds an index in to the deduplicated `classes` pool
+    for each codepoint in the block. Indices 0 and 1 are reserved for
+    `.none` and `.symbol`, the Nerd Font constraints follow.
+    """
+    index: dict[int, int] = {}
+    for i, (codepoints, _) in enumerate(groups, start=2):
+        for cp in codepoints:
+            index[cp] = i
+    for cp in symbol_codepoints(set(index)):
+        index[cp] = 1
+
+    block_size = 256
+    blocks: dict[tuple[int, ...], int] = {}
+    stage1: list[int] = []
+    stage2: list[int] = []
+    for block_start in range(0, max(index) + 1, block_size):
+        block = tuple(
+            index.get(cp, 0) for cp in range(block_start, block_start + block_size)
+        )
+        if block not in blocks:
+            blocks[block] = len(blocks)
+            stage2.extend(block)
+        stage1.append(blocks[block])
+
+    stage1_type = "u8" if len(blocks) <= 0x100 else "u16"
+    stage2_type = "u8" if len(groups) + 2 <= 0x100 else "u16"
+
+    s = f"""/// Get the symbol class of the provided codepoint.
+pub fn getSymbolClass(cp: u21) SymbolClass {{
+    const high = cp >> 8;
+    if (high >= stage1.len) return .none;
+    const block: usize = stage1[high];
+    return classes[stage2[block * {block_size} + (cp & 0xFF)]];
+}}
+
+/// Deduplicated pool of symbol classes, indexed by `stage2`.
+const classes = [_]SymbolClass{{
+    .none,
+    .symbol,
+"""
+    for _, constraint in groups:
+        s += f"    .{{ .nerd_font = {format_zig_constraint(constraint, '    ')} }},\n"
+    s += f"""}};
+
+/// Maps the high bits of a codepoint to its block in `stage2`.
+const stage1 = [_]{stage1_type}{{
+{format_zig_array(stage1)}}};
+
+/// Blocks of {block_size} indices in to `classes`.
+const stage2 = [_]{stage2_type}{{
+{format_zig_array(stage2)}}};
+"""
     return s
 
 
+def emit_zig_bitmap(fn_doc: str, fn_name: str, prefix: str, codepoints: list[int]) -> str:
+    """Emit a function testing membership in a set of codepoints.
+
+    Like `emit_zig_table` this is a two-level table over blocks of 256
+    codepoints, but each distinct block is packed in to four u64 words.
+    """
+    bits: dict[int, int] = defaultdict(int)
+    for cp in codepoints:
+        bits[cp >> 8] |= 1 << (cp & 0xFF)
+
+    blocks: dict[int, int] = {0: 0}
+    stage1: list[int] = []
+    for high in range(max(bits) + 1):
+        stage1.append(blocks.setdefault(bits[high], len(blocks)))
+    assert len(blocks) <= 0x100
+
+    s = f"""{fn_doc}pub fn {fn_name}(cp: u21) bool {{
+    const high = cp >> 8;
+    if (high >= {prefix}_stage1.len) return false;
+    const block = {prefix}_blocks[{prefix}_stage1[high]];
+    const word = block[(cp >> 6) & 0b11];
+    return ((word >> @as(u6, @truncate(cp))) & 1) != 0;
+}}
+
+/// Maps the high bits of a codepoint to its block in `{prefix}_blocks`.
+const {prefix}_stage1 = [_]u8{{
+{format_zig_array(stage1)}}};
+
+/// Distinct blocks of 256 bits, least significant bit first.
+const {prefix}_blocks = [_][4]u64{{
+"""
+    for block in blocks:
+        words = ", ".join(f"0x{(block >> (64 * i)) & (2**64 - 1):016x}" for i in range(4))
+        s += f"    .{{ {words} }},\n"
+    return s + "};\n"
+
+
+def emit_zig_double_width_table(groups: list[tuple[list[int], ZigConstraint]]) -> str:
+    """Emit a bitmap of the codepoints whose glyphs may be constrained to two
+    cells: symbols, minus Nerd Font glyphs whose constraint limits them to one.
+    """
+    single_width = {
+        cp
+        for codepoints, c in groups
+        if c.get("max_constraint_width", 2) == 1
+        for cp in codepoints
+    }
+    return emit_zig_bitmap(
+        """/// Whether the glyph for the provided codepoint may be constrained to
+/// two cells. This is true for symbols, except for Nerd Font glyphs whose
+/// constraint limits them to a single cell anyway.
+""",
+        "mayBeDoubleWidth",
+        "double_width",
+        symbol_codepoints(single_width),
+    )
+
+
+def emit_zig_codepoints(cp_tables: Mapping[str, Mapping[int, int]]) -> str:
+    """Emit the set of Symbols Nerd Font codepoints as a bitmap."""
+    s = """//! This is a generated file, produced by nerd_font_codegen.py
+//! DO NOT EDIT BY HAND!
+//!
+//! This file specifies which codepoints the Symbols Nerd Font has glyphs
+//! for, extracted from the nerd fonts patcher script and the symbol fonts.
+
+"""
+    return s + emit_zig_bitmap(
+        """/// Whether the Symbols Nerd Font has a glyph for the provided codepoint.
+""",
+        "hasCodepoint",
+        "codepoints",
+        sorted(cp for table in cp_tables.values() for cp in table.values()),
+    )
+
+
+# Field order of the enums in face.zig's RenderOptions.Constraint, used
+# to encode enum fields as integers in the embedded constraint blob.
+CONSTRAINT_ENUMS: dict[str, tuple[str, ...]] = {
+    "size": (".none", ".fit", ".cover", ".fit_cover1", ".stretch"),
+    "align_vertical": (".none", ".start", ".end", ".center", ".center1"),
+    "align_horizontal": (".none", ".start", ".end", ".center", ".center1"),
+    "height": (".cell", ".icon"),
+}
+
+# Default values of the fields of face.zig's RenderOptions.Constraint.
+CONSTRAINT_DEFAULTS: ZigConstraint = {
+    "size": ".none",
+    "align_vertical": ".none",
+    "align_horizontal": ".none",
+    "height": ".cell",
+    "max_constraint_width": 2,
+    "pad_top": 0.0,
+    "pad_left": 0.0,
+    "pad_right": 0.0,
+    "pad_bottom": 0.0,
+    "relative_width": 1.0,
+    "relative_height": 1.0,
+    "relative_x": 0.0,
+    "relative_y": 0.0,
+}
+
+BLOB_MAGIC = b"GNFA"
+BLOB_HEADER = struct.Struct("<4sII")
+BLOB_RANGE = struct.Struct("<III")
+BLOB_CONSTRAINT = struct.Struct("<6B2x9d")
+
+# Range table index marking a symbol without a Nerd Font constraint.
+BLOB_SYMBOL_INDEX = 0xFFFFFFFF
+
+
+def merge_constraint_ranges(
+    groups: list[tuple[list[int], ZigConstraint]],
+    symbols: bool = True,
+) -> list[tuple[int, int, int]]:
+    """Flatten constraint groups and, if `symbols`, the remaining symbol
+    codepoints to a sorted list of (start, end, index) ranges, merging
+    adjacent ranges that map to the same constraint."""
+    index = [(cp, i) for i, (codepoints, _) in enumerate(groups) for cp in codepoints]
+    if symbols:
+        index.extend(
+            (cp, BLOB_SYMBOL_INDEX)
+            for cp in symbol_codepoints({cp for cp, _ in index})
+        )
+    ranges: list[tuple[int, int, int]] = []
+    for cp, i in sorted(index):
+        if ranges and ranges[-1][1] == cp - 1 and ranges[-1][2] == i:
+            ranges[-1] = (ranges[-1][0], cp, i)
+        else:
+            ranges.append((cp, cp, i))
+    return ranges
+
+
+def emit_constraint_blob(groups: list[tuple[list[int], ZigConstraint]]) -> bytes:
+    """Encode constraint groups as a sorted range table followed by
+    a pool of fixed-size constraint records, see `emit_zig_blob_decoder`."""
+    ranges = merge_constraint_ranges(groups)
+    blob = bytearray(BLOB_HEADER.pack(BLOB_MAGIC, len(ranges), len(groups)))
+    for r in ranges:
+        blob += BLOB_RANGE.pack(*r)
+    for _, constraint in groups:
+        blob += pack_constraint(constraint)
+    return bytes(blob)
+
+
+def pack_constraint(constraint: ZigConstraint) -> bytes:
+    """Encode a constraint as a fixed-size BLOB_CONSTRAINT record."""
+    c = CONSTRAINT_DEFAULTS | constraint
+    return BLOB_CONSTRAINT.pack(
+        *(CONSTRAINT_ENUMS[field].index(c[field]) for field in CONSTRAINT_ENUMS),
+        c["max_constraint_width"],
+        "max_xy_ratio" in c,
+        c["pad_top"],
+        c["pad_left"],
+        c["pad_right"],
+        c["pad_bottom"],
+        c["relative_width"],
+        c["relative_height"],
+        c["relative_x"],
+        c["relative_y"],
+        c.get("max_xy_ratio", 0.0),
+    )
+
+
+def emit_zig_blob_decoder(blob_name: str) -> str:
+    return f"""const std = @import("std");
+
+/// Sorted, non-overlapping codepoint ranges followed by a deduplicated
+/// pool of constraints. See `emit_constraint_blob` in the codegen script.
+const blob = @embedFile("{blob_name}");
+
+const header_size = {BLOB_HEADER.size};
+const range_size = {BLOB_RANGE.size};
+const constraint_size = {BLOB_CONSTRAINT.size};
+const range_count = std.mem.readInt(u32, blob[4..8], .little);
+const constraints_offset = header_size + range_count * range_size;
+const symbol_index = std.math.maxInt(u32);
+
+comptime {{
+    std.debug.assert(std.mem.eql(u8, blob[0..4], "{BLOB_MAGIC.decode()}"));
+}}
+
+/// Get the symbol class of the provided codepoint.
+pub fn getSymbolClass(cp: u21) SymbolClass {{
+    var lo: usize = 0;
+    var hi: usize = range_count;
+    while (lo < hi) {{
+        const mid = lo + (hi - lo) / 2;
+        const range = blob[header_size + mid * range_size ..][0..range_size];
+        if (cp < std.mem.readInt(u32, range[0..4], .little)) {{
+            hi = mid;
+        }} else if (cp > std.mem.readInt(u32, range[4..8], .little)) {{
+            lo = mid + 1;
+        }} else {{
+            const index = std.mem.readInt(u32, range[8..12], .little);
+            if (index == symbol_index) return .symbol;
+            return .{{ .nerd_font = decodeConstraint(index) }};
+        }}
+    }}
+    return .none;
+}}
+
+fn decodeConstraint(index: usize) Constraint {{
+    const c = blob[constraints_offset + index * constraint_size ..][0..constraint_size];
+    return .{{
+        .size = @enumFromInt(c[0]),
+        .align_vertical = @enumFromInt(c[1]),
+        .align_horizontal = @enumFromInt(c[2]),
+        .height = @enumFromInt(c[3]),
+        .max_constraint_width = @intCast(c[4]),
+        .pad_top = readFloat(c[8..16]),
+        .pad_left = readFloat(c[16..24]),
+        .pad_right = readFloat(c[24..32]),
+        .pad_bottom = readFloat(c[32..40]),
+        .relative_width = readFloat(c[40..48]),
+        .relative_height = readFloat(c[48..56]),
+        .relative_x = readFloat(c[56..64]),
+        .relative_y = readFloat(c[64..72]),
+        .max_xy_ratio = if (c[5] != 0) readFloat(c[72..80]) else null,
+    }};
+}}
+
+fn readFloat(bytes: *const [8]u8) f64 {{
+    return @bitCast(std.mem.readInt(u64, bytes, .little));
+}}
+"""
+
+
+ZIG_MODULE_HEADER = """//! This is a generated file, produced by nerd_font_codegen.py
+//! DO NOT EDIT BY HAND!
+//!
+//! This file provides info extracted from the nerd fonts patcher script,
+//! specifying the scaling/positioning attributes of various glyphs.
+
+const Constraint = @import("face.zig").RenderOptions.Constraint;
+
+/// How the glyph for a codepoint should be constrained when rendering.
+/// Symbols are classified consistently with `isSymbol` in renderer/cell.zig.
+pub const SymbolClass = union(enum) {
+    /// Not a symbol, the glyph is rendered unconstrained.
+    none,
+    /// A symbol without a Nerd Font constraint, which
+    /// is constrained to fit inside its cell(s).
+    symbol,
+    /// A Nerd Font glyph, with the constraint from the nerd fonts patcher.
+    nerd_font: Constraint,
+
+    /// The constraint to render a glyph of this class with.
+    pub fn constraint(self: SymbolClass) Constraint {
+        return switch (self) {
+            .none => .none,
+            .symbol => .{ .size = .fit },
+            .nerd_font => |c| c,
+        };
+    }
+};
+
+/// Get the constraints for the provided codepoint.
+pub fn getConstraint(cp: u21) ?Constraint {
+    return switch (getSymbolClass(cp)) {
+        .none, .symbol => null,
+        .nerd_font => |c| c,
+    };
+}
+
+"""
+
+
+def emit_zig_module(
+    backend: Literal["switch", "table", "blob"],
+    groups: list[tuple[list[int], ZigConstraint]],
+    blob_name: str,
+    switch_arms: SwitchArmMemo | None = None,
+) -> tuple[str, bytes | None]:
+    """Render nerd_font_attributes.zig and, for the blob backend, its blob.
+    See `emit_zig_switch` for `switch_arms`."""
+    double_width = "\n" + emit_zig_double_width_table(groups)
+    match backend:
+        case "switch":
+            return (
+                ZIG_MODULE_HEADER + emit_zig_switch(groups, switch_arms) + double_width,
+                None,
+            )
+        case "table":
+            return ZIG_MODULE_HEADER + emit_zig_table(groups) + double_width, None
+        case "blob":
+            return (
+                ZIG_MODULE_HEADER + emit_zig_blob_decoder(blob_name) + double_width,
+                emit_constraint_blob(groups),
+            )
+
+
+def read_codepoints(font_file: Path | BinaryIO) -> set[int]:
+    """Read the codepoints mapped by the cmap of a font.
+
+    Only the cmap and maxp tables are read. In particular we don't need glyph
+    names, which would otherwise be read from the post table or, for CFF fonts,
+    decompiled from the charset."""
+    with TTFont(font_file, lazy=True) as font:
+        font.setGlyphOrder([f"glyph{i:05d}" for i in range(font["maxp"].numGlyphs)])
+        return set(font.getBestCmap())
+
+
+def codepoint_table_ranges(table: Mapping[int, int]) -> list[tuple[int, int, int]]:
+    """Compress a codepoint table to sorted (start, end, target) triples, each
+    mapping the original codepoints start..end to target..target + end - start."""
+    ranges: list[tuple[int, int, int]] = []
+    for cp_original, cp_nerdfont in sorted(table.items()):
+        if ranges:
+            start, end, target = ranges[-1]
+            if cp_original == end + 1 and cp_nerdfont == target + cp_original - start:
+                ranges[-1] = (start, cp_original, target)
+                continue
+        ranges.append((cp_original, cp_original, cp_nerdfont))
+    return ranges
+
+
+CODEPOINT_TABLES_MODULE_FOOTER = '''
+class CodepointTable(Mapping[int, int]):
+    """Read-only dict view of the codepoint table of a patch set."""
+
+    def __init__(self, ranges: array) -> None:
+        self._ranges = ranges
+        self._starts = ranges[0::3]
+
+    def __getitem__(self, cp: int) -> int:
+        i = bisect_right(self._starts, cp) - 1
+        if i >= 0 and cp <= self._ranges[3 * i + 1]:
+            return self._ranges[3 * i + 2] + cp - self._starts[i]
+        raise KeyError(cp)
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(0, len(self._ranges), 3):
+            yield from range(self._ranges[i], self._ranges[i + 1] + 1)
+
+    def __len__(self) -> int:
+        return sum(
+            self._ranges[i + 1] - self._ranges[i] + 1
+            for i in range(0, len(self._ranges), 3)
+        )
+
+
+cp_tables = {name: CodepointTable(table) for name, table in ranges.items()}
+
+
+def lookup(set_name: str, cp: int) -> int | None:
+    """Get the Nerd Font codepoint of `cp` in the original font of a patch set."""
+    return cp_tables[set_name].get(cp)
+'''
+
+
+def format_source_digests(source_digests: dict[str, str]) -> str:
+    if not source_digests:
+        return "{}"
+    lines = [f'    "{name}": "{source_digests[name]}",' for name in sorted(source_digests)]
+    return "{\n" + "\n".join(lines) + "\n}"
+
+
+def emit_codepoint_tables_module(
+    cp_tables: Mapping[str, Mapping[int, int]],
+    nf_version: str,
+    digest: str,
+    source_digests: dict[str, str],
+) -> str:
+    s = f"""#! This is a generated file, produced by nerd_font_codegen.py
+#! DO NOT EDIT BY HAND!
+#!
+#! This file specifies the mapping of codepoints in the original symbol
+#! fonts to codepoints in a patched Nerd Font. This is extracted from
+#! the nerd fonts patcher script and the symbol font files.
+#!
+#! Each table is stored as sorted (start, end, target) triples, each mapping
+#! the original codepoints start..end to target..target + end - start.
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+
+version = "{nf_version}"
+
+# Digest of the patch set definitions the tables were extracted with, see
+# codepoint_tables_digest, and of each symbol font they were extracted from.
+digest = "{digest}"
+source_digests = {format_source_digests(source_digests)}
+
+ranges = {{
+"""
+    for name, table in cp_tables.items():
+        s += f'    "{name}": array(\n        "L",\n        [\n'
+        for triple in codepoint_table_ranges(table):
+            s += "            " + ", ".join(f"{cp:#x}" for cp in triple) + ",\n"
+        s += "        ],\n    ),\n"
+    return s + "}\n\n" + CODEPOINT_TABLES_MODULE_FOOTER
+
+
+# Where the original fonts of the patch sets are downloaded to, and where the
+# codepoint tables extracted from them are stored.
+SYMBOL_FONTS_PATH = Path(__file__).with_name("nerd_font_symbol_fonts")
+CODEPOINT_TABLES_PATH = Path(__file__).with_name("nerd_font_codepoint_tables.py")
+
+
+class SymbolFontSource(ABC):
+    """Where the original fonts of the patch sets are read from, by their path
+    relative to the src/glyphs/ directory of the nerd fonts repository."""
+
+    @abstractmethod
+    def read(self, filename: str) -> bytes: ...
+
+    @abstractmethod
+    def local_digest(self, filename: str) -> str | None:
+        """Digest of the font, or None if it isn't available without fetching
+        it. Used to check whether cached codepoint tables are still valid."""
+
+
+class DownloadedSymbolFonts(SymbolFontSource):
+    """Downloads the fonts from the release of the given Nerd Fonts version to
+    SYMBOL_FONTS_PATH, unless they have been downloaded before."""
+
+    def __init__(self, nf_version: str) -> None:
+        self.nf_version = nf_version
+
+    def read(self, filename: str) -> bytes:
+        SYMBOL_FONTS_PATH.mkdir(exist_ok=True)
+        target_file = SYMBOL_FONTS_PATH / Path(filename).name
+        if not target_file.exists():
+            print(f"Info: Downloading '{filename}'")
+            urlretrieve(
+                f"https://github.com/ryanoasis/nerd-fonts/raw/refs/tags/v{self.nf_version}/src/glyphs/{filename}",
+                target_file,
+            )
+        return target_file.read_bytes()
+
+    def local_digest(self, filename: str) -> str | None:
+        target_file = SYMBOL_FONTS_PATH / Path(filename).name
+        return file_digest(target_file) if target_file.is_file() else None
+
+
+class GlyphDirSymbolFonts(SymbolFontSource):
+    """Reads the fonts from a local copy of the src/glyphs/ directory, like
+    font-patcher's --glyphdir."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def read(self, filename: str) -> bytes:
+        return (self.path / filename).read_bytes()
+
+    def local_digest(self, filename: str) -> str | None:
+        path = self.path / filename
+        return file_digest(path) if path.is_file() else None
+
+
+class ArchivedSymbolFonts(SymbolFontSource):
+    """Reads the fonts straight out of a zip or tar archive of the src/glyphs/
+    directory, or of the whole nerd fonts repository, without extracting it."""
+
+    def __init__(self, path: Path) -> None:
+        self.lock = threading.Lock()
+        self.archive: zipfile.ZipFile | tarfile.TarFile
+        if zipfile.is_zipfile(path):
+            self.archive = zipfile.ZipFile(path)
+            names = self.archive.namelist()
+        else:
+            self.archive = tarfile.open(path)
+            names = [m.name for m in self.archive.getmembers() if m.isfile()]
+        # Map paths relative to src/glyphs/ to member names. Archives of just
+        # the glyph directory may or may not have it as top-level directory.
+        self.members: dict[str, str] = {}
+        for name in names:
+            _, sep, filename = name.rpartition("glyphs/")
+            self.members.setdefault(filename if sep else name, name)
+
+    def read(self, filename: str) -> bytes:
+        name = self.members.get(filename)
+        if name is None:
+            raise FileNotFoundError(f"'{filename}' is not in the glyph archive")
+        # Archive members are read through a shared file object.
+        with self.lock:
+            if isinstance(self.archive, zipfile.ZipFile):
+                return self.archive.read(name)
+            f = self.archive.extractfile(name)
+            assert f is not None
+            return f.read()
+
+    def local_digest(self, filename: str) -> str | None:
+        if filename not in self.members:
+            return None
+        return hashlib.sha256(self.read(filename)).hexdigest()
+
+
+def symbol_font_source(glyphdir: Path | None, nf_version: str) -> SymbolFontSource:
+    if glyphdir is None:
+        return DownloadedSymbolFonts(nf_version)
+    if glyphdir.is_dir():
+        return GlyphDirSymbolFonts(glyphdir)
+    return ArchivedSymbolFonts(glyphdir)
+
+
+def read_symbol_font(
+    source: SymbolFontSource, filename: str
+) -> tuple[str, set[int] | None]:
+    """Read a symbol font, returning its digest and the codepoints it maps."""
+    data = source.read(filename)
+    try:
+        codepoints = read_codepoints(io.BytesIO(data))
+    except TTLibError:
+        # Not a TTF/OTF font. This is OK if the patch set is exact, so we let
+        # it pass. If there's a problem, later checks will catch it.
+        codepoints = None
+    return hashlib.sha256(data).hexdigest(), codepoints
+
+
+def codepoint_tables_digest(patch_sets: list[PatchSet], nf_version: str) -> str:
+    """Digest of the parts of the patch set definitions that the codepoint tables
+    depend on. The symbol fonts are downloaded from the tag of `nf_version`."""
+    definitions = [
+        (
+            entry["Name"],
+            entry["Filename"],
+            entry["Exact"],
+            entry["SymStart"],
+            entry["SymEnd"],
+            entry["SrcStart"],
+        )
+        for entry in patch_sets
+    ]
+    return hashlib.sha256(repr((nf_version, definitions)).encode()).hexdigest()
+
+
+def load_codepoint_tables(
+    path: Path,
+    patch_sets: list[PatchSet],
+    digest: str,
+    source: SymbolFontSource,
+) -> Mapping[str, Mapping[int, int]] | None:
+    """Load the codepoint tables stored at `path`, if they were extracted from
+    the same patch set definitions and from the same copies of the symbol fonts
+    that `source` has locally."""
+    if not path.is_file():
+        return None
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if getattr(module, "digest", None) != digest:
+        return None
+    source_digests: dict[str, str] = getattr(module, "source_digests", {})
+    for filename in dict.fromkeys(entry["Filename"] for entry in patch_sets):
+        local_digest = source.local_digest(filename)
+        if local_digest is not None and local_digest != source_digests.get(
+            Path(filename).name
+        ):
+            print(f"Info: Symbol font '{filename}' changed")
+            return None
+    return module.cp_tables
+
+
 def generate_codepoint_tables(
     patch_sets: list[PatchSet],
     nerd_font: TTFont,
     nf_version: str,
-) -> dict[str, dict[int, int]]:
-    # We may already have the table saved from a previous run.
-    if Path("nerd_font_codepoint_tables.py").exists():
-        import nerd_font_codepoint_tables
+    source: SymbolFontSource | None = None,
+    tables_path: Path = CODEPOINT_TABLES_PATH,
+) -> Mapping[str, Mapping[int, int]]:
+    """Map the original codepoints of every patch set to their Symbols Nerd
+    Font codepoints, reusing the tables stored at `tables_path` if they are
+    still valid and storing them there otherwise."""
+    if source is None:
+        source = DownloadedSymbolFonts(nf_version)
 
-        if nerd_font_codepoint_tables.version == nf_version:
-            return nerd_font_codepoint_tables.cp_tables
+    # We may already have the table saved from a previous run.
+    digest = codepoint_tables_digest(patch_sets, nf_version)
+    cached = load_codepoint_tables(tables_path, patch_sets, digest, source)
+    if cached is not None:
+        return cached
+
+    # Several patch sets share a source font, so read each one once, and read
+    # (or download) them concurrently since they are independent.
+    filenames = list(dict.fromkeys(entry["Filename"] for entry in patch_sets))
+    with profiler.phase("read symbol fonts"), ThreadPoolExecutor() as pool:
+        symbol_fonts = dict(
+            zip(filenames, pool.map(partial(read_symbol_font, source), filenames))
+        )
+    source_digests = {
+        Path(filename).name: font_digest
+        for filename, (font_digest, _) in symbol_fonts.items()
+    }
 
     cp_tables: dict[str, dict[int, int]] = {}
     cp_nerdfont_used: set[int] = set()
@@ -319,25 +1316,7 @@ def generate_codepoint_tables(
     for entry in patch_sets:
         patch_set_name = entry["Name"]
         print(f"Info: Extracting codepoint table from patch set '{patch_set_name}'")
-
-        # Extract codepoint map from original font file; download if needed
-        source_filename = entry["Filename"]
-        target_folder = Path("nerd_font_symbol_fonts")
-        target_folder.mkdir(exist_ok=True)
-        target_file = target_folder / Path(source_filename).name
-        if not target_file.exists():
-            print(f"Info: Downloading '{source_filename}'")
-            urlretrieve(
-                f"https://github.com/ryanoasis/nerd-fonts/raw/refs/tags/v{nf_version}/src/glyphs/{source_filename}",
-                target_file,
-            )
-        try:
-            with TTFont(target_file) as patchfont:
-                patch_cmap = patchfont.getBestCmap()
-        except TTLibError:
-            # Not a TTF/OTF font. This is OK if this patch set is exact, so we
-            # let if pass. If there's a problem, later checks will catch it.
-            patch_cmap = None
+        _, patch_cmap = symbol_fonts[entry["Filename"]]
 
         # A glyph's scale rules are specified using its codepoint in
         # the original font, which is sometimes different from its
@@ -389,189 +1368,1169 @@ def generate_codepoint_tables(
             cp_nerdfont_used.add(cp_nerdfont)
 
     # Store the table and corresponding Nerd Fonts version together in a module.
-    with open("nerd_font_codepoint_tables.py", "w") as f:
+    write_if_changed(
+        tables_path,
+        emit_codepoint_tables_module(cp_tables, nf_version, digest, source_digests),
+    )
+
+    return cp_tables
+
+
+def measure_glyph(glyphs: _TTGlyphSet, glyph_name: str) -> GlyphBounds:
+    """Measure the outline bounds (xMin, yMin, xMax, yMax) of a glyph."""
+    pen = BoundsPen(glyphSet=glyphs)
+    glyphs[glyph_name].draw(pen)
+    if pen.bounds is None:
+        raise ValueError(f"Glyph '{glyph_name}' has no outline")
+    return pen.bounds
+
+
+def glyph_bounds_provider(
+    font: TTFont, mode: BoundsMode = "exact"
+) -> Callable[[str], GlyphBounds]:
+    """Get a function measuring the outline bounds of glyphs of `font`, which
+    raises ValueError for glyphs without an outline.
+
+    In "exact" mode the outline is drawn with a BoundsPen. In "fast" mode,
+    TrueType glyphs use the bounding box stored in their glyf record, without
+    decompiling the outline, and CFF glyphs use the box around their control
+    points. Both enclose the outline, but may be larger than it where
+    off-curve points stick out."""
+    glyphs = font.getGlyphSet()
+    if mode == "exact":
+        return lambda glyph_name: measure_glyph(glyphs, glyph_name)
+    if "glyf" in font:
+        glyf = font["glyf"]
+        return lambda glyph_name: stored_glyph_bounds(glyf, glyph_name)
+
+    def control_bounds(glyph_name: str) -> GlyphBounds:
+        pen = ControlBoundsPen(glyphSet=glyphs)
+        glyphs[glyph_name].draw(pen)
+        if pen.bounds is None:
+            raise ValueError(f"Glyph '{glyph_name}' has no outline")
+        return pen.bounds
+
+    return control_bounds
+
+
+def stored_glyph_bounds(glyf: Any, glyph_name: str) -> GlyphBounds:
+    """Read the bounding box stored in the glyf record of a glyph."""
+    glyph = glyf.glyphs[glyph_name]
+    if hasattr(glyph, "data"):
+        # Not expanded yet, so read the bounds from the record header rather
+        # than decompiling the whole glyph.
+        if not glyph.data:
+            raise ValueError(f"Glyph '{glyph_name}' has no outline")
+        _, x_min, y_min, x_max, y_max = struct.unpack(">hhhhh", glyph.data[:10])
+        return (x_min, y_min, x_max, y_max)
+    if glyph.numberOfContours == 0:
+        raise ValueError(f"Glyph '{glyph_name}' has no outline")
+    return (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax)
+
+
+RES_FONTS_PATH = Path(__file__).with_name("res")
+
+
+def res_font_paths() -> list[Path]:
+    """The TrueType and OpenType fonts in src/font/res."""
+    return sorted(
+        path for path in RES_FONTS_PATH.iterdir() if path.suffix in (".ttf", ".otf")
+    )
+
+
+# Boxes stored in the glyf table are in whole font units, while the extremes
+# of curves generally aren't, so a stored box can lie up to a unit inside the
+# exact bounds. This is the case for 181 glyphs of each of the JetBrains Mono
+# Nerd Font faces in src/font/res.
+FAST_BOUNDS_TOLERANCE = 1
+
+
+def check_bounds_providers(font_paths: Iterable[Path]) -> bool:
+    """Compare the "fast" bounds of every glyph in the fonts at `font_paths` to
+    their exact bounds, printing a summary per font. Returns whether the fast
+    bounds enclosed the exact ones for every glyph, up to
+    FAST_BOUNDS_TOLERANCE."""
+    ok = True
+    for font_path in font_paths:
+        with TTFont(font_path, lazy=True) as font:
+            kind = "glyf" if "glyf" in font else "CFF"
+            exact = glyph_bounds_provider(font, "exact")
+            fast = glyph_bounds_provider(font, "fast")
+            measured = 0
+            differing: list[str] = []
+            not_enclosing: list[str] = []
+            max_deviation = 0.0
+            for glyph_name in font.getGlyphOrder():
+                try:
+                    exact_bounds = exact(glyph_name)
+                except ValueError:
+                    continue
+                fast_bounds = fast(glyph_name)
+                measured += 1
+                if fast_bounds == tuple(exact_bounds):
+                    continue
+                differing.append(glyph_name)
+                deviation = (
+                    exact_bounds[0] - fast_bounds[0],
+                    exact_bounds[1] - fast_bounds[1],
+                    fast_bounds[2] - exact_bounds[2],
+                    fast_bounds[3] - exact_bounds[3],
+                )
+                max_deviation = max(max_deviation, *map(abs, deviation))
+                if min(deviation) < -FAST_BOUNDS_TOLERANCE:
+                    not_enclosing.append(glyph_name)
+
         print(
-            """#! This is a generated file, produced by nerd_font_codegen.py
-#! DO NOT EDIT BY HAND!
-#!
-#! This file specifies the mapping of codepoints in the original symbol
-#! fonts to codepoints in a patched Nerd Font. This is extracted from
-#! the nerd fonts patcher script and the symbol font files.""",
-            file=f,
+            f"Info: {font_path.name} ({kind}): {len(differing)} of {measured} "
+            f"glyphs differ, by at most {max_deviation:g} units"
+        )
+        if not_enclosing:
+            print(
+                f"Error: Fast bounds of {len(not_enclosing)} glyphs in "
+                f"{font_path.name} don't enclose their outline within "
+                f"{FAST_BOUNDS_TOLERANCE} units, such as "
+                + ", ".join(f"'{glyph_name}'" for glyph_name in not_enclosing[:5])
+            )
+            ok = False
+    return ok
+
+
+# Number of glyph names handed to a worker process at a time. Measuring a single
+# glyph is cheap, so batching keeps the pickling overhead per glyph low.
+MEASURE_CHUNK_SIZE = 256
+
+# The font opened by `_measure_chunk` in this process, keyed by its path and
+# the modification time and size of the file, so that a font rewritten in place
+# is opened again. Chunks are measured in-process for small or single-job runs.
+_worker_font: tuple[tuple[Path, int, int], TTFont] | None = None
+
+
+def _close_worker_font() -> None:
+    global _worker_font
+    if _worker_font is not None:
+        _worker_font[1].close()
+        _worker_font = None
+
+
+def _measure_chunk(
+    font_path: Path, mode: BoundsMode, glyph_names: list[str]
+) -> dict[str, GlyphBounds | None]:
+    global _worker_font
+    # Open the font lazily on the first chunk a worker receives and keep it
+    # around for the following ones, rather than pickling it from the parent.
+    stat = font_path.stat()
+    key = (font_path, stat.st_mtime_ns, stat.st_size)
+    if _worker_font is None or _worker_font[0] != key:
+        _close_worker_font()
+        _worker_font = (key, TTFont(font_path, lazy=True))
+    measure = glyph_bounds_provider(_worker_font[1], mode)
+    result: dict[str, GlyphBounds | None] = {}
+    for glyph_name in glyph_names:
+        try:
+            result[glyph_name] = measure(glyph_name)
+        except ValueError:
+            result[glyph_name] = None
+    return result
+
+
+# Glyph bounds measured by previous runs, keyed by the SHA-256 digest of the font
+# file, the bounds mode and the glyph name. Only the entries for the
+# BOUNDS_CACHE_FONTS most recently measured fonts are kept, so that the tools
+# sharing the cache don't evict each other's fonts.
+BOUNDS_CACHE_PATH = Path(__file__).with_name("nerd_font_glyph_bounds.sqlite3")
+BOUNDS_CACHE_VERSION = 3
+BOUNDS_CACHE_FONTS = 8
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# Glyph bounds measured so far in this run, per font path and bounds mode.
+_glyph_bounds_memo: dict[tuple[Path, BoundsMode], dict[str, GlyphBounds | None]] = {}
+
+
+def measure_glyphs(
+    font_path: Path,
+    glyph_names: Iterable[str],
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    mode: BoundsMode = "exact",
+) -> dict[str, GlyphBounds]:
+    """Measure the outline bounds of the named glyphs of the font at `font_path`,
+    spreading the work over `jobs` processes. Glyphs without an outline are
+    left out of the result. See `glyph_bounds_provider` for `mode`.
+
+    Each glyph is measured at most once per run. If `cache_path` is given,
+    bounds are also looked up in and added to the SQLite database there, so
+    that only glyphs not measured by any previous run are drawn."""
+    names = set(glyph_names)
+    memo = _glyph_bounds_memo.setdefault((font_path.resolve(), mode), {})
+    missing = sorted(names - memo.keys())
+    if missing:
+        if cache_path is None:
+            memo.update(_measure_glyphs(font_path, missing, jobs, mode))
+        else:
+            memo.update(
+                _load_glyph_bounds(font_path, missing, jobs, mode, cache_path)
+            )
+    return {
+        glyph_name: bounds
+        for glyph_name in sorted(names)
+        if (bounds := memo[glyph_name]) is not None
+    }
+
+
+def _load_glyph_bounds(
+    font_path: Path,
+    names: list[str],
+    jobs: int,
+    mode: BoundsMode,
+    cache_path: Path,
+) -> dict[str, GlyphBounds | None]:
+    digest = file_digest(font_path)
+    with closing(sqlite3.connect(cache_path)) as db, db:
+        if db.execute("PRAGMA user_version").fetchone()[0] != BOUNDS_CACHE_VERSION:
+            db.execute("DROP TABLE IF EXISTS glyph_bounds")
+            db.execute("DROP TABLE IF EXISTS fonts")
+            db.execute(f"PRAGMA user_version = {BOUNDS_CACHE_VERSION}")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS glyph_bounds ("
+            "font_digest TEXT NOT NULL, mode TEXT NOT NULL, "
+            "glyph_name TEXT NOT NULL, "
+            "x_min REAL, y_min REAL, x_max REAL, y_max REAL, "
+            "PRIMARY KEY (font_digest, mode, glyph_name))"
+        )
+        # The fonts with cached bounds, by when they were last measured.
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS fonts ("
+            "font_digest TEXT PRIMARY KEY, last_used INTEGER NOT NULL)"
+        )
+        db.execute(
+            "INSERT INTO fonts VALUES "
+            "(?, (SELECT COALESCE(MAX(last_used), 0) + 1 FROM fonts)) "
+            "ON CONFLICT (font_digest) DO UPDATE SET last_used = excluded.last_used",
+            (digest,),
+        )
+        db.execute(
+            "DELETE FROM fonts WHERE font_digest NOT IN "
+            "(SELECT font_digest FROM fonts ORDER BY last_used DESC LIMIT ?)",
+            (BOUNDS_CACHE_FONTS,),
+        )
+        db.execute(
+            "DELETE FROM glyph_bounds "
+            "WHERE font_digest NOT IN (SELECT font_digest FROM fonts)"
         )
-        print(f'version = "{nf_version}"', file=f)
-        print("cp_tables = {", file=f)
-        for name, table in cp_tables.items():
-            print(f'    "{name}": {{', file=f)
-            for key, value in table.items():
-                print(f"        {hex(key)}: {hex(value)},", file=f)
-            print("    },", file=f)
-        print("}", file=f)
 
-    return cp_tables
+        # Glyphs without an outline are cached too, with NULL bounds.
+        result: dict[str, GlyphBounds | None] = {
+            glyph_name: None if x_min is None else (x_min, y_min, x_max, y_max)
+            for glyph_name, x_min, y_min, x_max, y_max in db.execute(
+                "SELECT glyph_name, x_min, y_min, x_max, y_max "
+                "FROM glyph_bounds WHERE font_digest = ? AND mode = ?",
+                (digest, mode),
+            )
+        }
+        missing = [glyph_name for glyph_name in names if glyph_name not in result]
+        if missing:
+            measured = _measure_glyphs(font_path, missing, jobs, mode)
+            db.executemany(
+                "INSERT INTO glyph_bounds VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (digest, mode, glyph_name, *(bounds or (None,) * 4))
+                    for glyph_name, bounds in measured.items()
+                ),
+            )
+            result |= measured
+    return result
+
+
+def _measure_glyphs(
+    font_path: Path, names: list[str], jobs: int, mode: BoundsMode
+) -> dict[str, GlyphBounds | None]:
+    chunks = [
+        names[i : i + MEASURE_CHUNK_SIZE]
+        for i in range(0, len(names), MEASURE_CHUNK_SIZE)
+    ]
+    if jobs <= 1 or len(chunks) <= 1:
+        results = [_measure_chunk(font_path, mode, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as pool:
+            results = list(
+                pool.map(_measure_chunk, repeat(font_path), repeat(mode), chunks)
+            )
 
+    # Merge in name order, so the result doesn't depend on which worker
+    # finished first.
+    merged: dict[str, GlyphBounds | None] = {}
+    for result in results:
+        merged |= result
+    return merged
 
-def generate_zig_switch_arms(
-    patch_sets: list[PatchSet],
+
+def collect_glyph_bounds(
+    font_path: Path,
     nerd_font: TTFont,
-    nf_version: str,
-) -> str:
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    mode: BoundsMode = "exact",
+) -> dict[int, GlyphBounds]:
+    """Measure the outline bounds of every glyph in the font's cmap."""
     cmap = nerd_font.getBestCmap()
-    glyphs = nerd_font.getGlyphSet()
-    cp_tables = generate_codepoint_tables(patch_sets, nerd_font, nf_version)
+    bounds = measure_glyphs(font_path, cmap.values(), jobs, cache_path, mode)
+    return {
+        cp: bounds[glyph_name]
+        for cp, glyph_name in sorted(cmap.items())
+        if glyph_name in bounds
+    }
 
-    entries: dict[int, PatchSetAttributeEntry] = {}
+
+def emit_zig_bounds(units_per_em: int, bounds: dict[int, GlyphBounds]) -> str:
+    """Emit the outline bounds of the Symbols Nerd Font glyphs as a table
+    sorted by codepoint. Bounds are rounded outwards to whole font units."""
+    codepoints = sorted(bounds)
+    s = f"""//! This is a generated file, produced by nerd_font_codegen.py
+//! DO NOT EDIT BY HAND!
+//!
+//! This file provides the outline bounding boxes of the glyphs in the
+//! Symbols Nerd Font, measured at build time, for inspecting the glyphs.
+//! The renderer doesn't use it, it measures outlines as it renders them.
+
+const std = @import("std");
+
+/// The units per em of the Symbols Nerd Font, which bounds are given in.
+pub const units_per_em = {units_per_em};
+
+/// Outline bounding box of a glyph, in font units.
+pub const Bounds = struct {{
+    x_min: i16,
+    y_min: i16,
+    x_max: i16,
+    y_max: i16,
+}};
+
+/// Get the outline bounds of the glyph for the provided codepoint.
+pub fn getBounds(cp: u21) ?Bounds {{
+    const i = std.sort.binarySearch(u21, &codepoints, cp, (struct {{
+        fn compare(context: u21, item: u21) std.math.Order {{
+            return std.math.order(context, item);
+        }}
+    }}).compare) orelse return null;
+    const b = bounds[i];
+    return .{{ .x_min = b[0], .y_min = b[1], .x_max = b[2], .y_max = b[3] }};
+}}
+
+const codepoints = [_]u21{{
+{format_zig_array([f"{cp:#x}" for cp in codepoints], 8)}}};
+
+const bounds = [_][4]i16{{
+"""
+    for cp in codepoints:
+        x_min, y_min, x_max, y_max = bounds[cp]
+        s += (
+            f"    .{{ {math.floor(x_min)}, {math.floor(y_min)}, "
+            f"{math.ceil(x_max)}, {math.ceil(y_max)} }},\n"
+        )
+    return s + "};\n"
+
+
+def scale_group_glyph_names(
+    patch_sets: list[PatchSet],
+    nerd_font: TTFont,
+    cp_tables: Mapping[str, Mapping[int, int]],
+) -> set[str]:
+    """Names of the glyphs whose bounds `collect_attribute_entries` needs, so that
+    they can be measured up front."""
+    cmap = nerd_font.getBestCmap()
+    names: set[str] = set()
     for entry in patch_sets:
-        patch_set_name = entry["Name"]
-        print(f"Info: Extracting rules from patch set '{patch_set_name}'")
+        if entry["ScaleRules"] is None:
+            continue
+        cp_table = cp_tables[entry["Name"]]
+        for group in entry["ScaleRules"]["ScaleGroups"]:
+            for cp_original in group:
+                if cp_original in cp_table:
+                    names.add(cmap[cp_table[cp_original]])
+                elif entry["Name"] == "Progress Indicators" and cp_original == 0xEDFF:
+                    # Stand-in, see collect_attribute_entries.
+                    names.add(cmap[0xE0B0])
+    return names
+
+
+class RelativeMetrics(TypedDict, total=False):
+    relative_x: float
+    relative_y: float
+    relative_width: float
+    relative_height: float
 
-        attributes = entry["Attributes"]
-        patch_set_entries: dict[int, PatchSetAttributeEntry] = {}
 
-        cp_table = cp_tables[patch_set_name]
-        for cp_original in range(entry["SymStart"], entry["SymEnd"] + 1):
+class ScaleGroupMetrics(NamedTuple):
+    bounds: GlyphBounds
+    is_monospace: bool
+    # The relative position and size of each glyph in the group, by Symbols
+    # Nerd Font codepoint. Horizontal ones are only set if the group is
+    # monospace.
+    relative: dict[int, RelativeMetrics]
+
+
+# Scale group metrics and first-group index per patch set name and groups.
+type ScaleGroupMemo = dict[
+    tuple[str, tuple[tuple[int, ...], ...]],
+    tuple[list[ScaleGroupMetrics], dict[int, int]],
+]
+
+
+def scale_group_metrics(
+    codepoints: list[int],
+    bounds: list[GlyphBounds],
+    advances: list[float],
+    padding: list[GlyphBounds],
+) -> ScaleGroupMetrics:
+    """Compute the combined bounds of a scale group from the bounds and advance
+    widths of its glyphs, and the position and size of each glyph relative to
+    them. `padding` are the bounds of stand-ins that only add vertical extent."""
+    xMin = min((b[0] for b in bounds), default=math.inf)
+    yMin = min((b[1] for b in bounds + padding), default=math.inf)
+    xMax = max((b[2] for b in bounds), default=-math.inf)
+    yMax = max((b[3] for b in bounds + padding), default=-math.inf)
+    group_width = xMax - xMin
+    group_height = yMax - yMin
+    # Horizontal alignment should only be grouped if the group is monospace,
+    # that is, if all glyphs in the group have the same advance width.
+    group_is_monospace = len(codepoints) > 1 and len(set(advances)) == 1
+
+    relative: dict[int, RelativeMetrics] = {}
+    for cp, this_bounds in zip(codepoints, bounds):
+        this_height = this_bounds[3] - this_bounds[1]
+        metrics: RelativeMetrics = {
+            "relative_height": this_height / group_height,
+            "relative_y": (this_bounds[1] - yMin) / group_height,
+        }
+        if group_is_monospace:
+            this_width = this_bounds[2] - this_bounds[0]
+            metrics["relative_width"] = this_width / group_width
+            metrics["relative_x"] = (this_bounds[0] - xMin) / group_width
+        relative[cp] = metrics
+    return ScaleGroupMetrics((xMin, yMin, xMax, yMax), group_is_monospace, relative)
+
+
+def scale_group_metrics_numpy(
+    codepoints: list[int],
+    bounds: list[GlyphBounds],
+    advances: list[float],
+    padding: list[GlyphBounds],
+) -> ScaleGroupMetrics:
+    """Same as `scale_group_metrics`, but computes the extents and relative
+    metrics of the whole group in single NumPy passes. The results are the
+    same to the bit, since both do the same IEEE double operations."""
+    b = np.array(bounds, dtype=np.float64).reshape(-1, 4)
+    p = np.array(padding, dtype=np.float64).reshape(-1, 4)
+    xMin = float(b[:, 0].min(initial=math.inf))
+    yMin = float(min(b[:, 1].min(initial=math.inf), p[:, 1].min(initial=math.inf)))
+    xMax = float(b[:, 2].max(initial=-math.inf))
+    yMax = float(max(b[:, 3].max(initial=-math.inf), p[:, 3].max(initial=-math.inf)))
+    group_width = xMax - xMin
+    group_height = yMax - yMin
+    a = np.array(advances, dtype=np.float64)
+    group_is_monospace = len(codepoints) > 1 and bool((a == a[0]).all())
+
+    # Raise on a degenerate group like the Python version does, rather than
+    # quietly producing infinities.
+    with np.errstate(divide="raise", invalid="raise"):
+        columns = {
+            "relative_height": ((b[:, 3] - b[:, 1]) / group_height).tolist(),
+            "relative_y": ((b[:, 1] - yMin) / group_height).tolist(),
+        }
+        if group_is_monospace:
+            columns["relative_width"] = ((b[:, 2] - b[:, 0]) / group_width).tolist()
+            columns["relative_x"] = ((b[:, 0] - xMin) / group_width).tolist()
+    relative = {
+        cp: cast(RelativeMetrics, dict(zip(columns, row)))
+        for cp, row in zip(codepoints, zip(*columns.values()))
+    }
+    return ScaleGroupMetrics((xMin, yMin, xMax, yMax), group_is_monospace, relative)
+
+
+def measure_scale_groups(
+    patch_set_name: str,
+    scale_groups: list[list[int] | range],
+    cp_table: Mapping[int, int],
+    cmap: dict[int, str],
+    glyphs: _TTGlyphSet,
+    glyph_bounds: dict[str, GlyphBounds],
+    vectorized: bool = np is not None,
+) -> tuple[list[ScaleGroupMetrics], dict[int, int]]:
+    """Compute the combined bounds of each scale group and the relative metrics
+    of its glyphs, and map each original codepoint to the index of the first
+    group it is found in. Codepoints whose glyph has no outline are skipped.
+
+    With `vectorized`, the per-group math is done with NumPy."""
+    group_metrics = scale_group_metrics_numpy if vectorized else scale_group_metrics
+    metrics: list[ScaleGroupMetrics] = []
+    first_group: dict[int, int] = {}
+    for i, group in enumerate(scale_groups):
+        # Glyph names by Symbols Nerd Font codepoint, without duplicates.
+        members: dict[int, str] = {}
+        padding: list[GlyphBounds] = []
+        for cp_original in group:
             if cp_original not in cp_table:
+                # There is one special case where a scale group includes
+                # a glyph from the original font that's not in any patch
+                # set, and hence not in the Symbols Only font. The point
+                # of this glyph is to add extra vertical padding to a
+                # stretched (^xy) scale group, which means that its
+                # scaled and aligned position would span the line height
+                # plus overlap. Thus, we can use any other stretched
+                # glyph with overlap as stand-in to get the vertical
+                # bounds, such as as 0xE0B0 (powerline left hard
+                # divider). We don't worry about the horizontal bounds,
+                # as they by design should not affect the group's
+                # bounding box.
+                if patch_set_name == "Progress Indicators" and cp_original == 0xEDFF:
+                    padding.append(glyph_bounds[cmap[0xE0B0]])
+                else:
+                    # Other cases are due to lazily specified scale
+                    # groups with gaps in the codepoint range.
+                    print(
+                        f"Info: Skipping scale group codepoint {hex(cp_original)}, which does not exist in patch set '{patch_set_name}'"
+                    )
                 continue
             cp_nerdfont = cp_table[cp_original]
+            if cmap[cp_nerdfont] not in glyph_bounds:
+                # A glyph without an outline has no extent to add to the group,
+                # nor to scale relative to it, so it is left out, like in
+                # symbol_font_analyzer.glyph_runs.
+                print(
+                    f"Info: Skipping scale group codepoint {hex(cp_original)}, "
+                    f"which has no outline in patch set '{patch_set_name}'"
+                )
+                continue
+            first_group.setdefault(cp_original, i)
+            members[cp_nerdfont] = cmap[cp_nerdfont]
+
+        metrics.append(
+            group_metrics(
+                list(members),
+                [glyph_bounds[name] for name in members.values()],
+                [glyphs[name].width for name in members.values()],
+                padding,
+            )
+        )
+    return metrics, first_group
+
+
+def patch_set_digest(entry: PatchSet, cp_table: Mapping[int, int]) -> str:
+    """Digest of everything the attribute entries of a patch set depend on,
+    besides the Symbols Nerd Font itself."""
+    return hashlib.sha256(repr((entry, sorted(cp_table.items()))).encode()).hexdigest()
+
+
+def collect_patch_set_entries(
+    entry: PatchSet,
+    cp_table: Mapping[int, int],
+    cmap: dict[int, str],
+    glyphs: _TTGlyphSet,
+    glyph_bounds: dict[str, GlyphBounds],
+    scale_group_memo: ScaleGroupMemo,
+    vectorized: bool = np is not None,
+) -> dict[int, PatchSetAttributeEntry]:
+    patch_set_name = entry["Name"]
+    print(f"Info: Extracting rules from patch set '{patch_set_name}'")
+
+    attributes = entry["Attributes"]
+    patch_set_entries: dict[int, PatchSetAttributeEntry] = {}
+
+    for cp_original in range(entry["SymStart"], entry["SymEnd"] + 1):
+        if cp_original not in cp_table:
+            continue
+        cp_nerdfont = cp_table[cp_original]
+        if cp_original in attributes:
+            patch_set_entries[cp_nerdfont] = attributes[cp_original].copy()
+        else:
+            patch_set_entries[cp_nerdfont] = attributes["default"].copy()
+
+    if entry["ScaleRules"] is not None:
+        # Several patch sets share both their name, and hence codepoint
+        # table, and their scale rules (e.g., the Octicons ranges), so we
+        # only measure each distinct set of groups once.
+        scale_groups = entry["ScaleRules"]["ScaleGroups"]
+        key = (patch_set_name, tuple(tuple(group) for group in scale_groups))
+        if key not in scale_group_memo:
+            scale_group_memo[key] = measure_scale_groups(
+                patch_set_name,
+                scale_groups,
+                cp_table,
+                cmap,
+                glyphs,
+                glyph_bounds,
+                vectorized,
+            )
+        group_metrics, first_group = scale_group_memo[key]
+
+        # Codepoints may contribute to the bounding box of multiple groups,
+        # but should be scaled according to the first group they are found
+        # in.
+        for cp_original, group_index in first_group.items():
+            if cp_original not in cp_table:
+                continue
+            cp_nerdfont = cp_table[cp_original]
+            # Scale groups may cut across patch sets, but we're only
+            # updating a single patch set at a time, so we skip codepoints
+            # not in it.
+            if cp_nerdfont not in patch_set_entries:
+                continue
+            patch_set_entries[cp_nerdfont].update(
+                group_metrics[group_index].relative[cp_nerdfont]
+            )
+
+    return patch_set_entries
+
+
+def collect_attribute_entries(
+    patch_sets: list[PatchSet],
+    nerd_font: TTFont,
+    cp_tables: Mapping[str, Mapping[int, int]],
+    glyph_bounds: dict[str, GlyphBounds],
+    patch_set_cache: dict[str, dict[int, PatchSetAttributeEntry]] | None = None,
+    vectorized: bool = np is not None,
+) -> dict[int, PatchSetAttributeEntry]:
+    """Collect the attributes of every codepoint in `patch_sets`.
+
+    If `patch_set_cache` is given, the entries of patch sets whose digest is in
+    it are reused rather than recomputed, and those of the others are added.
+    With `vectorized`, the relative metrics of scale groups are computed with
+    NumPy."""
+    cmap = nerd_font.getBestCmap()
+    glyphs = nerd_font.getGlyphSet()
+
+    scale_group_memo: ScaleGroupMemo = {}
+    entries: dict[int, PatchSetAttributeEntry] = {}
+    for entry in patch_sets:
+        patch_set_name = entry["Name"]
+        cp_table = cp_tables[patch_set_name]
+        digest = patch_set_digest(entry, cp_table)
+        if patch_set_cache is not None and digest in patch_set_cache:
+            patch_set_entries = patch_set_cache[digest]
+        else:
+            with profiler.phase(f"patch set: {patch_set_name}"):
+                patch_set_entries = collect_patch_set_entries(
+                    entry,
+                    cp_table,
+                    cmap,
+                    glyphs,
+                    glyph_bounds,
+                    scale_group_memo,
+                    vectorized,
+                )
+            if patch_set_cache is not None:
+                patch_set_cache[digest] = patch_set_entries
+
+        for cp_nerdfont in patch_set_entries:
             if cp_nerdfont in entries:
                 raise ValueError(
                     f"Overlap for codepoint {hex(cp_nerdfont)} in patch set '{patch_set_name}'"
                 )
-            if cp_original in attributes:
-                patch_set_entries[cp_nerdfont] = attributes[cp_original].copy()
-            else:
-                patch_set_entries[cp_nerdfont] = attributes["default"].copy()
-
-        if entry["ScaleRules"] is not None:
-            for group in entry["ScaleRules"]["ScaleGroups"]:
-                xMin = math.inf
-                yMin = math.inf
-                xMax = -math.inf
-                yMax = -math.inf
-                individual_bounds: dict[int, tuple[int, int, int, int]] = {}
-                individual_advances: set[float] = set()
-                for cp_original in group:
-                    if cp_original not in cp_table:
-                        # There is one special case where a scale group includes
-                        # a glyph from the original font that's not in any patch
-                        # set, and hence not in the Symbols Only font. The point
-                        # of this glyph is to add extra vertical padding to a
-                        # stretched (^xy) scale group, which means that its
-                        # scaled and aligned position would span the line height
-                        # plus overlap. Thus, we can use any other stretched
-                        # glyph with overlap as stand-in to get the vertical
-                        # bounds, such as as 0xE0B0 (powerline left hard
-                        # divider). We don't worry about the horizontal bounds,
-                        # as they by design should not affect the group's
-                        # bounding box.
-                        if (
-                            patch_set_name == "Progress Indicators"
-                            and cp_original == 0xEDFF
-                        ):
-                            glyph = glyphs[cmap[0xE0B0]]
-                            bounds = BoundsPen(glyphSet=glyphs)
-                            glyph.draw(bounds)
-                            yMin = min(bounds.bounds[1], yMin)
-                            yMax = max(bounds.bounds[3], yMax)
-                        else:
-                            # Other cases are due to lazily specified scale
-                            # groups with gaps in the codepoint range.
-                            print(
-                                f"Info: Skipping scale group codepoint {hex(cp_original)}, which does not exist in patch set '{patch_set_name}'"
-                            )
-                        continue
-
-                    cp_nerdfont = cp_table[cp_original]
-                    glyph = glyphs[cmap[cp_nerdfont]]
-                    individual_advances.add(glyph.width)
-                    bounds = BoundsPen(glyphSet=glyphs)
-                    glyph.draw(bounds)
-                    individual_bounds[cp_nerdfont] = bounds.bounds
-                    xMin = min(bounds.bounds[0], xMin)
-                    yMin = min(bounds.bounds[1], yMin)
-                    xMax = max(bounds.bounds[2], xMax)
-                    yMax = max(bounds.bounds[3], yMax)
-                group_width = xMax - xMin
-                group_height = yMax - yMin
-                group_is_monospace = (len(individual_bounds) > 1) and (
-                    len(individual_advances) == 1
-                )
-                for cp_original in group:
-                    if cp_original not in cp_table:
-                        continue
-                    cp_nerdfont = cp_table[cp_original]
-                    if (
-                        # Scale groups may cut across patch sets, but we're only
-                        # updating a single patch set at a time, so we skip
-                        # codepoints not in it.
-                        cp_nerdfont not in patch_set_entries
-                        # Codepoints may contribute to the bounding box of multiple groups,
-                        # but should be scaled according to the first group they are found
-                        # in. Hence, to avoid overwriting, we need to skip codepoints that
-                        # have already been assigned a scale group.
-                        or "relative_height" in patch_set_entries[cp_nerdfont]
-                    ):
-                        continue
-                    this_bounds = individual_bounds[cp_nerdfont]
-                    this_height = this_bounds[3] - this_bounds[1]
-                    patch_set_entries[cp_nerdfont]["relative_height"] = (
-                        this_height / group_height
-                    )
-                    patch_set_entries[cp_nerdfont]["relative_y"] = (
-                        this_bounds[1] - yMin
-                    ) / group_height
-                    # Horizontal alignment should only be grouped if the group is monospace,
-                    # that is, if all glyphs in the group have the same advance width.
-                    if group_is_monospace:
-                        this_width = this_bounds[2] - this_bounds[0]
-                        patch_set_entries[cp_nerdfont]["relative_width"] = (
-                            this_width / group_width
-                        )
-                        patch_set_entries[cp_nerdfont]["relative_x"] = (
-                            this_bounds[0] - xMin
-                        ) / group_width
         entries |= patch_set_entries
 
-    # Group codepoints by attribute key
+    return entries
+
+
+def group_attribute_entries(
+    entries: dict[int, PatchSetAttributeEntry],
+) -> list[list[int]]:
+    """Group codepoints by attribute key, ordered by their lowest codepoint."""
     grouped = defaultdict[AttributeHash, list[int]](list)
     for cp, attr in entries.items():
         grouped[attr_key(attr)].append(cp)
+    return sorted(grouped.values())
 
-    # Emit zig switch arms
-    result: list[str] = []
-    for codepoints in sorted(grouped.values()):
-        # Use one of the attrs in the group to emit the value
-        attr = entries[codepoints[0]]
-        result.append(emit_zig_entry_multikey(codepoints, attr))
 
-    return "\n".join(result)
+def check_vectorized_metrics(
+    patch_sets: list[PatchSet],
+    nerd_font: TTFont,
+    cp_tables: Mapping[str, Mapping[int, int]],
+    glyph_bounds: dict[str, GlyphBounds],
+) -> bool:
+    """Compare the attribute entries computed with and without NumPy, printing
+    the codepoints where they differ. Returns whether they are identical."""
+    if np is None:
+        print("Error: NumPy is not installed")
+        return False
+    python = collect_attribute_entries(
+        patch_sets, nerd_font, cp_tables, glyph_bounds, vectorized=False
+    )
+    vectorized = collect_attribute_entries(
+        patch_sets, nerd_font, cp_tables, glyph_bounds, vectorized=True
+    )
+    differing = [cp for cp in python if python[cp] != vectorized.get(cp)]
+    differing += [cp for cp in vectorized if cp not in python]
+    print(
+        f"Info: {len(differing)} of {len(python)} codepoints differ between the "
+        "NumPy and plain Python metrics"
+    )
+    for cp in differing[:5]:
+        print(f"Error: {hex(cp)}: {python.get(cp)} != {vectorized.get(cp)}")
+    return not differing
 
 
-if __name__ == "__main__":
-    project_root = Path(__file__).resolve().parents[2]
+def generate_constraint_groups(
+    patch_sets: list[PatchSet],
+    nerd_font: TTFont,
+    cp_tables: Mapping[str, Mapping[int, int]],
+    font_path: Path,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    mode: BoundsMode = "exact",
+    patch_set_cache: dict[str, dict[int, PatchSetAttributeEntry]] | None = None,
+) -> list[tuple[list[int], ZigConstraint]]:
+    # Only measure the glyphs of patch sets that we need to recompute.
+    stale = [
+        entry
+        for entry in patch_sets
+        if patch_set_cache is None
+        or patch_set_digest(entry, cp_tables[entry["Name"]]) not in patch_set_cache
+    ]
+    with profiler.phase("measure glyphs"):
+        glyph_bounds = measure_glyphs(
+            font_path,
+            scale_group_glyph_names(stale, nerd_font, cp_tables),
+            jobs,
+            cache_path,
+            mode,
+        )
+    with profiler.phase("collect attributes"):
+        entries = collect_attribute_entries(
+            patch_sets, nerd_font, cp_tables, glyph_bounds, patch_set_cache
+        )
+    with profiler.phase("group attributes"):
+        return [
+            (codepoints, attr_to_constraint(entries[codepoints[0]]))
+            for codepoints in group_attribute_entries(entries)
+        ]
+
+
+# Digests of the inputs and outputs of the last run, along with the attribute
+# entries it computed for each patch set, so that reruns can skip the work
+# whose inputs didn't change.
+STAMP_PATH = Path(__file__).with_name("nerd_font_codegen.stamp.json")
+
+
+def combined_digest(paths: Iterable[Path], *extra: str) -> str:
+    """Digest of the contents of the files at `paths` plus `extra`. Files that
+    don't exist are included as such."""
+    h = hashlib.sha256()
+    for path in paths:
+        digest = file_digest(path) if path.is_file() else "missing"
+        h.update(f"{path.name}:{digest}\n".encode())
+    for value in extra:
+        h.update(f"{value}\n".encode())
+    return h.hexdigest()
+
+
+def read_stamp(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_stamp(
+    path: Path,
+    toolchain: str,
+    inputs: str,
+    outputs: list[Path],
+    patch_set_cache: dict[str, dict[int, PatchSetAttributeEntry]],
+) -> None:
+    stamp = {
+        "toolchain": toolchain,
+        "inputs": inputs,
+        "outputs": {output.name: file_digest(output) for output in outputs},
+        "patch_sets": patch_set_cache,
+    }
+    write_if_changed(path, json.dumps(stamp))
+
+
+def stamp_patch_set_cache(
+    stamp: dict[str, Any],
+) -> dict[str, dict[int, PatchSetAttributeEntry]]:
+    return {
+        digest: {int(cp): entry for cp, entry in entries.items()}
+        for digest, entries in stamp.get("patch_sets", {}).items()
+    }
 
-    nf_path = sys.argv[1]
 
-    nerd_font = TTFont(nf_path)
+def outputs_unchanged(directory: Path, outputs: dict[str, str]) -> bool:
+    return bool(outputs) and all(
+        (directory / name).is_file() and file_digest(directory / name) == digest
+        for name, digest in outputs.items()
+    )
 
-    patcher_path = project_root / "vendor" / "nerd-fonts" / "font-patcher.py"
-    source = patcher_path.read_text(encoding="utf-8")
-    patch_set, nf_version = extract_patch_set_values(source)
 
-    out_path = project_root / "src" / "font" / "nerd_font_attributes.zig"
+class Codegen:
+    """A configuration of the codegen, along with the state `--watch` keeps
+    between runs: the open Symbols Nerd Font, the extracted patch sets and
+    codepoint tables, the attribute entries of each patch set and the emitted
+    switch arms. Measured glyph bounds are kept in `_glyph_bounds_memo`."""
+
+    def __init__(self, args: argparse.Namespace, project_root: Path) -> None:
+        self.args = args
+        self.nerd_font_path: Path = args.nerd_font
+        self.patcher_path = project_root / "vendor" / "nerd-fonts" / "font-patcher.py"
+        self.out_path = project_root / "src" / "font" / "nerd_font_attributes.zig"
+        self.cache_path = None if args.no_cache else BOUNDS_CACHE_PATH
+        self.bounds_mode: BoundsMode = "fast" if args.fast_bounds else "exact"
+
+        self.nerd_font: TTFont | None = None
+        self.patch_sets: tuple[list[PatchSet], str] | None = None
+        self.cp_tables: Mapping[str, Mapping[int, int]] | None = None
+        self.patch_set_cache: dict[str, dict[int, PatchSetAttributeEntry]] | None = (
+            None
+        )
+        self.switch_arms: SwitchArmMemo = {}
+
+    def symbol_font_paths(self) -> list[Path]:
+        """The local copies of the symbol fonts."""
+        glyphdir: Path | None = self.args.glyphdir
+        paths = []
+        if SYMBOL_FONTS_PATH.is_dir():
+            paths += sorted(SYMBOL_FONTS_PATH.iterdir())
+        if glyphdir is not None and glyphdir.is_dir():
+            paths += sorted(path for path in glyphdir.rglob("*") if path.is_file())
+        elif glyphdir is not None:
+            paths.append(glyphdir)
+        return paths
+
+    def watched_paths(self) -> list[Path]:
+        return [
+            Path(__file__).resolve(),
+            self.patcher_path,
+            self.nerd_font_path,
+            *self.symbol_font_paths(),
+        ]
+
+    def invalidate(self, changed: set[Path]) -> None:
+        """Drop the state that depends on the `changed` files."""
+        if self.nerd_font_path in changed:
+            if self.nerd_font is not None:
+                self.nerd_font.close()
+            self.nerd_font = None
+            _glyph_bounds_memo.pop(
+                (self.nerd_font_path.resolve(), self.bounds_mode), None
+            )
+            _close_worker_font()
+            # The attribute entries of every patch set depend on the font.
+            self.patch_set_cache = None
+            self.cp_tables = None
+        if self.patcher_path in changed:
+            self.patch_sets = None
+            self.cp_tables = None
+        if changed - {self.nerd_font_path, self.patcher_path}:
+            # A symbol font.
+            self.cp_tables = None
+
+    def prepare(self) -> tuple[TTFont, list[PatchSet], Mapping[str, Mapping[int, int]]]:
+        """Open the Symbols Nerd Font, and extract the patch sets and codepoint
+        tables, unless they are still around from the previous run."""
+        if self.nerd_font is None:
+            # Open lazily, so that only the tables that are used (cmap, glyf or
+            # CFF, and hmtx) are decompiled, and glyphs only as they are
+            # measured.
+            self.nerd_font = TTFont(self.nerd_font_path, lazy=True)
+
+        if self.patch_sets is None:
+            with profiler.phase("extract patch sets"):
+                self.patch_sets = load_patch_sets(
+                    self.patcher_path,
+                    None if self.args.no_cache else PATCH_SETS_CACHE_PATH,
+                )
+        patch_sets, nf_version = self.patch_sets
+
+        if self.cp_tables is None:
+            with profiler.phase("codepoint tables"):
+                self.cp_tables = generate_codepoint_tables(
+                    patch_sets,
+                    self.nerd_font,
+                    nf_version,
+                    symbol_font_source(self.args.glyphdir, nf_version),
+                )
+        return self.nerd_font, patch_sets, self.cp_tables
+
+    def inputs_digest(self, toolchain_digest: str) -> str:
+        """Digest of everything besides the toolchain that affects the output."""
+        return combined_digest(
+            [self.patcher_path, CODEPOINT_TABLES_PATH, *self.symbol_font_paths()],
+            toolchain_digest,
+            self.args.backend,
+            str(self.args.bounds),
+        )
 
-    with out_path.open("w", encoding="utf-8") as f:
-        f.write("""//! This is a generated file, produced by nerd_font_codegen.py
-//! DO NOT EDIT BY HAND!
-//!
-//! This file provides info extracted from the nerd fonts patcher script,
-//! specifying the scaling/positioning attributes of various glyphs.
+    def run(self, force: bool = False) -> None:
+        """Regenerate the outputs whose inputs changed since the last run."""
+        args = self.args
+        blob_path = self.out_path.with_suffix(".bin")
 
-const Constraint = @import("face.zig").RenderOptions.Constraint;
+        # The toolchain digest covers what every patch set's attribute entries
+        # depend on, the inputs digest everything else that affects the output.
+        toolchain_digest = combined_digest(
+            [Path(__file__).resolve(), self.nerd_font_path], self.bounds_mode
+        )
+        inputs_digest = self.inputs_digest(toolchain_digest)
+        stamp = {} if force else read_stamp(STAMP_PATH)
+        if stamp.get("inputs") == inputs_digest and outputs_unchanged(
+            self.out_path.parent, stamp.get("outputs", {})
+        ):
+            print("Info: Generated files are up to date")
+            return
+        if self.patch_set_cache is None:
+            self.patch_set_cache = (
+                stamp_patch_set_cache(stamp)
+                if stamp.get("toolchain") == toolchain_digest
+                else {}
+            )
 
-/// Get the constraints for the provided codepoint.
-pub fn getConstraint(cp: u21) ?Constraint {
-    return switch (cp) {
-""")
-        f.write(generate_zig_switch_arms(patch_set, nerd_font, nf_version))
-        f.write("\n        else => null,\n    };\n}\n")
+        nerd_font, patch_sets, cp_tables = self.prepare()
+        codepoints_path = self.out_path.with_name("nerd_font_codepoints.zig")
+        with profiler.phase("emit codepoints"):
+            write_if_changed(codepoints_path, emit_zig_codepoints(cp_tables))
+        outputs = [self.out_path, codepoints_path]
+
+        groups = generate_constraint_groups(
+            patch_sets,
+            nerd_font,
+            cp_tables,
+            self.nerd_font_path,
+            args.jobs,
+            self.cache_path,
+            self.bounds_mode,
+            self.patch_set_cache,
+        )
+        with profiler.phase("emit attributes"):
+            zig, blob = emit_zig_module(
+                args.backend, groups, blob_path.name, self.switch_arms
+            )
+            write_if_changed(self.out_path, zig)
+        if blob is not None:
+            write_if_changed(blob_path, blob)
+            outputs.append(blob_path)
+        else:
+            # Don't leave a stale blob around from a previous run.
+            blob_path.unlink(missing_ok=True)
+
+        if args.bounds:
+            bounds_path = self.out_path.with_name("nerd_font_bounds.zig")
+            outputs.append(bounds_path)
+            with profiler.phase("emit bounds"):
+                write_if_changed(
+                    bounds_path,
+                    emit_zig_bounds(
+                        nerd_font["head"].unitsPerEm,
+                        collect_glyph_bounds(
+                            self.nerd_font_path,
+                            nerd_font,
+                            args.jobs,
+                            self.cache_path,
+                            self.bounds_mode,
+                        ),
+                    ),
+                )
+
+        # Only keep the entries of the current patch sets around.
+        self.patch_set_cache = {
+            digest: self.patch_set_cache[digest]
+            for digest in (
+                patch_set_digest(entry, cp_tables[entry["Name"]])
+                for entry in patch_sets
+            )
+        }
+        # Generating may have rewritten the codepoint tables or downloaded
+        # symbol fonts, so record the inputs as they are now, or the next run
+        # would find them changed.
+        write_stamp(
+            STAMP_PATH,
+            toolchain_digest,
+            self.inputs_digest(toolchain_digest),
+            outputs,
+            self.patch_set_cache,
+        )
+
+
+def file_snapshot(paths: Iterable[Path]) -> dict[Path, tuple[int, int]]:
+    """The modification time and size of each of `paths` that exists."""
+    snapshot: dict[Path, tuple[int, int]] = {}
+    for path in paths:
+        with suppress(OSError):
+            st = path.stat()
+            snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+def watch(codegen: Codegen, interval: float) -> None:
+    """Rerun `codegen` whenever one of its inputs changes, polling them every
+    `interval` seconds, until interrupted. If this script itself changes, it is
+    restarted to pick up the new code."""
+    script = Path(__file__).resolve()
+    seen = file_snapshot(codegen.watched_paths())
+    print(f"Info: Watching {len(seen)} files for changes")
+    while True:
+        time.sleep(interval)
+        current = file_snapshot(codegen.watched_paths())
+        changed = {
+            path
+            for path in seen.keys() | current.keys()
+            if seen.get(path) != current.get(path)
+        }
+        if not changed:
+            continue
+        seen = current
+        if script in changed:
+            print(f"Info: {script.name} changed, restarting")
+            os.execv(sys.executable, [sys.executable, *sys.argv])
+
+        print("Info: Changed: " + ", ".join(sorted(path.name for path in changed)))
+        codegen.invalidate(changed)
+        start = time.perf_counter()
+        try:
+            codegen.run()
+        except Exception as e:
+            # Most likely an input that was saved halfway through an edit, so
+            # keep watching for the next save.
+            print(f"Error: {type(e).__name__}: {e}")
+            continue
+        print(f"Info: Regenerated in {(time.perf_counter() - start) * 1000:.0f}ms")
+        if profiler.enabled:
+            print(profiler.report(), end="")
+            profiler.records.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate nerd_font_attributes.zig from the nerd fonts patcher."
+    )
+    parser.add_argument(
+        "nerd_font",
+        type=Path,
+        help="path to a copy of the SymbolsNerdFont (not Mono!) font",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("switch", "table", "blob"),
+        default="table",
+        help="emit getSymbolClass as a switch over codepoint ranges, as a "
+        "two-level lookup table, or as a decoder for an embedded binary "
+        "range table (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--bounds",
+        action="store_true",
+        help="also emit the outline bounds of every glyph to nerd_font_bounds.zig",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes to measure glyph outlines with "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"measure every glyph outline even if it is in {BOUNDS_CACHE_PATH.name}, "
+        f"and extract the patch sets even if they are in {PATCH_SETS_CACHE_PATH.name}",
+    )
+    parser.add_argument(
+        "--glyphdir",
+        type=Path,
+        help="read the symbol fonts from this copy of the nerd fonts src/glyphs/ "
+        "directory, or from a zip or tar archive of it, instead of downloading "
+        "them",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="regenerate everything, even if no input changed since the last run",
+    )
+    parser.add_argument(
+        "--fast-bounds",
+        action="store_true",
+        help="use the bounding boxes stored in the font (glyf) or the control "
+        "boxes (CFF) rather than exact outline bounds, which can change the "
+        "generated constraints",
+    )
+    parser.add_argument(
+        "--check-bounds",
+        action="store_true",
+        help="compare fast and exact bounds for the given font and the fonts "
+        "in src/font/res, then exit",
+    )
+    parser.add_argument(
+        "--check-vectorized",
+        action="store_true",
+        help="check that the scale group metrics computed with NumPy match the "
+        "plain Python ones for the given font, then exit",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="print the wall time, CPU time and peak RSS of each phase and patch "
+        "set; if PATH ends in .json, also write them there, otherwise write a "
+        "cProfile dump of the run there",
+    )
+    parser.add_argument(
+        "--watch",
+        nargs="?",
+        const=0.25,
+        type=float,
+        metavar="SECONDS",
+        help="after generating, keep running and regenerate whenever the patcher "
+        "or a font changes, checking every SECONDS (default: %(const)s)",
+    )
+    args = parser.parse_args()
+    profiler.enabled = args.profile is not None
+    cprofile = None
+    if args.profile and not args.profile.endswith(".json"):
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+
+    project_root = Path(__file__).resolve().parents[2]
+
+    if args.check_bounds:
+        ok = check_bounds_providers([args.nerd_font, *res_font_paths()])
+        sys.exit(0 if ok else 1)
+
+    codegen = Codegen(args, project_root)
+
+    if args.check_vectorized:
+        nerd_font, patch_sets, cp_tables = codegen.prepare()
+        glyph_bounds = measure_glyphs(
+            args.nerd_font,
+            scale_group_glyph_names(patch_sets, nerd_font, cp_tables),
+            args.jobs,
+            codegen.cache_path,
+            codegen.bounds_mode,
+        )
+        sys.exit(
+            0
+            if check_vectorized_metrics(patch_sets, nerd_font, cp_tables, glyph_bounds)
+            else 1
+        )
+
+    codegen.run(args.force)
+
+    if profiler.enabled:
+        print(profiler.report(), end="")
+    if args.profile and args.profile.endswith(".json"):
+        Path(args.profile).write_text(
+            json.dumps(profiler.records, indent=2) + "\n", encoding="utf-8"
+        )
+    elif cprofile is not None:
+        cprofile.disable()
+        cprofile.dump_stats(args.profile)
+
+    if args.watch is not None:
+        profiler.records.clear()
+        with suppress(KeyboardInterrupt):
+            watch(codegen, args.watch)
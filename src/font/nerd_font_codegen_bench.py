@@ -0,0 +1,602 @@
+"""
+This file benchmarks nerd_font_codegen.py without the real Nerd Fonts. It builds
+a synthetic Symbols Nerd Font, the symbol fonts its patch sets are taken from
+and a font-patcher.py defining those patch sets, at a range of glyph counts, and
+times each stage of the codegen on them:
+
+- `extract_patch_set_values`, parsing the patch sets out of font-patcher.py
+- `generate_codepoint_tables`, mapping original to Nerd Font codepoints
+- `generate_constraint_groups`, measuring the glyphs and grouping attributes
+- `emit_zig_module`, once per backend
+
+It prints the best time of each stage at each size, along with how the time
+scales with the glyph count, as the exponent k of the best fit of t ~ n^k. A
+stage that used to scale linearly and now has k near 2 has a regression, even if
+the small sizes still look fast.
+
+Pass `--save PATH` to store the timings as JSON, and `--baseline PATH` to
+compare against such a file. The benchmark then exits with a non-zero status if
+any stage got slower than the baseline by more than `--tolerance`.
+
+Pass `--check` to run the regression checks instead, which build their own
+fonts where they need any:
+
+- `fast_bounds`: the fast bounds of the fonts in src/font/res enclose their
+  outlines, up to `FAST_BOUNDS_TOLERANCE`
+- `vectorized_metrics`: the attributes computed with NumPy are exactly those of
+  the plain Python fallback, on a synthetic font (skipped without NumPy)
+- `rewritten_font`: a font rewritten in place is measured again rather than
+  through the copy opened before, as happens under `--watch`
+
+A TrueType font has at most 65,535 glyphs, so the largest default size is
+65,000 glyphs rather than 100,000.
+
+This script requires Python 3.12 or greater and the `fontTools` python module,
+and has to live next to nerd_font_codegen.py.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import TTFont
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Mapping, NamedTuple
+
+import nerd_font_codegen as codegen
+
+# Where the synthetic glyphs are put in the Symbols Nerd Font, and where the
+# original codepoints of the patch sets start. Both are big enough for 65,534
+# glyphs, the most a TrueType font can have besides .notdef.
+NERD_FONT_START = 0xF0000
+ORIGINAL_START = 0x20000
+
+# Every this many original codepoints there's a gap without a glyph, which the
+# packed patch sets have to skip.
+GAP_EVERY = 8
+
+# Every this many original codepoints has its own attributes.
+OVERRIDE_EVERY = 32
+
+BACKENDS = ("switch", "table", "blob")
+
+
+class Layout(NamedTuple):
+    """The shape of the synthetic fonts and patch sets."""
+
+    glyphs: int
+    patch_sets: int
+    contours: int
+    points: int
+    group_size: int
+
+
+class PatchSetLayout(NamedTuple):
+    name: str
+    filename: str
+    exact: bool
+    # Original codepoints, in order, and the Nerd Font codepoint of the first.
+    codepoints: list[int]
+    src_start: int
+    monospace: bool
+    scaled: bool
+
+
+def plan_patch_sets(layout: Layout) -> list[PatchSetLayout]:
+    """Split the glyphs over the patch sets. Every fourth patch set is exact,
+    the others are packed with gaps, and every third one has no scale rules."""
+    plans: list[PatchSetLayout] = []
+    src_start = NERD_FONT_START
+    original_start = ORIGINAL_START
+    per_set, extra = divmod(layout.glyphs, layout.patch_sets)
+    for k in range(layout.patch_sets):
+        count = per_set + (k < extra)
+        exact = k % 4 == 0
+        if exact:
+            codepoints = list(range(src_start, src_start + count))
+        else:
+            codepoints = []
+            cp = original_start
+            while len(codepoints) < count:
+                if (cp - original_start) % GAP_EVERY != GAP_EVERY - 1:
+                    codepoints.append(cp)
+                cp += 1
+            original_start = cp + 1
+        plans.append(
+            PatchSetLayout(
+                f"Set {k}",
+                f"set-{k}.ttf",
+                exact,
+                codepoints,
+                src_start,
+                k % 2 == 0,
+                k % 3 != 2,
+            )
+        )
+        src_start += count
+    return plans
+
+
+def draw_glyph(rng: random.Random, layout: Layout) -> tuple[object, int]:
+    """Draw a glyph of random quadratic contours, returning it along with its
+    left side bearing."""
+    pen = TTGlyphPen(None)
+    x_min = math.inf
+    for _ in range(layout.contours):
+        cx = rng.randrange(100, 900)
+        cy = rng.randrange(0, 700)
+        radius = rng.randrange(50, 300)
+        points = []
+        for i in range(layout.points):
+            angle = 2 * math.pi * i / layout.points
+            r = radius * rng.uniform(0.5, 1.5)
+            points.append(
+                (round(cx + r * math.cos(angle)), round(cy + r * math.sin(angle)))
+            )
+        x_min = min(x_min, *(x for x, _ in points))
+        # Alternate on- and off-curve points, so that the exact bounds need
+        # the curves to be evaluated.
+        pen.moveTo(points[0])
+        for i in range(1, len(points) - 1, 2):
+            pen.qCurveTo(points[i], points[i + 1])
+        pen.closePath()
+    return pen.glyph(), int(x_min)
+
+
+def build_font(
+    path: Path,
+    cmap: dict[int, str],
+    glyphs: dict[str, object],
+    metrics: dict[str, tuple[int, int]],
+) -> None:
+    glyph_order = [".notdef", *glyphs]
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap(cmap)
+    fb.setupGlyf({".notdef": TTGlyphPen(None).glyph(), **glyphs})
+    fb.setupHorizontalMetrics({".notdef": (500, 0), **metrics})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Bench Symbols", "styleName": "Regular"})
+    fb.setupOS2(
+        sTypoAscender=800, sTypoDescender=-200, usWinAscent=800, usWinDescent=200
+    )
+    fb.setupPost()
+    fb.save(str(path))
+
+
+def build_fonts(directory: Path, layout: Layout, plans: list[PatchSetLayout]) -> Path:
+    """Build the Symbols Nerd Font and the symbol fonts of the patch sets in
+    `directory`, returning the path of the former."""
+    rng = random.Random(repr(layout))
+    cmap: dict[int, str] = {}
+    glyphs: dict[str, object] = {}
+    metrics: dict[str, tuple[int, int]] = {}
+    for k, plan in enumerate(plans):
+        for i, _ in enumerate(plan.codepoints):
+            name = f"s{k}g{i}"
+            cmap[plan.src_start + i] = name
+            glyphs[name], lsb = draw_glyph(rng, layout)
+            advance = 1000 if plan.monospace else 600 + 100 * (i % 5)
+            metrics[name] = (advance, lsb)
+
+        # Only the cmaps of the symbol fonts are read, so their glyphs can be
+        # empty.
+        names = [f"g{i}" for i in range(len(plan.codepoints))]
+        empty = TTGlyphPen(None).glyph()
+        build_font(
+            directory / plan.filename,
+            dict(zip(plan.codepoints, names)),
+            dict.fromkeys(names, empty),
+            dict.fromkeys(names, (1000, 0)),
+        )
+
+    nerd_font_path = directory / "SymbolsNerdFont-Regular.ttf"
+    build_font(nerd_font_path, cmap, glyphs, metrics)
+    return nerd_font_path
+
+
+ATTRIBUTE_DEFAULTS = (
+    "{'align': 'c', 'valign': 'c', 'stretch': 'pa', 'params': {}}",
+    "{'align': 'c', 'valign': 'c', 'stretch': '^pa', 'params': {'overlap': 0.02}}",
+    "{'align': 'l', 'valign': 'c', 'stretch': 'xy2', 'params': {'xy-ratio': 0.7}}",
+    "{'align': 'c', 'valign': 'c', 'stretch': 'pa1', 'params': {'ypadding': 0.3}}",
+)
+ATTRIBUTE_OVERRIDE = (
+    "{'align': 'r', 'valign': 'c', 'stretch': '^xy', 'params': {'overlap': 0.01}}"
+)
+
+
+def generate_patcher(plans: list[PatchSetLayout], layout: Layout) -> str:
+    """Generate a font-patcher.py defining the patch sets, with scale rules and
+    attributes in named variables like the real one."""
+    s = 'version = "3.4.0"\n\n\nclass font_patcher:\n    def setup_patch_set(self):\n'
+    for k, plan in enumerate(plans):
+        if plan.scaled:
+            # Alternate between ranges, which include the gaps, and lists.
+            groups = []
+            for i in range(0, len(plan.codepoints), layout.group_size):
+                group = plan.codepoints[i : i + layout.group_size]
+                if (i // layout.group_size) % 2:
+                    groups.append("[" + ", ".join(map(hex, group)) + "]")
+                else:
+                    groups.append(f"range({hex(group[0])}, {hex(group[-1] + 1)})")
+            s += (
+                f"        SCALE_{k} = {{'ShiftMode': '', 'ScaleGroups': [\n"
+                + "".join(f"            {group},\n" for group in groups)
+                + "        ]}\n"
+            )
+        default = ATTRIBUTE_DEFAULTS[k % len(ATTRIBUTE_DEFAULTS)]
+        s += (
+            f"        ATTR_{k} = {{\n"
+            f"            'default': {default},\n"
+            + "".join(
+                f"            {hex(cp)}: {ATTRIBUTE_OVERRIDE},\n"
+                for cp in plan.codepoints[::OVERRIDE_EVERY]
+            )
+            + "        }\n"
+        )
+    s += "        self.patch_set = [\n"
+    for k, plan in enumerate(plans):
+        s += (
+            f"            {{'Enabled': True, 'Name': {plan.name!r}, "
+            f"'Filename': {plan.filename!r}, 'Exact': {plan.exact}, "
+            f"'SymStart': {hex(plan.codepoints[0])}, "
+            f"'SymEnd': {hex(plan.codepoints[-1])}, "
+            f"'SrcStart': {None if plan.exact else hex(plan.src_start)}, "
+            f"'ScaleRules': {f'SCALE_{k}' if plan.scaled else None}, "
+            f"'Attributes': ATTR_{k}}},\n"
+        )
+    return s + "        ]\n"
+
+
+def best_time(
+    run: Callable[[], object],
+    repeat: int,
+    setup: Callable[[], None] = lambda: None,
+) -> float:
+    """Run `run` `repeat` times, calling `setup` before each run, and return
+    the fastest run time in seconds."""
+    best = math.inf
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(layout: Layout, repeat: int, jobs: int) -> dict[str, float]:
+    """Time each codegen stage on fonts with the given layout."""
+    plans = plan_patch_sets(layout)
+    with tempfile.TemporaryDirectory(prefix="nerd-font-bench-") as tmp:
+        directory = Path(tmp)
+        nerd_font_path = build_fonts(directory, layout, plans)
+        source = generate_patcher(plans, layout)
+        tables_path = directory / "codepoint_tables.py"
+        symbol_fonts = codegen.GlyphDirSymbolFonts(directory)
+
+        times: dict[str, float] = {}
+        times["extract_patch_set_values"] = best_time(
+            lambda: codegen.extract_patch_set_values(source), repeat
+        )
+        patch_sets, nf_version = codegen.extract_patch_set_values(source)
+
+        def open_font() -> TTFont:
+            return TTFont(nerd_font_path, lazy=True)
+
+        def generate_codepoint_tables() -> Mapping[str, Mapping[int, int]]:
+            return codegen.generate_codepoint_tables(
+                patch_sets, open_font(), nf_version, symbol_fonts, tables_path
+            )
+
+        # Drop the stored tables before each run, so that they are extracted
+        # from the fonts rather than loaded.
+        times["generate_codepoint_tables"] = best_time(
+            generate_codepoint_tables,
+            repeat,
+            lambda: tables_path.unlink(missing_ok=True),
+        )
+        cp_tables = generate_codepoint_tables()
+
+        def generate_constraint_groups() -> (
+            list[tuple[list[int], codegen.ZigConstraint]]
+        ):
+            return codegen.generate_constraint_groups(
+                patch_sets, open_font(), cp_tables, nerd_font_path, jobs
+            )
+
+        # Forget the glyphs measured by the previous run.
+        times["generate_constraint_groups"] = best_time(
+            generate_constraint_groups, repeat, codegen._glyph_bounds_memo.clear
+        )
+        groups = generate_constraint_groups()
+
+        for backend in BACKENDS:
+            times[f"emit_zig_module ({backend})"] = best_time(
+                lambda: codegen.emit_zig_module(backend, groups, "attributes.bin"),
+                repeat,
+            )
+    return times
+
+
+# The layout of the fonts the checks build, small enough to check quickly but
+# with every kind of patch set.
+CHECK_LAYOUT = Layout(2000, 8, 2, 12, 16)
+
+
+def errors(run: Callable[[], object]) -> list[str]:
+    """Run `run`, returning the errors it prints."""
+    output = StringIO()
+    with redirect_stdout(output):
+        run()
+    return [
+        line.removeprefix("Error: ")
+        for line in output.getvalue().splitlines()
+        if line.startswith("Error: ")
+    ]
+
+
+def check_fast_bounds(directory: Path) -> list[str]:
+    return errors(lambda: codegen.check_bounds_providers(codegen.res_font_paths()))
+
+
+def check_vectorized_metrics(directory: Path) -> list[str]:
+    if codegen.np is None:
+        print("Warning: NumPy is not installed, skipping vectorized_metrics")
+        return []
+    plans = plan_patch_sets(CHECK_LAYOUT)
+    nerd_font_path = build_fonts(directory, CHECK_LAYOUT, plans)
+    patch_sets, nf_version = codegen.extract_patch_set_values(
+        generate_patcher(plans, CHECK_LAYOUT)
+    )
+    with TTFont(nerd_font_path, lazy=True) as nerd_font:
+        with redirect_stdout(StringIO()):
+            cp_tables = codegen.generate_codepoint_tables(
+                patch_sets,
+                nerd_font,
+                nf_version,
+                codegen.GlyphDirSymbolFonts(directory),
+                directory / "codepoint_tables.py",
+            )
+        glyph_bounds = codegen.measure_glyphs(
+            nerd_font_path,
+            codegen.scale_group_glyph_names(patch_sets, nerd_font, cp_tables),
+        )
+        return errors(
+            lambda: codegen.check_vectorized_metrics(
+                patch_sets, nerd_font, cp_tables, glyph_bounds
+            )
+        )
+
+
+def check_rewritten_font(directory: Path) -> list[str]:
+    """Measure a font in-process, rewrite it in place with other outlines, as
+    an editor would under --watch, and measure it again."""
+    font_path = directory / "font.ttf"
+    names = [f"g{i}" for i in range(8)]
+
+    def build(size: int) -> None:
+        glyphs = {}
+        for i, name in enumerate(names):
+            pen = TTGlyphPen(None)
+            pen.moveTo((0, 0))
+            pen.lineTo((0, size + i))
+            pen.lineTo((size + i, size + i))
+            pen.lineTo((size + i, 0))
+            pen.closePath()
+            glyphs[name] = pen.glyph()
+        build_font(
+            font_path,
+            dict(zip(range(0xE000, 0xE000 + len(names)), names)),
+            glyphs,
+            dict.fromkeys(names, (1000, 0)),
+        )
+
+    build(100)
+    codegen.measure_glyphs(font_path, names)
+    build(200)
+    # Forget the measured bounds like Codegen.invalidate does, but keep the
+    # font opened for measuring, which has to notice the change by itself.
+    codegen._glyph_bounds_memo.clear()
+    measured = codegen.measure_glyphs(font_path, names)
+    with TTFont(font_path, lazy=True) as font:
+        exact = codegen.glyph_bounds_provider(font, "exact")
+        return [
+            f"{name} measured as {measured[name]} rather than {exact(name)}"
+            for name in names
+            if measured[name] != exact(name)
+        ]
+
+
+# The regression checks run by --check. Each gets an empty directory to build
+# fonts in and returns its failures.
+CHECKS: list[Callable[[Path], list[str]]] = [
+    check_fast_bounds,
+    check_vectorized_metrics,
+    check_rewritten_font,
+]
+
+
+def run_checks() -> bool:
+    ok = True
+    for check in CHECKS:
+        name = check.__name__.removeprefix("check_")
+        with tempfile.TemporaryDirectory(prefix="nerd-font-check-") as tmp:
+            failures = check(Path(tmp))
+        for failure in failures:
+            print(f"Error: {name}: {failure}")
+        if not failures:
+            print(f"Info: {name}: ok")
+        ok = ok and not failures
+    return ok
+
+
+def scaling_exponent(sizes: list[int], times: list[float]) -> float:
+    """Slope of the least squares fit of log(time) against log(size)."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sum(
+        (x - x_mean) ** 2 for x in xs
+    )
+
+
+def report(results: dict[int, dict[str, float]]) -> str:
+    sizes = sorted(results)
+    stages = list(results[sizes[0]])
+    width = max(map(len, stages))
+    s = f"{'stage':<{width}}" + "".join(f"  {n:>9,}" for n in sizes)
+    s += "  scaling\n" if len(sizes) > 1 else "\n"
+    for stage in stages:
+        times = [results[n][stage] for n in sizes]
+        s += f"{stage:<{width}}" + "".join(f"  {t * 1000:>7.1f}ms" for t in times)
+        if len(sizes) > 1:
+            s += f"  n^{scaling_exponent(sizes, times):.2f}"
+        s += "\n"
+    return s
+
+
+def compare(
+    results: dict[int, dict[str, float]],
+    baseline: dict[int, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Describe the stages that got slower than `baseline` by more than
+    `tolerance`, a fraction of the baseline time."""
+    regressions: list[str] = []
+    for n, times in sorted(results.items()):
+        for stage, t in times.items():
+            before = baseline.get(n, {}).get(stage)
+            if before is not None and t > before * (1 + tolerance):
+                regressions.append(
+                    f"{stage} at {n:,} glyphs: {before * 1000:.1f}ms -> "
+                    f"{t * 1000:.1f}ms (+{(t / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def parse_sizes(value: str) -> list[int]:
+    sizes = [int(size) for size in value.split(",")]
+    for size in sizes:
+        if not 1 <= size <= 65534:
+            raise argparse.ArgumentTypeError(
+                f"glyph count {size} is not between 1 and 65534"
+            )
+    return sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark nerd_font_codegen.py on synthetic symbol fonts."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=[1000, 10000, 65000],
+        help="comma-separated glyph counts to benchmark (default: 1000,10000,65000)",
+    )
+    parser.add_argument(
+        "--patch-sets",
+        type=int,
+        default=12,
+        help="number of patch sets to spread the glyphs over (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--contours",
+        type=int,
+        default=2,
+        help="number of contours per glyph (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=12,
+        help="number of points per contour (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=16,
+        help="number of glyphs per scale group (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of runs per stage, of which the fastest counts "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes to measure glyph outlines with "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        metavar="PATH",
+        help="write the timings to PATH as JSON",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="PATH",
+        help="compare the timings to those saved at PATH",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="fraction by which a stage may be slower than the baseline "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="run the regression checks instead of the benchmark",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if run_checks() else 1)
+
+    results: dict[int, dict[str, float]] = {}
+    for size in args.sizes:
+        layout = Layout(
+            size,
+            min(args.patch_sets, size),
+            args.contours,
+            args.points,
+            args.group_size,
+        )
+        print(f"Info: Benchmarking {size:,} glyphs", file=sys.stderr)
+        # The codegen reports its progress per patch set, which would drown
+        # out the results.
+        with redirect_stdout(StringIO()):
+            results[size] = benchmark(layout, args.repeat, args.jobs)
+
+    print(report(results), end="")
+
+    if args.save is not None:
+        args.save.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is not None:
+        saved = json.loads(args.baseline.read_text(encoding="utf-8"))
+        baseline = {int(n): times for n, times in saved.items()}
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Error: Slower than baseline: {regression}")
+        if regressions:
+            sys.exit(1)
@@ -4,10446 +4,206 @@
 #! This file specifies the mapping of codepoints in the original symbol
 #! fonts to codepoints in a patched Nerd Font. This is extracted from
 #! the nerd fonts patcher script and the symbol font files.
+#!
+#! Each table is stored as sorted (start, end, target) triples, each mapping
+#! the original codepoints start..end to target..target + end - start.
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+
 version = "3.4.0"
-cp_tables = {
-    "Seti-UI + Custom": {
-        0xe4fa: 0xe5fa,
-        0xe4fb: 0xe5fb,
-        0xe4fc: 0xe5fc,
-        0xe4fd: 0xe5fd,
-        0xe4fe: 0xe5fe,
-        0xe4ff: 0xe5ff,
-        0xe500: 0xe600,
-        0xe501: 0xe601,
-        0xe502: 0xe602,
-        0xe503: 0xe603,
-        0xe504: 0xe604,
-        0xe505: 0xe605,
-        0xe506: 0xe606,
-        0xe507: 0xe607,
-        0xe508: 0xe608,
-        0xe509: 0xe609,
-        0xe50a: 0xe60a,
-        0xe50b: 0xe60b,
-        0xe50c: 0xe60c,
-        0xe50d: 0xe60d,
-        0xe50e: 0xe60e,
-        0xe50f: 0xe60f,
-        0xe510: 0xe610,
-        0xe511: 0xe611,
-        0xe512: 0xe612,
-        0xe513: 0xe613,
-        0xe514: 0xe614,
-        0xe515: 0xe615,
-        0xe516: 0xe616,
-        0xe517: 0xe617,
-        0xe518: 0xe618,
-        0xe519: 0xe619,
-        0xe51a: 0xe61a,
-        0xe51b: 0xe61b,
-        0xe51c: 0xe61c,
-        0xe51d: 0xe61d,
-        0xe51e: 0xe61e,
-        0xe51f: 0xe61f,
-        0xe520: 0xe620,
-        0xe521: 0xe621,
-        0xe522: 0xe622,
-        0xe523: 0xe623,
-        0xe524: 0xe624,
-        0xe525: 0xe625,
-        0xe526: 0xe626,
-        0xe527: 0xe627,
-        0xe528: 0xe628,
-        0xe529: 0xe629,
-        0xe52a: 0xe62a,
-        0xe52b: 0xe62b,
-        0xe52c: 0xe62c,
-        0xe52d: 0xe62d,
-        0xe52e: 0xe62e,
-        0xe52f: 0xe62f,
-        0xe530: 0xe630,
-        0xe531: 0xe631,
-        0xe532: 0xe632,
-        0xe533: 0xe633,
-        0xe534: 0xe634,
-        0xe535: 0xe635,
-        0xe536: 0xe636,
-        0xe537: 0xe637,
-        0xe538: 0xe638,
-        0xe539: 0xe639,
-        0xe53a: 0xe63a,
-        0xe53b: 0xe63b,
-        0xe53c: 0xe63c,
-        0xe53d: 0xe63d,
-        0xe53e: 0xe63e,
-        0xe53f: 0xe63f,
-        0xe540: 0xe640,
-        0xe541: 0xe641,
-        0xe542: 0xe642,
-        0xe543: 0xe643,
-        0xe544: 0xe644,
-        0xe545: 0xe645,
-        0xe546: 0xe646,
-        0xe547: 0xe647,
-        0xe548: 0xe648,
-        0xe549: 0xe649,
-        0xe54a: 0xe64a,
-        0xe54b: 0xe64b,
-        0xe54c: 0xe64c,
-        0xe54d: 0xe64d,
-        0xe54e: 0xe64e,
-        0xe54f: 0xe64f,
-        0xe550: 0xe650,
-        0xe551: 0xe651,
-        0xe552: 0xe652,
-        0xe553: 0xe653,
-        0xe554: 0xe654,
-        0xe555: 0xe655,
-        0xe556: 0xe656,
-        0xe557: 0xe657,
-        0xe558: 0xe658,
-        0xe559: 0xe659,
-        0xe55a: 0xe65a,
-        0xe55b: 0xe65b,
-        0xe55c: 0xe65c,
-        0xe55d: 0xe65d,
-        0xe55e: 0xe65e,
-        0xe55f: 0xe65f,
-        0xe560: 0xe660,
-        0xe561: 0xe661,
-        0xe562: 0xe662,
-        0xe563: 0xe663,
-        0xe564: 0xe664,
-        0xe565: 0xe665,
-        0xe566: 0xe666,
-        0xe567: 0xe667,
-        0xe568: 0xe668,
-        0xe569: 0xe669,
-        0xe56a: 0xe66a,
-        0xe56b: 0xe66b,
-        0xe56c: 0xe66c,
-        0xe56d: 0xe66d,
-        0xe56e: 0xe66e,
-        0xe56f: 0xe66f,
-        0xe570: 0xe670,
-        0xe571: 0xe671,
-        0xe572: 0xe672,
-        0xe573: 0xe673,
-        0xe574: 0xe674,
-        0xe575: 0xe675,
-        0xe576: 0xe676,
-        0xe577: 0xe677,
-        0xe578: 0xe678,
-        0xe579: 0xe679,
-        0xe57a: 0xe67a,
-        0xe57b: 0xe67b,
-        0xe57c: 0xe67c,
-        0xe57d: 0xe67d,
-        0xe57e: 0xe67e,
-        0xe57f: 0xe67f,
-        0xe580: 0xe680,
-        0xe581: 0xe681,
-        0xe582: 0xe682,
-        0xe583: 0xe683,
-        0xe584: 0xe684,
-        0xe585: 0xe685,
-        0xe586: 0xe686,
-        0xe587: 0xe687,
-        0xe588: 0xe688,
-        0xe589: 0xe689,
-        0xe58a: 0xe68a,
-        0xe58b: 0xe68b,
-        0xe58c: 0xe68c,
-        0xe58d: 0xe68d,
-        0xe58e: 0xe68e,
-        0xe58f: 0xe68f,
-        0xe590: 0xe690,
-        0xe591: 0xe691,
-        0xe592: 0xe692,
-        0xe593: 0xe693,
-        0xe594: 0xe694,
-        0xe595: 0xe695,
-        0xe596: 0xe696,
-        0xe597: 0xe697,
-        0xe598: 0xe698,
-        0xe599: 0xe699,
-        0xe59a: 0xe69a,
-        0xe59b: 0xe69b,
-        0xe59c: 0xe69c,
-        0xe59d: 0xe69d,
-        0xe59e: 0xe69e,
-        0xe59f: 0xe69f,
-        0xe5a0: 0xe6a0,
-        0xe5a1: 0xe6a1,
-        0xe5a2: 0xe6a2,
-        0xe5a3: 0xe6a3,
-        0xe5a4: 0xe6a4,
-        0xe5a5: 0xe6a5,
-        0xe5a6: 0xe6a6,
-        0xe5a7: 0xe6a7,
-        0xe5a8: 0xe6a8,
-        0xe5a9: 0xe6a9,
-        0xe5aa: 0xe6aa,
-        0xe5ab: 0xe6ab,
-        0xe5ac: 0xe6ac,
-        0xe5ad: 0xe6ad,
-        0xe5ae: 0xe6ae,
-        0xe5af: 0xe6af,
-        0xe5b0: 0xe6b0,
-        0xe5b1: 0xe6b1,
-        0xe5b2: 0xe6b2,
-        0xe5b3: 0xe6b3,
-        0xe5b4: 0xe6b4,
-        0xe5b5: 0xe6b5,
-        0xe5b6: 0xe6b6,
-        0xe5b7: 0xe6b7,
-        0xe5b8: 0xe6b8,
-    },
-    "Heavy Angle Brackets": {
-        0x276c: 0x276c,
-        0x276d: 0x276d,
-        0x276e: 0x276e,
-        0x276f: 0x276f,
-        0x2770: 0x2770,
-        0x2771: 0x2771,
-    },
-    "Progress Indicators": {
-        0xee00: 0xee00,
-        0xee01: 0xee01,
-        0xee02: 0xee02,
-        0xee03: 0xee03,
-        0xee04: 0xee04,
-        0xee05: 0xee05,
-        0xee06: 0xee06,
-        0xee07: 0xee07,
-        0xee08: 0xee08,
-        0xee09: 0xee09,
-        0xee0a: 0xee0a,
-        0xee0b: 0xee0b,
-    },
-    "Devicons": {
-        0xe600: 0xe700,
-        0xe601: 0xe701,
-        0xe602: 0xe702,
-        0xe603: 0xe703,
-        0xe604: 0xe704,
-        0xe605: 0xe705,
-        0xe606: 0xe706,
-        0xe607: 0xe707,
-        0xe608: 0xe708,
-        0xe609: 0xe709,
-        0xe60a: 0xe70a,
-        0xe60b: 0xe70b,
-        0xe60c: 0xe70c,
-        0xe60d: 0xe70d,
-        0xe60e: 0xe70e,
-        0xe60f: 0xe70f,
-        0xe610: 0xe710,
-        0xe611: 0xe711,
-        0xe612: 0xe712,
-        0xe613: 0xe713,
-        0xe614: 0xe714,
-        0xe615: 0xe715,
-        0xe616: 0xe716,
-        0xe617: 0xe717,
-        0xe618: 0xe718,
-        0xe619: 0xe719,
-        0xe61a: 0xe71a,
-        0xe61b: 0xe71b,
-        0xe61c: 0xe71c,
-        0xe61d: 0xe71d,
-        0xe61e: 0xe71e,
-        0xe61f: 0xe71f,
-        0xe620: 0xe720,
-        0xe621: 0xe721,
-        0xe622: 0xe722,
-        0xe623: 0xe723,
-        0xe624: 0xe724,
-        0xe625: 0xe725,
-        0xe626: 0xe726,
-        0xe627: 0xe727,
-        0xe628: 0xe728,
-        0xe629: 0xe729,
-        0xe62a: 0xe72a,
-        0xe62b: 0xe72b,
-        0xe62c: 0xe72c,
-        0xe62d: 0xe72d,
-        0xe62e: 0xe72e,
-        0xe62f: 0xe72f,
-        0xe630: 0xe730,
-        0xe631: 0xe731,
-        0xe632: 0xe732,
-        0xe633: 0xe733,
-        0xe634: 0xe734,
-        0xe635: 0xe735,
-        0xe636: 0xe736,
-        0xe637: 0xe737,
-        0xe638: 0xe738,
-        0xe639: 0xe739,
-        0xe63a: 0xe73a,
-        0xe63b: 0xe73b,
-        0xe63c: 0xe73c,
-        0xe63d: 0xe73d,
-        0xe63e: 0xe73e,
-        0xe63f: 0xe73f,
-        0xe640: 0xe740,
-        0xe641: 0xe741,
-        0xe642: 0xe742,
-        0xe643: 0xe743,
-        0xe644: 0xe744,
-        0xe645: 0xe745,
-        0xe646: 0xe746,
-        0xe647: 0xe747,
-        0xe648: 0xe748,
-        0xe649: 0xe749,
-        0xe64a: 0xe74a,
-        0xe64b: 0xe74b,
-        0xe64c: 0xe74c,
-        0xe64d: 0xe74d,
-        0xe64e: 0xe74e,
-        0xe64f: 0xe74f,
-        0xe650: 0xe750,
-        0xe651: 0xe751,
-        0xe652: 0xe752,
-        0xe653: 0xe753,
-        0xe654: 0xe754,
-        0xe655: 0xe755,
-        0xe656: 0xe756,
-        0xe657: 0xe757,
-        0xe658: 0xe758,
-        0xe659: 0xe759,
-        0xe65a: 0xe75a,
-        0xe65b: 0xe75b,
-        0xe65c: 0xe75c,
-        0xe65d: 0xe75d,
-        0xe65e: 0xe75e,
-        0xe65f: 0xe75f,
-        0xe660: 0xe760,
-        0xe661: 0xe761,
-        0xe662: 0xe762,
-        0xe663: 0xe763,
-        0xe664: 0xe764,
-        0xe665: 0xe765,
-        0xe666: 0xe766,
-        0xe667: 0xe767,
-        0xe668: 0xe768,
-        0xe669: 0xe769,
-        0xe66a: 0xe76a,
-        0xe66b: 0xe76b,
-        0xe66c: 0xe76c,
-        0xe66d: 0xe76d,
-        0xe66e: 0xe76e,
-        0xe66f: 0xe76f,
-        0xe670: 0xe770,
-        0xe671: 0xe771,
-        0xe672: 0xe772,
-        0xe673: 0xe773,
-        0xe674: 0xe774,
-        0xe675: 0xe775,
-        0xe676: 0xe776,
-        0xe677: 0xe777,
-        0xe678: 0xe778,
-        0xe679: 0xe779,
-        0xe67a: 0xe77a,
-        0xe67b: 0xe77b,
-        0xe67c: 0xe77c,
-        0xe67d: 0xe77d,
-        0xe67e: 0xe77e,
-        0xe67f: 0xe77f,
-        0xe680: 0xe780,
-        0xe681: 0xe781,
-        0xe682: 0xe782,
-        0xe683: 0xe783,
-        0xe684: 0xe784,
-        0xe685: 0xe785,
-        0xe686: 0xe786,
-        0xe687: 0xe787,
-        0xe688: 0xe788,
-        0xe689: 0xe789,
-        0xe68a: 0xe78a,
-        0xe68b: 0xe78b,
-        0xe68c: 0xe78c,
-        0xe68d: 0xe78d,
-        0xe68e: 0xe78e,
-        0xe68f: 0xe78f,
-        0xe690: 0xe790,
-        0xe691: 0xe791,
-        0xe692: 0xe792,
-        0xe693: 0xe793,
-        0xe694: 0xe794,
-        0xe695: 0xe795,
-        0xe696: 0xe796,
-        0xe697: 0xe797,
-        0xe698: 0xe798,
-        0xe699: 0xe799,
-        0xe69a: 0xe79a,
-        0xe69b: 0xe79b,
-        0xe69c: 0xe79c,
-        0xe69d: 0xe79d,
-        0xe69e: 0xe79e,
-        0xe69f: 0xe79f,
-        0xe6a0: 0xe7a0,
-        0xe6a1: 0xe7a1,
-        0xe6a2: 0xe7a2,
-        0xe6a3: 0xe7a3,
-        0xe6a4: 0xe7a4,
-        0xe6a5: 0xe7a5,
-        0xe6a6: 0xe7a6,
-        0xe6a7: 0xe7a7,
-        0xe6a8: 0xe7a8,
-        0xe6a9: 0xe7a9,
-        0xe6aa: 0xe7aa,
-        0xe6ab: 0xe7ab,
-        0xe6ac: 0xe7ac,
-        0xe6ad: 0xe7ad,
-        0xe6ae: 0xe7ae,
-        0xe6af: 0xe7af,
-        0xe6b0: 0xe7b0,
-        0xe6b1: 0xe7b1,
-        0xe6b2: 0xe7b2,
-        0xe6b3: 0xe7b3,
-        0xe6b4: 0xe7b4,
-        0xe6b5: 0xe7b5,
-        0xe6b6: 0xe7b6,
-        0xe6b7: 0xe7b7,
-        0xe6b8: 0xe7b8,
-        0xe6b9: 0xe7b9,
-        0xe6ba: 0xe7ba,
-        0xe6bb: 0xe7bb,
-        0xe6bc: 0xe7bc,
-        0xe6bd: 0xe7bd,
-        0xe6be: 0xe7be,
-        0xe6bf: 0xe7bf,
-        0xe6c0: 0xe7c0,
-        0xe6c1: 0xe7c1,
-        0xe6c2: 0xe7c2,
-        0xe6c3: 0xe7c3,
-        0xe6c4: 0xe7c4,
-        0xe6c5: 0xe7c5,
-        0xe6c6: 0xe7c6,
-        0xe6c7: 0xe7c7,
-        0xe6c8: 0xe7c8,
-        0xe6c9: 0xe7c9,
-        0xe6ca: 0xe7ca,
-        0xe6cb: 0xe7cb,
-        0xe6cc: 0xe7cc,
-        0xe6cd: 0xe7cd,
-        0xe6ce: 0xe7ce,
-        0xe6cf: 0xe7cf,
-        0xe6d0: 0xe7d0,
-        0xe6d1: 0xe7d1,
-        0xe6d2: 0xe7d2,
-        0xe6d3: 0xe7d3,
-        0xe6d4: 0xe7d4,
-        0xe6d5: 0xe7d5,
-        0xe6d6: 0xe7d6,
-        0xe6d7: 0xe7d7,
-        0xe6d8: 0xe7d8,
-        0xe6d9: 0xe7d9,
-        0xe6da: 0xe7da,
-        0xe6db: 0xe7db,
-        0xe6dc: 0xe7dc,
-        0xe6dd: 0xe7dd,
-        0xe6de: 0xe7de,
-        0xe6df: 0xe7df,
-        0xe6e0: 0xe7e0,
-        0xe6e1: 0xe7e1,
-        0xe6e2: 0xe7e2,
-        0xe6e3: 0xe7e3,
-        0xe6e4: 0xe7e4,
-        0xe6e5: 0xe7e5,
-        0xe6e6: 0xe7e6,
-        0xe6e7: 0xe7e7,
-        0xe6e8: 0xe7e8,
-        0xe6e9: 0xe7e9,
-        0xe6ea: 0xe7ea,
-        0xe6eb: 0xe7eb,
-        0xe6ec: 0xe7ec,
-        0xe6ed: 0xe7ed,
-        0xe6ee: 0xe7ee,
-        0xe6ef: 0xe7ef,
-        0xe6f0: 0xe7f0,
-        0xe6f1: 0xe7f1,
-        0xe6f2: 0xe7f2,
-        0xe6f3: 0xe7f3,
-        0xe6f4: 0xe7f4,
-        0xe6f5: 0xe7f5,
-        0xe6f6: 0xe7f6,
-        0xe6f7: 0xe7f7,
-        0xe6f8: 0xe7f8,
-        0xe6f9: 0xe7f9,
-        0xe6fa: 0xe7fa,
-        0xe6fb: 0xe7fb,
-        0xe6fc: 0xe7fc,
-        0xe6fd: 0xe7fd,
-        0xe6fe: 0xe7fe,
-        0xe6ff: 0xe7ff,
-        0xe700: 0xe800,
-        0xe701: 0xe801,
-        0xe702: 0xe802,
-        0xe703: 0xe803,
-        0xe704: 0xe804,
-        0xe705: 0xe805,
-        0xe706: 0xe806,
-        0xe707: 0xe807,
-        0xe708: 0xe808,
-        0xe709: 0xe809,
-        0xe70a: 0xe80a,
-        0xe70b: 0xe80b,
-        0xe70c: 0xe80c,
-        0xe70d: 0xe80d,
-        0xe70e: 0xe80e,
-        0xe70f: 0xe80f,
-        0xe710: 0xe810,
-        0xe711: 0xe811,
-        0xe712: 0xe812,
-        0xe713: 0xe813,
-        0xe714: 0xe814,
-        0xe715: 0xe815,
-        0xe716: 0xe816,
-        0xe717: 0xe817,
-        0xe718: 0xe818,
-        0xe719: 0xe819,
-        0xe71a: 0xe81a,
-        0xe71b: 0xe81b,
-        0xe71c: 0xe81c,
-        0xe71d: 0xe81d,
-        0xe71e: 0xe81e,
-        0xe71f: 0xe81f,
-        0xe720: 0xe820,
-        0xe721: 0xe821,
-        0xe722: 0xe822,
-        0xe723: 0xe823,
-        0xe724: 0xe824,
-        0xe725: 0xe825,
-        0xe726: 0xe826,
-        0xe727: 0xe827,
-        0xe728: 0xe828,
-        0xe729: 0xe829,
-        0xe72a: 0xe82a,
-        0xe72b: 0xe82b,
-        0xe72c: 0xe82c,
-        0xe72d: 0xe82d,
-        0xe72e: 0xe82e,
-        0xe72f: 0xe82f,
-        0xe730: 0xe830,
-        0xe731: 0xe831,
-        0xe732: 0xe832,
-        0xe733: 0xe833,
-        0xe734: 0xe834,
-        0xe735: 0xe835,
-        0xe736: 0xe836,
-        0xe737: 0xe837,
-        0xe738: 0xe838,
-        0xe739: 0xe839,
-        0xe73a: 0xe83a,
-        0xe73b: 0xe83b,
-        0xe73c: 0xe83c,
-        0xe73d: 0xe83d,
-        0xe73e: 0xe83e,
-        0xe73f: 0xe83f,
-        0xe740: 0xe840,
-        0xe741: 0xe841,
-        0xe742: 0xe842,
-        0xe743: 0xe843,
-        0xe744: 0xe844,
-        0xe745: 0xe845,
-        0xe746: 0xe846,
-        0xe747: 0xe847,
-        0xe748: 0xe848,
-        0xe749: 0xe849,
-        0xe74a: 0xe84a,
-        0xe74b: 0xe84b,
-        0xe74c: 0xe84c,
-        0xe74d: 0xe84d,
-        0xe74e: 0xe84e,
-        0xe74f: 0xe84f,
-        0xe750: 0xe850,
-        0xe751: 0xe851,
-        0xe752: 0xe852,
-        0xe753: 0xe853,
-        0xe754: 0xe854,
-        0xe755: 0xe855,
-        0xe756: 0xe856,
-        0xe757: 0xe857,
-        0xe758: 0xe858,
-        0xe759: 0xe859,
-        0xe75a: 0xe85a,
-        0xe75b: 0xe85b,
-        0xe75c: 0xe85c,
-        0xe75d: 0xe85d,
-        0xe75e: 0xe85e,
-        0xe75f: 0xe85f,
-        0xe760: 0xe860,
-        0xe761: 0xe861,
-        0xe762: 0xe862,
-        0xe763: 0xe863,
-        0xe764: 0xe864,
-        0xe765: 0xe865,
-        0xe766: 0xe866,
-        0xe767: 0xe867,
-        0xe768: 0xe868,
-        0xe769: 0xe869,
-        0xe76a: 0xe86a,
-        0xe76b: 0xe86b,
-        0xe76c: 0xe86c,
-        0xe76d: 0xe86d,
-        0xe76e: 0xe86e,
-        0xe76f: 0xe86f,
-        0xe770: 0xe870,
-        0xe771: 0xe871,
-        0xe772: 0xe872,
-        0xe773: 0xe873,
-        0xe774: 0xe874,
-        0xe775: 0xe875,
-        0xe776: 0xe876,
-        0xe777: 0xe877,
-        0xe778: 0xe878,
-        0xe779: 0xe879,
-        0xe77a: 0xe87a,
-        0xe77b: 0xe87b,
-        0xe77c: 0xe87c,
-        0xe77d: 0xe87d,
-        0xe77e: 0xe87e,
-        0xe77f: 0xe87f,
-        0xe780: 0xe880,
-        0xe781: 0xe881,
-        0xe782: 0xe882,
-        0xe783: 0xe883,
-        0xe784: 0xe884,
-        0xe785: 0xe885,
-        0xe786: 0xe886,
-        0xe787: 0xe887,
-        0xe788: 0xe888,
-        0xe789: 0xe889,
-        0xe78a: 0xe88a,
-        0xe78b: 0xe88b,
-        0xe78c: 0xe88c,
-        0xe78d: 0xe88d,
-        0xe78e: 0xe88e,
-        0xe78f: 0xe88f,
-        0xe790: 0xe890,
-        0xe791: 0xe891,
-        0xe792: 0xe892,
-        0xe793: 0xe893,
-        0xe794: 0xe894,
-        0xe795: 0xe895,
-        0xe796: 0xe896,
-        0xe797: 0xe897,
-        0xe798: 0xe898,
-        0xe799: 0xe899,
-        0xe79a: 0xe89a,
-        0xe79b: 0xe89b,
-        0xe79c: 0xe89c,
-        0xe79d: 0xe89d,
-        0xe79e: 0xe89e,
-        0xe79f: 0xe89f,
-        0xe7a0: 0xe8a0,
-        0xe7a1: 0xe8a1,
-        0xe7a2: 0xe8a2,
-        0xe7a3: 0xe8a3,
-        0xe7a4: 0xe8a4,
-        0xe7a5: 0xe8a5,
-        0xe7a6: 0xe8a6,
-        0xe7a7: 0xe8a7,
-        0xe7a8: 0xe8a8,
-        0xe7a9: 0xe8a9,
-        0xe7aa: 0xe8aa,
-        0xe7ab: 0xe8ab,
-        0xe7ac: 0xe8ac,
-        0xe7ad: 0xe8ad,
-        0xe7ae: 0xe8ae,
-        0xe7af: 0xe8af,
-        0xe7b0: 0xe8b0,
-        0xe7b1: 0xe8b1,
-        0xe7b2: 0xe8b2,
-        0xe7b3: 0xe8b3,
-        0xe7b4: 0xe8b4,
-        0xe7b5: 0xe8b5,
-        0xe7b6: 0xe8b6,
-        0xe7b7: 0xe8b7,
-        0xe7b8: 0xe8b8,
-        0xe7b9: 0xe8b9,
-        0xe7ba: 0xe8ba,
-        0xe7bb: 0xe8bb,
-        0xe7bc: 0xe8bc,
-        0xe7bd: 0xe8bd,
-        0xe7be: 0xe8be,
-        0xe7bf: 0xe8bf,
-        0xe7c0: 0xe8c0,
-        0xe7c1: 0xe8c1,
-        0xe7c2: 0xe8c2,
-        0xe7c3: 0xe8c3,
-        0xe7c4: 0xe8c4,
-        0xe7c5: 0xe8c5,
-        0xe7c6: 0xe8c6,
-        0xe7c7: 0xe8c7,
-        0xe7c8: 0xe8c8,
-        0xe7c9: 0xe8c9,
-        0xe7ca: 0xe8ca,
-        0xe7cb: 0xe8cb,
-        0xe7cc: 0xe8cc,
-        0xe7cd: 0xe8cd,
-        0xe7ce: 0xe8ce,
-        0xe7cf: 0xe8cf,
-        0xe7d0: 0xe8d0,
-        0xe7d1: 0xe8d1,
-        0xe7d2: 0xe8d2,
-        0xe7d3: 0xe8d3,
-        0xe7d4: 0xe8d4,
-        0xe7d5: 0xe8d5,
-        0xe7d6: 0xe8d6,
-        0xe7d7: 0xe8d7,
-        0xe7d8: 0xe8d8,
-        0xe7d9: 0xe8d9,
-        0xe7da: 0xe8da,
-        0xe7db: 0xe8db,
-        0xe7dc: 0xe8dc,
-        0xe7dd: 0xe8dd,
-        0xe7de: 0xe8de,
-        0xe7df: 0xe8df,
-        0xe7e0: 0xe8e0,
-        0xe7e1: 0xe8e1,
-        0xe7e2: 0xe8e2,
-        0xe7e3: 0xe8e3,
-        0xe7e4: 0xe8e4,
-        0xe7e5: 0xe8e5,
-        0xe7e6: 0xe8e6,
-        0xe7e7: 0xe8e7,
-        0xe7e8: 0xe8e8,
-        0xe7e9: 0xe8e9,
-        0xe7ea: 0xe8ea,
-        0xe7eb: 0xe8eb,
-        0xe7ec: 0xe8ec,
-        0xe7ed: 0xe8ed,
-        0xe7ee: 0xe8ee,
-        0xe7ef: 0xe8ef,
-    },
-    "Powerline Symbols": {
-        0xe0a0: 0xe0a0,
-        0xe0a1: 0xe0a1,
-        0xe0a2: 0xe0a2,
-        0xe0b0: 0xe0b0,
-        0xe0b1: 0xe0b1,
-        0xe0b2: 0xe0b2,
-        0xe0b3: 0xe0b3,
-    },
-    "Powerline Extra Symbols": {
-        0xe0a3: 0xe0a3,
-        0xe0b4: 0xe0b4,
-        0xe0b5: 0xe0b5,
-        0xe0b6: 0xe0b6,
-        0xe0b7: 0xe0b7,
-        0xe0b8: 0xe0b8,
-        0xe0b9: 0xe0b9,
-        0xe0ba: 0xe0ba,
-        0xe0bb: 0xe0bb,
-        0xe0bc: 0xe0bc,
-        0xe0bd: 0xe0bd,
-        0xe0be: 0xe0be,
-        0xe0bf: 0xe0bf,
-        0xe0c0: 0xe0c0,
-        0xe0c1: 0xe0c1,
-        0xe0c2: 0xe0c2,
-        0xe0c3: 0xe0c3,
-        0xe0c4: 0xe0c4,
-        0xe0c5: 0xe0c5,
-        0xe0c6: 0xe0c6,
-        0xe0c7: 0xe0c7,
-        0xe0c8: 0xe0c8,
-        0xe0ca: 0xe0ca,
-        0xe0cc: 0xe0cc,
-        0xe0cd: 0xe0cd,
-        0xe0ce: 0xe0ce,
-        0xe0cf: 0xe0cf,
-        0xe0d0: 0xe0d0,
-        0xe0d1: 0xe0d1,
-        0xe0d2: 0xe0d2,
-        0xe0d4: 0xe0d4,
-        0xe0d6: 0xe0d6,
-        0xe0d7: 0xe0d7,
-        0x2630: 0x2630,
-    },
-    "Pomicons": {
-        0xe000: 0xe000,
-        0xe001: 0xe001,
-        0xe002: 0xe002,
-        0xe003: 0xe003,
-        0xe004: 0xe004,
-        0xe005: 0xe005,
-        0xe006: 0xe006,
-        0xe007: 0xe007,
-        0xe008: 0xe008,
-        0xe009: 0xe009,
-        0xe00a: 0xe00a,
-    },
-    "Font Awesome": {
-        0xed00: 0xed00,
-        0xed01: 0xed01,
-        0xed02: 0xed02,
-        0xed03: 0xed03,
-        0xed04: 0xed04,
-        0xed05: 0xed05,
-        0xed06: 0xed06,
-        0xed07: 0xed07,
-        0xed08: 0xed08,
-        0xed09: 0xed09,
-        0xed0a: 0xed0a,
-        0xed0b: 0xed0b,
-        0xed0c: 0xed0c,
-        0xed0d: 0xed0d,
-        0xed0e: 0xed0e,
-        0xed0f: 0xed0f,
-        0xed10: 0xed10,
-        0xed11: 0xed11,
-        0xed12: 0xed12,
-        0xed13: 0xed13,
-        0xed14: 0xed14,
-        0xed15: 0xed15,
-        0xed16: 0xed16,
-        0xed17: 0xed17,
-        0xed18: 0xed18,
-        0xed19: 0xed19,
-        0xed1a: 0xed1a,
-        0xed1b: 0xed1b,
-        0xed1c: 0xed1c,
-        0xed1d: 0xed1d,
-        0xed1e: 0xed1e,
-        0xed1f: 0xed1f,
-        0xed20: 0xed20,
-        0xed21: 0xed21,
-        0xed22: 0xed22,
-        0xed23: 0xed23,
-        0xed24: 0xed24,
-        0xed25: 0xed25,
-        0xed26: 0xed26,
-        0xed27: 0xed27,
-        0xed28: 0xed28,
-        0xed29: 0xed29,
-        0xed2a: 0xed2a,
-        0xed2b: 0xed2b,
-        0xed2c: 0xed2c,
-        0xed2d: 0xed2d,
-        0xed2e: 0xed2e,
-        0xed2f: 0xed2f,
-        0xed30: 0xed30,
-        0xed31: 0xed31,
-        0xed32: 0xed32,
-        0xed33: 0xed33,
-        0xed34: 0xed34,
-        0xed35: 0xed35,
-        0xed36: 0xed36,
-        0xed37: 0xed37,
-        0xed38: 0xed38,
-        0xed39: 0xed39,
-        0xed3a: 0xed3a,
-        0xed3b: 0xed3b,
-        0xed3c: 0xed3c,
-        0xed3d: 0xed3d,
-        0xed3e: 0xed3e,
-        0xed3f: 0xed3f,
-        0xed40: 0xed40,
-        0xed41: 0xed41,
-        0xed42: 0xed42,
-        0xed43: 0xed43,
-        0xed44: 0xed44,
-        0xed45: 0xed45,
-        0xed46: 0xed46,
-        0xed47: 0xed47,
-        0xed48: 0xed48,
-        0xed49: 0xed49,
-        0xed4a: 0xed4a,
-        0xed4b: 0xed4b,
-        0xed4c: 0xed4c,
-        0xed4d: 0xed4d,
-        0xed4e: 0xed4e,
-        0xed4f: 0xed4f,
-        0xed50: 0xed50,
-        0xed51: 0xed51,
-        0xed52: 0xed52,
-        0xed53: 0xed53,
-        0xed54: 0xed54,
-        0xed55: 0xed55,
-        0xed56: 0xed56,
-        0xed57: 0xed57,
-        0xed58: 0xed58,
-        0xed59: 0xed59,
-        0xed5a: 0xed5a,
-        0xed5b: 0xed5b,
-        0xed5c: 0xed5c,
-        0xed5d: 0xed5d,
-        0xed5e: 0xed5e,
-        0xed5f: 0xed5f,
-        0xed60: 0xed60,
-        0xed61: 0xed61,
-        0xed62: 0xed62,
-        0xed63: 0xed63,
-        0xed64: 0xed64,
-        0xed65: 0xed65,
-        0xed66: 0xed66,
-        0xed67: 0xed67,
-        0xed68: 0xed68,
-        0xed69: 0xed69,
-        0xed6a: 0xed6a,
-        0xed6b: 0xed6b,
-        0xed6c: 0xed6c,
-        0xed6d: 0xed6d,
-        0xed6e: 0xed6e,
-        0xed6f: 0xed6f,
-        0xed70: 0xed70,
-        0xed71: 0xed71,
-        0xed72: 0xed72,
-        0xed73: 0xed73,
-        0xed74: 0xed74,
-        0xed75: 0xed75,
-        0xed76: 0xed76,
-        0xed77: 0xed77,
-        0xed78: 0xed78,
-        0xed79: 0xed79,
-        0xed7a: 0xed7a,
-        0xed7b: 0xed7b,
-        0xed7c: 0xed7c,
-        0xed7d: 0xed7d,
-        0xed7e: 0xed7e,
-        0xed7f: 0xed7f,
-        0xed80: 0xed80,
-        0xed81: 0xed81,
-        0xed82: 0xed82,
-        0xed83: 0xed83,
-        0xed84: 0xed84,
-        0xed85: 0xed85,
-        0xed86: 0xed86,
-        0xed87: 0xed87,
-        0xed88: 0xed88,
-        0xed89: 0xed89,
-        0xed8a: 0xed8a,
-        0xed8b: 0xed8b,
-        0xed8c: 0xed8c,
-        0xed8d: 0xed8d,
-        0xed8e: 0xed8e,
-        0xed8f: 0xed8f,
-        0xed90: 0xed90,
-        0xed91: 0xed91,
-        0xed92: 0xed92,
-        0xed93: 0xed93,
-        0xed94: 0xed94,
-        0xed95: 0xed95,
-        0xed96: 0xed96,
-        0xed97: 0xed97,
-        0xed98: 0xed98,
-        0xed99: 0xed99,
-        0xed9a: 0xed9a,
-        0xed9b: 0xed9b,
-        0xed9c: 0xed9c,
-        0xed9d: 0xed9d,
-        0xed9e: 0xed9e,
-        0xed9f: 0xed9f,
-        0xeda0: 0xeda0,
-        0xeda1: 0xeda1,
-        0xeda2: 0xeda2,
-        0xeda3: 0xeda3,
-        0xeda4: 0xeda4,
-        0xeda5: 0xeda5,
-        0xeda6: 0xeda6,
-        0xeda7: 0xeda7,
-        0xeda8: 0xeda8,
-        0xeda9: 0xeda9,
-        0xedaa: 0xedaa,
-        0xedab: 0xedab,
-        0xedac: 0xedac,
-        0xedad: 0xedad,
-        0xedae: 0xedae,
-        0xedaf: 0xedaf,
-        0xedb0: 0xedb0,
-        0xedb1: 0xedb1,
-        0xedb2: 0xedb2,
-        0xedb3: 0xedb3,
-        0xedb4: 0xedb4,
-        0xedb5: 0xedb5,
-        0xedb6: 0xedb6,
-        0xedb7: 0xedb7,
-        0xedb8: 0xedb8,
-        0xedb9: 0xedb9,
-        0xedba: 0xedba,
-        0xedbb: 0xedbb,
-        0xedbc: 0xedbc,
-        0xedbd: 0xedbd,
-        0xedbe: 0xedbe,
-        0xedbf: 0xedbf,
-        0xedc0: 0xedc0,
-        0xedc1: 0xedc1,
-        0xedc2: 0xedc2,
-        0xedc3: 0xedc3,
-        0xedc4: 0xedc4,
-        0xedc5: 0xedc5,
-        0xedc6: 0xedc6,
-        0xedc7: 0xedc7,
-        0xedc8: 0xedc8,
-        0xedc9: 0xedc9,
-        0xedca: 0xedca,
-        0xedcb: 0xedcb,
-        0xedcc: 0xedcc,
-        0xedcd: 0xedcd,
-        0xedce: 0xedce,
-        0xedcf: 0xedcf,
-        0xedd0: 0xedd0,
-        0xedd1: 0xedd1,
-        0xedd2: 0xedd2,
-        0xedd3: 0xedd3,
-        0xedd4: 0xedd4,
-        0xedd5: 0xedd5,
-        0xedd6: 0xedd6,
-        0xedd7: 0xedd7,
-        0xedd8: 0xedd8,
-        0xedd9: 0xedd9,
-        0xedda: 0xedda,
-        0xeddb: 0xeddb,
-        0xeddc: 0xeddc,
-        0xeddd: 0xeddd,
-        0xedde: 0xedde,
-        0xeddf: 0xeddf,
-        0xede0: 0xede0,
-        0xede1: 0xede1,
-        0xede2: 0xede2,
-        0xede3: 0xede3,
-        0xede4: 0xede4,
-        0xede5: 0xede5,
-        0xede6: 0xede6,
-        0xede7: 0xede7,
-        0xede8: 0xede8,
-        0xede9: 0xede9,
-        0xedea: 0xedea,
-        0xedeb: 0xedeb,
-        0xedec: 0xedec,
-        0xeded: 0xeded,
-        0xedee: 0xedee,
-        0xedef: 0xedef,
-        0xedf0: 0xedf0,
-        0xedf1: 0xedf1,
-        0xedf2: 0xedf2,
-        0xedf3: 0xedf3,
-        0xedf4: 0xedf4,
-        0xedf5: 0xedf5,
-        0xedf6: 0xedf6,
-        0xedf7: 0xedf7,
-        0xedf8: 0xedf8,
-        0xedf9: 0xedf9,
-        0xedfa: 0xedfa,
-        0xedfb: 0xedfb,
-        0xedfc: 0xedfc,
-        0xedfd: 0xedfd,
-        0xedfe: 0xedfe,
-        0xedff: 0xedff,
-        0xee0c: 0xee0c,
-        0xee0d: 0xee0d,
-        0xee0e: 0xee0e,
-        0xee0f: 0xee0f,
-        0xee10: 0xee10,
-        0xee11: 0xee11,
-        0xee12: 0xee12,
-        0xee13: 0xee13,
-        0xee14: 0xee14,
-        0xee15: 0xee15,
-        0xee16: 0xee16,
-        0xee17: 0xee17,
-        0xee18: 0xee18,
-        0xee19: 0xee19,
-        0xee1a: 0xee1a,
-        0xee1b: 0xee1b,
-        0xee1c: 0xee1c,
-        0xee1d: 0xee1d,
-        0xee1e: 0xee1e,
-        0xee1f: 0xee1f,
-        0xee20: 0xee20,
-        0xee21: 0xee21,
-        0xee22: 0xee22,
-        0xee23: 0xee23,
-        0xee24: 0xee24,
-        0xee25: 0xee25,
-        0xee26: 0xee26,
-        0xee27: 0xee27,
-        0xee28: 0xee28,
-        0xee29: 0xee29,
-        0xee2a: 0xee2a,
-        0xee2b: 0xee2b,
-        0xee2c: 0xee2c,
-        0xee2d: 0xee2d,
-        0xee2e: 0xee2e,
-        0xee2f: 0xee2f,
-        0xee30: 0xee30,
-        0xee31: 0xee31,
-        0xee32: 0xee32,
-        0xee33: 0xee33,
-        0xee34: 0xee34,
-        0xee35: 0xee35,
-        0xee36: 0xee36,
-        0xee37: 0xee37,
-        0xee38: 0xee38,
-        0xee39: 0xee39,
-        0xee3a: 0xee3a,
-        0xee3b: 0xee3b,
-        0xee3c: 0xee3c,
-        0xee3d: 0xee3d,
-        0xee3e: 0xee3e,
-        0xee3f: 0xee3f,
-        0xee40: 0xee40,
-        0xee41: 0xee41,
-        0xee42: 0xee42,
-        0xee43: 0xee43,
-        0xee44: 0xee44,
-        0xee45: 0xee45,
-        0xee46: 0xee46,
-        0xee47: 0xee47,
-        0xee48: 0xee48,
-        0xee49: 0xee49,
-        0xee4a: 0xee4a,
-        0xee4b: 0xee4b,
-        0xee4c: 0xee4c,
-        0xee4d: 0xee4d,
-        0xee4e: 0xee4e,
-        0xee4f: 0xee4f,
-        0xee50: 0xee50,
-        0xee51: 0xee51,
-        0xee52: 0xee52,
-        0xee53: 0xee53,
-        0xee54: 0xee54,
-        0xee55: 0xee55,
-        0xee56: 0xee56,
-        0xee57: 0xee57,
-        0xee58: 0xee58,
-        0xee59: 0xee59,
-        0xee5a: 0xee5a,
-        0xee5b: 0xee5b,
-        0xee5c: 0xee5c,
-        0xee5d: 0xee5d,
-        0xee5e: 0xee5e,
-        0xee5f: 0xee5f,
-        0xee60: 0xee60,
-        0xee61: 0xee61,
-        0xee62: 0xee62,
-        0xee63: 0xee63,
-        0xee64: 0xee64,
-        0xee65: 0xee65,
-        0xee66: 0xee66,
-        0xee67: 0xee67,
-        0xee68: 0xee68,
-        0xee69: 0xee69,
-        0xee6a: 0xee6a,
-        0xee6b: 0xee6b,
-        0xee6c: 0xee6c,
-        0xee6d: 0xee6d,
-        0xee6e: 0xee6e,
-        0xee6f: 0xee6f,
-        0xee70: 0xee70,
-        0xee71: 0xee71,
-        0xee72: 0xee72,
-        0xee73: 0xee73,
-        0xee74: 0xee74,
-        0xee75: 0xee75,
-        0xee76: 0xee76,
-        0xee77: 0xee77,
-        0xee78: 0xee78,
-        0xee79: 0xee79,
-        0xee7a: 0xee7a,
-        0xee7b: 0xee7b,
-        0xee7c: 0xee7c,
-        0xee7d: 0xee7d,
-        0xee7e: 0xee7e,
-        0xee7f: 0xee7f,
-        0xee80: 0xee80,
-        0xee81: 0xee81,
-        0xee82: 0xee82,
-        0xee83: 0xee83,
-        0xee84: 0xee84,
-        0xee85: 0xee85,
-        0xee86: 0xee86,
-        0xee87: 0xee87,
-        0xee88: 0xee88,
-        0xee89: 0xee89,
-        0xee8a: 0xee8a,
-        0xee8b: 0xee8b,
-        0xee8c: 0xee8c,
-        0xee8d: 0xee8d,
-        0xee8e: 0xee8e,
-        0xee8f: 0xee8f,
-        0xee90: 0xee90,
-        0xee91: 0xee91,
-        0xee92: 0xee92,
-        0xee93: 0xee93,
-        0xee94: 0xee94,
-        0xee95: 0xee95,
-        0xee96: 0xee96,
-        0xee97: 0xee97,
-        0xee98: 0xee98,
-        0xee99: 0xee99,
-        0xee9a: 0xee9a,
-        0xee9b: 0xee9b,
-        0xee9c: 0xee9c,
-        0xee9d: 0xee9d,
-        0xee9e: 0xee9e,
-        0xee9f: 0xee9f,
-        0xeea0: 0xeea0,
-        0xeea1: 0xeea1,
-        0xeea2: 0xeea2,
-        0xeea3: 0xeea3,
-        0xeea4: 0xeea4,
-        0xeea5: 0xeea5,
-        0xeea6: 0xeea6,
-        0xeea7: 0xeea7,
-        0xeea8: 0xeea8,
-        0xeea9: 0xeea9,
-        0xeeaa: 0xeeaa,
-        0xeeab: 0xeeab,
-        0xeeac: 0xeeac,
-        0xeead: 0xeead,
-        0xeeae: 0xeeae,
-        0xeeaf: 0xeeaf,
-        0xeeb0: 0xeeb0,
-        0xeeb1: 0xeeb1,
-        0xeeb2: 0xeeb2,
-        0xeeb3: 0xeeb3,
-        0xeeb4: 0xeeb4,
-        0xeeb5: 0xeeb5,
-        0xeeb6: 0xeeb6,
-        0xeeb7: 0xeeb7,
-        0xeeb8: 0xeeb8,
-        0xeeb9: 0xeeb9,
-        0xeeba: 0xeeba,
-        0xeebb: 0xeebb,
-        0xeebc: 0xeebc,
-        0xeebd: 0xeebd,
-        0xeebe: 0xeebe,
-        0xeebf: 0xeebf,
-        0xeec0: 0xeec0,
-        0xeec1: 0xeec1,
-        0xeec2: 0xeec2,
-        0xeec3: 0xeec3,
-        0xeec4: 0xeec4,
-        0xeec5: 0xeec5,
-        0xeec6: 0xeec6,
-        0xeec7: 0xeec7,
-        0xeec8: 0xeec8,
-        0xeec9: 0xeec9,
-        0xeeca: 0xeeca,
-        0xeecb: 0xeecb,
-        0xeecc: 0xeecc,
-        0xeecd: 0xeecd,
-        0xeece: 0xeece,
-        0xeecf: 0xeecf,
-        0xeed0: 0xeed0,
-        0xeed1: 0xeed1,
-        0xeed2: 0xeed2,
-        0xeed3: 0xeed3,
-        0xeed4: 0xeed4,
-        0xeed5: 0xeed5,
-        0xeed6: 0xeed6,
-        0xeed7: 0xeed7,
-        0xeed8: 0xeed8,
-        0xeed9: 0xeed9,
-        0xeeda: 0xeeda,
-        0xeedb: 0xeedb,
-        0xeedc: 0xeedc,
-        0xeedd: 0xeedd,
-        0xeede: 0xeede,
-        0xeedf: 0xeedf,
-        0xeee0: 0xeee0,
-        0xeee1: 0xeee1,
-        0xeee2: 0xeee2,
-        0xeee3: 0xeee3,
-        0xeee4: 0xeee4,
-        0xeee5: 0xeee5,
-        0xeee6: 0xeee6,
-        0xeee7: 0xeee7,
-        0xeee8: 0xeee8,
-        0xeee9: 0xeee9,
-        0xeeea: 0xeeea,
-        0xeeeb: 0xeeeb,
-        0xeeec: 0xeeec,
-        0xeeed: 0xeeed,
-        0xeeee: 0xeeee,
-        0xeeef: 0xeeef,
-        0xeef0: 0xeef0,
-        0xeef1: 0xeef1,
-        0xeef2: 0xeef2,
-        0xeef3: 0xeef3,
-        0xeef4: 0xeef4,
-        0xeef5: 0xeef5,
-        0xeef6: 0xeef6,
-        0xeef7: 0xeef7,
-        0xeef8: 0xeef8,
-        0xeef9: 0xeef9,
-        0xeefa: 0xeefa,
-        0xeefb: 0xeefb,
-        0xeefc: 0xeefc,
-        0xeefd: 0xeefd,
-        0xeefe: 0xeefe,
-        0xeeff: 0xeeff,
-        0xef00: 0xef00,
-        0xef01: 0xef01,
-        0xef02: 0xef02,
-        0xef03: 0xef03,
-        0xef04: 0xef04,
-        0xef05: 0xef05,
-        0xef06: 0xef06,
-        0xef07: 0xef07,
-        0xef08: 0xef08,
-        0xef09: 0xef09,
-        0xef0a: 0xef0a,
-        0xef0b: 0xef0b,
-        0xef0c: 0xef0c,
-        0xef0d: 0xef0d,
-        0xef0e: 0xef0e,
-        0xef0f: 0xef0f,
-        0xef10: 0xef10,
-        0xef11: 0xef11,
-        0xef12: 0xef12,
-        0xef13: 0xef13,
-        0xef14: 0xef14,
-        0xef15: 0xef15,
-        0xef16: 0xef16,
-        0xef17: 0xef17,
-        0xef18: 0xef18,
-        0xef19: 0xef19,
-        0xef1a: 0xef1a,
-        0xef1b: 0xef1b,
-        0xef1c: 0xef1c,
-        0xef1d: 0xef1d,
-        0xef1e: 0xef1e,
-        0xef1f: 0xef1f,
-        0xef20: 0xef20,
-        0xef21: 0xef21,
-        0xef22: 0xef22,
-        0xef23: 0xef23,
-        0xef24: 0xef24,
-        0xef25: 0xef25,
-        0xef26: 0xef26,
-        0xef27: 0xef27,
-        0xef28: 0xef28,
-        0xef29: 0xef29,
-        0xef2a: 0xef2a,
-        0xef2b: 0xef2b,
-        0xef2c: 0xef2c,
-        0xef2d: 0xef2d,
-        0xef2e: 0xef2e,
-        0xef2f: 0xef2f,
-        0xef30: 0xef30,
-        0xef31: 0xef31,
-        0xef32: 0xef32,
-        0xef33: 0xef33,
-        0xef34: 0xef34,
-        0xef35: 0xef35,
-        0xef36: 0xef36,
-        0xef37: 0xef37,
-        0xef38: 0xef38,
-        0xef39: 0xef39,
-        0xef3a: 0xef3a,
-        0xef3b: 0xef3b,
-        0xef3c: 0xef3c,
-        0xef3d: 0xef3d,
-        0xef3e: 0xef3e,
-        0xef3f: 0xef3f,
-        0xef40: 0xef40,
-        0xef41: 0xef41,
-        0xef42: 0xef42,
-        0xef43: 0xef43,
-        0xef44: 0xef44,
-        0xef45: 0xef45,
-        0xef46: 0xef46,
-        0xef47: 0xef47,
-        0xef48: 0xef48,
-        0xef49: 0xef49,
-        0xef4a: 0xef4a,
-        0xef4b: 0xef4b,
-        0xef4c: 0xef4c,
-        0xef4d: 0xef4d,
-        0xef4e: 0xef4e,
-        0xef4f: 0xef4f,
-        0xef50: 0xef50,
-        0xef51: 0xef51,
-        0xef52: 0xef52,
-        0xef53: 0xef53,
-        0xef54: 0xef54,
-        0xef55: 0xef55,
-        0xef56: 0xef56,
-        0xef57: 0xef57,
-        0xef58: 0xef58,
-        0xef59: 0xef59,
-        0xef5a: 0xef5a,
-        0xef5b: 0xef5b,
-        0xef5c: 0xef5c,
-        0xef5d: 0xef5d,
-        0xef5e: 0xef5e,
-        0xef5f: 0xef5f,
-        0xef60: 0xef60,
-        0xef61: 0xef61,
-        0xef62: 0xef62,
-        0xef63: 0xef63,
-        0xef64: 0xef64,
-        0xef65: 0xef65,
-        0xef66: 0xef66,
-        0xef67: 0xef67,
-        0xef68: 0xef68,
-        0xef69: 0xef69,
-        0xef6a: 0xef6a,
-        0xef6b: 0xef6b,
-        0xef6c: 0xef6c,
-        0xef6d: 0xef6d,
-        0xef6e: 0xef6e,
-        0xef6f: 0xef6f,
-        0xef70: 0xef70,
-        0xef71: 0xef71,
-        0xef72: 0xef72,
-        0xef73: 0xef73,
-        0xef74: 0xef74,
-        0xef75: 0xef75,
-        0xef76: 0xef76,
-        0xef77: 0xef77,
-        0xef78: 0xef78,
-        0xef79: 0xef79,
-        0xef7a: 0xef7a,
-        0xef7b: 0xef7b,
-        0xef7c: 0xef7c,
-        0xef7d: 0xef7d,
-        0xef7e: 0xef7e,
-        0xef7f: 0xef7f,
-        0xef80: 0xef80,
-        0xef81: 0xef81,
-        0xef82: 0xef82,
-        0xef83: 0xef83,
-        0xef84: 0xef84,
-        0xef85: 0xef85,
-        0xef86: 0xef86,
-        0xef87: 0xef87,
-        0xef88: 0xef88,
-        0xef89: 0xef89,
-        0xef8a: 0xef8a,
-        0xef8b: 0xef8b,
-        0xef8c: 0xef8c,
-        0xef8d: 0xef8d,
-        0xef8e: 0xef8e,
-        0xef8f: 0xef8f,
-        0xef90: 0xef90,
-        0xef91: 0xef91,
-        0xef92: 0xef92,
-        0xef93: 0xef93,
-        0xef94: 0xef94,
-        0xef95: 0xef95,
-        0xef96: 0xef96,
-        0xef97: 0xef97,
-        0xef98: 0xef98,
-        0xef99: 0xef99,
-        0xef9a: 0xef9a,
-        0xef9b: 0xef9b,
-        0xef9c: 0xef9c,
-        0xef9d: 0xef9d,
-        0xef9e: 0xef9e,
-        0xef9f: 0xef9f,
-        0xefa0: 0xefa0,
-        0xefa1: 0xefa1,
-        0xefa2: 0xefa2,
-        0xefa3: 0xefa3,
-        0xefa4: 0xefa4,
-        0xefa5: 0xefa5,
-        0xefa6: 0xefa6,
-        0xefa7: 0xefa7,
-        0xefa8: 0xefa8,
-        0xefa9: 0xefa9,
-        0xefaa: 0xefaa,
-        0xefab: 0xefab,
-        0xefac: 0xefac,
-        0xefad: 0xefad,
-        0xefae: 0xefae,
-        0xefaf: 0xefaf,
-        0xefb0: 0xefb0,
-        0xefb1: 0xefb1,
-        0xefb2: 0xefb2,
-        0xefb3: 0xefb3,
-        0xefb4: 0xefb4,
-        0xefb5: 0xefb5,
-        0xefb6: 0xefb6,
-        0xefb7: 0xefb7,
-        0xefb8: 0xefb8,
-        0xefb9: 0xefb9,
-        0xefba: 0xefba,
-        0xefbb: 0xefbb,
-        0xefbc: 0xefbc,
-        0xefbd: 0xefbd,
-        0xefbe: 0xefbe,
-        0xefbf: 0xefbf,
-        0xefc0: 0xefc0,
-        0xefc1: 0xefc1,
-        0xefc2: 0xefc2,
-        0xefc3: 0xefc3,
-        0xefc4: 0xefc4,
-        0xefc5: 0xefc5,
-        0xefc6: 0xefc6,
-        0xefc7: 0xefc7,
-        0xefc8: 0xefc8,
-        0xefc9: 0xefc9,
-        0xefca: 0xefca,
-        0xefcb: 0xefcb,
-        0xefcc: 0xefcc,
-        0xefcd: 0xefcd,
-        0xefce: 0xefce,
-        0xf000: 0xf000,
-        0xf001: 0xf001,
-        0xf002: 0xf002,
-        0xf003: 0xf003,
-        0xf004: 0xf004,
-        0xf005: 0xf005,
-        0xf006: 0xf006,
-        0xf007: 0xf007,
-        0xf008: 0xf008,
-        0xf009: 0xf009,
-        0xf00a: 0xf00a,
-        0xf00b: 0xf00b,
-        0xf00c: 0xf00c,
-        0xf00d: 0xf00d,
-        0xf00e: 0xf00e,
-        0xf00f: 0xf00f,
-        0xf010: 0xf010,
-        0xf011: 0xf011,
-        0xf012: 0xf012,
-        0xf013: 0xf013,
-        0xf014: 0xf014,
-        0xf015: 0xf015,
-        0xf016: 0xf016,
-        0xf017: 0xf017,
-        0xf018: 0xf018,
-        0xf019: 0xf019,
-        0xf01a: 0xf01a,
-        0xf01b: 0xf01b,
-        0xf01c: 0xf01c,
-        0xf01d: 0xf01d,
-        0xf01e: 0xf01e,
-        0xf01f: 0xf01f,
-        0xf020: 0xf020,
-        0xf021: 0xf021,
-        0xf022: 0xf022,
-        0xf023: 0xf023,
-        0xf024: 0xf024,
-        0xf025: 0xf025,
-        0xf026: 0xf026,
-        0xf027: 0xf027,
-        0xf028: 0xf028,
-        0xf029: 0xf029,
-        0xf02a: 0xf02a,
-        0xf02b: 0xf02b,
-        0xf02c: 0xf02c,
-        0xf02d: 0xf02d,
-        0xf02e: 0xf02e,
-        0xf02f: 0xf02f,
-        0xf030: 0xf030,
-        0xf031: 0xf031,
-        0xf032: 0xf032,
-        0xf033: 0xf033,
-        0xf034: 0xf034,
-        0xf035: 0xf035,
-        0xf036: 0xf036,
-        0xf037: 0xf037,
-        0xf038: 0xf038,
-        0xf039: 0xf039,
-        0xf03a: 0xf03a,
-        0xf03b: 0xf03b,
-        0xf03c: 0xf03c,
-        0xf03d: 0xf03d,
-        0xf03e: 0xf03e,
-        0xf03f: 0xf03f,
-        0xf040: 0xf040,
-        0xf041: 0xf041,
-        0xf042: 0xf042,
-        0xf043: 0xf043,
-        0xf044: 0xf044,
-        0xf045: 0xf045,
-        0xf046: 0xf046,
-        0xf047: 0xf047,
-        0xf048: 0xf048,
-        0xf049: 0xf049,
-        0xf04a: 0xf04a,
-        0xf04b: 0xf04b,
-        0xf04c: 0xf04c,
-        0xf04d: 0xf04d,
-        0xf04e: 0xf04e,
-        0xf04f: 0xf04f,
-        0xf050: 0xf050,
-        0xf051: 0xf051,
-        0xf052: 0xf052,
-        0xf053: 0xf053,
-        0xf054: 0xf054,
-        0xf055: 0xf055,
-        0xf056: 0xf056,
-        0xf057: 0xf057,
-        0xf058: 0xf058,
-        0xf059: 0xf059,
-        0xf05a: 0xf05a,
-        0xf05b: 0xf05b,
-        0xf05c: 0xf05c,
-        0xf05d: 0xf05d,
-        0xf05e: 0xf05e,
-        0xf05f: 0xf05f,
-        0xf060: 0xf060,
-        0xf061: 0xf061,
-        0xf062: 0xf062,
-        0xf063: 0xf063,
-        0xf064: 0xf064,
-        0xf065: 0xf065,
-        0xf066: 0xf066,
-        0xf067: 0xf067,
-        0xf068: 0xf068,
-        0xf069: 0xf069,
-        0xf06a: 0xf06a,
-        0xf06b: 0xf06b,
-        0xf06c: 0xf06c,
-        0xf06d: 0xf06d,
-        0xf06e: 0xf06e,
-        0xf06f: 0xf06f,
-        0xf070: 0xf070,
-        0xf071: 0xf071,
-        0xf072: 0xf072,
-        0xf073: 0xf073,
-        0xf074: 0xf074,
-        0xf075: 0xf075,
-        0xf076: 0xf076,
-        0xf077: 0xf077,
-        0xf078: 0xf078,
-        0xf079: 0xf079,
-        0xf07a: 0xf07a,
-        0xf07b: 0xf07b,
-        0xf07c: 0xf07c,
-        0xf07d: 0xf07d,
-        0xf07e: 0xf07e,
-        0xf07f: 0xf07f,
-        0xf080: 0xf080,
-        0xf081: 0xf081,
-        0xf082: 0xf082,
-        0xf083: 0xf083,
-        0xf084: 0xf084,
-        0xf085: 0xf085,
-        0xf086: 0xf086,
-        0xf087: 0xf087,
-        0xf088: 0xf088,
-        0xf089: 0xf089,
-        0xf08a: 0xf08a,
-        0xf08b: 0xf08b,
-        0xf08c: 0xf08c,
-        0xf08d: 0xf08d,
-        0xf08e: 0xf08e,
-        0xf08f: 0xf08f,
-        0xf090: 0xf090,
-        0xf091: 0xf091,
-        0xf092: 0xf092,
-        0xf093: 0xf093,
-        0xf094: 0xf094,
-        0xf095: 0xf095,
-        0xf096: 0xf096,
-        0xf097: 0xf097,
-        0xf098: 0xf098,
-        0xf099: 0xf099,
-        0xf09a: 0xf09a,
-        0xf09b: 0xf09b,
-        0xf09c: 0xf09c,
-        0xf09d: 0xf09d,
-        0xf09e: 0xf09e,
-        0xf09f: 0xf09f,
-        0xf0a0: 0xf0a0,
-        0xf0a1: 0xf0a1,
-        0xf0a2: 0xf0a2,
-        0xf0a3: 0xf0a3,
-        0xf0a4: 0xf0a4,
-        0xf0a5: 0xf0a5,
-        0xf0a6: 0xf0a6,
-        0xf0a7: 0xf0a7,
-        0xf0a8: 0xf0a8,
-        0xf0a9: 0xf0a9,
-        0xf0aa: 0xf0aa,
-        0xf0ab: 0xf0ab,
-        0xf0ac: 0xf0ac,
-        0xf0ad: 0xf0ad,
-        0xf0ae: 0xf0ae,
-        0xf0af: 0xf0af,
-        0xf0b0: 0xf0b0,
-        0xf0b1: 0xf0b1,
-        0xf0b2: 0xf0b2,
-        0xf0b3: 0xf0b3,
-        0xf0b4: 0xf0b4,
-        0xf0b5: 0xf0b5,
-        0xf0b6: 0xf0b6,
-        0xf0b7: 0xf0b7,
-        0xf0b8: 0xf0b8,
-        0xf0b9: 0xf0b9,
-        0xf0ba: 0xf0ba,
-        0xf0bb: 0xf0bb,
-        0xf0bc: 0xf0bc,
-        0xf0bd: 0xf0bd,
-        0xf0be: 0xf0be,
-        0xf0bf: 0xf0bf,
-        0xf0c0: 0xf0c0,
-        0xf0c1: 0xf0c1,
-        0xf0c2: 0xf0c2,
-        0xf0c3: 0xf0c3,
-        0xf0c4: 0xf0c4,
-        0xf0c5: 0xf0c5,
-        0xf0c6: 0xf0c6,
-        0xf0c7: 0xf0c7,
-        0xf0c8: 0xf0c8,
-        0xf0c9: 0xf0c9,
-        0xf0ca: 0xf0ca,
-        0xf0cb: 0xf0cb,
-        0xf0cc: 0xf0cc,
-        0xf0cd: 0xf0cd,
-        0xf0ce: 0xf0ce,
-        0xf0cf: 0xf0cf,
-        0xf0d0: 0xf0d0,
-        0xf0d1: 0xf0d1,
-        0xf0d2: 0xf0d2,
-        0xf0d3: 0xf0d3,
-        0xf0d4: 0xf0d4,
-        0xf0d5: 0xf0d5,
-        0xf0d6: 0xf0d6,
-        0xf0d7: 0xf0d7,
-        0xf0d8: 0xf0d8,
-        0xf0d9: 0xf0d9,
-        0xf0da: 0xf0da,
-        0xf0db: 0xf0db,
-        0xf0dc: 0xf0dc,
-        0xf0dd: 0xf0dd,
-        0xf0de: 0xf0de,
-        0xf0df: 0xf0df,
-        0xf0e0: 0xf0e0,
-        0xf0e1: 0xf0e1,
-        0xf0e2: 0xf0e2,
-        0xf0e3: 0xf0e3,
-        0xf0e4: 0xf0e4,
-        0xf0e5: 0xf0e5,
-        0xf0e6: 0xf0e6,
-        0xf0e7: 0xf0e7,
-        0xf0e8: 0xf0e8,
-        0xf0e9: 0xf0e9,
-        0xf0ea: 0xf0ea,
-        0xf0eb: 0xf0eb,
-        0xf0ec: 0xf0ec,
-        0xf0ed: 0xf0ed,
-        0xf0ee: 0xf0ee,
-        0xf0ef: 0xf0ef,
-        0xf0f0: 0xf0f0,
-        0xf0f1: 0xf0f1,
-        0xf0f2: 0xf0f2,
-        0xf0f3: 0xf0f3,
-        0xf0f4: 0xf0f4,
-        0xf0f5: 0xf0f5,
-        0xf0f6: 0xf0f6,
-        0xf0f7: 0xf0f7,
-        0xf0f8: 0xf0f8,
-        0xf0f9: 0xf0f9,
-        0xf0fa: 0xf0fa,
-        0xf0fb: 0xf0fb,
-        0xf0fc: 0xf0fc,
-        0xf0fd: 0xf0fd,
-        0xf0fe: 0xf0fe,
-        0xf0ff: 0xf0ff,
-        0xf100: 0xf100,
-        0xf101: 0xf101,
-        0xf102: 0xf102,
-        0xf103: 0xf103,
-        0xf104: 0xf104,
-        0xf105: 0xf105,
-        0xf106: 0xf106,
-        0xf107: 0xf107,
-        0xf108: 0xf108,
-        0xf109: 0xf109,
-        0xf10a: 0xf10a,
-        0xf10b: 0xf10b,
-        0xf10c: 0xf10c,
-        0xf10d: 0xf10d,
-        0xf10e: 0xf10e,
-        0xf10f: 0xf10f,
-        0xf110: 0xf110,
-        0xf111: 0xf111,
-        0xf112: 0xf112,
-        0xf113: 0xf113,
-        0xf114: 0xf114,
-        0xf115: 0xf115,
-        0xf116: 0xf116,
-        0xf117: 0xf117,
-        0xf118: 0xf118,
-        0xf119: 0xf119,
-        0xf11a: 0xf11a,
-        0xf11b: 0xf11b,
-        0xf11c: 0xf11c,
-        0xf11d: 0xf11d,
-        0xf11e: 0xf11e,
-        0xf11f: 0xf11f,
-        0xf120: 0xf120,
-        0xf121: 0xf121,
-        0xf122: 0xf122,
-        0xf123: 0xf123,
-        0xf124: 0xf124,
-        0xf125: 0xf125,
-        0xf126: 0xf126,
-        0xf127: 0xf127,
-        0xf128: 0xf128,
-        0xf129: 0xf129,
-        0xf12a: 0xf12a,
-        0xf12b: 0xf12b,
-        0xf12c: 0xf12c,
-        0xf12d: 0xf12d,
-        0xf12e: 0xf12e,
-        0xf12f: 0xf12f,
-        0xf130: 0xf130,
-        0xf131: 0xf131,
-        0xf132: 0xf132,
-        0xf133: 0xf133,
-        0xf134: 0xf134,
-        0xf135: 0xf135,
-        0xf136: 0xf136,
-        0xf137: 0xf137,
-        0xf138: 0xf138,
-        0xf139: 0xf139,
-        0xf13a: 0xf13a,
-        0xf13b: 0xf13b,
-        0xf13c: 0xf13c,
-        0xf13d: 0xf13d,
-        0xf13e: 0xf13e,
-        0xf13f: 0xf13f,
-        0xf140: 0xf140,
-        0xf141: 0xf141,
-        0xf142: 0xf142,
-        0xf143: 0xf143,
-        0xf144: 0xf144,
-        0xf145: 0xf145,
-        0xf146: 0xf146,
-        0xf147: 0xf147,
-        0xf148: 0xf148,
-        0xf149: 0xf149,
-        0xf14a: 0xf14a,
-        0xf14b: 0xf14b,
-        0xf14c: 0xf14c,
-        0xf14d: 0xf14d,
-        0xf14e: 0xf14e,
-        0xf14f: 0xf14f,
-        0xf150: 0xf150,
-        0xf151: 0xf151,
-        0xf152: 0xf152,
-        0xf153: 0xf153,
-        0xf154: 0xf154,
-        0xf155: 0xf155,
-        0xf156: 0xf156,
-        0xf157: 0xf157,
-        0xf158: 0xf158,
-        0xf159: 0xf159,
-        0xf15a: 0xf15a,
-        0xf15b: 0xf15b,
-        0xf15c: 0xf15c,
-        0xf15d: 0xf15d,
-        0xf15e: 0xf15e,
-        0xf15f: 0xf15f,
-        0xf160: 0xf160,
-        0xf161: 0xf161,
-        0xf162: 0xf162,
-        0xf163: 0xf163,
-        0xf164: 0xf164,
-        0xf165: 0xf165,
-        0xf166: 0xf166,
-        0xf167: 0xf167,
-        0xf168: 0xf168,
-        0xf169: 0xf169,
-        0xf16a: 0xf16a,
-        0xf16b: 0xf16b,
-        0xf16c: 0xf16c,
-        0xf16d: 0xf16d,
-        0xf16e: 0xf16e,
-        0xf16f: 0xf16f,
-        0xf170: 0xf170,
-        0xf171: 0xf171,
-        0xf172: 0xf172,
-        0xf173: 0xf173,
-        0xf174: 0xf174,
-        0xf175: 0xf175,
-        0xf176: 0xf176,
-        0xf177: 0xf177,
-        0xf178: 0xf178,
-        0xf179: 0xf179,
-        0xf17a: 0xf17a,
-        0xf17b: 0xf17b,
-        0xf17c: 0xf17c,
-        0xf17d: 0xf17d,
-        0xf17e: 0xf17e,
-        0xf17f: 0xf17f,
-        0xf180: 0xf180,
-        0xf181: 0xf181,
-        0xf182: 0xf182,
-        0xf183: 0xf183,
-        0xf184: 0xf184,
-        0xf185: 0xf185,
-        0xf186: 0xf186,
-        0xf187: 0xf187,
-        0xf188: 0xf188,
-        0xf189: 0xf189,
-        0xf18a: 0xf18a,
-        0xf18b: 0xf18b,
-        0xf18c: 0xf18c,
-        0xf18d: 0xf18d,
-        0xf18e: 0xf18e,
-        0xf18f: 0xf18f,
-        0xf190: 0xf190,
-        0xf191: 0xf191,
-        0xf192: 0xf192,
-        0xf193: 0xf193,
-        0xf194: 0xf194,
-        0xf195: 0xf195,
-        0xf196: 0xf196,
-        0xf197: 0xf197,
-        0xf198: 0xf198,
-        0xf199: 0xf199,
-        0xf19a: 0xf19a,
-        0xf19b: 0xf19b,
-        0xf19c: 0xf19c,
-        0xf19d: 0xf19d,
-        0xf19e: 0xf19e,
-        0xf19f: 0xf19f,
-        0xf1a0: 0xf1a0,
-        0xf1a1: 0xf1a1,
-        0xf1a2: 0xf1a2,
-        0xf1a3: 0xf1a3,
-        0xf1a4: 0xf1a4,
-        0xf1a5: 0xf1a5,
-        0xf1a6: 0xf1a6,
-        0xf1a7: 0xf1a7,
-        0xf1a8: 0xf1a8,
-        0xf1a9: 0xf1a9,
-        0xf1aa: 0xf1aa,
-        0xf1ab: 0xf1ab,
-        0xf1ac: 0xf1ac,
-        0xf1ad: 0xf1ad,
-        0xf1ae: 0xf1ae,
-        0xf1af: 0xf1af,
-        0xf1b0: 0xf1b0,
-        0xf1b1: 0xf1b1,
-        0xf1b2: 0xf1b2,
-        0xf1b3: 0xf1b3,
-        0xf1b4: 0xf1b4,
-        0xf1b5: 0xf1b5,
-        0xf1b6: 0xf1b6,
-        0xf1b7: 0xf1b7,
-        0xf1b8: 0xf1b8,
-        0xf1b9: 0xf1b9,
-        0xf1ba: 0xf1ba,
-        0xf1bb: 0xf1bb,
-        0xf1bc: 0xf1bc,
-        0xf1bd: 0xf1bd,
-        0xf1be: 0xf1be,
-        0xf1bf: 0xf1bf,
-        0xf1c0: 0xf1c0,
-        0xf1c1: 0xf1c1,
-        0xf1c2: 0xf1c2,
-        0xf1c3: 0xf1c3,
-        0xf1c4: 0xf1c4,
-        0xf1c5: 0xf1c5,
-        0xf1c6: 0xf1c6,
-        0xf1c7: 0xf1c7,
-        0xf1c8: 0xf1c8,
-        0xf1c9: 0xf1c9,
-        0xf1ca: 0xf1ca,
-        0xf1cb: 0xf1cb,
-        0xf1cc: 0xf1cc,
-        0xf1cd: 0xf1cd,
-        0xf1ce: 0xf1ce,
-        0xf1cf: 0xf1cf,
-        0xf1d0: 0xf1d0,
-        0xf1d1: 0xf1d1,
-        0xf1d2: 0xf1d2,
-        0xf1d3: 0xf1d3,
-        0xf1d4: 0xf1d4,
-        0xf1d5: 0xf1d5,
-        0xf1d6: 0xf1d6,
-        0xf1d7: 0xf1d7,
-        0xf1d8: 0xf1d8,
-        0xf1d9: 0xf1d9,
-        0xf1da: 0xf1da,
-        0xf1db: 0xf1db,
-        0xf1dc: 0xf1dc,
-        0xf1dd: 0xf1dd,
-        0xf1de: 0xf1de,
-        0xf1df: 0xf1df,
-        0xf1e0: 0xf1e0,
-        0xf1e1: 0xf1e1,
-        0xf1e2: 0xf1e2,
-        0xf1e3: 0xf1e3,
-        0xf1e4: 0xf1e4,
-        0xf1e5: 0xf1e5,
-        0xf1e6: 0xf1e6,
-        0xf1e7: 0xf1e7,
-        0xf1e8: 0xf1e8,
-        0xf1e9: 0xf1e9,
-        0xf1ea: 0xf1ea,
-        0xf1eb: 0xf1eb,
-        0xf1ec: 0xf1ec,
-        0xf1ed: 0xf1ed,
-        0xf1ee: 0xf1ee,
-        0xf1ef: 0xf1ef,
-        0xf1f0: 0xf1f0,
-        0xf1f1: 0xf1f1,
-        0xf1f2: 0xf1f2,
-        0xf1f3: 0xf1f3,
-        0xf1f4: 0xf1f4,
-        0xf1f5: 0xf1f5,
-        0xf1f6: 0xf1f6,
-        0xf1f7: 0xf1f7,
-        0xf1f8: 0xf1f8,
-        0xf1f9: 0xf1f9,
-        0xf1fa: 0xf1fa,
-        0xf1fb: 0xf1fb,
-        0xf1fc: 0xf1fc,
-        0xf1fd: 0xf1fd,
-        0xf1fe: 0xf1fe,
-        0xf1ff: 0xf1ff,
-        0xf200: 0xf200,
-        0xf201: 0xf201,
-        0xf202: 0xf202,
-        0xf203: 0xf203,
-        0xf204: 0xf204,
-        0xf205: 0xf205,
-        0xf206: 0xf206,
-        0xf207: 0xf207,
-        0xf208: 0xf208,
-        0xf209: 0xf209,
-        0xf20a: 0xf20a,
-        0xf20b: 0xf20b,
-        0xf20c: 0xf20c,
-        0xf20d: 0xf20d,
-        0xf20e: 0xf20e,
-        0xf20f: 0xf20f,
-        0xf210: 0xf210,
-        0xf211: 0xf211,
-        0xf212: 0xf212,
-        0xf213: 0xf213,
-        0xf214: 0xf214,
-        0xf215: 0xf215,
-        0xf216: 0xf216,
-        0xf217: 0xf217,
-        0xf218: 0xf218,
-        0xf219: 0xf219,
-        0xf21a: 0xf21a,
-        0xf21b: 0xf21b,
-        0xf21c: 0xf21c,
-        0xf21d: 0xf21d,
-        0xf21e: 0xf21e,
-        0xf21f: 0xf21f,
-        0xf220: 0xf220,
-        0xf221: 0xf221,
-        0xf222: 0xf222,
-        0xf223: 0xf223,
-        0xf224: 0xf224,
-        0xf225: 0xf225,
-        0xf226: 0xf226,
-        0xf227: 0xf227,
-        0xf228: 0xf228,
-        0xf229: 0xf229,
-        0xf22a: 0xf22a,
-        0xf22b: 0xf22b,
-        0xf22c: 0xf22c,
-        0xf22d: 0xf22d,
-        0xf22e: 0xf22e,
-        0xf22f: 0xf22f,
-        0xf230: 0xf230,
-        0xf231: 0xf231,
-        0xf232: 0xf232,
-        0xf233: 0xf233,
-        0xf234: 0xf234,
-        0xf235: 0xf235,
-        0xf236: 0xf236,
-        0xf237: 0xf237,
-        0xf238: 0xf238,
-        0xf239: 0xf239,
-        0xf23a: 0xf23a,
-        0xf23b: 0xf23b,
-        0xf23c: 0xf23c,
-        0xf23d: 0xf23d,
-        0xf23e: 0xf23e,
-        0xf23f: 0xf23f,
-        0xf240: 0xf240,
-        0xf241: 0xf241,
-        0xf242: 0xf242,
-        0xf243: 0xf243,
-        0xf244: 0xf244,
-        0xf245: 0xf245,
-        0xf246: 0xf246,
-        0xf247: 0xf247,
-        0xf248: 0xf248,
-        0xf249: 0xf249,
-        0xf24a: 0xf24a,
-        0xf24b: 0xf24b,
-        0xf24c: 0xf24c,
-        0xf24d: 0xf24d,
-        0xf24e: 0xf24e,
-        0xf24f: 0xf24f,
-        0xf250: 0xf250,
-        0xf251: 0xf251,
-        0xf252: 0xf252,
-        0xf253: 0xf253,
-        0xf254: 0xf254,
-        0xf255: 0xf255,
-        0xf256: 0xf256,
-        0xf257: 0xf257,
-        0xf258: 0xf258,
-        0xf259: 0xf259,
-        0xf25a: 0xf25a,
-        0xf25b: 0xf25b,
-        0xf25c: 0xf25c,
-        0xf25d: 0xf25d,
-        0xf25e: 0xf25e,
-        0xf25f: 0xf25f,
-        0xf260: 0xf260,
-        0xf261: 0xf261,
-        0xf262: 0xf262,
-        0xf263: 0xf263,
-        0xf264: 0xf264,
-        0xf265: 0xf265,
-        0xf266: 0xf266,
-        0xf267: 0xf267,
-        0xf268: 0xf268,
-        0xf269: 0xf269,
-        0xf26a: 0xf26a,
-        0xf26b: 0xf26b,
-        0xf26c: 0xf26c,
-        0xf26d: 0xf26d,
-        0xf26e: 0xf26e,
-        0xf26f: 0xf26f,
-        0xf270: 0xf270,
-        0xf271: 0xf271,
-        0xf272: 0xf272,
-        0xf273: 0xf273,
-        0xf274: 0xf274,
-        0xf275: 0xf275,
-        0xf276: 0xf276,
-        0xf277: 0xf277,
-        0xf278: 0xf278,
-        0xf279: 0xf279,
-        0xf27a: 0xf27a,
-        0xf27b: 0xf27b,
-        0xf27c: 0xf27c,
-        0xf27d: 0xf27d,
-        0xf27e: 0xf27e,
-        0xf27f: 0xf27f,
-        0xf280: 0xf280,
-        0xf281: 0xf281,
-        0xf282: 0xf282,
-        0xf283: 0xf283,
-        0xf284: 0xf284,
-        0xf285: 0xf285,
-        0xf286: 0xf286,
-        0xf287: 0xf287,
-        0xf288: 0xf288,
-        0xf289: 0xf289,
-        0xf28a: 0xf28a,
-        0xf28b: 0xf28b,
-        0xf28c: 0xf28c,
-        0xf28d: 0xf28d,
-        0xf28e: 0xf28e,
-        0xf28f: 0xf28f,
-        0xf290: 0xf290,
-        0xf291: 0xf291,
-        0xf292: 0xf292,
-        0xf293: 0xf293,
-        0xf294: 0xf294,
-        0xf295: 0xf295,
-        0xf296: 0xf296,
-        0xf297: 0xf297,
-        0xf298: 0xf298,
-        0xf299: 0xf299,
-        0xf29a: 0xf29a,
-        0xf29b: 0xf29b,
-        0xf29c: 0xf29c,
-        0xf29d: 0xf29d,
-        0xf29e: 0xf29e,
-        0xf29f: 0xf29f,
-        0xf2a0: 0xf2a0,
-        0xf2a1: 0xf2a1,
-        0xf2a2: 0xf2a2,
-        0xf2a3: 0xf2a3,
-        0xf2a4: 0xf2a4,
-        0xf2a5: 0xf2a5,
-        0xf2a6: 0xf2a6,
-        0xf2a7: 0xf2a7,
-        0xf2a8: 0xf2a8,
-        0xf2a9: 0xf2a9,
-        0xf2aa: 0xf2aa,
-        0xf2ab: 0xf2ab,
-        0xf2ac: 0xf2ac,
-        0xf2ad: 0xf2ad,
-        0xf2ae: 0xf2ae,
-        0xf2af: 0xf2af,
-        0xf2b0: 0xf2b0,
-        0xf2b1: 0xf2b1,
-        0xf2b2: 0xf2b2,
-        0xf2b3: 0xf2b3,
-        0xf2b4: 0xf2b4,
-        0xf2b5: 0xf2b5,
-        0xf2b6: 0xf2b6,
-        0xf2b7: 0xf2b7,
-        0xf2b8: 0xf2b8,
-        0xf2b9: 0xf2b9,
-        0xf2ba: 0xf2ba,
-        0xf2bb: 0xf2bb,
-        0xf2bc: 0xf2bc,
-        0xf2bd: 0xf2bd,
-        0xf2be: 0xf2be,
-        0xf2bf: 0xf2bf,
-        0xf2c0: 0xf2c0,
-        0xf2c1: 0xf2c1,
-        0xf2c2: 0xf2c2,
-        0xf2c3: 0xf2c3,
-        0xf2c4: 0xf2c4,
-        0xf2c5: 0xf2c5,
-        0xf2c6: 0xf2c6,
-        0xf2c7: 0xf2c7,
-        0xf2c8: 0xf2c8,
-        0xf2c9: 0xf2c9,
-        0xf2ca: 0xf2ca,
-        0xf2cb: 0xf2cb,
-        0xf2cc: 0xf2cc,
-        0xf2cd: 0xf2cd,
-        0xf2ce: 0xf2ce,
-        0xf2cf: 0xf2cf,
-        0xf2d0: 0xf2d0,
-        0xf2d1: 0xf2d1,
-        0xf2d2: 0xf2d2,
-        0xf2d3: 0xf2d3,
-        0xf2d4: 0xf2d4,
-        0xf2d5: 0xf2d5,
-        0xf2d6: 0xf2d6,
-        0xf2d7: 0xf2d7,
-        0xf2d8: 0xf2d8,
-        0xf2d9: 0xf2d9,
-        0xf2da: 0xf2da,
-        0xf2db: 0xf2db,
-        0xf2dc: 0xf2dc,
-        0xf2dd: 0xf2dd,
-        0xf2de: 0xf2de,
-        0xf2df: 0xf2df,
-        0xf2e0: 0xf2e0,
-        0xf2e1: 0xf2e1,
-        0xf2e2: 0xf2e2,
-        0xf2e3: 0xf2e3,
-        0xf2e4: 0xf2e4,
-        0xf2e5: 0xf2e5,
-        0xf2e6: 0xf2e6,
-        0xf2e7: 0xf2e7,
-        0xf2e8: 0xf2e8,
-        0xf2e9: 0xf2e9,
-        0xf2ea: 0xf2ea,
-        0xf2eb: 0xf2eb,
-        0xf2ec: 0xf2ec,
-        0xf2ed: 0xf2ed,
-        0xf2ee: 0xf2ee,
-        0xf2ef: 0xf2ef,
-        0xf2f0: 0xf2f0,
-        0xf2f1: 0xf2f1,
-        0xf2f2: 0xf2f2,
-        0xf2f3: 0xf2f3,
-        0xf2f4: 0xf2f4,
-        0xf2f5: 0xf2f5,
-        0xf2f6: 0xf2f6,
-        0xf2f7: 0xf2f7,
-        0xf2f8: 0xf2f8,
-        0xf2f9: 0xf2f9,
-        0xf2fa: 0xf2fa,
-        0xf2fb: 0xf2fb,
-        0xf2fc: 0xf2fc,
-        0xf2fd: 0xf2fd,
-        0xf2fe: 0xf2fe,
-        0xf2ff: 0xf2ff,
-    },
-    "Font Awesome Extension": {
-        0xe000: 0xe200,
-        0xe001: 0xe201,
-        0xe002: 0xe202,
-        0xe003: 0xe203,
-        0xe004: 0xe204,
-        0xe005: 0xe205,
-        0xe006: 0xe206,
-        0xe007: 0xe207,
-        0xe008: 0xe208,
-        0xe009: 0xe209,
-        0xe00a: 0xe20a,
-        0xe00b: 0xe20b,
-        0xe00c: 0xe20c,
-        0xe00d: 0xe20d,
-        0xe00e: 0xe20e,
-        0xe00f: 0xe20f,
-        0xe010: 0xe210,
-        0xe011: 0xe211,
-        0xe012: 0xe212,
-        0xe013: 0xe213,
-        0xe014: 0xe214,
-        0xe015: 0xe215,
-        0xe016: 0xe216,
-        0xe017: 0xe217,
-        0xe018: 0xe218,
-        0xe019: 0xe219,
-        0xe01a: 0xe21a,
-        0xe01b: 0xe21b,
-        0xe01c: 0xe21c,
-        0xe01d: 0xe21d,
-        0xe01e: 0xe21e,
-        0xe01f: 0xe21f,
-        0xe020: 0xe220,
-        0xe021: 0xe221,
-        0xe022: 0xe222,
-        0xe023: 0xe223,
-        0xe024: 0xe224,
-        0xe025: 0xe225,
-        0xe026: 0xe226,
-        0xe027: 0xe227,
-        0xe028: 0xe228,
-        0xe029: 0xe229,
-        0xe02a: 0xe22a,
-        0xe02b: 0xe22b,
-        0xe02c: 0xe22c,
-        0xe02d: 0xe22d,
-        0xe02e: 0xe22e,
-        0xe02f: 0xe22f,
-        0xe030: 0xe230,
-        0xe031: 0xe231,
-        0xe032: 0xe232,
-        0xe033: 0xe233,
-        0xe034: 0xe234,
-        0xe035: 0xe235,
-        0xe036: 0xe236,
-        0xe037: 0xe237,
-        0xe038: 0xe238,
-        0xe039: 0xe239,
-        0xe03a: 0xe23a,
-        0xe03b: 0xe23b,
-        0xe03c: 0xe23c,
-        0xe03d: 0xe23d,
-        0xe03e: 0xe23e,
-        0xe03f: 0xe23f,
-        0xe040: 0xe240,
-        0xe041: 0xe241,
-        0xe042: 0xe242,
-        0xe043: 0xe243,
-        0xe044: 0xe244,
-        0xe045: 0xe245,
-        0xe046: 0xe246,
-        0xe047: 0xe247,
-        0xe048: 0xe248,
-        0xe049: 0xe249,
-        0xe04a: 0xe24a,
-        0xe04b: 0xe24b,
-        0xe04c: 0xe24c,
-        0xe04d: 0xe24d,
-        0xe04e: 0xe24e,
-        0xe04f: 0xe24f,
-        0xe050: 0xe250,
-        0xe051: 0xe251,
-        0xe052: 0xe252,
-        0xe053: 0xe253,
-        0xe054: 0xe254,
-        0xe055: 0xe255,
-        0xe056: 0xe256,
-        0xe057: 0xe257,
-        0xe058: 0xe258,
-        0xe059: 0xe259,
-        0xe05a: 0xe25a,
-        0xe05b: 0xe25b,
-        0xe05c: 0xe25c,
-        0xe05d: 0xe25d,
-        0xe05e: 0xe25e,
-        0xe05f: 0xe25f,
-        0xe060: 0xe260,
-        0xe061: 0xe261,
-        0xe062: 0xe262,
-        0xe063: 0xe263,
-        0xe064: 0xe264,
-        0xe065: 0xe265,
-        0xe066: 0xe266,
-        0xe067: 0xe267,
-        0xe068: 0xe268,
-        0xe069: 0xe269,
-        0xe06a: 0xe26a,
-        0xe06b: 0xe26b,
-        0xe06c: 0xe26c,
-        0xe06d: 0xe26d,
-        0xe06e: 0xe26e,
-        0xe06f: 0xe26f,
-        0xe070: 0xe270,
-        0xe071: 0xe271,
-        0xe072: 0xe272,
-        0xe073: 0xe273,
-        0xe074: 0xe274,
-        0xe075: 0xe275,
-        0xe076: 0xe276,
-        0xe077: 0xe277,
-        0xe078: 0xe278,
-        0xe079: 0xe279,
-        0xe07a: 0xe27a,
-        0xe07b: 0xe27b,
-        0xe07c: 0xe27c,
-        0xe07d: 0xe27d,
-        0xe07e: 0xe27e,
-        0xe07f: 0xe27f,
-        0xe080: 0xe280,
-        0xe081: 0xe281,
-        0xe082: 0xe282,
-        0xe083: 0xe283,
-        0xe084: 0xe284,
-        0xe085: 0xe285,
-        0xe086: 0xe286,
-        0xe087: 0xe287,
-        0xe088: 0xe288,
-        0xe089: 0xe289,
-        0xe08a: 0xe28a,
-        0xe08b: 0xe28b,
-        0xe08c: 0xe28c,
-        0xe08d: 0xe28d,
-        0xe08e: 0xe28e,
-        0xe08f: 0xe28f,
-        0xe090: 0xe290,
-        0xe091: 0xe291,
-        0xe092: 0xe292,
-        0xe093: 0xe293,
-        0xe094: 0xe294,
-        0xe095: 0xe295,
-        0xe096: 0xe296,
-        0xe097: 0xe297,
-        0xe098: 0xe298,
-        0xe099: 0xe299,
-        0xe09a: 0xe29a,
-        0xe09b: 0xe29b,
-        0xe09c: 0xe29c,
-        0xe09d: 0xe29d,
-        0xe09e: 0xe29e,
-        0xe09f: 0xe29f,
-        0xe0a0: 0xe2a0,
-        0xe0a1: 0xe2a1,
-        0xe0a2: 0xe2a2,
-        0xe0a3: 0xe2a3,
-        0xe0a4: 0xe2a4,
-        0xe0a5: 0xe2a5,
-        0xe0a6: 0xe2a6,
-        0xe0a7: 0xe2a7,
-        0xe0a8: 0xe2a8,
-        0xe0a9: 0xe2a9,
-    },
-    "Power Symbols": {
-        0x23fb: 0x23fb,
-        0x23fc: 0x23fc,
-        0x23fd: 0x23fd,
-        0x23fe: 0x23fe,
-        0x2b58: 0x2b58,
-    },
-    "Material": {
-        0xf0001: 0xf0001,
-        0xf0002: 0xf0002,
-        0xf0003: 0xf0003,
-        0xf0004: 0xf0004,
-        0xf0005: 0xf0005,
-        0xf0006: 0xf0006,
-        0xf0007: 0xf0007,
-        0xf0008: 0xf0008,
-        0xf0009: 0xf0009,
-        0xf000a: 0xf000a,
-        0xf000b: 0xf000b,
-        0xf000c: 0xf000c,
-        0xf000d: 0xf000d,
-        0xf000e: 0xf000e,
-        0xf000f: 0xf000f,
-        0xf0010: 0xf0010,
-        0xf0011: 0xf0011,
-        0xf0012: 0xf0012,
-        0xf0013: 0xf0013,
-        0xf0014: 0xf0014,
-        0xf0015: 0xf0015,
-        0xf0016: 0xf0016,
-        0xf0017: 0xf0017,
-        0xf0018: 0xf0018,
-        0xf0019: 0xf0019,
-        0xf001a: 0xf001a,
-        0xf001b: 0xf001b,
-        0xf001c: 0xf001c,
-        0xf001d: 0xf001d,
-        0xf001e: 0xf001e,
-        0xf001f: 0xf001f,
-        0xf0020: 0xf0020,
-        0xf0021: 0xf0021,
-        0xf0022: 0xf0022,
-        0xf0023: 0xf0023,
-        0xf0024: 0xf0024,
-        0xf0025: 0xf0025,
-        0xf0026: 0xf0026,
-        0xf0027: 0xf0027,
-        0xf0028: 0xf0028,
-        0xf0029: 0xf0029,
-        0xf002a: 0xf002a,
-        0xf002b: 0xf002b,
-        0xf002c: 0xf002c,
-        0xf002d: 0xf002d,
-        0xf002e: 0xf002e,
-        0xf002f: 0xf002f,
-        0xf0030: 0xf0030,
-        0xf0031: 0xf0031,
-        0xf0032: 0xf0032,
-        0xf0033: 0xf0033,
-        0xf0034: 0xf0034,
-        0xf0035: 0xf0035,
-        0xf0036: 0xf0036,
-        0xf0037: 0xf0037,
-        0xf0038: 0xf0038,
-        0xf0039: 0xf0039,
-        0xf003a: 0xf003a,
-        0xf003b: 0xf003b,
-        0xf003c: 0xf003c,
-        0xf003d: 0xf003d,
-        0xf003e: 0xf003e,
-        0xf003f: 0xf003f,
-        0xf0040: 0xf0040,
-        0xf0041: 0xf0041,
-        0xf0042: 0xf0042,
-        0xf0043: 0xf0043,
-        0xf0044: 0xf0044,
-        0xf0045: 0xf0045,
-        0xf0046: 0xf0046,
-        0xf0047: 0xf0047,
-        0xf0048: 0xf0048,
-        0xf0049: 0xf0049,
-        0xf004a: 0xf004a,
-        0xf004b: 0xf004b,
-        0xf004c: 0xf004c,
-        0xf004d: 0xf004d,
-        0xf004e: 0xf004e,
-        0xf004f: 0xf004f,
-        0xf0050: 0xf0050,
-        0xf0051: 0xf0051,
-        0xf0052: 0xf0052,
-        0xf0053: 0xf0053,
-        0xf0054: 0xf0054,
-        0xf0055: 0xf0055,
-        0xf0056: 0xf0056,
-        0xf0057: 0xf0057,
-        0xf0058: 0xf0058,
-        0xf0059: 0xf0059,
-        0xf005a: 0xf005a,
-        0xf005b: 0xf005b,
-        0xf005c: 0xf005c,
-        0xf005d: 0xf005d,
-        0xf005e: 0xf005e,
-        0xf005f: 0xf005f,
-        0xf0060: 0xf0060,
-        0xf0061: 0xf0061,
-        0xf0062: 0xf0062,
-        0xf0063: 0xf0063,
-        0xf0064: 0xf0064,
-        0xf0065: 0xf0065,
-        0xf0066: 0xf0066,
-        0xf0067: 0xf0067,
-        0xf0068: 0xf0068,
-        0xf0069: 0xf0069,
-        0xf006a: 0xf006a,
-        0xf006b: 0xf006b,
-        0xf006c: 0xf006c,
-        0xf006d: 0xf006d,
-        0xf006e: 0xf006e,
-        0xf006f: 0xf006f,
-        0xf0070: 0xf0070,
-        0xf0071: 0xf0071,
-        0xf0072: 0xf0072,
-        0xf0073: 0xf0073,
-        0xf0074: 0xf0074,
-        0xf0075: 0xf0075,
-        0xf0076: 0xf0076,
-        0xf0077: 0xf0077,
-        0xf0078: 0xf0078,
-        0xf0079: 0xf0079,
-        0xf007a: 0xf007a,
-        0xf007b: 0xf007b,
-        0xf007c: 0xf007c,
-        0xf007d: 0xf007d,
-        0xf007e: 0xf007e,
-        0xf007f: 0xf007f,
-        0xf0080: 0xf0080,
-        0xf0081: 0xf0081,
-        0xf0082: 0xf0082,
-        0xf0083: 0xf0083,
-        0xf0084: 0xf0084,
-        0xf0085: 0xf0085,
-        0xf0086: 0xf0086,
-        0xf0087: 0xf0087,
-        0xf0088: 0xf0088,
-        0xf0089: 0xf0089,
-        0xf008a: 0xf008a,
-        0xf008b: 0xf008b,
-        0xf008c: 0xf008c,
-        0xf008d: 0xf008d,
-        0xf008e: 0xf008e,
-        0xf008f: 0xf008f,
-        0xf0090: 0xf0090,
-        0xf0091: 0xf0091,
-        0xf0092: 0xf0092,
-        0xf0093: 0xf0093,
-        0xf0094: 0xf0094,
-        0xf0095: 0xf0095,
-        0xf0096: 0xf0096,
-        0xf0097: 0xf0097,
-        0xf0098: 0xf0098,
-        0xf0099: 0xf0099,
-        0xf009a: 0xf009a,
-        0xf009b: 0xf009b,
-        0xf009c: 0xf009c,
-        0xf009d: 0xf009d,
-        0xf009e: 0xf009e,
-        0xf009f: 0xf009f,
-        0xf00a0: 0xf00a0,
-        0xf00a1: 0xf00a1,
-        0xf00a2: 0xf00a2,
-        0xf00a3: 0xf00a3,
-        0xf00a4: 0xf00a4,
-        0xf00a5: 0xf00a5,
-        0xf00a6: 0xf00a6,
-        0xf00a7: 0xf00a7,
-        0xf00a8: 0xf00a8,
-        0xf00a9: 0xf00a9,
-        0xf00aa: 0xf00aa,
-        0xf00ab: 0xf00ab,
-        0xf00ac: 0xf00ac,
-        0xf00ad: 0xf00ad,
-        0xf00ae: 0xf00ae,
-        0xf00af: 0xf00af,
-        0xf00b0: 0xf00b0,
-        0xf00b1: 0xf00b1,
-        0xf00b2: 0xf00b2,
-        0xf00b3: 0xf00b3,
-        0xf00b4: 0xf00b4,
-        0xf00b5: 0xf00b5,
-        0xf00b6: 0xf00b6,
-        0xf00b7: 0xf00b7,
-        0xf00b8: 0xf00b8,
-        0xf00b9: 0xf00b9,
-        0xf00ba: 0xf00ba,
-        0xf00bb: 0xf00bb,
-        0xf00bc: 0xf00bc,
-        0xf00bd: 0xf00bd,
-        0xf00be: 0xf00be,
-        0xf00bf: 0xf00bf,
-        0xf00c0: 0xf00c0,
-        0xf00c1: 0xf00c1,
-        0xf00c2: 0xf00c2,
-        0xf00c3: 0xf00c3,
-        0xf00c4: 0xf00c4,
-        0xf00c5: 0xf00c5,
-        0xf00c6: 0xf00c6,
-        0xf00c7: 0xf00c7,
-        0xf00c8: 0xf00c8,
-        0xf00c9: 0xf00c9,
-        0xf00ca: 0xf00ca,
-        0xf00cb: 0xf00cb,
-        0xf00cc: 0xf00cc,
-        0xf00cd: 0xf00cd,
-        0xf00ce: 0xf00ce,
-        0xf00cf: 0xf00cf,
-        0xf00d0: 0xf00d0,
-        0xf00d1: 0xf00d1,
-        0xf00d2: 0xf00d2,
-        0xf00d3: 0xf00d3,
-        0xf00d4: 0xf00d4,
-        0xf00d5: 0xf00d5,
-        0xf00d6: 0xf00d6,
-        0xf00d7: 0xf00d7,
-        0xf00d8: 0xf00d8,
-        0xf00d9: 0xf00d9,
-        0xf00da: 0xf00da,
-        0xf00db: 0xf00db,
-        0xf00dc: 0xf00dc,
-        0xf00dd: 0xf00dd,
-        0xf00de: 0xf00de,
-        0xf00df: 0xf00df,
-        0xf00e0: 0xf00e0,
-        0xf00e1: 0xf00e1,
-        0xf00e2: 0xf00e2,
-        0xf00e3: 0xf00e3,
-        0xf00e4: 0xf00e4,
-        0xf00e5: 0xf00e5,
-        0xf00e6: 0xf00e6,
-        0xf00e7: 0xf00e7,
-        0xf00e8: 0xf00e8,
-        0xf00e9: 0xf00e9,
-        0xf00ea: 0xf00ea,
-        0xf00eb: 0xf00eb,
-        0xf00ec: 0xf00ec,
-        0xf00ed: 0xf00ed,
-        0xf00ee: 0xf00ee,
-        0xf00ef: 0xf00ef,
-        0xf00f0: 0xf00f0,
-        0xf00f1: 0xf00f1,
-        0xf00f2: 0xf00f2,
-        0xf00f3: 0xf00f3,
-        0xf00f4: 0xf00f4,
-        0xf00f5: 0xf00f5,
-        0xf00f6: 0xf00f6,
-        0xf00f7: 0xf00f7,
-        0xf00f8: 0xf00f8,
-        0xf00f9: 0xf00f9,
-        0xf00fa: 0xf00fa,
-        0xf00fb: 0xf00fb,
-        0xf00fc: 0xf00fc,
-        0xf00fd: 0xf00fd,
-        0xf00fe: 0xf00fe,
-        0xf00ff: 0xf00ff,
-        0xf0100: 0xf0100,
-        0xf0101: 0xf0101,
-        0xf0102: 0xf0102,
-        0xf0103: 0xf0103,
-        0xf0104: 0xf0104,
-        0xf0105: 0xf0105,
-        0xf0106: 0xf0106,
-        0xf0107: 0xf0107,
-        0xf0108: 0xf0108,
-        0xf0109: 0xf0109,
-        0xf010a: 0xf010a,
-        0xf010b: 0xf010b,
-        0xf010c: 0xf010c,
-        0xf010d: 0xf010d,
-        0xf010e: 0xf010e,
-        0xf010f: 0xf010f,
-        0xf0110: 0xf0110,
-        0xf0111: 0xf0111,
-        0xf0112: 0xf0112,
-        0xf0113: 0xf0113,
-        0xf0114: 0xf0114,
-        0xf0115: 0xf0115,
-        0xf0116: 0xf0116,
-        0xf0117: 0xf0117,
-        0xf0118: 0xf0118,
-        0xf0119: 0xf0119,
-        0xf011a: 0xf011a,
-        0xf011b: 0xf011b,
-        0xf011c: 0xf011c,
-        0xf011d: 0xf011d,
-        0xf011e: 0xf011e,
-        0xf011f: 0xf011f,
-        0xf0120: 0xf0120,
-        0xf0121: 0xf0121,
-        0xf0122: 0xf0122,
-        0xf0123: 0xf0123,
-        0xf0124: 0xf0124,
-        0xf0125: 0xf0125,
-        0xf0126: 0xf0126,
-        0xf0127: 0xf0127,
-        0xf0128: 0xf0128,
-        0xf0129: 0xf0129,
-        0xf012a: 0xf012a,
-        0xf012b: 0xf012b,
-        0xf012c: 0xf012c,
-        0xf012d: 0xf012d,
-        0xf012e: 0xf012e,
-        0xf012f: 0xf012f,
-        0xf0130: 0xf0130,
-        0xf0131: 0xf0131,
-        0xf0132: 0xf0132,
-        0xf0133: 0xf0133,
-        0xf0134: 0xf0134,
-        0xf0135: 0xf0135,
-        0xf0136: 0xf0136,
-        0xf0137: 0xf0137,
-        0xf0138: 0xf0138,
-        0xf0139: 0xf0139,
-        0xf013a: 0xf013a,
-        0xf013b: 0xf013b,
-        0xf013c: 0xf013c,
-        0xf013d: 0xf013d,
-        0xf013e: 0xf013e,
-        0xf013f: 0xf013f,
-        0xf0140: 0xf0140,
-        0xf0141: 0xf0141,
-        0xf0142: 0xf0142,
-        0xf0143: 0xf0143,
-        0xf0144: 0xf0144,
-        0xf0145: 0xf0145,
-        0xf0146: 0xf0146,
-        0xf0147: 0xf0147,
-        0xf0148: 0xf0148,
-        0xf0149: 0xf0149,
-        0xf014a: 0xf014a,
-        0xf014b: 0xf014b,
-        0xf014c: 0xf014c,
-        0xf014d: 0xf014d,
-        0xf014e: 0xf014e,
-        0xf014f: 0xf014f,
-        0xf0150: 0xf0150,
-        0xf0151: 0xf0151,
-        0xf0152: 0xf0152,
-        0xf0153: 0xf0153,
-        0xf0154: 0xf0154,
-        0xf0155: 0xf0155,
-        0xf0156: 0xf0156,
-        0xf0157: 0xf0157,
-        0xf0158: 0xf0158,
-        0xf0159: 0xf0159,
-        0xf015a: 0xf015a,
-        0xf015b: 0xf015b,
-        0xf015c: 0xf015c,
-        0xf015d: 0xf015d,
-        0xf015e: 0xf015e,
-        0xf015f: 0xf015f,
-        0xf0160: 0xf0160,
-        0xf0161: 0xf0161,
-        0xf0162: 0xf0162,
-        0xf0163: 0xf0163,
-        0xf0164: 0xf0164,
-        0xf0165: 0xf0165,
-        0xf0166: 0xf0166,
-        0xf0167: 0xf0167,
-        0xf0168: 0xf0168,
-        0xf0169: 0xf0169,
-        0xf016a: 0xf016a,
-        0xf016b: 0xf016b,
-        0xf016c: 0xf016c,
-        0xf016d: 0xf016d,
-        0xf016e: 0xf016e,
-        0xf016f: 0xf016f,
-        0xf0170: 0xf0170,
-        0xf0171: 0xf0171,
-        0xf0172: 0xf0172,
-        0xf0173: 0xf0173,
-        0xf0174: 0xf0174,
-        0xf0175: 0xf0175,
-        0xf0176: 0xf0176,
-        0xf0177: 0xf0177,
-        0xf0178: 0xf0178,
-        0xf0179: 0xf0179,
-        0xf017a: 0xf017a,
-        0xf017b: 0xf017b,
-        0xf017c: 0xf017c,
-        0xf017d: 0xf017d,
-        0xf017e: 0xf017e,
-        0xf017f: 0xf017f,
-        0xf0180: 0xf0180,
-        0xf0181: 0xf0181,
-        0xf0182: 0xf0182,
-        0xf0183: 0xf0183,
-        0xf0184: 0xf0184,
-        0xf0185: 0xf0185,
-        0xf0186: 0xf0186,
-        0xf0187: 0xf0187,
-        0xf0188: 0xf0188,
-        0xf0189: 0xf0189,
-        0xf018a: 0xf018a,
-        0xf018b: 0xf018b,
-        0xf018c: 0xf018c,
-        0xf018d: 0xf018d,
-        0xf018e: 0xf018e,
-        0xf018f: 0xf018f,
-        0xf0190: 0xf0190,
-        0xf0191: 0xf0191,
-        0xf0192: 0xf0192,
-        0xf0193: 0xf0193,
-        0xf0194: 0xf0194,
-        0xf0195: 0xf0195,
-        0xf0196: 0xf0196,
-        0xf0197: 0xf0197,
-        0xf0198: 0xf0198,
-        0xf0199: 0xf0199,
-        0xf019a: 0xf019a,
-        0xf019b: 0xf019b,
-        0xf019c: 0xf019c,
-        0xf019d: 0xf019d,
-        0xf019e: 0xf019e,
-        0xf019f: 0xf019f,
-        0xf01a0: 0xf01a0,
-        0xf01a1: 0xf01a1,
-        0xf01a2: 0xf01a2,
-        0xf01a3: 0xf01a3,
-        0xf01a4: 0xf01a4,
-        0xf01a5: 0xf01a5,
-        0xf01a6: 0xf01a6,
-        0xf01a7: 0xf01a7,
-        0xf01a8: 0xf01a8,
-        0xf01a9: 0xf01a9,
-        0xf01aa: 0xf01aa,
-        0xf01ab: 0xf01ab,
-        0xf01ac: 0xf01ac,
-        0xf01ad: 0xf01ad,
-        0xf01ae: 0xf01ae,
-        0xf01af: 0xf01af,
-        0xf01b0: 0xf01b0,
-        0xf01b1: 0xf01b1,
-        0xf01b2: 0xf01b2,
-        0xf01b3: 0xf01b3,
-        0xf01b4: 0xf01b4,
-        0xf01b5: 0xf01b5,
-        0xf01b6: 0xf01b6,
-        0xf01b7: 0xf01b7,
-        0xf01b8: 0xf01b8,
-        0xf01b9: 0xf01b9,
-        0xf01ba: 0xf01ba,
-        0xf01bb: 0xf01bb,
-        0xf01bc: 0xf01bc,
-        0xf01bd: 0xf01bd,
-        0xf01be: 0xf01be,
-        0xf01bf: 0xf01bf,
-        0xf01c0: 0xf01c0,
-        0xf01c1: 0xf01c1,
-        0xf01c2: 0xf01c2,
-        0xf01c3: 0xf01c3,
-        0xf01c4: 0xf01c4,
-        0xf01c5: 0xf01c5,
-        0xf01c6: 0xf01c6,
-        0xf01c7: 0xf01c7,
-        0xf01c8: 0xf01c8,
-        0xf01c9: 0xf01c9,
-        0xf01ca: 0xf01ca,
-        0xf01cb: 0xf01cb,
-        0xf01cc: 0xf01cc,
-        0xf01cd: 0xf01cd,
-        0xf01ce: 0xf01ce,
-        0xf01cf: 0xf01cf,
-        0xf01d0: 0xf01d0,
-        0xf01d1: 0xf01d1,
-        0xf01d2: 0xf01d2,
-        0xf01d3: 0xf01d3,
-        0xf01d4: 0xf01d4,
-        0xf01d5: 0xf01d5,
-        0xf01d6: 0xf01d6,
-        0xf01d7: 0xf01d7,
-        0xf01d8: 0xf01d8,
-        0xf01d9: 0xf01d9,
-        0xf01da: 0xf01da,
-        0xf01db: 0xf01db,
-        0xf01dc: 0xf01dc,
-        0xf01dd: 0xf01dd,
-        0xf01de: 0xf01de,
-        0xf01df: 0xf01df,
-        0xf01e0: 0xf01e0,
-        0xf01e1: 0xf01e1,
-        0xf01e2: 0xf01e2,
-        0xf01e3: 0xf01e3,
-        0xf01e4: 0xf01e4,
-        0xf01e5: 0xf01e5,
-        0xf01e6: 0xf01e6,
-        0xf01e7: 0xf01e7,
-        0xf01e8: 0xf01e8,
-        0xf01e9: 0xf01e9,
-        0xf01ea: 0xf01ea,
-        0xf01eb: 0xf01eb,
-        0xf01ec: 0xf01ec,
-        0xf01ed: 0xf01ed,
-        0xf01ee: 0xf01ee,
-        0xf01ef: 0xf01ef,
-        0xf01f0: 0xf01f0,
-        0xf01f1: 0xf01f1,
-        0xf01f2: 0xf01f2,
-        0xf01f3: 0xf01f3,
-        0xf01f4: 0xf01f4,
-        0xf01f5: 0xf01f5,
-        0xf01f6: 0xf01f6,
-        0xf01f7: 0xf01f7,
-        0xf01f8: 0xf01f8,
-        0xf01f9: 0xf01f9,
-        0xf01fa: 0xf01fa,
-        0xf01fb: 0xf01fb,
-        0xf01fc: 0xf01fc,
-        0xf01fd: 0xf01fd,
-        0xf01fe: 0xf01fe,
-        0xf01ff: 0xf01ff,
-        0xf0200: 0xf0200,
-        0xf0201: 0xf0201,
-        0xf0202: 0xf0202,
-        0xf0203: 0xf0203,
-        0xf0204: 0xf0204,
-        0xf0205: 0xf0205,
-        0xf0206: 0xf0206,
-        0xf0207: 0xf0207,
-        0xf0208: 0xf0208,
-        0xf0209: 0xf0209,
-        0xf020a: 0xf020a,
-        0xf020b: 0xf020b,
-        0xf020c: 0xf020c,
-        0xf020d: 0xf020d,
-        0xf020e: 0xf020e,
-        0xf020f: 0xf020f,
-        0xf0210: 0xf0210,
-        0xf0211: 0xf0211,
-        0xf0212: 0xf0212,
-        0xf0213: 0xf0213,
-        0xf0214: 0xf0214,
-        0xf0215: 0xf0215,
-        0xf0216: 0xf0216,
-        0xf0217: 0xf0217,
-        0xf0218: 0xf0218,
-        0xf0219: 0xf0219,
-        0xf021a: 0xf021a,
-        0xf021b: 0xf021b,
-        0xf021c: 0xf021c,
-        0xf021d: 0xf021d,
-        0xf021e: 0xf021e,
-        0xf021f: 0xf021f,
-        0xf0220: 0xf0220,
-        0xf0221: 0xf0221,
-        0xf0222: 0xf0222,
-        0xf0223: 0xf0223,
-        0xf0224: 0xf0224,
-        0xf0225: 0xf0225,
-        0xf0226: 0xf0226,
-        0xf0227: 0xf0227,
-        0xf0228: 0xf0228,
-        0xf0229: 0xf0229,
-        0xf022a: 0xf022a,
-        0xf022b: 0xf022b,
-        0xf022c: 0xf022c,
-        0xf022d: 0xf022d,
-        0xf022e: 0xf022e,
-        0xf022f: 0xf022f,
-        0xf0230: 0xf0230,
-        0xf0231: 0xf0231,
-        0xf0232: 0xf0232,
-        0xf0233: 0xf0233,
-        0xf0234: 0xf0234,
-        0xf0235: 0xf0235,
-        0xf0236: 0xf0236,
-        0xf0237: 0xf0237,
-        0xf0238: 0xf0238,
-        0xf0239: 0xf0239,
-        0xf023a: 0xf023a,
-        0xf023b: 0xf023b,
-        0xf023c: 0xf023c,
-        0xf023d: 0xf023d,
-        0xf023e: 0xf023e,
-        0xf023f: 0xf023f,
-        0xf0240: 0xf0240,
-        0xf0241: 0xf0241,
-        0xf0242: 0xf0242,
-        0xf0243: 0xf0243,
-        0xf0244: 0xf0244,
-        0xf0245: 0xf0245,
-        0xf0246: 0xf0246,
-        0xf0247: 0xf0247,
-        0xf0248: 0xf0248,
-        0xf0249: 0xf0249,
-        0xf024a: 0xf024a,
-        0xf024b: 0xf024b,
-        0xf024c: 0xf024c,
-        0xf024d: 0xf024d,
-        0xf024e: 0xf024e,
-        0xf024f: 0xf024f,
-        0xf0250: 0xf0250,
-        0xf0251: 0xf0251,
-        0xf0252: 0xf0252,
-        0xf0253: 0xf0253,
-        0xf0254: 0xf0254,
-        0xf0255: 0xf0255,
-        0xf0256: 0xf0256,
-        0xf0257: 0xf0257,
-        0xf0258: 0xf0258,
-        0xf0259: 0xf0259,
-        0xf025a: 0xf025a,
-        0xf025b: 0xf025b,
-        0xf025c: 0xf025c,
-        0xf025d: 0xf025d,
-        0xf025e: 0xf025e,
-        0xf025f: 0xf025f,
-        0xf0260: 0xf0260,
-        0xf0261: 0xf0261,
-        0xf0262: 0xf0262,
-        0xf0263: 0xf0263,
-        0xf0264: 0xf0264,
-        0xf0265: 0xf0265,
-        0xf0266: 0xf0266,
-        0xf0267: 0xf0267,
-        0xf0268: 0xf0268,
-        0xf0269: 0xf0269,
-        0xf026a: 0xf026a,
-        0xf026b: 0xf026b,
-        0xf026c: 0xf026c,
-        0xf026d: 0xf026d,
-        0xf026e: 0xf026e,
-        0xf026f: 0xf026f,
-        0xf0270: 0xf0270,
-        0xf0271: 0xf0271,
-        0xf0272: 0xf0272,
-        0xf0273: 0xf0273,
-        0xf0274: 0xf0274,
-        0xf0275: 0xf0275,
-        0xf0276: 0xf0276,
-        0xf0277: 0xf0277,
-        0xf0278: 0xf0278,
-        0xf0279: 0xf0279,
-        0xf027a: 0xf027a,
-        0xf027b: 0xf027b,
-        0xf027c: 0xf027c,
-        0xf027d: 0xf027d,
-        0xf027e: 0xf027e,
-        0xf027f: 0xf027f,
-        0xf0280: 0xf0280,
-        0xf0281: 0xf0281,
-        0xf0282: 0xf0282,
-        0xf0283: 0xf0283,
-        0xf0284: 0xf0284,
-        0xf0285: 0xf0285,
-        0xf0286: 0xf0286,
-        0xf0287: 0xf0287,
-        0xf0288: 0xf0288,
-        0xf0289: 0xf0289,
-        0xf028a: 0xf028a,
-        0xf028b: 0xf028b,
-        0xf028c: 0xf028c,
-        0xf028d: 0xf028d,
-        0xf028e: 0xf028e,
-        0xf028f: 0xf028f,
-        0xf0290: 0xf0290,
-        0xf0291: 0xf0291,
-        0xf0292: 0xf0292,
-        0xf0293: 0xf0293,
-        0xf0294: 0xf0294,
-        0xf0295: 0xf0295,
-        0xf0296: 0xf0296,
-        0xf0297: 0xf0297,
-        0xf0298: 0xf0298,
-        0xf0299: 0xf0299,
-        0xf029a: 0xf029a,
-        0xf029b: 0xf029b,
-        0xf029c: 0xf029c,
-        0xf029d: 0xf029d,
-        0xf029e: 0xf029e,
-        0xf029f: 0xf029f,
-        0xf02a0: 0xf02a0,
-        0xf02a1: 0xf02a1,
-        0xf02a2: 0xf02a2,
-        0xf02a3: 0xf02a3,
-        0xf02a4: 0xf02a4,
-        0xf02a5: 0xf02a5,
-        0xf02a6: 0xf02a6,
-        0xf02a7: 0xf02a7,
-        0xf02a8: 0xf02a8,
-        0xf02a9: 0xf02a9,
-        0xf02aa: 0xf02aa,
-        0xf02ab: 0xf02ab,
-        0xf02ac: 0xf02ac,
-        0xf02ad: 0xf02ad,
-        0xf02ae: 0xf02ae,
-        0xf02af: 0xf02af,
-        0xf02b0: 0xf02b0,
-        0xf02b1: 0xf02b1,
-        0xf02b2: 0xf02b2,
-        0xf02b3: 0xf02b3,
-        0xf02b4: 0xf02b4,
-        0xf02b5: 0xf02b5,
-        0xf02b6: 0xf02b6,
-        0xf02b7: 0xf02b7,
-        0xf02b8: 0xf02b8,
-        0xf02b9: 0xf02b9,
-        0xf02ba: 0xf02ba,
-        0xf02bb: 0xf02bb,
-        0xf02bc: 0xf02bc,
-        0xf02bd: 0xf02bd,
-        0xf02be: 0xf02be,
-        0xf02bf: 0xf02bf,
-        0xf02c0: 0xf02c0,
-        0xf02c1: 0xf02c1,
-        0xf02c2: 0xf02c2,
-        0xf02c3: 0xf02c3,
-        0xf02c4: 0xf02c4,
-        0xf02c5: 0xf02c5,
-        0xf02c6: 0xf02c6,
-        0xf02c7: 0xf02c7,
-        0xf02c8: 0xf02c8,
-        0xf02c9: 0xf02c9,
-        0xf02ca: 0xf02ca,
-        0xf02cb: 0xf02cb,
-        0xf02cc: 0xf02cc,
-        0xf02cd: 0xf02cd,
-        0xf02ce: 0xf02ce,
-        0xf02cf: 0xf02cf,
-        0xf02d0: 0xf02d0,
-        0xf02d1: 0xf02d1,
-        0xf02d2: 0xf02d2,
-        0xf02d3: 0xf02d3,
-        0xf02d4: 0xf02d4,
-        0xf02d5: 0xf02d5,
-        0xf02d6: 0xf02d6,
-        0xf02d7: 0xf02d7,
-        0xf02d8: 0xf02d8,
-        0xf02d9: 0xf02d9,
-        0xf02da: 0xf02da,
-        0xf02db: 0xf02db,
-        0xf02dc: 0xf02dc,
-        0xf02dd: 0xf02dd,
-        0xf02de: 0xf02de,
-        0xf02df: 0xf02df,
-        0xf02e0: 0xf02e0,
-        0xf02e1: 0xf02e1,
-        0xf02e2: 0xf02e2,
-        0xf02e3: 0xf02e3,
-        0xf02e4: 0xf02e4,
-        0xf02e5: 0xf02e5,
-        0xf02e6: 0xf02e6,
-        0xf02e7: 0xf02e7,
-        0xf02e8: 0xf02e8,
-        0xf02e9: 0xf02e9,
-        0xf02ea: 0xf02ea,
-        0xf02eb: 0xf02eb,
-        0xf02ec: 0xf02ec,
-        0xf02ed: 0xf02ed,
-        0xf02ee: 0xf02ee,
-        0xf02ef: 0xf02ef,
-        0xf02f0: 0xf02f0,
-        0xf02f1: 0xf02f1,
-        0xf02f2: 0xf02f2,
-        0xf02f3: 0xf02f3,
-        0xf02f4: 0xf02f4,
-        0xf02f5: 0xf02f5,
-        0xf02f6: 0xf02f6,
-        0xf02f7: 0xf02f7,
-        0xf02f8: 0xf02f8,
-        0xf02f9: 0xf02f9,
-        0xf02fa: 0xf02fa,
-        0xf02fb: 0xf02fb,
-        0xf02fc: 0xf02fc,
-        0xf02fd: 0xf02fd,
-        0xf02fe: 0xf02fe,
-        0xf02ff: 0xf02ff,
-        0xf0300: 0xf0300,
-        0xf0301: 0xf0301,
-        0xf0302: 0xf0302,
-        0xf0303: 0xf0303,
-        0xf0304: 0xf0304,
-        0xf0305: 0xf0305,
-        0xf0306: 0xf0306,
-        0xf0307: 0xf0307,
-        0xf0308: 0xf0308,
-        0xf0309: 0xf0309,
-        0xf030a: 0xf030a,
-        0xf030b: 0xf030b,
-        0xf030c: 0xf030c,
-        0xf030d: 0xf030d,
-        0xf030e: 0xf030e,
-        0xf030f: 0xf030f,
-        0xf0310: 0xf0310,
-        0xf0311: 0xf0311,
-        0xf0312: 0xf0312,
-        0xf0313: 0xf0313,
-        0xf0314: 0xf0314,
-        0xf0315: 0xf0315,
-        0xf0316: 0xf0316,
-        0xf0317: 0xf0317,
-        0xf0318: 0xf0318,
-        0xf0319: 0xf0319,
-        0xf031a: 0xf031a,
-        0xf031b: 0xf031b,
-        0xf031c: 0xf031c,
-        0xf031d: 0xf031d,
-        0xf031e: 0xf031e,
-        0xf031f: 0xf031f,
-        0xf0320: 0xf0320,
-        0xf0321: 0xf0321,
-        0xf0322: 0xf0322,
-        0xf0323: 0xf0323,
-        0xf0324: 0xf0324,
-        0xf0325: 0xf0325,
-        0xf0326: 0xf0326,
-        0xf0327: 0xf0327,
-        0xf0328: 0xf0328,
-        0xf0329: 0xf0329,
-        0xf032a: 0xf032a,
-        0xf032b: 0xf032b,
-        0xf032c: 0xf032c,
-        0xf032d: 0xf032d,
-        0xf032e: 0xf032e,
-        0xf032f: 0xf032f,
-        0xf0330: 0xf0330,
-        0xf0331: 0xf0331,
-        0xf0332: 0xf0332,
-        0xf0333: 0xf0333,
-        0xf0334: 0xf0334,
-        0xf0335: 0xf0335,
-        0xf0336: 0xf0336,
-        0xf0337: 0xf0337,
-        0xf0338: 0xf0338,
-        0xf0339: 0xf0339,
-        0xf033a: 0xf033a,
-        0xf033b: 0xf033b,
-        0xf033c: 0xf033c,
-        0xf033d: 0xf033d,
-        0xf033e: 0xf033e,
-        0xf033f: 0xf033f,
-        0xf0340: 0xf0340,
-        0xf0341: 0xf0341,
-        0xf0342: 0xf0342,
-        0xf0343: 0xf0343,
-        0xf0344: 0xf0344,
-        0xf0345: 0xf0345,
-        0xf0346: 0xf0346,
-        0xf0347: 0xf0347,
-        0xf0348: 0xf0348,
-        0xf0349: 0xf0349,
-        0xf034a: 0xf034a,
-        0xf034b: 0xf034b,
-        0xf034c: 0xf034c,
-        0xf034d: 0xf034d,
-        0xf034e: 0xf034e,
-        0xf034f: 0xf034f,
-        0xf0350: 0xf0350,
-        0xf0351: 0xf0351,
-        0xf0352: 0xf0352,
-        0xf0353: 0xf0353,
-        0xf0354: 0xf0354,
-        0xf0355: 0xf0355,
-        0xf0356: 0xf0356,
-        0xf0357: 0xf0357,
-        0xf0358: 0xf0358,
-        0xf0359: 0xf0359,
-        0xf035a: 0xf035a,
-        0xf035b: 0xf035b,
-        0xf035c: 0xf035c,
-        0xf035d: 0xf035d,
-        0xf035e: 0xf035e,
-        0xf035f: 0xf035f,
-        0xf0360: 0xf0360,
-        0xf0361: 0xf0361,
-        0xf0362: 0xf0362,
-        0xf0363: 0xf0363,
-        0xf0364: 0xf0364,
-        0xf0365: 0xf0365,
-        0xf0366: 0xf0366,
-        0xf0367: 0xf0367,
-        0xf0368: 0xf0368,
-        0xf0369: 0xf0369,
-        0xf036a: 0xf036a,
-        0xf036b: 0xf036b,
-        0xf036c: 0xf036c,
-        0xf036d: 0xf036d,
-        0xf036e: 0xf036e,
-        0xf036f: 0xf036f,
-        0xf0370: 0xf0370,
-        0xf0371: 0xf0371,
-        0xf0372: 0xf0372,
-        0xf0373: 0xf0373,
-        0xf0374: 0xf0374,
-        0xf0375: 0xf0375,
-        0xf0376: 0xf0376,
-        0xf0377: 0xf0377,
-        0xf0378: 0xf0378,
-        0xf0379: 0xf0379,
-        0xf037a: 0xf037a,
-        0xf037b: 0xf037b,
-        0xf037c: 0xf037c,
-        0xf037d: 0xf037d,
-        0xf037e: 0xf037e,
-        0xf037f: 0xf037f,
-        0xf0380: 0xf0380,
-        0xf0381: 0xf0381,
-        0xf0382: 0xf0382,
-        0xf0383: 0xf0383,
-        0xf0384: 0xf0384,
-        0xf0385: 0xf0385,
-        0xf0386: 0xf0386,
-        0xf0387: 0xf0387,
-        0xf0388: 0xf0388,
-        0xf0389: 0xf0389,
-        0xf038a: 0xf038a,
-        0xf038b: 0xf038b,
-        0xf038c: 0xf038c,
-        0xf038d: 0xf038d,
-        0xf038e: 0xf038e,
-        0xf038f: 0xf038f,
-        0xf0390: 0xf0390,
-        0xf0391: 0xf0391,
-        0xf0392: 0xf0392,
-        0xf0393: 0xf0393,
-        0xf0394: 0xf0394,
-        0xf0395: 0xf0395,
-        0xf0396: 0xf0396,
-        0xf0397: 0xf0397,
-        0xf0398: 0xf0398,
-        0xf0399: 0xf0399,
-        0xf039a: 0xf039a,
-        0xf039b: 0xf039b,
-        0xf039c: 0xf039c,
-        0xf039d: 0xf039d,
-        0xf039e: 0xf039e,
-        0xf039f: 0xf039f,
-        0xf03a0: 0xf03a0,
-        0xf03a1: 0xf03a1,
-        0xf03a2: 0xf03a2,
-        0xf03a3: 0xf03a3,
-        0xf03a4: 0xf03a4,
-        0xf03a5: 0xf03a5,
-        0xf03a6: 0xf03a6,
-        0xf03a7: 0xf03a7,
-        0xf03a8: 0xf03a8,
-        0xf03a9: 0xf03a9,
-        0xf03aa: 0xf03aa,
-        0xf03ab: 0xf03ab,
-        0xf03ac: 0xf03ac,
-        0xf03ad: 0xf03ad,
-        0xf03ae: 0xf03ae,
-        0xf03af: 0xf03af,
-        0xf03b0: 0xf03b0,
-        0xf03b1: 0xf03b1,
-        0xf03b2: 0xf03b2,
-        0xf03b3: 0xf03b3,
-        0xf03b4: 0xf03b4,
-        0xf03b5: 0xf03b5,
-        0xf03b6: 0xf03b6,
-        0xf03b7: 0xf03b7,
-        0xf03b8: 0xf03b8,
-        0xf03b9: 0xf03b9,
-        0xf03ba: 0xf03ba,
-        0xf03bb: 0xf03bb,
-        0xf03bc: 0xf03bc,
-        0xf03bd: 0xf03bd,
-        0xf03be: 0xf03be,
-        0xf03bf: 0xf03bf,
-        0xf03c0: 0xf03c0,
-        0xf03c1: 0xf03c1,
-        0xf03c2: 0xf03c2,
-        0xf03c3: 0xf03c3,
-        0xf03c4: 0xf03c4,
-        0xf03c5: 0xf03c5,
-        0xf03c6: 0xf03c6,
-        0xf03c7: 0xf03c7,
-        0xf03c8: 0xf03c8,
-        0xf03c9: 0xf03c9,
-        0xf03ca: 0xf03ca,
-        0xf03cb: 0xf03cb,
-        0xf03cc: 0xf03cc,
-        0xf03cd: 0xf03cd,
-        0xf03ce: 0xf03ce,
-        0xf03cf: 0xf03cf,
-        0xf03d0: 0xf03d0,
-        0xf03d1: 0xf03d1,
-        0xf03d2: 0xf03d2,
-        0xf03d3: 0xf03d3,
-        0xf03d4: 0xf03d4,
-        0xf03d5: 0xf03d5,
-        0xf03d6: 0xf03d6,
-        0xf03d7: 0xf03d7,
-        0xf03d8: 0xf03d8,
-        0xf03d9: 0xf03d9,
-        0xf03da: 0xf03da,
-        0xf03db: 0xf03db,
-        0xf03dc: 0xf03dc,
-        0xf03dd: 0xf03dd,
-        0xf03de: 0xf03de,
-        0xf03df: 0xf03df,
-        0xf03e0: 0xf03e0,
-        0xf03e1: 0xf03e1,
-        0xf03e2: 0xf03e2,
-        0xf03e3: 0xf03e3,
-        0xf03e4: 0xf03e4,
-        0xf03e5: 0xf03e5,
-        0xf03e6: 0xf03e6,
-        0xf03e7: 0xf03e7,
-        0xf03e8: 0xf03e8,
-        0xf03e9: 0xf03e9,
-        0xf03ea: 0xf03ea,
-        0xf03eb: 0xf03eb,
-        0xf03ec: 0xf03ec,
-        0xf03ed: 0xf03ed,
-        0xf03ee: 0xf03ee,
-        0xf03ef: 0xf03ef,
-        0xf03f0: 0xf03f0,
-        0xf03f1: 0xf03f1,
-        0xf03f2: 0xf03f2,
-        0xf03f3: 0xf03f3,
-        0xf03f4: 0xf03f4,
-        0xf03f5: 0xf03f5,
-        0xf03f6: 0xf03f6,
-        0xf03f7: 0xf03f7,
-        0xf03f8: 0xf03f8,
-        0xf03f9: 0xf03f9,
-        0xf03fa: 0xf03fa,
-        0xf03fb: 0xf03fb,
-        0xf03fc: 0xf03fc,
-        0xf03fd: 0xf03fd,
-        0xf03fe: 0xf03fe,
-        0xf03ff: 0xf03ff,
-        0xf0400: 0xf0400,
-        0xf0401: 0xf0401,
-        0xf0402: 0xf0402,
-        0xf0403: 0xf0403,
-        0xf0404: 0xf0404,
-        0xf0405: 0xf0405,
-        0xf0406: 0xf0406,
-        0xf0407: 0xf0407,
-        0xf0408: 0xf0408,
-        0xf0409: 0xf0409,
-        0xf040a: 0xf040a,
-        0xf040b: 0xf040b,
-        0xf040c: 0xf040c,
-        0xf040d: 0xf040d,
-        0xf040e: 0xf040e,
-        0xf040f: 0xf040f,
-        0xf0410: 0xf0410,
-        0xf0411: 0xf0411,
-        0xf0412: 0xf0412,
-        0xf0413: 0xf0413,
-        0xf0414: 0xf0414,
-        0xf0415: 0xf0415,
-        0xf0416: 0xf0416,
-        0xf0417: 0xf0417,
-        0xf0418: 0xf0418,
-        0xf0419: 0xf0419,
-        0xf041a: 0xf041a,
-        0xf041b: 0xf041b,
-        0xf041c: 0xf041c,
-        0xf041d: 0xf041d,
-        0xf041e: 0xf041e,
-        0xf041f: 0xf041f,
-        0xf0420: 0xf0420,
-        0xf0421: 0xf0421,
-        0xf0422: 0xf0422,
-        0xf0423: 0xf0423,
-        0xf0424: 0xf0424,
-        0xf0425: 0xf0425,
-        0xf0426: 0xf0426,
-        0xf0427: 0xf0427,
-        0xf0428: 0xf0428,
-        0xf0429: 0xf0429,
-        0xf042a: 0xf042a,
-        0xf042b: 0xf042b,
-        0xf042c: 0xf042c,
-        0xf042d: 0xf042d,
-        0xf042e: 0xf042e,
-        0xf042f: 0xf042f,
-        0xf0430: 0xf0430,
-        0xf0431: 0xf0431,
-        0xf0432: 0xf0432,
-        0xf0433: 0xf0433,
-        0xf0434: 0xf0434,
-        0xf0435: 0xf0435,
-        0xf0436: 0xf0436,
-        0xf0437: 0xf0437,
-        0xf0438: 0xf0438,
-        0xf0439: 0xf0439,
-        0xf043a: 0xf043a,
-        0xf043b: 0xf043b,
-        0xf043c: 0xf043c,
-        0xf043d: 0xf043d,
-        0xf043e: 0xf043e,
-        0xf043f: 0xf043f,
-        0xf0440: 0xf0440,
-        0xf0441: 0xf0441,
-        0xf0442: 0xf0442,
-        0xf0443: 0xf0443,
-        0xf0444: 0xf0444,
-        0xf0445: 0xf0445,
-        0xf0446: 0xf0446,
-        0xf0447: 0xf0447,
-        0xf0448: 0xf0448,
-        0xf0449: 0xf0449,
-        0xf044a: 0xf044a,
-        0xf044b: 0xf044b,
-        0xf044c: 0xf044c,
-        0xf044d: 0xf044d,
-        0xf044e: 0xf044e,
-        0xf044f: 0xf044f,
-        0xf0450: 0xf0450,
-        0xf0451: 0xf0451,
-        0xf0452: 0xf0452,
-        0xf0453: 0xf0453,
-        0xf0454: 0xf0454,
-        0xf0455: 0xf0455,
-        0xf0456: 0xf0456,
-        0xf0457: 0xf0457,
-        0xf0458: 0xf0458,
-        0xf0459: 0xf0459,
-        0xf045a: 0xf045a,
-        0xf045b: 0xf045b,
-        0xf045c: 0xf045c,
-        0xf045d: 0xf045d,
-        0xf045e: 0xf045e,
-        0xf045f: 0xf045f,
-        0xf0460: 0xf0460,
-        0xf0461: 0xf0461,
-        0xf0462: 0xf0462,
-        0xf0463: 0xf0463,
-        0xf0464: 0xf0464,
-        0xf0465: 0xf0465,
-        0xf0466: 0xf0466,
-        0xf0467: 0xf0467,
-        0xf0468: 0xf0468,
-        0xf0469: 0xf0469,
-        0xf046a: 0xf046a,
-        0xf046b: 0xf046b,
-        0xf046c: 0xf046c,
-        0xf046d: 0xf046d,
-        0xf046e: 0xf046e,
-        0xf046f: 0xf046f,
-        0xf0470: 0xf0470,
-        0xf0471: 0xf0471,
-        0xf0472: 0xf0472,
-        0xf0473: 0xf0473,
-        0xf0474: 0xf0474,
-        0xf0475: 0xf0475,
-        0xf0476: 0xf0476,
-        0xf0477: 0xf0477,
-        0xf0478: 0xf0478,
-        0xf0479: 0xf0479,
-        0xf047a: 0xf047a,
-        0xf047b: 0xf047b,
-        0xf047c: 0xf047c,
-        0xf047d: 0xf047d,
-        0xf047e: 0xf047e,
-        0xf047f: 0xf047f,
-        0xf0480: 0xf0480,
-        0xf0481: 0xf0481,
-        0xf0482: 0xf0482,
-        0xf0483: 0xf0483,
-        0xf0484: 0xf0484,
-        0xf0485: 0xf0485,
-        0xf0486: 0xf0486,
-        0xf0487: 0xf0487,
-        0xf0488: 0xf0488,
-        0xf0489: 0xf0489,
-        0xf048a: 0xf048a,
-        0xf048b: 0xf048b,
-        0xf048c: 0xf048c,
-        0xf048d: 0xf048d,
-        0xf048e: 0xf048e,
-        0xf048f: 0xf048f,
-        0xf0490: 0xf0490,
-        0xf0491: 0xf0491,
-        0xf0492: 0xf0492,
-        0xf0493: 0xf0493,
-        0xf0494: 0xf0494,
-        0xf0495: 0xf0495,
-        0xf0496: 0xf0496,
-        0xf0497: 0xf0497,
-        0xf0498: 0xf0498,
-        0xf0499: 0xf0499,
-        0xf049a: 0xf049a,
-        0xf049b: 0xf049b,
-        0xf049c: 0xf049c,
-        0xf049d: 0xf049d,
-        0xf049e: 0xf049e,
-        0xf049f: 0xf049f,
-        0xf04a0: 0xf04a0,
-        0xf04a1: 0xf04a1,
-        0xf04a2: 0xf04a2,
-        0xf04a3: 0xf04a3,
-        0xf04a4: 0xf04a4,
-        0xf04a5: 0xf04a5,
-        0xf04a6: 0xf04a6,
-        0xf04a7: 0xf04a7,
-        0xf04a8: 0xf04a8,
-        0xf04a9: 0xf04a9,
-        0xf04aa: 0xf04aa,
-        0xf04ab: 0xf04ab,
-        0xf04ac: 0xf04ac,
-        0xf04ad: 0xf04ad,
-        0xf04ae: 0xf04ae,
-        0xf04af: 0xf04af,
-        0xf04b0: 0xf04b0,
-        0xf04b1: 0xf04b1,
-        0xf04b2: 0xf04b2,
-        0xf04b3: 0xf04b3,
-        0xf04b4: 0xf04b4,
-        0xf04b5: 0xf04b5,
-        0xf04b6: 0xf04b6,
-        0xf04b7: 0xf04b7,
-        0xf04b8: 0xf04b8,
-        0xf04b9: 0xf04b9,
-        0xf04ba: 0xf04ba,
-        0xf04bb: 0xf04bb,
-        0xf04bc: 0xf04bc,
-        0xf04bd: 0xf04bd,
-        0xf04be: 0xf04be,
-        0xf04bf: 0xf04bf,
-        0xf04c0: 0xf04c0,
-        0xf04c1: 0xf04c1,
-        0xf04c2: 0xf04c2,
-        0xf04c3: 0xf04c3,
-        0xf04c4: 0xf04c4,
-        0xf04c5: 0xf04c5,
-        0xf04c6: 0xf04c6,
-        0xf04c7: 0xf04c7,
-        0xf04c8: 0xf04c8,
-        0xf04c9: 0xf04c9,
-        0xf04ca: 0xf04ca,
-        0xf04cb: 0xf04cb,
-        0xf04cc: 0xf04cc,
-        0xf04cd: 0xf04cd,
-        0xf04ce: 0xf04ce,
-        0xf04cf: 0xf04cf,
-        0xf04d0: 0xf04d0,
-        0xf04d1: 0xf04d1,
-        0xf04d2: 0xf04d2,
-        0xf04d3: 0xf04d3,
-        0xf04d4: 0xf04d4,
-        0xf04d5: 0xf04d5,
-        0xf04d6: 0xf04d6,
-        0xf04d7: 0xf04d7,
-        0xf04d8: 0xf04d8,
-        0xf04d9: 0xf04d9,
-        0xf04da: 0xf04da,
-        0xf04db: 0xf04db,
-        0xf04dc: 0xf04dc,
-        0xf04dd: 0xf04dd,
-        0xf04de: 0xf04de,
-        0xf04df: 0xf04df,
-        0xf04e0: 0xf04e0,
-        0xf04e1: 0xf04e1,
-        0xf04e2: 0xf04e2,
-        0xf04e3: 0xf04e3,
-        0xf04e4: 0xf04e4,
-        0xf04e5: 0xf04e5,
-        0xf04e6: 0xf04e6,
-        0xf04e7: 0xf04e7,
-        0xf04e8: 0xf04e8,
-        0xf04e9: 0xf04e9,
-        0xf04ea: 0xf04ea,
-        0xf04eb: 0xf04eb,
-        0xf04ec: 0xf04ec,
-        0xf04ed: 0xf04ed,
-        0xf04ee: 0xf04ee,
-        0xf04ef: 0xf04ef,
-        0xf04f0: 0xf04f0,
-        0xf04f1: 0xf04f1,
-        0xf04f2: 0xf04f2,
-        0xf04f3: 0xf04f3,
-        0xf04f4: 0xf04f4,
-        0xf04f5: 0xf04f5,
-        0xf04f6: 0xf04f6,
-        0xf04f7: 0xf04f7,
-        0xf04f8: 0xf04f8,
-        0xf04f9: 0xf04f9,
-        0xf04fa: 0xf04fa,
-        0xf04fb: 0xf04fb,
-        0xf04fc: 0xf04fc,
-        0xf04fd: 0xf04fd,
-        0xf04fe: 0xf04fe,
-        0xf04ff: 0xf04ff,
-        0xf0500: 0xf0500,
-        0xf0501: 0xf0501,
-        0xf0502: 0xf0502,
-        0xf0503: 0xf0503,
-        0xf0504: 0xf0504,
-        0xf0505: 0xf0505,
-        0xf0506: 0xf0506,
-        0xf0507: 0xf0507,
-        0xf0508: 0xf0508,
-        0xf0509: 0xf0509,
-        0xf050a: 0xf050a,
-        0xf050b: 0xf050b,
-        0xf050c: 0xf050c,
-        0xf050d: 0xf050d,
-        0xf050e: 0xf050e,
-        0xf050f: 0xf050f,
-        0xf0510: 0xf0510,
-        0xf0511: 0xf0511,
-        0xf0512: 0xf0512,
-        0xf0513: 0xf0513,
-        0xf0514: 0xf0514,
-        0xf0515: 0xf0515,
-        0xf0516: 0xf0516,
-        0xf0517: 0xf0517,
-        0xf0518: 0xf0518,
-        0xf0519: 0xf0519,
-        0xf051a: 0xf051a,
-        0xf051b: 0xf051b,
-        0xf051c: 0xf051c,
-        0xf051d: 0xf051d,
-        0xf051e: 0xf051e,
-        0xf051f: 0xf051f,
-        0xf0520: 0xf0520,
-        0xf0521: 0xf0521,
-        0xf0522: 0xf0522,
-        0xf0523: 0xf0523,
-        0xf0524: 0xf0524,
-        0xf0525: 0xf0525,
-        0xf0526: 0xf0526,
-        0xf0527: 0xf0527,
-        0xf0528: 0xf0528,
-        0xf0529: 0xf0529,
-        0xf052a: 0xf052a,
-        0xf052b: 0xf052b,
-        0xf052c: 0xf052c,
-        0xf052d: 0xf052d,
-        0xf052e: 0xf052e,
-        0xf052f: 0xf052f,
-        0xf0530: 0xf0530,
-        0xf0531: 0xf0531,
-        0xf0532: 0xf0532,
-        0xf0533: 0xf0533,
-        0xf0534: 0xf0534,
-        0xf0535: 0xf0535,
-        0xf0536: 0xf0536,
-        0xf0537: 0xf0537,
-        0xf0538: 0xf0538,
-        0xf0539: 0xf0539,
-        0xf053a: 0xf053a,
-        0xf053b: 0xf053b,
-        0xf053c: 0xf053c,
-        0xf053d: 0xf053d,
-        0xf053e: 0xf053e,
-        0xf053f: 0xf053f,
-        0xf0540: 0xf0540,
-        0xf0541: 0xf0541,
-        0xf0542: 0xf0542,
-        0xf0543: 0xf0543,
-        0xf0544: 0xf0544,
-        0xf0545: 0xf0545,
-        0xf0546: 0xf0546,
-        0xf0547: 0xf0547,
-        0xf0548: 0xf0548,
-        0xf0549: 0xf0549,
-        0xf054a: 0xf054a,
-        0xf054b: 0xf054b,
-        0xf054c: 0xf054c,
-        0xf054d: 0xf054d,
-        0xf054e: 0xf054e,
-        0xf054f: 0xf054f,
-        0xf0550: 0xf0550,
-        0xf0551: 0xf0551,
-        0xf0552: 0xf0552,
-        0xf0553: 0xf0553,
-        0xf0554: 0xf0554,
-        0xf0555: 0xf0555,
-        0xf0556: 0xf0556,
-        0xf0557: 0xf0557,
-        0xf0558: 0xf0558,
-        0xf0559: 0xf0559,
-        0xf055a: 0xf055a,
-        0xf055b: 0xf055b,
-        0xf055c: 0xf055c,
-        0xf055d: 0xf055d,
-        0xf055e: 0xf055e,
-        0xf055f: 0xf055f,
-        0xf0560: 0xf0560,
-        0xf0561: 0xf0561,
-        0xf0562: 0xf0562,
-        0xf0563: 0xf0563,
-        0xf0564: 0xf0564,
-        0xf0565: 0xf0565,
-        0xf0566: 0xf0566,
-        0xf0567: 0xf0567,
-        0xf0568: 0xf0568,
-        0xf0569: 0xf0569,
-        0xf056a: 0xf056a,
-        0xf056b: 0xf056b,
-        0xf056c: 0xf056c,
-        0xf056d: 0xf056d,
-        0xf056e: 0xf056e,
-        0xf056f: 0xf056f,
-        0xf0570: 0xf0570,
-        0xf0571: 0xf0571,
-        0xf0572: 0xf0572,
-        0xf0573: 0xf0573,
-        0xf0574: 0xf0574,
-        0xf0575: 0xf0575,
-        0xf0576: 0xf0576,
-        0xf0577: 0xf0577,
-        0xf0578: 0xf0578,
-        0xf0579: 0xf0579,
-        0xf057a: 0xf057a,
-        0xf057b: 0xf057b,
-        0xf057c: 0xf057c,
-        0xf057d: 0xf057d,
-        0xf057e: 0xf057e,
-        0xf057f: 0xf057f,
-        0xf0580: 0xf0580,
-        0xf0581: 0xf0581,
-        0xf0582: 0xf0582,
-        0xf0583: 0xf0583,
-        0xf0584: 0xf0584,
-        0xf0585: 0xf0585,
-        0xf0586: 0xf0586,
-        0xf0587: 0xf0587,
-        0xf0588: 0xf0588,
-        0xf0589: 0xf0589,
-        0xf058a: 0xf058a,
-        0xf058b: 0xf058b,
-        0xf058c: 0xf058c,
-        0xf058d: 0xf058d,
-        0xf058e: 0xf058e,
-        0xf058f: 0xf058f,
-        0xf0590: 0xf0590,
-        0xf0591: 0xf0591,
-        0xf0592: 0xf0592,
-        0xf0593: 0xf0593,
-        0xf0594: 0xf0594,
-        0xf0595: 0xf0595,
-        0xf0596: 0xf0596,
-        0xf0597: 0xf0597,
-        0xf0598: 0xf0598,
-        0xf0599: 0xf0599,
-        0xf059a: 0xf059a,
-        0xf059b: 0xf059b,
-        0xf059c: 0xf059c,
-        0xf059d: 0xf059d,
-        0xf059e: 0xf059e,
-        0xf059f: 0xf059f,
-        0xf05a0: 0xf05a0,
-        0xf05a1: 0xf05a1,
-        0xf05a2: 0xf05a2,
-        0xf05a3: 0xf05a3,
-        0xf05a4: 0xf05a4,
-        0xf05a5: 0xf05a5,
-        0xf05a6: 0xf05a6,
-        0xf05a7: 0xf05a7,
-        0xf05a8: 0xf05a8,
-        0xf05a9: 0xf05a9,
-        0xf05aa: 0xf05aa,
-        0xf05ab: 0xf05ab,
-        0xf05ac: 0xf05ac,
-        0xf05ad: 0xf05ad,
-        0xf05ae: 0xf05ae,
-        0xf05af: 0xf05af,
-        0xf05b0: 0xf05b0,
-        0xf05b1: 0xf05b1,
-        0xf05b2: 0xf05b2,
-        0xf05b3: 0xf05b3,
-        0xf05b4: 0xf05b4,
-        0xf05b5: 0xf05b5,
-        0xf05b6: 0xf05b6,
-        0xf05b7: 0xf05b7,
-        0xf05b8: 0xf05b8,
-        0xf05b9: 0xf05b9,
-        0xf05ba: 0xf05ba,
-        0xf05bb: 0xf05bb,
-        0xf05bc: 0xf05bc,
-        0xf05bd: 0xf05bd,
-        0xf05be: 0xf05be,
-        0xf05bf: 0xf05bf,
-        0xf05c0: 0xf05c0,
-        0xf05c1: 0xf05c1,
-        0xf05c2: 0xf05c2,
-        0xf05c3: 0xf05c3,
-        0xf05c4: 0xf05c4,
-        0xf05c5: 0xf05c5,
-        0xf05c6: 0xf05c6,
-        0xf05c7: 0xf05c7,
-        0xf05c8: 0xf05c8,
-        0xf05c9: 0xf05c9,
-        0xf05ca: 0xf05ca,
-        0xf05cb: 0xf05cb,
-        0xf05cc: 0xf05cc,
-        0xf05cd: 0xf05cd,
-        0xf05ce: 0xf05ce,
-        0xf05cf: 0xf05cf,
-        0xf05d0: 0xf05d0,
-        0xf05d1: 0xf05d1,
-        0xf05d2: 0xf05d2,
-        0xf05d3: 0xf05d3,
-        0xf05d4: 0xf05d4,
-        0xf05d5: 0xf05d5,
-        0xf05d6: 0xf05d6,
-        0xf05d7: 0xf05d7,
-        0xf05d8: 0xf05d8,
-        0xf05d9: 0xf05d9,
-        0xf05da: 0xf05da,
-        0xf05db: 0xf05db,
-        0xf05dc: 0xf05dc,
-        0xf05dd: 0xf05dd,
-        0xf05de: 0xf05de,
-        0xf05df: 0xf05df,
-        0xf05e0: 0xf05e0,
-        0xf05e1: 0xf05e1,
-        0xf05e2: 0xf05e2,
-        0xf05e3: 0xf05e3,
-        0xf05e4: 0xf05e4,
-        0xf05e5: 0xf05e5,
-        0xf05e6: 0xf05e6,
-        0xf05e7: 0xf05e7,
-        0xf05e8: 0xf05e8,
-        0xf05e9: 0xf05e9,
-        0xf05ea: 0xf05ea,
-        0xf05eb: 0xf05eb,
-        0xf05ec: 0xf05ec,
-        0xf05ed: 0xf05ed,
-        0xf05ee: 0xf05ee,
-        0xf05ef: 0xf05ef,
-        0xf05f0: 0xf05f0,
-        0xf05f1: 0xf05f1,
-        0xf05f2: 0xf05f2,
-        0xf05f3: 0xf05f3,
-        0xf05f4: 0xf05f4,
-        0xf05f5: 0xf05f5,
-        0xf05f6: 0xf05f6,
-        0xf05f7: 0xf05f7,
-        0xf05f8: 0xf05f8,
-        0xf05f9: 0xf05f9,
-        0xf05fa: 0xf05fa,
-        0xf05fb: 0xf05fb,
-        0xf05fc: 0xf05fc,
-        0xf05fd: 0xf05fd,
-        0xf05fe: 0xf05fe,
-        0xf05ff: 0xf05ff,
-        0xf0600: 0xf0600,
-        0xf0601: 0xf0601,
-        0xf0602: 0xf0602,
-        0xf0603: 0xf0603,
-        0xf0604: 0xf0604,
-        0xf0605: 0xf0605,
-        0xf0606: 0xf0606,
-        0xf0607: 0xf0607,
-        0xf0608: 0xf0608,
-        0xf0609: 0xf0609,
-        0xf060a: 0xf060a,
-        0xf060b: 0xf060b,
-        0xf060c: 0xf060c,
-        0xf060d: 0xf060d,
-        0xf060e: 0xf060e,
-        0xf060f: 0xf060f,
-        0xf0610: 0xf0610,
-        0xf0611: 0xf0611,
-        0xf0612: 0xf0612,
-        0xf0613: 0xf0613,
-        0xf0614: 0xf0614,
-        0xf0615: 0xf0615,
-        0xf0616: 0xf0616,
-        0xf0617: 0xf0617,
-        0xf0618: 0xf0618,
-        0xf0619: 0xf0619,
-        0xf061a: 0xf061a,
-        0xf061b: 0xf061b,
-        0xf061c: 0xf061c,
-        0xf061d: 0xf061d,
-        0xf061e: 0xf061e,
-        0xf061f: 0xf061f,
-        0xf0620: 0xf0620,
-        0xf0621: 0xf0621,
-        0xf0622: 0xf0622,
-        0xf0623: 0xf0623,
-        0xf0624: 0xf0624,
-        0xf0625: 0xf0625,
-        0xf0626: 0xf0626,
-        0xf0627: 0xf0627,
-        0xf0628: 0xf0628,
-        0xf0629: 0xf0629,
-        0xf062a: 0xf062a,
-        0xf062b: 0xf062b,
-        0xf062c: 0xf062c,
-        0xf062d: 0xf062d,
-        0xf062e: 0xf062e,
-        0xf062f: 0xf062f,
-        0xf0630: 0xf0630,
-        0xf0631: 0xf0631,
-        0xf0632: 0xf0632,
-        0xf0633: 0xf0633,
-        0xf0634: 0xf0634,
-        0xf0635: 0xf0635,
-        0xf0636: 0xf0636,
-        0xf0637: 0xf0637,
-        0xf0638: 0xf0638,
-        0xf0639: 0xf0639,
-        0xf063a: 0xf063a,
-        0xf063b: 0xf063b,
-        0xf063c: 0xf063c,
-        0xf063d: 0xf063d,
-        0xf063e: 0xf063e,
-        0xf063f: 0xf063f,
-        0xf0640: 0xf0640,
-        0xf0641: 0xf0641,
-        0xf0642: 0xf0642,
-        0xf0643: 0xf0643,
-        0xf0644: 0xf0644,
-        0xf0645: 0xf0645,
-        0xf0646: 0xf0646,
-        0xf0647: 0xf0647,
-        0xf0648: 0xf0648,
-        0xf0649: 0xf0649,
-        0xf064a: 0xf064a,
-        0xf064b: 0xf064b,
-        0xf064c: 0xf064c,
-        0xf064d: 0xf064d,
-        0xf064e: 0xf064e,
-        0xf064f: 0xf064f,
-        0xf0650: 0xf0650,
-        0xf0651: 0xf0651,
-        0xf0652: 0xf0652,
-        0xf0653: 0xf0653,
-        0xf0654: 0xf0654,
-        0xf0655: 0xf0655,
-        0xf0656: 0xf0656,
-        0xf0657: 0xf0657,
-        0xf0658: 0xf0658,
-        0xf0659: 0xf0659,
-        0xf065a: 0xf065a,
-        0xf065b: 0xf065b,
-        0xf065c: 0xf065c,
-        0xf065d: 0xf065d,
-        0xf065e: 0xf065e,
-        0xf065f: 0xf065f,
-        0xf0660: 0xf0660,
-        0xf0661: 0xf0661,
-        0xf0662: 0xf0662,
-        0xf0663: 0xf0663,
-        0xf0664: 0xf0664,
-        0xf0665: 0xf0665,
-        0xf0666: 0xf0666,
-        0xf0667: 0xf0667,
-        0xf0668: 0xf0668,
-        0xf0669: 0xf0669,
-        0xf066a: 0xf066a,
-        0xf066b: 0xf066b,
-        0xf066c: 0xf066c,
-        0xf066d: 0xf066d,
-        0xf066e: 0xf066e,
-        0xf066f: 0xf066f,
-        0xf0670: 0xf0670,
-        0xf0671: 0xf0671,
-        0xf0672: 0xf0672,
-        0xf0673: 0xf0673,
-        0xf0674: 0xf0674,
-        0xf0675: 0xf0675,
-        0xf0676: 0xf0676,
-        0xf0677: 0xf0677,
-        0xf0678: 0xf0678,
-        0xf0679: 0xf0679,
-        0xf067a: 0xf067a,
-        0xf067b: 0xf067b,
-        0xf067c: 0xf067c,
-        0xf067d: 0xf067d,
-        0xf067e: 0xf067e,
-        0xf067f: 0xf067f,
-        0xf0680: 0xf0680,
-        0xf0681: 0xf0681,
-        0xf0682: 0xf0682,
-        0xf0683: 0xf0683,
-        0xf0684: 0xf0684,
-        0xf0685: 0xf0685,
-        0xf0686: 0xf0686,
-        0xf0687: 0xf0687,
-        0xf0688: 0xf0688,
-        0xf0689: 0xf0689,
-        0xf068a: 0xf068a,
-        0xf068b: 0xf068b,
-        0xf068c: 0xf068c,
-        0xf068d: 0xf068d,
-        0xf068e: 0xf068e,
-        0xf068f: 0xf068f,
-        0xf0690: 0xf0690,
-        0xf0691: 0xf0691,
-        0xf0692: 0xf0692,
-        0xf0693: 0xf0693,
-        0xf0694: 0xf0694,
-        0xf0695: 0xf0695,
-        0xf0696: 0xf0696,
-        0xf0697: 0xf0697,
-        0xf0698: 0xf0698,
-        0xf0699: 0xf0699,
-        0xf069a: 0xf069a,
-        0xf069b: 0xf069b,
-        0xf069c: 0xf069c,
-        0xf069d: 0xf069d,
-        0xf069e: 0xf069e,
-        0xf069f: 0xf069f,
-        0xf06a0: 0xf06a0,
-        0xf06a1: 0xf06a1,
-        0xf06a2: 0xf06a2,
-        0xf06a3: 0xf06a3,
-        0xf06a4: 0xf06a4,
-        0xf06a5: 0xf06a5,
-        0xf06a6: 0xf06a6,
-        0xf06a7: 0xf06a7,
-        0xf06a8: 0xf06a8,
-        0xf06a9: 0xf06a9,
-        0xf06aa: 0xf06aa,
-        0xf06ab: 0xf06ab,
-        0xf06ac: 0xf06ac,
-        0xf06ad: 0xf06ad,
-        0xf06ae: 0xf06ae,
-        0xf06af: 0xf06af,
-        0xf06b0: 0xf06b0,
-        0xf06b1: 0xf06b1,
-        0xf06b2: 0xf06b2,
-        0xf06b3: 0xf06b3,
-        0xf06b4: 0xf06b4,
-        0xf06b5: 0xf06b5,
-        0xf06b6: 0xf06b6,
-        0xf06b7: 0xf06b7,
-        0xf06b8: 0xf06b8,
-        0xf06b9: 0xf06b9,
-        0xf06ba: 0xf06ba,
-        0xf06bb: 0xf06bb,
-        0xf06bc: 0xf06bc,
-        0xf06bd: 0xf06bd,
-        0xf06be: 0xf06be,
-        0xf06bf: 0xf06bf,
-        0xf06c0: 0xf06c0,
-        0xf06c1: 0xf06c1,
-        0xf06c2: 0xf06c2,
-        0xf06c3: 0xf06c3,
-        0xf06c4: 0xf06c4,
-        0xf06c5: 0xf06c5,
-        0xf06c6: 0xf06c6,
-        0xf06c7: 0xf06c7,
-        0xf06c8: 0xf06c8,
-        0xf06c9: 0xf06c9,
-        0xf06ca: 0xf06ca,
-        0xf06cb: 0xf06cb,
-        0xf06cc: 0xf06cc,
-        0xf06cd: 0xf06cd,
-        0xf06ce: 0xf06ce,
-        0xf06cf: 0xf06cf,
-        0xf06d0: 0xf06d0,
-        0xf06d1: 0xf06d1,
-        0xf06d2: 0xf06d2,
-        0xf06d3: 0xf06d3,
-        0xf06d4: 0xf06d4,
-        0xf06d5: 0xf06d5,
-        0xf06d6: 0xf06d6,
-        0xf06d7: 0xf06d7,
-        0xf06d8: 0xf06d8,
-        0xf06d9: 0xf06d9,
-        0xf06da: 0xf06da,
-        0xf06db: 0xf06db,
-        0xf06dc: 0xf06dc,
-        0xf06dd: 0xf06dd,
-        0xf06de: 0xf06de,
-        0xf06df: 0xf06df,
-        0xf06e0: 0xf06e0,
-        0xf06e1: 0xf06e1,
-        0xf06e2: 0xf06e2,
-        0xf06e3: 0xf06e3,
-        0xf06e4: 0xf06e4,
-        0xf06e5: 0xf06e5,
-        0xf06e6: 0xf06e6,
-        0xf06e7: 0xf06e7,
-        0xf06e8: 0xf06e8,
-        0xf06e9: 0xf06e9,
-        0xf06ea: 0xf06ea,
-        0xf06eb: 0xf06eb,
-        0xf06ec: 0xf06ec,
-        0xf06ed: 0xf06ed,
-        0xf06ee: 0xf06ee,
-        0xf06ef: 0xf06ef,
-        0xf06f0: 0xf06f0,
-        0xf06f1: 0xf06f1,
-        0xf06f2: 0xf06f2,
-        0xf06f3: 0xf06f3,
-        0xf06f4: 0xf06f4,
-        0xf06f5: 0xf06f5,
-        0xf06f6: 0xf06f6,
-        0xf06f7: 0xf06f7,
-        0xf06f8: 0xf06f8,
-        0xf06f9: 0xf06f9,
-        0xf06fa: 0xf06fa,
-        0xf06fb: 0xf06fb,
-        0xf06fc: 0xf06fc,
-        0xf06fd: 0xf06fd,
-        0xf06fe: 0xf06fe,
-        0xf06ff: 0xf06ff,
-        0xf0700: 0xf0700,
-        0xf0701: 0xf0701,
-        0xf0702: 0xf0702,
-        0xf0703: 0xf0703,
-        0xf0704: 0xf0704,
-        0xf0705: 0xf0705,
-        0xf0706: 0xf0706,
-        0xf0707: 0xf0707,
-        0xf0708: 0xf0708,
-        0xf0709: 0xf0709,
-        0xf070a: 0xf070a,
-        0xf070b: 0xf070b,
-        0xf070c: 0xf070c,
-        0xf070d: 0xf070d,
-        0xf070e: 0xf070e,
-        0xf070f: 0xf070f,
-        0xf0710: 0xf0710,
-        0xf0711: 0xf0711,
-        0xf0712: 0xf0712,
-        0xf0713: 0xf0713,
-        0xf0714: 0xf0714,
-        0xf0715: 0xf0715,
-        0xf0716: 0xf0716,
-        0xf0717: 0xf0717,
-        0xf0718: 0xf0718,
-        0xf0719: 0xf0719,
-        0xf071a: 0xf071a,
-        0xf071b: 0xf071b,
-        0xf071c: 0xf071c,
-        0xf071d: 0xf071d,
-        0xf071e: 0xf071e,
-        0xf071f: 0xf071f,
-        0xf0720: 0xf0720,
-        0xf0721: 0xf0721,
-        0xf0722: 0xf0722,
-        0xf0723: 0xf0723,
-        0xf0724: 0xf0724,
-        0xf0725: 0xf0725,
-        0xf0726: 0xf0726,
-        0xf0727: 0xf0727,
-        0xf0728: 0xf0728,
-        0xf0729: 0xf0729,
-        0xf072a: 0xf072a,
-        0xf072b: 0xf072b,
-        0xf072c: 0xf072c,
-        0xf072d: 0xf072d,
-        0xf072e: 0xf072e,
-        0xf072f: 0xf072f,
-        0xf0730: 0xf0730,
-        0xf0731: 0xf0731,
-        0xf0732: 0xf0732,
-        0xf0733: 0xf0733,
-        0xf0734: 0xf0734,
-        0xf0735: 0xf0735,
-        0xf0736: 0xf0736,
-        0xf0737: 0xf0737,
-        0xf0738: 0xf0738,
-        0xf0739: 0xf0739,
-        0xf073a: 0xf073a,
-        0xf073b: 0xf073b,
-        0xf073c: 0xf073c,
-        0xf073d: 0xf073d,
-        0xf073e: 0xf073e,
-        0xf073f: 0xf073f,
-        0xf0740: 0xf0740,
-        0xf0741: 0xf0741,
-        0xf0742: 0xf0742,
-        0xf0743: 0xf0743,
-        0xf0744: 0xf0744,
-        0xf0745: 0xf0745,
-        0xf0746: 0xf0746,
-        0xf0747: 0xf0747,
-        0xf0748: 0xf0748,
-        0xf0749: 0xf0749,
-        0xf074a: 0xf074a,
-        0xf074b: 0xf074b,
-        0xf074c: 0xf074c,
-        0xf074d: 0xf074d,
-        0xf074e: 0xf074e,
-        0xf074f: 0xf074f,
-        0xf0750: 0xf0750,
-        0xf0751: 0xf0751,
-        0xf0752: 0xf0752,
-        0xf0753: 0xf0753,
-        0xf0754: 0xf0754,
-        0xf0755: 0xf0755,
-        0xf0756: 0xf0756,
-        0xf0757: 0xf0757,
-        0xf0758: 0xf0758,
-        0xf0759: 0xf0759,
-        0xf075a: 0xf075a,
-        0xf075b: 0xf075b,
-        0xf075c: 0xf075c,
-        0xf075d: 0xf075d,
-        0xf075e: 0xf075e,
-        0xf075f: 0xf075f,
-        0xf0760: 0xf0760,
-        0xf0761: 0xf0761,
-        0xf0762: 0xf0762,
-        0xf0763: 0xf0763,
-        0xf0764: 0xf0764,
-        0xf0765: 0xf0765,
-        0xf0766: 0xf0766,
-        0xf0767: 0xf0767,
-        0xf0768: 0xf0768,
-        0xf0769: 0xf0769,
-        0xf076a: 0xf076a,
-        0xf076b: 0xf076b,
-        0xf076c: 0xf076c,
-        0xf076d: 0xf076d,
-        0xf076e: 0xf076e,
-        0xf076f: 0xf076f,
-        0xf0770: 0xf0770,
-        0xf0771: 0xf0771,
-        0xf0772: 0xf0772,
-        0xf0773: 0xf0773,
-        0xf0774: 0xf0774,
-        0xf0775: 0xf0775,
-        0xf0776: 0xf0776,
-        0xf0777: 0xf0777,
-        0xf0778: 0xf0778,
-        0xf0779: 0xf0779,
-        0xf077a: 0xf077a,
-        0xf077b: 0xf077b,
-        0xf077c: 0xf077c,
-        0xf077d: 0xf077d,
-        0xf077e: 0xf077e,
-        0xf077f: 0xf077f,
-        0xf0780: 0xf0780,
-        0xf0781: 0xf0781,
-        0xf0782: 0xf0782,
-        0xf0783: 0xf0783,
-        0xf0784: 0xf0784,
-        0xf0785: 0xf0785,
-        0xf0786: 0xf0786,
-        0xf0787: 0xf0787,
-        0xf0788: 0xf0788,
-        0xf0789: 0xf0789,
-        0xf078a: 0xf078a,
-        0xf078b: 0xf078b,
-        0xf078c: 0xf078c,
-        0xf078d: 0xf078d,
-        0xf078e: 0xf078e,
-        0xf078f: 0xf078f,
-        0xf0790: 0xf0790,
-        0xf0791: 0xf0791,
-        0xf0792: 0xf0792,
-        0xf0793: 0xf0793,
-        0xf0794: 0xf0794,
-        0xf0795: 0xf0795,
-        0xf0796: 0xf0796,
-        0xf0797: 0xf0797,
-        0xf0798: 0xf0798,
-        0xf0799: 0xf0799,
-        0xf079a: 0xf079a,
-        0xf079b: 0xf079b,
-        0xf079c: 0xf079c,
-        0xf079d: 0xf079d,
-        0xf079e: 0xf079e,
-        0xf079f: 0xf079f,
-        0xf07a0: 0xf07a0,
-        0xf07a1: 0xf07a1,
-        0xf07a2: 0xf07a2,
-        0xf07a3: 0xf07a3,
-        0xf07a4: 0xf07a4,
-        0xf07a5: 0xf07a5,
-        0xf07a6: 0xf07a6,
-        0xf07a7: 0xf07a7,
-        0xf07a8: 0xf07a8,
-        0xf07a9: 0xf07a9,
-        0xf07aa: 0xf07aa,
-        0xf07ab: 0xf07ab,
-        0xf07ac: 0xf07ac,
-        0xf07ad: 0xf07ad,
-        0xf07ae: 0xf07ae,
-        0xf07af: 0xf07af,
-        0xf07b0: 0xf07b0,
-        0xf07b1: 0xf07b1,
-        0xf07b2: 0xf07b2,
-        0xf07b3: 0xf07b3,
-        0xf07b4: 0xf07b4,
-        0xf07b5: 0xf07b5,
-        0xf07b6: 0xf07b6,
-        0xf07b7: 0xf07b7,
-        0xf07b8: 0xf07b8,
-        0xf07b9: 0xf07b9,
-        0xf07ba: 0xf07ba,
-        0xf07bb: 0xf07bb,
-        0xf07bc: 0xf07bc,
-        0xf07bd: 0xf07bd,
-        0xf07be: 0xf07be,
-        0xf07bf: 0xf07bf,
-        0xf07c0: 0xf07c0,
-        0xf07c1: 0xf07c1,
-        0xf07c2: 0xf07c2,
-        0xf07c3: 0xf07c3,
-        0xf07c4: 0xf07c4,
-        0xf07c5: 0xf07c5,
-        0xf07c6: 0xf07c6,
-        0xf07c7: 0xf07c7,
-        0xf07c8: 0xf07c8,
-        0xf07c9: 0xf07c9,
-        0xf07ca: 0xf07ca,
-        0xf07cb: 0xf07cb,
-        0xf07cc: 0xf07cc,
-        0xf07cd: 0xf07cd,
-        0xf07ce: 0xf07ce,
-        0xf07cf: 0xf07cf,
-        0xf07d0: 0xf07d0,
-        0xf07d1: 0xf07d1,
-        0xf07d2: 0xf07d2,
-        0xf07d3: 0xf07d3,
-        0xf07d4: 0xf07d4,
-        0xf07d5: 0xf07d5,
-        0xf07d6: 0xf07d6,
-        0xf07d7: 0xf07d7,
-        0xf07d8: 0xf07d8,
-        0xf07d9: 0xf07d9,
-        0xf07da: 0xf07da,
-        0xf07db: 0xf07db,
-        0xf07dc: 0xf07dc,
-        0xf07dd: 0xf07dd,
-        0xf07de: 0xf07de,
-        0xf07df: 0xf07df,
-        0xf07e0: 0xf07e0,
-        0xf07e1: 0xf07e1,
-        0xf07e2: 0xf07e2,
-        0xf07e3: 0xf07e3,
-        0xf07e4: 0xf07e4,
-        0xf07e5: 0xf07e5,
-        0xf07e6: 0xf07e6,
-        0xf07e7: 0xf07e7,
-        0xf07e8: 0xf07e8,
-        0xf07e9: 0xf07e9,
-        0xf07ea: 0xf07ea,
-        0xf07eb: 0xf07eb,
-        0xf07ec: 0xf07ec,
-        0xf07ed: 0xf07ed,
-        0xf07ee: 0xf07ee,
-        0xf07ef: 0xf07ef,
-        0xf07f0: 0xf07f0,
-        0xf07f1: 0xf07f1,
-        0xf07f2: 0xf07f2,
-        0xf07f3: 0xf07f3,
-        0xf07f4: 0xf07f4,
-        0xf07f5: 0xf07f5,
-        0xf07f6: 0xf07f6,
-        0xf07f7: 0xf07f7,
-        0xf07f8: 0xf07f8,
-        0xf07f9: 0xf07f9,
-        0xf07fa: 0xf07fa,
-        0xf07fb: 0xf07fb,
-        0xf07fc: 0xf07fc,
-        0xf07fd: 0xf07fd,
-        0xf07fe: 0xf07fe,
-        0xf07ff: 0xf07ff,
-        0xf0800: 0xf0800,
-        0xf0801: 0xf0801,
-        0xf0802: 0xf0802,
-        0xf0803: 0xf0803,
-        0xf0804: 0xf0804,
-        0xf0805: 0xf0805,
-        0xf0806: 0xf0806,
-        0xf0807: 0xf0807,
-        0xf0808: 0xf0808,
-        0xf0809: 0xf0809,
-        0xf080a: 0xf080a,
-        0xf080b: 0xf080b,
-        0xf080c: 0xf080c,
-        0xf080d: 0xf080d,
-        0xf080e: 0xf080e,
-        0xf080f: 0xf080f,
-        0xf0810: 0xf0810,
-        0xf0811: 0xf0811,
-        0xf0812: 0xf0812,
-        0xf0813: 0xf0813,
-        0xf0814: 0xf0814,
-        0xf0815: 0xf0815,
-        0xf0816: 0xf0816,
-        0xf0817: 0xf0817,
-        0xf0818: 0xf0818,
-        0xf0819: 0xf0819,
-        0xf081a: 0xf081a,
-        0xf081b: 0xf081b,
-        0xf081c: 0xf081c,
-        0xf081d: 0xf081d,
-        0xf081e: 0xf081e,
-        0xf081f: 0xf081f,
-        0xf0820: 0xf0820,
-        0xf0821: 0xf0821,
-        0xf0822: 0xf0822,
-        0xf0823: 0xf0823,
-        0xf0824: 0xf0824,
-        0xf0825: 0xf0825,
-        0xf0826: 0xf0826,
-        0xf0827: 0xf0827,
-        0xf0828: 0xf0828,
-        0xf0829: 0xf0829,
-        0xf082a: 0xf082a,
-        0xf082b: 0xf082b,
-        0xf082c: 0xf082c,
-        0xf082d: 0xf082d,
-        0xf082e: 0xf082e,
-        0xf082f: 0xf082f,
-        0xf0830: 0xf0830,
-        0xf0831: 0xf0831,
-        0xf0832: 0xf0832,
-        0xf0833: 0xf0833,
-        0xf0834: 0xf0834,
-        0xf0835: 0xf0835,
-        0xf0836: 0xf0836,
-        0xf0837: 0xf0837,
-        0xf0838: 0xf0838,
-        0xf0839: 0xf0839,
-        0xf083a: 0xf083a,
-        0xf083b: 0xf083b,
-        0xf083c: 0xf083c,
-        0xf083d: 0xf083d,
-        0xf083e: 0xf083e,
-        0xf083f: 0xf083f,
-        0xf0840: 0xf0840,
-        0xf0841: 0xf0841,
-        0xf0842: 0xf0842,
-        0xf0843: 0xf0843,
-        0xf0844: 0xf0844,
-        0xf0845: 0xf0845,
-        0xf0846: 0xf0846,
-        0xf0847: 0xf0847,
-        0xf0848: 0xf0848,
-        0xf0849: 0xf0849,
-        0xf084a: 0xf084a,
-        0xf084b: 0xf084b,
-        0xf084c: 0xf084c,
-        0xf084d: 0xf084d,
-        0xf084e: 0xf084e,
-        0xf084f: 0xf084f,
-        0xf0850: 0xf0850,
-        0xf0851: 0xf0851,
-        0xf0852: 0xf0852,
-        0xf0853: 0xf0853,
-        0xf0854: 0xf0854,
-        0xf0855: 0xf0855,
-        0xf0856: 0xf0856,
-        0xf0857: 0xf0857,
-        0xf0858: 0xf0858,
-        0xf0859: 0xf0859,
-        0xf085a: 0xf085a,
-        0xf085b: 0xf085b,
-        0xf085c: 0xf085c,
-        0xf085d: 0xf085d,
-        0xf085e: 0xf085e,
-        0xf085f: 0xf085f,
-        0xf0860: 0xf0860,
-        0xf0861: 0xf0861,
-        0xf0862: 0xf0862,
-        0xf0863: 0xf0863,
-        0xf0864: 0xf0864,
-        0xf0865: 0xf0865,
-        0xf0866: 0xf0866,
-        0xf0867: 0xf0867,
-        0xf0868: 0xf0868,
-        0xf0869: 0xf0869,
-        0xf086a: 0xf086a,
-        0xf086b: 0xf086b,
-        0xf086c: 0xf086c,
-        0xf086d: 0xf086d,
-        0xf086e: 0xf086e,
-        0xf086f: 0xf086f,
-        0xf0870: 0xf0870,
-        0xf0871: 0xf0871,
-        0xf0872: 0xf0872,
-        0xf0873: 0xf0873,
-        0xf0874: 0xf0874,
-        0xf0875: 0xf0875,
-        0xf0876: 0xf0876,
-        0xf0877: 0xf0877,
-        0xf0878: 0xf0878,
-        0xf0879: 0xf0879,
-        0xf087a: 0xf087a,
-        0xf087b: 0xf087b,
-        0xf087c: 0xf087c,
-        0xf087d: 0xf087d,
-        0xf087e: 0xf087e,
-        0xf087f: 0xf087f,
-        0xf0880: 0xf0880,
-        0xf0881: 0xf0881,
-        0xf0882: 0xf0882,
-        0xf0883: 0xf0883,
-        0xf0884: 0xf0884,
-        0xf0885: 0xf0885,
-        0xf0886: 0xf0886,
-        0xf0887: 0xf0887,
-        0xf0888: 0xf0888,
-        0xf0889: 0xf0889,
-        0xf088a: 0xf088a,
-        0xf088b: 0xf088b,
-        0xf088c: 0xf088c,
-        0xf088d: 0xf088d,
-        0xf088e: 0xf088e,
-        0xf088f: 0xf088f,
-        0xf0890: 0xf0890,
-        0xf0891: 0xf0891,
-        0xf0892: 0xf0892,
-        0xf0893: 0xf0893,
-        0xf0894: 0xf0894,
-        0xf0895: 0xf0895,
-        0xf0896: 0xf0896,
-        0xf0897: 0xf0897,
-        0xf0898: 0xf0898,
-        0xf0899: 0xf0899,
-        0xf089a: 0xf089a,
-        0xf089b: 0xf089b,
-        0xf089c: 0xf089c,
-        0xf089d: 0xf089d,
-        0xf089e: 0xf089e,
-        0xf089f: 0xf089f,
-        0xf08a0: 0xf08a0,
-        0xf08a1: 0xf08a1,
-        0xf08a2: 0xf08a2,
-        0xf08a3: 0xf08a3,
-        0xf08a4: 0xf08a4,
-        0xf08a5: 0xf08a5,
-        0xf08a6: 0xf08a6,
-        0xf08a7: 0xf08a7,
-        0xf08a8: 0xf08a8,
-        0xf08a9: 0xf08a9,
-        0xf08aa: 0xf08aa,
-        0xf08ab: 0xf08ab,
-        0xf08ac: 0xf08ac,
-        0xf08ad: 0xf08ad,
-        0xf08ae: 0xf08ae,
-        0xf08af: 0xf08af,
-        0xf08b0: 0xf08b0,
-        0xf08b1: 0xf08b1,
-        0xf08b2: 0xf08b2,
-        0xf08b3: 0xf08b3,
-        0xf08b4: 0xf08b4,
-        0xf08b5: 0xf08b5,
-        0xf08b6: 0xf08b6,
-        0xf08b7: 0xf08b7,
-        0xf08b8: 0xf08b8,
-        0xf08b9: 0xf08b9,
-        0xf08ba: 0xf08ba,
-        0xf08bb: 0xf08bb,
-        0xf08bc: 0xf08bc,
-        0xf08bd: 0xf08bd,
-        0xf08be: 0xf08be,
-        0xf08bf: 0xf08bf,
-        0xf08c0: 0xf08c0,
-        0xf08c1: 0xf08c1,
-        0xf08c2: 0xf08c2,
-        0xf08c3: 0xf08c3,
-        0xf08c4: 0xf08c4,
-        0xf08c5: 0xf08c5,
-        0xf08c6: 0xf08c6,
-        0xf08c7: 0xf08c7,
-        0xf08c8: 0xf08c8,
-        0xf08c9: 0xf08c9,
-        0xf08ca: 0xf08ca,
-        0xf08cb: 0xf08cb,
-        0xf08cc: 0xf08cc,
-        0xf08cd: 0xf08cd,
-        0xf08ce: 0xf08ce,
-        0xf08cf: 0xf08cf,
-        0xf08d0: 0xf08d0,
-        0xf08d1: 0xf08d1,
-        0xf08d2: 0xf08d2,
-        0xf08d3: 0xf08d3,
-        0xf08d4: 0xf08d4,
-        0xf08d5: 0xf08d5,
-        0xf08d6: 0xf08d6,
-        0xf08d7: 0xf08d7,
-        0xf08d8: 0xf08d8,
-        0xf08d9: 0xf08d9,
-        0xf08da: 0xf08da,
-        0xf08db: 0xf08db,
-        0xf08dc: 0xf08dc,
-        0xf08dd: 0xf08dd,
-        0xf08de: 0xf08de,
-        0xf08df: 0xf08df,
-        0xf08e0: 0xf08e0,
-        0xf08e1: 0xf08e1,
-        0xf08e2: 0xf08e2,
-        0xf08e3: 0xf08e3,
-        0xf08e4: 0xf08e4,
-        0xf08e5: 0xf08e5,
-        0xf08e6: 0xf08e6,
-        0xf08e7: 0xf08e7,
-        0xf08e8: 0xf08e8,
-        0xf08e9: 0xf08e9,
-        0xf08ea: 0xf08ea,
-        0xf08eb: 0xf08eb,
-        0xf08ec: 0xf08ec,
-        0xf08ed: 0xf08ed,
-        0xf08ee: 0xf08ee,
-        0xf08ef: 0xf08ef,
-        0xf08f0: 0xf08f0,
-        0xf08f1: 0xf08f1,
-        0xf08f2: 0xf08f2,
-        0xf08f3: 0xf08f3,
-        0xf08f4: 0xf08f4,
-        0xf08f5: 0xf08f5,
-        0xf08f6: 0xf08f6,
-        0xf08f7: 0xf08f7,
-        0xf08f8: 0xf08f8,
-        0xf08f9: 0xf08f9,
-        0xf08fa: 0xf08fa,
-        0xf08fb: 0xf08fb,
-        0xf08fc: 0xf08fc,
-        0xf08fd: 0xf08fd,
-        0xf08fe: 0xf08fe,
-        0xf08ff: 0xf08ff,
-        0xf0900: 0xf0900,
-        0xf0901: 0xf0901,
-        0xf0902: 0xf0902,
-        0xf0903: 0xf0903,
-        0xf0904: 0xf0904,
-        0xf0905: 0xf0905,
-        0xf0906: 0xf0906,
-        0xf0907: 0xf0907,
-        0xf0908: 0xf0908,
-        0xf0909: 0xf0909,
-        0xf090a: 0xf090a,
-        0xf090b: 0xf090b,
-        0xf090c: 0xf090c,
-        0xf090d: 0xf090d,
-        0xf090e: 0xf090e,
-        0xf090f: 0xf090f,
-        0xf0910: 0xf0910,
-        0xf0911: 0xf0911,
-        0xf0912: 0xf0912,
-        0xf0913: 0xf0913,
-        0xf0914: 0xf0914,
-        0xf0915: 0xf0915,
-        0xf0916: 0xf0916,
-        0xf0917: 0xf0917,
-        0xf0918: 0xf0918,
-        0xf0919: 0xf0919,
-        0xf091a: 0xf091a,
-        0xf091b: 0xf091b,
-        0xf091c: 0xf091c,
-        0xf091d: 0xf091d,
-        0xf091e: 0xf091e,
-        0xf091f: 0xf091f,
-        0xf0920: 0xf0920,
-        0xf0921: 0xf0921,
-        0xf0922: 0xf0922,
-        0xf0923: 0xf0923,
-        0xf0924: 0xf0924,
-        0xf0925: 0xf0925,
-        0xf0926: 0xf0926,
-        0xf0927: 0xf0927,
-        0xf0928: 0xf0928,
-        0xf0929: 0xf0929,
-        0xf092a: 0xf092a,
-        0xf092b: 0xf092b,
-        0xf092c: 0xf092c,
-        0xf092d: 0xf092d,
-        0xf092e: 0xf092e,
-        0xf092f: 0xf092f,
-        0xf0930: 0xf0930,
-        0xf0931: 0xf0931,
-        0xf0932: 0xf0932,
-        0xf0933: 0xf0933,
-        0xf0934: 0xf0934,
-        0xf0935: 0xf0935,
-        0xf0936: 0xf0936,
-        0xf0937: 0xf0937,
-        0xf0938: 0xf0938,
-        0xf0939: 0xf0939,
-        0xf093a: 0xf093a,
-        0xf093b: 0xf093b,
-        0xf093c: 0xf093c,
-        0xf093d: 0xf093d,
-        0xf093e: 0xf093e,
-        0xf093f: 0xf093f,
-        0xf0940: 0xf0940,
-        0xf0941: 0xf0941,
-        0xf0942: 0xf0942,
-        0xf0943: 0xf0943,
-        0xf0944: 0xf0944,
-        0xf0945: 0xf0945,
-        0xf0946: 0xf0946,
-        0xf0947: 0xf0947,
-        0xf0948: 0xf0948,
-        0xf0949: 0xf0949,
-        0xf094a: 0xf094a,
-        0xf094b: 0xf094b,
-        0xf094c: 0xf094c,
-        0xf094d: 0xf094d,
-        0xf094e: 0xf094e,
-        0xf094f: 0xf094f,
-        0xf0950: 0xf0950,
-        0xf0951: 0xf0951,
-        0xf0952: 0xf0952,
-        0xf0953: 0xf0953,
-        0xf0954: 0xf0954,
-        0xf0955: 0xf0955,
-        0xf0956: 0xf0956,
-        0xf0957: 0xf0957,
-        0xf0958: 0xf0958,
-        0xf0959: 0xf0959,
-        0xf095a: 0xf095a,
-        0xf095b: 0xf095b,
-        0xf095c: 0xf095c,
-        0xf095d: 0xf095d,
-        0xf095e: 0xf095e,
-        0xf095f: 0xf095f,
-        0xf0960: 0xf0960,
-        0xf0961: 0xf0961,
-        0xf0962: 0xf0962,
-        0xf0963: 0xf0963,
-        0xf0964: 0xf0964,
-        0xf0965: 0xf0965,
-        0xf0966: 0xf0966,
-        0xf0967: 0xf0967,
-        0xf0968: 0xf0968,
-        0xf0969: 0xf0969,
-        0xf096a: 0xf096a,
-        0xf096b: 0xf096b,
-        0xf096c: 0xf096c,
-        0xf096d: 0xf096d,
-        0xf096e: 0xf096e,
-        0xf096f: 0xf096f,
-        0xf0970: 0xf0970,
-        0xf0971: 0xf0971,
-        0xf0972: 0xf0972,
-        0xf0973: 0xf0973,
-        0xf0974: 0xf0974,
-        0xf0975: 0xf0975,
-        0xf0976: 0xf0976,
-        0xf0977: 0xf0977,
-        0xf0978: 0xf0978,
-        0xf0979: 0xf0979,
-        0xf097a: 0xf097a,
-        0xf097b: 0xf097b,
-        0xf097c: 0xf097c,
-        0xf097d: 0xf097d,
-        0xf097e: 0xf097e,
-        0xf097f: 0xf097f,
-        0xf0980: 0xf0980,
-        0xf0981: 0xf0981,
-        0xf0982: 0xf0982,
-        0xf0983: 0xf0983,
-        0xf0984: 0xf0984,
-        0xf0985: 0xf0985,
-        0xf0986: 0xf0986,
-        0xf0987: 0xf0987,
-        0xf0988: 0xf0988,
-        0xf0989: 0xf0989,
-        0xf098a: 0xf098a,
-        0xf098b: 0xf098b,
-        0xf098c: 0xf098c,
-        0xf098d: 0xf098d,
-        0xf098e: 0xf098e,
-        0xf098f: 0xf098f,
-        0xf0990: 0xf0990,
-        0xf0991: 0xf0991,
-        0xf0992: 0xf0992,
-        0xf0993: 0xf0993,
-        0xf0994: 0xf0994,
-        0xf0995: 0xf0995,
-        0xf0996: 0xf0996,
-        0xf0997: 0xf0997,
-        0xf0998: 0xf0998,
-        0xf0999: 0xf0999,
-        0xf099a: 0xf099a,
-        0xf099b: 0xf099b,
-        0xf099c: 0xf099c,
-        0xf099d: 0xf099d,
-        0xf099e: 0xf099e,
-        0xf099f: 0xf099f,
-        0xf09a0: 0xf09a0,
-        0xf09a1: 0xf09a1,
-        0xf09a2: 0xf09a2,
-        0xf09a3: 0xf09a3,
-        0xf09a4: 0xf09a4,
-        0xf09a5: 0xf09a5,
-        0xf09a6: 0xf09a6,
-        0xf09a7: 0xf09a7,
-        0xf09a8: 0xf09a8,
-        0xf09a9: 0xf09a9,
-        0xf09aa: 0xf09aa,
-        0xf09ab: 0xf09ab,
-        0xf09ac: 0xf09ac,
-        0xf09ad: 0xf09ad,
-        0xf09ae: 0xf09ae,
-        0xf09af: 0xf09af,
-        0xf09b0: 0xf09b0,
-        0xf09b1: 0xf09b1,
-        0xf09b2: 0xf09b2,
-        0xf09b3: 0xf09b3,
-        0xf09b4: 0xf09b4,
-        0xf09b5: 0xf09b5,
-        0xf09b6: 0xf09b6,
-        0xf09b7: 0xf09b7,
-        0xf09b8: 0xf09b8,
-        0xf09b9: 0xf09b9,
-        0xf09ba: 0xf09ba,
-        0xf09bb: 0xf09bb,
-        0xf09bc: 0xf09bc,
-        0xf09bd: 0xf09bd,
-        0xf09be: 0xf09be,
-        0xf09bf: 0xf09bf,
-        0xf09c0: 0xf09c0,
-        0xf09c1: 0xf09c1,
-        0xf09c2: 0xf09c2,
-        0xf09c3: 0xf09c3,
-        0xf09c4: 0xf09c4,
-        0xf09c5: 0xf09c5,
-        0xf09c6: 0xf09c6,
-        0xf09c7: 0xf09c7,
-        0xf09c8: 0xf09c8,
-        0xf09c9: 0xf09c9,
-        0xf09ca: 0xf09ca,
-        0xf09cb: 0xf09cb,
-        0xf09cc: 0xf09cc,
-        0xf09cd: 0xf09cd,
-        0xf09ce: 0xf09ce,
-        0xf09cf: 0xf09cf,
-        0xf09d0: 0xf09d0,
-        0xf09d1: 0xf09d1,
-        0xf09d2: 0xf09d2,
-        0xf09d3: 0xf09d3,
-        0xf09d4: 0xf09d4,
-        0xf09d5: 0xf09d5,
-        0xf09d6: 0xf09d6,
-        0xf09d7: 0xf09d7,
-        0xf09d8: 0xf09d8,
-        0xf09d9: 0xf09d9,
-        0xf09da: 0xf09da,
-        0xf09db: 0xf09db,
-        0xf09dc: 0xf09dc,
-        0xf09dd: 0xf09dd,
-        0xf09de: 0xf09de,
-        0xf09df: 0xf09df,
-        0xf09e0: 0xf09e0,
-        0xf09e1: 0xf09e1,
-        0xf09e2: 0xf09e2,
-        0xf09e3: 0xf09e3,
-        0xf09e4: 0xf09e4,
-        0xf09e5: 0xf09e5,
-        0xf09e6: 0xf09e6,
-        0xf09e7: 0xf09e7,
-        0xf09e8: 0xf09e8,
-        0xf09e9: 0xf09e9,
-        0xf09ea: 0xf09ea,
-        0xf09eb: 0xf09eb,
-        0xf09ec: 0xf09ec,
-        0xf09ed: 0xf09ed,
-        0xf09ee: 0xf09ee,
-        0xf09ef: 0xf09ef,
-        0xf09f0: 0xf09f0,
-        0xf09f1: 0xf09f1,
-        0xf09f2: 0xf09f2,
-        0xf09f3: 0xf09f3,
-        0xf09f4: 0xf09f4,
-        0xf09f5: 0xf09f5,
-        0xf09f6: 0xf09f6,
-        0xf09f7: 0xf09f7,
-        0xf09f8: 0xf09f8,
-        0xf09f9: 0xf09f9,
-        0xf09fa: 0xf09fa,
-        0xf09fb: 0xf09fb,
-        0xf09fc: 0xf09fc,
-        0xf09fd: 0xf09fd,
-        0xf09fe: 0xf09fe,
-        0xf09ff: 0xf09ff,
-        0xf0a00: 0xf0a00,
-        0xf0a01: 0xf0a01,
-        0xf0a02: 0xf0a02,
-        0xf0a03: 0xf0a03,
-        0xf0a04: 0xf0a04,
-        0xf0a05: 0xf0a05,
-        0xf0a06: 0xf0a06,
-        0xf0a07: 0xf0a07,
-        0xf0a08: 0xf0a08,
-        0xf0a09: 0xf0a09,
-        0xf0a0a: 0xf0a0a,
-        0xf0a0b: 0xf0a0b,
-        0xf0a0c: 0xf0a0c,
-        0xf0a0d: 0xf0a0d,
-        0xf0a0e: 0xf0a0e,
-        0xf0a0f: 0xf0a0f,
-        0xf0a10: 0xf0a10,
-        0xf0a11: 0xf0a11,
-        0xf0a12: 0xf0a12,
-        0xf0a13: 0xf0a13,
-        0xf0a14: 0xf0a14,
-        0xf0a15: 0xf0a15,
-        0xf0a16: 0xf0a16,
-        0xf0a17: 0xf0a17,
-        0xf0a18: 0xf0a18,
-        0xf0a19: 0xf0a19,
-        0xf0a1a: 0xf0a1a,
-        0xf0a1b: 0xf0a1b,
-        0xf0a1c: 0xf0a1c,
-        0xf0a1d: 0xf0a1d,
-        0xf0a1e: 0xf0a1e,
-        0xf0a1f: 0xf0a1f,
-        0xf0a20: 0xf0a20,
-        0xf0a21: 0xf0a21,
-        0xf0a22: 0xf0a22,
-        0xf0a23: 0xf0a23,
-        0xf0a24: 0xf0a24,
-        0xf0a25: 0xf0a25,
-        0xf0a26: 0xf0a26,
-        0xf0a27: 0xf0a27,
-        0xf0a28: 0xf0a28,
-        0xf0a29: 0xf0a29,
-        0xf0a2a: 0xf0a2a,
-        0xf0a2b: 0xf0a2b,
-        0xf0a2c: 0xf0a2c,
-        0xf0a2d: 0xf0a2d,
-        0xf0a2e: 0xf0a2e,
-        0xf0a2f: 0xf0a2f,
-        0xf0a30: 0xf0a30,
-        0xf0a31: 0xf0a31,
-        0xf0a32: 0xf0a32,
-        0xf0a33: 0xf0a33,
-        0xf0a34: 0xf0a34,
-        0xf0a35: 0xf0a35,
-        0xf0a36: 0xf0a36,
-        0xf0a37: 0xf0a37,
-        0xf0a38: 0xf0a38,
-        0xf0a39: 0xf0a39,
-        0xf0a3a: 0xf0a3a,
-        0xf0a3b: 0xf0a3b,
-        0xf0a3c: 0xf0a3c,
-        0xf0a3d: 0xf0a3d,
-        0xf0a3e: 0xf0a3e,
-        0xf0a3f: 0xf0a3f,
-        0xf0a40: 0xf0a40,
-        0xf0a41: 0xf0a41,
-        0xf0a42: 0xf0a42,
-        0xf0a43: 0xf0a43,
-        0xf0a44: 0xf0a44,
-        0xf0a45: 0xf0a45,
-        0xf0a46: 0xf0a46,
-        0xf0a47: 0xf0a47,
-        0xf0a48: 0xf0a48,
-        0xf0a49: 0xf0a49,
-        0xf0a4a: 0xf0a4a,
-        0xf0a4b: 0xf0a4b,
-        0xf0a4c: 0xf0a4c,
-        0xf0a4d: 0xf0a4d,
-        0xf0a4e: 0xf0a4e,
-        0xf0a4f: 0xf0a4f,
-        0xf0a50: 0xf0a50,
-        0xf0a51: 0xf0a51,
-        0xf0a52: 0xf0a52,
-        0xf0a53: 0xf0a53,
-        0xf0a54: 0xf0a54,
-        0xf0a55: 0xf0a55,
-        0xf0a56: 0xf0a56,
-        0xf0a57: 0xf0a57,
-        0xf0a58: 0xf0a58,
-        0xf0a59: 0xf0a59,
-        0xf0a5a: 0xf0a5a,
-        0xf0a5b: 0xf0a5b,
-        0xf0a5c: 0xf0a5c,
-        0xf0a5d: 0xf0a5d,
-        0xf0a5e: 0xf0a5e,
-        0xf0a5f: 0xf0a5f,
-        0xf0a60: 0xf0a60,
-        0xf0a61: 0xf0a61,
-        0xf0a62: 0xf0a62,
-        0xf0a63: 0xf0a63,
-        0xf0a64: 0xf0a64,
-        0xf0a65: 0xf0a65,
-        0xf0a66: 0xf0a66,
-        0xf0a67: 0xf0a67,
-        0xf0a68: 0xf0a68,
-        0xf0a69: 0xf0a69,
-        0xf0a6a: 0xf0a6a,
-        0xf0a6b: 0xf0a6b,
-        0xf0a6c: 0xf0a6c,
-        0xf0a6d: 0xf0a6d,
-        0xf0a6e: 0xf0a6e,
-        0xf0a6f: 0xf0a6f,
-        0xf0a70: 0xf0a70,
-        0xf0a71: 0xf0a71,
-        0xf0a72: 0xf0a72,
-        0xf0a73: 0xf0a73,
-        0xf0a74: 0xf0a74,
-        0xf0a75: 0xf0a75,
-        0xf0a76: 0xf0a76,
-        0xf0a77: 0xf0a77,
-        0xf0a78: 0xf0a78,
-        0xf0a79: 0xf0a79,
-        0xf0a7a: 0xf0a7a,
-        0xf0a7b: 0xf0a7b,
-        0xf0a7c: 0xf0a7c,
-        0xf0a7d: 0xf0a7d,
-        0xf0a7e: 0xf0a7e,
-        0xf0a7f: 0xf0a7f,
-        0xf0a80: 0xf0a80,
-        0xf0a81: 0xf0a81,
-        0xf0a82: 0xf0a82,
-        0xf0a83: 0xf0a83,
-        0xf0a84: 0xf0a84,
-        0xf0a85: 0xf0a85,
-        0xf0a86: 0xf0a86,
-        0xf0a87: 0xf0a87,
-        0xf0a88: 0xf0a88,
-        0xf0a89: 0xf0a89,
-        0xf0a8a: 0xf0a8a,
-        0xf0a8b: 0xf0a8b,
-        0xf0a8c: 0xf0a8c,
-        0xf0a8d: 0xf0a8d,
-        0xf0a8e: 0xf0a8e,
-        0xf0a8f: 0xf0a8f,
-        0xf0a90: 0xf0a90,
-        0xf0a91: 0xf0a91,
-        0xf0a92: 0xf0a92,
-        0xf0a93: 0xf0a93,
-        0xf0a94: 0xf0a94,
-        0xf0a95: 0xf0a95,
-        0xf0a96: 0xf0a96,
-        0xf0a97: 0xf0a97,
-        0xf0a98: 0xf0a98,
-        0xf0a99: 0xf0a99,
-        0xf0a9a: 0xf0a9a,
-        0xf0a9b: 0xf0a9b,
-        0xf0a9c: 0xf0a9c,
-        0xf0a9d: 0xf0a9d,
-        0xf0a9e: 0xf0a9e,
-        0xf0a9f: 0xf0a9f,
-        0xf0aa0: 0xf0aa0,
-        0xf0aa1: 0xf0aa1,
-        0xf0aa2: 0xf0aa2,
-        0xf0aa3: 0xf0aa3,
-        0xf0aa4: 0xf0aa4,
-        0xf0aa5: 0xf0aa5,
-        0xf0aa6: 0xf0aa6,
-        0xf0aa7: 0xf0aa7,
-        0xf0aa8: 0xf0aa8,
-        0xf0aa9: 0xf0aa9,
-        0xf0aaa: 0xf0aaa,
-        0xf0aab: 0xf0aab,
-        0xf0aac: 0xf0aac,
-        0xf0aad: 0xf0aad,
-        0xf0aae: 0xf0aae,
-        0xf0aaf: 0xf0aaf,
-        0xf0ab0: 0xf0ab0,
-        0xf0ab1: 0xf0ab1,
-        0xf0ab2: 0xf0ab2,
-        0xf0ab3: 0xf0ab3,
-        0xf0ab4: 0xf0ab4,
-        0xf0ab5: 0xf0ab5,
-        0xf0ab6: 0xf0ab6,
-        0xf0ab7: 0xf0ab7,
-        0xf0ab8: 0xf0ab8,
-        0xf0ab9: 0xf0ab9,
-        0xf0aba: 0xf0aba,
-        0xf0abb: 0xf0abb,
-        0xf0abc: 0xf0abc,
-        0xf0abd: 0xf0abd,
-        0xf0abe: 0xf0abe,
-        0xf0abf: 0xf0abf,
-        0xf0ac0: 0xf0ac0,
-        0xf0ac1: 0xf0ac1,
-        0xf0ac2: 0xf0ac2,
-        0xf0ac3: 0xf0ac3,
-        0xf0ac4: 0xf0ac4,
-        0xf0ac5: 0xf0ac5,
-        0xf0ac6: 0xf0ac6,
-        0xf0ac7: 0xf0ac7,
-        0xf0ac8: 0xf0ac8,
-        0xf0ac9: 0xf0ac9,
-        0xf0aca: 0xf0aca,
-        0xf0acb: 0xf0acb,
-        0xf0acc: 0xf0acc,
-        0xf0acd: 0xf0acd,
-        0xf0ace: 0xf0ace,
-        0xf0acf: 0xf0acf,
-        0xf0ad0: 0xf0ad0,
-        0xf0ad1: 0xf0ad1,
-        0xf0ad2: 0xf0ad2,
-        0xf0ad3: 0xf0ad3,
-        0xf0ad4: 0xf0ad4,
-        0xf0ad5: 0xf0ad5,
-        0xf0ad6: 0xf0ad6,
-        0xf0ad7: 0xf0ad7,
-        0xf0ad8: 0xf0ad8,
-        0xf0ad9: 0xf0ad9,
-        0xf0ada: 0xf0ada,
-        0xf0adb: 0xf0adb,
-        0xf0adc: 0xf0adc,
-        0xf0add: 0xf0add,
-        0xf0ade: 0xf0ade,
-        0xf0adf: 0xf0adf,
-        0xf0ae0: 0xf0ae0,
-        0xf0ae1: 0xf0ae1,
-        0xf0ae2: 0xf0ae2,
-        0xf0ae3: 0xf0ae3,
-        0xf0ae4: 0xf0ae4,
-        0xf0ae5: 0xf0ae5,
-        0xf0ae6: 0xf0ae6,
-        0xf0ae7: 0xf0ae7,
-        0xf0ae8: 0xf0ae8,
-        0xf0ae9: 0xf0ae9,
-        0xf0aea: 0xf0aea,
-        0xf0aeb: 0xf0aeb,
-        0xf0aec: 0xf0aec,
-        0xf0aed: 0xf0aed,
-        0xf0aee: 0xf0aee,
-        0xf0aef: 0xf0aef,
-        0xf0af0: 0xf0af0,
-        0xf0af1: 0xf0af1,
-        0xf0af2: 0xf0af2,
-        0xf0af3: 0xf0af3,
-        0xf0af4: 0xf0af4,
-        0xf0af5: 0xf0af5,
-        0xf0af6: 0xf0af6,
-        0xf0af7: 0xf0af7,
-        0xf0af8: 0xf0af8,
-        0xf0af9: 0xf0af9,
-        0xf0afa: 0xf0afa,
-        0xf0afb: 0xf0afb,
-        0xf0afc: 0xf0afc,
-        0xf0afd: 0xf0afd,
-        0xf0afe: 0xf0afe,
-        0xf0aff: 0xf0aff,
-        0xf0b00: 0xf0b00,
-        0xf0b01: 0xf0b01,
-        0xf0b02: 0xf0b02,
-        0xf0b03: 0xf0b03,
-        0xf0b04: 0xf0b04,
-        0xf0b05: 0xf0b05,
-        0xf0b06: 0xf0b06,
-        0xf0b07: 0xf0b07,
-        0xf0b08: 0xf0b08,
-        0xf0b09: 0xf0b09,
-        0xf0b0a: 0xf0b0a,
-        0xf0b0b: 0xf0b0b,
-        0xf0b0c: 0xf0b0c,
-        0xf0b0d: 0xf0b0d,
-        0xf0b0e: 0xf0b0e,
-        0xf0b0f: 0xf0b0f,
-        0xf0b10: 0xf0b10,
-        0xf0b11: 0xf0b11,
-        0xf0b12: 0xf0b12,
-        0xf0b13: 0xf0b13,
-        0xf0b14: 0xf0b14,
-        0xf0b15: 0xf0b15,
-        0xf0b16: 0xf0b16,
-        0xf0b17: 0xf0b17,
-        0xf0b18: 0xf0b18,
-        0xf0b19: 0xf0b19,
-        0xf0b1a: 0xf0b1a,
-        0xf0b1b: 0xf0b1b,
-        0xf0b1c: 0xf0b1c,
-        0xf0b1d: 0xf0b1d,
-        0xf0b1e: 0xf0b1e,
-        0xf0b1f: 0xf0b1f,
-        0xf0b20: 0xf0b20,
-        0xf0b21: 0xf0b21,
-        0xf0b22: 0xf0b22,
-        0xf0b23: 0xf0b23,
-        0xf0b24: 0xf0b24,
-        0xf0b25: 0xf0b25,
-        0xf0b26: 0xf0b26,
-        0xf0b27: 0xf0b27,
-        0xf0b28: 0xf0b28,
-        0xf0b29: 0xf0b29,
-        0xf0b2a: 0xf0b2a,
-        0xf0b2b: 0xf0b2b,
-        0xf0b2c: 0xf0b2c,
-        0xf0b2d: 0xf0b2d,
-        0xf0b2e: 0xf0b2e,
-        0xf0b2f: 0xf0b2f,
-        0xf0b30: 0xf0b30,
-        0xf0b31: 0xf0b31,
-        0xf0b32: 0xf0b32,
-        0xf0b33: 0xf0b33,
-        0xf0b34: 0xf0b34,
-        0xf0b35: 0xf0b35,
-        0xf0b36: 0xf0b36,
-        0xf0b37: 0xf0b37,
-        0xf0b38: 0xf0b38,
-        0xf0b39: 0xf0b39,
-        0xf0b3a: 0xf0b3a,
-        0xf0b3b: 0xf0b3b,
-        0xf0b3c: 0xf0b3c,
-        0xf0b3d: 0xf0b3d,
-        0xf0b3e: 0xf0b3e,
-        0xf0b3f: 0xf0b3f,
-        0xf0b40: 0xf0b40,
-        0xf0b41: 0xf0b41,
-        0xf0b42: 0xf0b42,
-        0xf0b43: 0xf0b43,
-        0xf0b44: 0xf0b44,
-        0xf0b45: 0xf0b45,
-        0xf0b46: 0xf0b46,
-        0xf0b47: 0xf0b47,
-        0xf0b48: 0xf0b48,
-        0xf0b49: 0xf0b49,
-        0xf0b4a: 0xf0b4a,
-        0xf0b4b: 0xf0b4b,
-        0xf0b4c: 0xf0b4c,
-        0xf0b4d: 0xf0b4d,
-        0xf0b4e: 0xf0b4e,
-        0xf0b4f: 0xf0b4f,
-        0xf0b50: 0xf0b50,
-        0xf0b51: 0xf0b51,
-        0xf0b52: 0xf0b52,
-        0xf0b53: 0xf0b53,
-        0xf0b54: 0xf0b54,
-        0xf0b55: 0xf0b55,
-        0xf0b56: 0xf0b56,
-        0xf0b57: 0xf0b57,
-        0xf0b58: 0xf0b58,
-        0xf0b59: 0xf0b59,
-        0xf0b5a: 0xf0b5a,
-        0xf0b5b: 0xf0b5b,
-        0xf0b5c: 0xf0b5c,
-        0xf0b5d: 0xf0b5d,
-        0xf0b5e: 0xf0b5e,
-        0xf0b5f: 0xf0b5f,
-        0xf0b60: 0xf0b60,
-        0xf0b61: 0xf0b61,
-        0xf0b62: 0xf0b62,
-        0xf0b63: 0xf0b63,
-        0xf0b64: 0xf0b64,
-        0xf0b65: 0xf0b65,
-        0xf0b66: 0xf0b66,
-        0xf0b67: 0xf0b67,
-        0xf0b68: 0xf0b68,
-        0xf0b69: 0xf0b69,
-        0xf0b6a: 0xf0b6a,
-        0xf0b6b: 0xf0b6b,
-        0xf0b6c: 0xf0b6c,
-        0xf0b6d: 0xf0b6d,
-        0xf0b6e: 0xf0b6e,
-        0xf0b6f: 0xf0b6f,
-        0xf0b70: 0xf0b70,
-        0xf0b71: 0xf0b71,
-        0xf0b72: 0xf0b72,
-        0xf0b73: 0xf0b73,
-        0xf0b74: 0xf0b74,
-        0xf0b75: 0xf0b75,
-        0xf0b76: 0xf0b76,
-        0xf0b77: 0xf0b77,
-        0xf0b78: 0xf0b78,
-        0xf0b79: 0xf0b79,
-        0xf0b7a: 0xf0b7a,
-        0xf0b7b: 0xf0b7b,
-        0xf0b7c: 0xf0b7c,
-        0xf0b7d: 0xf0b7d,
-        0xf0b7e: 0xf0b7e,
-        0xf0b7f: 0xf0b7f,
-        0xf0b80: 0xf0b80,
-        0xf0b81: 0xf0b81,
-        0xf0b82: 0xf0b82,
-        0xf0b83: 0xf0b83,
-        0xf0b84: 0xf0b84,
-        0xf0b85: 0xf0b85,
-        0xf0b86: 0xf0b86,
-        0xf0b87: 0xf0b87,
-        0xf0b88: 0xf0b88,
-        0xf0b89: 0xf0b89,
-        0xf0b8a: 0xf0b8a,
-        0xf0b8b: 0xf0b8b,
-        0xf0b8c: 0xf0b8c,
-        0xf0b8d: 0xf0b8d,
-        0xf0b8e: 0xf0b8e,
-        0xf0b8f: 0xf0b8f,
-        0xf0b90: 0xf0b90,
-        0xf0b91: 0xf0b91,
-        0xf0b92: 0xf0b92,
-        0xf0b93: 0xf0b93,
-        0xf0b94: 0xf0b94,
-        0xf0b95: 0xf0b95,
-        0xf0b96: 0xf0b96,
-        0xf0b97: 0xf0b97,
-        0xf0b98: 0xf0b98,
-        0xf0b99: 0xf0b99,
-        0xf0b9a: 0xf0b9a,
-        0xf0b9b: 0xf0b9b,
-        0xf0b9c: 0xf0b9c,
-        0xf0b9d: 0xf0b9d,
-        0xf0b9e: 0xf0b9e,
-        0xf0b9f: 0xf0b9f,
-        0xf0ba0: 0xf0ba0,
-        0xf0ba1: 0xf0ba1,
-        0xf0ba2: 0xf0ba2,
-        0xf0ba3: 0xf0ba3,
-        0xf0ba4: 0xf0ba4,
-        0xf0ba5: 0xf0ba5,
-        0xf0ba6: 0xf0ba6,
-        0xf0ba7: 0xf0ba7,
-        0xf0ba8: 0xf0ba8,
-        0xf0ba9: 0xf0ba9,
-        0xf0baa: 0xf0baa,
-        0xf0bab: 0xf0bab,
-        0xf0bac: 0xf0bac,
-        0xf0bad: 0xf0bad,
-        0xf0bae: 0xf0bae,
-        0xf0baf: 0xf0baf,
-        0xf0bb0: 0xf0bb0,
-        0xf0bb1: 0xf0bb1,
-        0xf0bb2: 0xf0bb2,
-        0xf0bb3: 0xf0bb3,
-        0xf0bb4: 0xf0bb4,
-        0xf0bb5: 0xf0bb5,
-        0xf0bb6: 0xf0bb6,
-        0xf0bb7: 0xf0bb7,
-        0xf0bb8: 0xf0bb8,
-        0xf0bb9: 0xf0bb9,
-        0xf0bba: 0xf0bba,
-        0xf0bbb: 0xf0bbb,
-        0xf0bbc: 0xf0bbc,
-        0xf0bbd: 0xf0bbd,
-        0xf0bbe: 0xf0bbe,
-        0xf0bbf: 0xf0bbf,
-        0xf0bc0: 0xf0bc0,
-        0xf0bc1: 0xf0bc1,
-        0xf0bc2: 0xf0bc2,
-        0xf0bc3: 0xf0bc3,
-        0xf0bc4: 0xf0bc4,
-        0xf0bc5: 0xf0bc5,
-        0xf0bc6: 0xf0bc6,
-        0xf0bc7: 0xf0bc7,
-        0xf0bc8: 0xf0bc8,
-        0xf0bc9: 0xf0bc9,
-        0xf0bca: 0xf0bca,
-        0xf0bcb: 0xf0bcb,
-        0xf0bcc: 0xf0bcc,
-        0xf0bcd: 0xf0bcd,
-        0xf0bce: 0xf0bce,
-        0xf0bcf: 0xf0bcf,
-        0xf0bd0: 0xf0bd0,
-        0xf0bd1: 0xf0bd1,
-        0xf0bd2: 0xf0bd2,
-        0xf0bd3: 0xf0bd3,
-        0xf0bd4: 0xf0bd4,
-        0xf0bd5: 0xf0bd5,
-        0xf0bd6: 0xf0bd6,
-        0xf0bd7: 0xf0bd7,
-        0xf0bd8: 0xf0bd8,
-        0xf0bd9: 0xf0bd9,
-        0xf0bda: 0xf0bda,
-        0xf0bdb: 0xf0bdb,
-        0xf0bdc: 0xf0bdc,
-        0xf0bdd: 0xf0bdd,
-        0xf0bde: 0xf0bde,
-        0xf0bdf: 0xf0bdf,
-        0xf0be0: 0xf0be0,
-        0xf0be1: 0xf0be1,
-        0xf0be2: 0xf0be2,
-        0xf0be3: 0xf0be3,
-        0xf0be4: 0xf0be4,
-        0xf0be5: 0xf0be5,
-        0xf0be6: 0xf0be6,
-        0xf0be7: 0xf0be7,
-        0xf0be8: 0xf0be8,
-        0xf0be9: 0xf0be9,
-        0xf0bea: 0xf0bea,
-        0xf0beb: 0xf0beb,
-        0xf0bec: 0xf0bec,
-        0xf0bed: 0xf0bed,
-        0xf0bee: 0xf0bee,
-        0xf0bef: 0xf0bef,
-        0xf0bf0: 0xf0bf0,
-        0xf0bf1: 0xf0bf1,
-        0xf0bf2: 0xf0bf2,
-        0xf0bf3: 0xf0bf3,
-        0xf0bf4: 0xf0bf4,
-        0xf0bf5: 0xf0bf5,
-        0xf0bf6: 0xf0bf6,
-        0xf0bf7: 0xf0bf7,
-        0xf0bf8: 0xf0bf8,
-        0xf0bf9: 0xf0bf9,
-        0xf0bfa: 0xf0bfa,
-        0xf0bfb: 0xf0bfb,
-        0xf0bfc: 0xf0bfc,
-        0xf0bfd: 0xf0bfd,
-        0xf0bfe: 0xf0bfe,
-        0xf0bff: 0xf0bff,
-        0xf0c00: 0xf0c00,
-        0xf0c01: 0xf0c01,
-        0xf0c02: 0xf0c02,
-        0xf0c03: 0xf0c03,
-        0xf0c04: 0xf0c04,
-        0xf0c05: 0xf0c05,
-        0xf0c06: 0xf0c06,
-        0xf0c07: 0xf0c07,
-        0xf0c08: 0xf0c08,
-        0xf0c09: 0xf0c09,
-        0xf0c0a: 0xf0c0a,
-        0xf0c0b: 0xf0c0b,
-        0xf0c0c: 0xf0c0c,
-        0xf0c0d: 0xf0c0d,
-        0xf0c0e: 0xf0c0e,
-        0xf0c0f: 0xf0c0f,
-        0xf0c10: 0xf0c10,
-        0xf0c11: 0xf0c11,
-        0xf0c12: 0xf0c12,
-        0xf0c13: 0xf0c13,
-        0xf0c14: 0xf0c14,
-        0xf0c15: 0xf0c15,
-        0xf0c16: 0xf0c16,
-        0xf0c17: 0xf0c17,
-        0xf0c18: 0xf0c18,
-        0xf0c19: 0xf0c19,
-        0xf0c1a: 0xf0c1a,
-        0xf0c1b: 0xf0c1b,
-        0xf0c1c: 0xf0c1c,
-        0xf0c1d: 0xf0c1d,
-        0xf0c1e: 0xf0c1e,
-        0xf0c1f: 0xf0c1f,
-        0xf0c20: 0xf0c20,
-        0xf0c21: 0xf0c21,
-        0xf0c22: 0xf0c22,
-        0xf0c23: 0xf0c23,
-        0xf0c24: 0xf0c24,
-        0xf0c25: 0xf0c25,
-        0xf0c26: 0xf0c26,
-        0xf0c27: 0xf0c27,
-        0xf0c28: 0xf0c28,
-        0xf0c29: 0xf0c29,
-        0xf0c2a: 0xf0c2a,
-        0xf0c2b: 0xf0c2b,
-        0xf0c2c: 0xf0c2c,
-        0xf0c2d: 0xf0c2d,
-        0xf0c2e: 0xf0c2e,
-        0xf0c2f: 0xf0c2f,
-        0xf0c30: 0xf0c30,
-        0xf0c31: 0xf0c31,
-        0xf0c32: 0xf0c32,
-        0xf0c33: 0xf0c33,
-        0xf0c34: 0xf0c34,
-        0xf0c35: 0xf0c35,
-        0xf0c36: 0xf0c36,
-        0xf0c37: 0xf0c37,
-        0xf0c38: 0xf0c38,
-        0xf0c39: 0xf0c39,
-        0xf0c3a: 0xf0c3a,
-        0xf0c3b: 0xf0c3b,
-        0xf0c3c: 0xf0c3c,
-        0xf0c3d: 0xf0c3d,
-        0xf0c3e: 0xf0c3e,
-        0xf0c3f: 0xf0c3f,
-        0xf0c40: 0xf0c40,
-        0xf0c41: 0xf0c41,
-        0xf0c42: 0xf0c42,
-        0xf0c43: 0xf0c43,
-        0xf0c44: 0xf0c44,
-        0xf0c45: 0xf0c45,
-        0xf0c46: 0xf0c46,
-        0xf0c47: 0xf0c47,
-        0xf0c48: 0xf0c48,
-        0xf0c49: 0xf0c49,
-        0xf0c4a: 0xf0c4a,
-        0xf0c4b: 0xf0c4b,
-        0xf0c4c: 0xf0c4c,
-        0xf0c4d: 0xf0c4d,
-        0xf0c4e: 0xf0c4e,
-        0xf0c4f: 0xf0c4f,
-        0xf0c50: 0xf0c50,
-        0xf0c51: 0xf0c51,
-        0xf0c52: 0xf0c52,
-        0xf0c53: 0xf0c53,
-        0xf0c54: 0xf0c54,
-        0xf0c55: 0xf0c55,
-        0xf0c56: 0xf0c56,
-        0xf0c57: 0xf0c57,
-        0xf0c58: 0xf0c58,
-        0xf0c59: 0xf0c59,
-        0xf0c5a: 0xf0c5a,
-        0xf0c5b: 0xf0c5b,
-        0xf0c5c: 0xf0c5c,
-        0xf0c5d: 0xf0c5d,
-        0xf0c5e: 0xf0c5e,
-        0xf0c5f: 0xf0c5f,
-        0xf0c60: 0xf0c60,
-        0xf0c61: 0xf0c61,
-        0xf0c62: 0xf0c62,
-        0xf0c63: 0xf0c63,
-        0xf0c64: 0xf0c64,
-        0xf0c65: 0xf0c65,
-        0xf0c66: 0xf0c66,
-        0xf0c67: 0xf0c67,
-        0xf0c68: 0xf0c68,
-        0xf0c69: 0xf0c69,
-        0xf0c6a: 0xf0c6a,
-        0xf0c6b: 0xf0c6b,
-        0xf0c6c: 0xf0c6c,
-        0xf0c6d: 0xf0c6d,
-        0xf0c6e: 0xf0c6e,
-        0xf0c6f: 0xf0c6f,
-        0xf0c70: 0xf0c70,
-        0xf0c71: 0xf0c71,
-        0xf0c72: 0xf0c72,
-        0xf0c73: 0xf0c73,
-        0xf0c74: 0xf0c74,
-        0xf0c75: 0xf0c75,
-        0xf0c76: 0xf0c76,
-        0xf0c77: 0xf0c77,
-        0xf0c78: 0xf0c78,
-        0xf0c79: 0xf0c79,
-        0xf0c7a: 0xf0c7a,
-        0xf0c7b: 0xf0c7b,
-        0xf0c7c: 0xf0c7c,
-        0xf0c7d: 0xf0c7d,
-        0xf0c7e: 0xf0c7e,
-        0xf0c7f: 0xf0c7f,
-        0xf0c80: 0xf0c80,
-        0xf0c81: 0xf0c81,
-        0xf0c82: 0xf0c82,
-        0xf0c83: 0xf0c83,
-        0xf0c84: 0xf0c84,
-        0xf0c85: 0xf0c85,
-        0xf0c86: 0xf0c86,
-        0xf0c87: 0xf0c87,
-        0xf0c88: 0xf0c88,
-        0xf0c89: 0xf0c89,
-        0xf0c8a: 0xf0c8a,
-        0xf0c8b: 0xf0c8b,
-        0xf0c8c: 0xf0c8c,
-        0xf0c8d: 0xf0c8d,
-        0xf0c8e: 0xf0c8e,
-        0xf0c8f: 0xf0c8f,
-        0xf0c90: 0xf0c90,
-        0xf0c91: 0xf0c91,
-        0xf0c92: 0xf0c92,
-        0xf0c93: 0xf0c93,
-        0xf0c94: 0xf0c94,
-        0xf0c95: 0xf0c95,
-        0xf0c96: 0xf0c96,
-        0xf0c97: 0xf0c97,
-        0xf0c98: 0xf0c98,
-        0xf0c99: 0xf0c99,
-        0xf0c9a: 0xf0c9a,
-        0xf0c9b: 0xf0c9b,
-        0xf0c9c: 0xf0c9c,
-        0xf0c9d: 0xf0c9d,
-        0xf0c9e: 0xf0c9e,
-        0xf0c9f: 0xf0c9f,
-        0xf0ca0: 0xf0ca0,
-        0xf0ca1: 0xf0ca1,
-        0xf0ca2: 0xf0ca2,
-        0xf0ca3: 0xf0ca3,
-        0xf0ca4: 0xf0ca4,
-        0xf0ca5: 0xf0ca5,
-        0xf0ca6: 0xf0ca6,
-        0xf0ca7: 0xf0ca7,
-        0xf0ca8: 0xf0ca8,
-        0xf0ca9: 0xf0ca9,
-        0xf0caa: 0xf0caa,
-        0xf0cab: 0xf0cab,
-        0xf0cac: 0xf0cac,
-        0xf0cad: 0xf0cad,
-        0xf0cae: 0xf0cae,
-        0xf0caf: 0xf0caf,
-        0xf0cb0: 0xf0cb0,
-        0xf0cb1: 0xf0cb1,
-        0xf0cb2: 0xf0cb2,
-        0xf0cb3: 0xf0cb3,
-        0xf0cb4: 0xf0cb4,
-        0xf0cb5: 0xf0cb5,
-        0xf0cb6: 0xf0cb6,
-        0xf0cb7: 0xf0cb7,
-        0xf0cb8: 0xf0cb8,
-        0xf0cb9: 0xf0cb9,
-        0xf0cba: 0xf0cba,
-        0xf0cbb: 0xf0cbb,
-        0xf0cbc: 0xf0cbc,
-        0xf0cbd: 0xf0cbd,
-        0xf0cbe: 0xf0cbe,
-        0xf0cbf: 0xf0cbf,
-        0xf0cc0: 0xf0cc0,
-        0xf0cc1: 0xf0cc1,
-        0xf0cc2: 0xf0cc2,
-        0xf0cc3: 0xf0cc3,
-        0xf0cc4: 0xf0cc4,
-        0xf0cc5: 0xf0cc5,
-        0xf0cc6: 0xf0cc6,
-        0xf0cc7: 0xf0cc7,
-        0xf0cc8: 0xf0cc8,
-        0xf0cc9: 0xf0cc9,
-        0xf0cca: 0xf0cca,
-        0xf0ccb: 0xf0ccb,
-        0xf0ccc: 0xf0ccc,
-        0xf0ccd: 0xf0ccd,
-        0xf0cce: 0xf0cce,
-        0xf0ccf: 0xf0ccf,
-        0xf0cd0: 0xf0cd0,
-        0xf0cd1: 0xf0cd1,
-        0xf0cd2: 0xf0cd2,
-        0xf0cd3: 0xf0cd3,
-        0xf0cd4: 0xf0cd4,
-        0xf0cd5: 0xf0cd5,
-        0xf0cd6: 0xf0cd6,
-        0xf0cd7: 0xf0cd7,
-        0xf0cd8: 0xf0cd8,
-        0xf0cd9: 0xf0cd9,
-        0xf0cda: 0xf0cda,
-        0xf0cdb: 0xf0cdb,
-        0xf0cdc: 0xf0cdc,
-        0xf0cdd: 0xf0cdd,
-        0xf0cde: 0xf0cde,
-        0xf0cdf: 0xf0cdf,
-        0xf0ce0: 0xf0ce0,
-        0xf0ce1: 0xf0ce1,
-        0xf0ce2: 0xf0ce2,
-        0xf0ce3: 0xf0ce3,
-        0xf0ce4: 0xf0ce4,
-        0xf0ce5: 0xf0ce5,
-        0xf0ce6: 0xf0ce6,
-        0xf0ce7: 0xf0ce7,
-        0xf0ce8: 0xf0ce8,
-        0xf0ce9: 0xf0ce9,
-        0xf0cea: 0xf0cea,
-        0xf0ceb: 0xf0ceb,
-        0xf0cec: 0xf0cec,
-        0xf0ced: 0xf0ced,
-        0xf0cee: 0xf0cee,
-        0xf0cef: 0xf0cef,
-        0xf0cf0: 0xf0cf0,
-        0xf0cf1: 0xf0cf1,
-        0xf0cf2: 0xf0cf2,
-        0xf0cf3: 0xf0cf3,
-        0xf0cf4: 0xf0cf4,
-        0xf0cf5: 0xf0cf5,
-        0xf0cf6: 0xf0cf6,
-        0xf0cf7: 0xf0cf7,
-        0xf0cf8: 0xf0cf8,
-        0xf0cf9: 0xf0cf9,
-        0xf0cfa: 0xf0cfa,
-        0xf0cfb: 0xf0cfb,
-        0xf0cfc: 0xf0cfc,
-        0xf0cfd: 0xf0cfd,
-        0xf0cfe: 0xf0cfe,
-        0xf0cff: 0xf0cff,
-        0xf0d00: 0xf0d00,
-        0xf0d01: 0xf0d01,
-        0xf0d02: 0xf0d02,
-        0xf0d03: 0xf0d03,
-        0xf0d04: 0xf0d04,
-        0xf0d05: 0xf0d05,
-        0xf0d06: 0xf0d06,
-        0xf0d07: 0xf0d07,
-        0xf0d08: 0xf0d08,
-        0xf0d09: 0xf0d09,
-        0xf0d0a: 0xf0d0a,
-        0xf0d0b: 0xf0d0b,
-        0xf0d0c: 0xf0d0c,
-        0xf0d0d: 0xf0d0d,
-        0xf0d0e: 0xf0d0e,
-        0xf0d0f: 0xf0d0f,
-        0xf0d10: 0xf0d10,
-        0xf0d11: 0xf0d11,
-        0xf0d12: 0xf0d12,
-        0xf0d13: 0xf0d13,
-        0xf0d14: 0xf0d14,
-        0xf0d15: 0xf0d15,
-        0xf0d16: 0xf0d16,
-        0xf0d17: 0xf0d17,
-        0xf0d18: 0xf0d18,
-        0xf0d19: 0xf0d19,
-        0xf0d1a: 0xf0d1a,
-        0xf0d1b: 0xf0d1b,
-        0xf0d1c: 0xf0d1c,
-        0xf0d1d: 0xf0d1d,
-        0xf0d1e: 0xf0d1e,
-        0xf0d1f: 0xf0d1f,
-        0xf0d20: 0xf0d20,
-        0xf0d21: 0xf0d21,
-        0xf0d22: 0xf0d22,
-        0xf0d23: 0xf0d23,
-        0xf0d24: 0xf0d24,
-        0xf0d25: 0xf0d25,
-        0xf0d26: 0xf0d26,
-        0xf0d27: 0xf0d27,
-        0xf0d28: 0xf0d28,
-        0xf0d29: 0xf0d29,
-        0xf0d2a: 0xf0d2a,
-        0xf0d2b: 0xf0d2b,
-        0xf0d2c: 0xf0d2c,
-        0xf0d2d: 0xf0d2d,
-        0xf0d2e: 0xf0d2e,
-        0xf0d2f: 0xf0d2f,
-        0xf0d30: 0xf0d30,
-        0xf0d31: 0xf0d31,
-        0xf0d32: 0xf0d32,
-        0xf0d33: 0xf0d33,
-        0xf0d34: 0xf0d34,
-        0xf0d35: 0xf0d35,
-        0xf0d36: 0xf0d36,
-        0xf0d37: 0xf0d37,
-        0xf0d38: 0xf0d38,
-        0xf0d39: 0xf0d39,
-        0xf0d3a: 0xf0d3a,
-        0xf0d3b: 0xf0d3b,
-        0xf0d3c: 0xf0d3c,
-        0xf0d3d: 0xf0d3d,
-        0xf0d3e: 0xf0d3e,
-        0xf0d3f: 0xf0d3f,
-        0xf0d40: 0xf0d40,
-        0xf0d41: 0xf0d41,
-        0xf0d42: 0xf0d42,
-        0xf0d43: 0xf0d43,
-        0xf0d44: 0xf0d44,
-        0xf0d45: 0xf0d45,
-        0xf0d46: 0xf0d46,
-        0xf0d47: 0xf0d47,
-        0xf0d48: 0xf0d48,
-        0xf0d49: 0xf0d49,
-        0xf0d4a: 0xf0d4a,
-        0xf0d4b: 0xf0d4b,
-        0xf0d4c: 0xf0d4c,
-        0xf0d4d: 0xf0d4d,
-        0xf0d4e: 0xf0d4e,
-        0xf0d4f: 0xf0d4f,
-        0xf0d50: 0xf0d50,
-        0xf0d51: 0xf0d51,
-        0xf0d52: 0xf0d52,
-        0xf0d53: 0xf0d53,
-        0xf0d54: 0xf0d54,
-        0xf0d55: 0xf0d55,
-        0xf0d56: 0xf0d56,
-        0xf0d57: 0xf0d57,
-        0xf0d58: 0xf0d58,
-        0xf0d59: 0xf0d59,
-        0xf0d5a: 0xf0d5a,
-        0xf0d5b: 0xf0d5b,
-        0xf0d5c: 0xf0d5c,
-        0xf0d5d: 0xf0d5d,
-        0xf0d5e: 0xf0d5e,
-        0xf0d5f: 0xf0d5f,
-        0xf0d60: 0xf0d60,
-        0xf0d61: 0xf0d61,
-        0xf0d62: 0xf0d62,
-        0xf0d63: 0xf0d63,
-        0xf0d64: 0xf0d64,
-        0xf0d65: 0xf0d65,
-        0xf0d66: 0xf0d66,
-        0xf0d67: 0xf0d67,
-        0xf0d68: 0xf0d68,
-        0xf0d69: 0xf0d69,
-        0xf0d6a: 0xf0d6a,
-        0xf0d6b: 0xf0d6b,
-        0xf0d6c: 0xf0d6c,
-        0xf0d6d: 0xf0d6d,
-        0xf0d6e: 0xf0d6e,
-        0xf0d6f: 0xf0d6f,
-        0xf0d70: 0xf0d70,
-        0xf0d71: 0xf0d71,
-        0xf0d72: 0xf0d72,
-        0xf0d73: 0xf0d73,
-        0xf0d74: 0xf0d74,
-        0xf0d75: 0xf0d75,
-        0xf0d76: 0xf0d76,
-        0xf0d77: 0xf0d77,
-        0xf0d78: 0xf0d78,
-        0xf0d79: 0xf0d79,
-        0xf0d7a: 0xf0d7a,
-        0xf0d7b: 0xf0d7b,
-        0xf0d7c: 0xf0d7c,
-        0xf0d7d: 0xf0d7d,
-        0xf0d7e: 0xf0d7e,
-        0xf0d7f: 0xf0d7f,
-        0xf0d80: 0xf0d80,
-        0xf0d81: 0xf0d81,
-        0xf0d82: 0xf0d82,
-        0xf0d83: 0xf0d83,
-        0xf0d84: 0xf0d84,
-        0xf0d85: 0xf0d85,
-        0xf0d86: 0xf0d86,
-        0xf0d87: 0xf0d87,
-        0xf0d88: 0xf0d88,
-        0xf0d89: 0xf0d89,
-        0xf0d8a: 0xf0d8a,
-        0xf0d8b: 0xf0d8b,
-        0xf0d8c: 0xf0d8c,
-        0xf0d8d: 0xf0d8d,
-        0xf0d8e: 0xf0d8e,
-        0xf0d8f: 0xf0d8f,
-        0xf0d90: 0xf0d90,
-        0xf0d91: 0xf0d91,
-        0xf0d92: 0xf0d92,
-        0xf0d93: 0xf0d93,
-        0xf0d94: 0xf0d94,
-        0xf0d95: 0xf0d95,
-        0xf0d96: 0xf0d96,
-        0xf0d97: 0xf0d97,
-        0xf0d98: 0xf0d98,
-        0xf0d99: 0xf0d99,
-        0xf0d9a: 0xf0d9a,
-        0xf0d9b: 0xf0d9b,
-        0xf0d9c: 0xf0d9c,
-        0xf0d9d: 0xf0d9d,
-        0xf0d9e: 0xf0d9e,
-        0xf0d9f: 0xf0d9f,
-        0xf0da0: 0xf0da0,
-        0xf0da1: 0xf0da1,
-        0xf0da2: 0xf0da2,
-        0xf0da3: 0xf0da3,
-        0xf0da4: 0xf0da4,
-        0xf0da5: 0xf0da5,
-        0xf0da6: 0xf0da6,
-        0xf0da7: 0xf0da7,
-        0xf0da8: 0xf0da8,
-        0xf0da9: 0xf0da9,
-        0xf0daa: 0xf0daa,
-        0xf0dab: 0xf0dab,
-        0xf0dac: 0xf0dac,
-        0xf0dad: 0xf0dad,
-        0xf0dae: 0xf0dae,
-        0xf0daf: 0xf0daf,
-        0xf0db0: 0xf0db0,
-        0xf0db1: 0xf0db1,
-        0xf0db2: 0xf0db2,
-        0xf0db3: 0xf0db3,
-        0xf0db4: 0xf0db4,
-        0xf0db5: 0xf0db5,
-        0xf0db6: 0xf0db6,
-        0xf0db7: 0xf0db7,
-        0xf0db8: 0xf0db8,
-        0xf0db9: 0xf0db9,
-        0xf0dba: 0xf0dba,
-        0xf0dbb: 0xf0dbb,
-        0xf0dbc: 0xf0dbc,
-        0xf0dbd: 0xf0dbd,
-        0xf0dbe: 0xf0dbe,
-        0xf0dbf: 0xf0dbf,
-        0xf0dc0: 0xf0dc0,
-        0xf0dc1: 0xf0dc1,
-        0xf0dc2: 0xf0dc2,
-        0xf0dc3: 0xf0dc3,
-        0xf0dc4: 0xf0dc4,
-        0xf0dc5: 0xf0dc5,
-        0xf0dc6: 0xf0dc6,
-        0xf0dc7: 0xf0dc7,
-        0xf0dc8: 0xf0dc8,
-        0xf0dc9: 0xf0dc9,
-        0xf0dca: 0xf0dca,
-        0xf0dcb: 0xf0dcb,
-        0xf0dcc: 0xf0dcc,
-        0xf0dcd: 0xf0dcd,
-        0xf0dce: 0xf0dce,
-        0xf0dcf: 0xf0dcf,
-        0xf0dd0: 0xf0dd0,
-        0xf0dd1: 0xf0dd1,
-        0xf0dd2: 0xf0dd2,
-        0xf0dd3: 0xf0dd3,
-        0xf0dd4: 0xf0dd4,
-        0xf0dd5: 0xf0dd5,
-        0xf0dd6: 0xf0dd6,
-        0xf0dd7: 0xf0dd7,
-        0xf0dd8: 0xf0dd8,
-        0xf0dd9: 0xf0dd9,
-        0xf0dda: 0xf0dda,
-        0xf0ddb: 0xf0ddb,
-        0xf0ddc: 0xf0ddc,
-        0xf0ddd: 0xf0ddd,
-        0xf0dde: 0xf0dde,
-        0xf0ddf: 0xf0ddf,
-        0xf0de0: 0xf0de0,
-        0xf0de1: 0xf0de1,
-        0xf0de2: 0xf0de2,
-        0xf0de3: 0xf0de3,
-        0xf0de4: 0xf0de4,
-        0xf0de5: 0xf0de5,
-        0xf0de6: 0xf0de6,
-        0xf0de7: 0xf0de7,
-        0xf0de8: 0xf0de8,
-        0xf0de9: 0xf0de9,
-        0xf0dea: 0xf0dea,
-        0xf0deb: 0xf0deb,
-        0xf0dec: 0xf0dec,
-        0xf0ded: 0xf0ded,
-        0xf0dee: 0xf0dee,
-        0xf0def: 0xf0def,
-        0xf0df0: 0xf0df0,
-        0xf0df1: 0xf0df1,
-        0xf0df2: 0xf0df2,
-        0xf0df3: 0xf0df3,
-        0xf0df4: 0xf0df4,
-        0xf0df5: 0xf0df5,
-        0xf0df6: 0xf0df6,
-        0xf0df7: 0xf0df7,
-        0xf0df8: 0xf0df8,
-        0xf0df9: 0xf0df9,
-        0xf0dfa: 0xf0dfa,
-        0xf0dfb: 0xf0dfb,
-        0xf0dfc: 0xf0dfc,
-        0xf0dfd: 0xf0dfd,
-        0xf0dfe: 0xf0dfe,
-        0xf0dff: 0xf0dff,
-        0xf0e00: 0xf0e00,
-        0xf0e01: 0xf0e01,
-        0xf0e02: 0xf0e02,
-        0xf0e03: 0xf0e03,
-        0xf0e04: 0xf0e04,
-        0xf0e05: 0xf0e05,
-        0xf0e06: 0xf0e06,
-        0xf0e07: 0xf0e07,
-        0xf0e08: 0xf0e08,
-        0xf0e09: 0xf0e09,
-        0xf0e0a: 0xf0e0a,
-        0xf0e0b: 0xf0e0b,
-        0xf0e0c: 0xf0e0c,
-        0xf0e0d: 0xf0e0d,
-        0xf0e0e: 0xf0e0e,
-        0xf0e0f: 0xf0e0f,
-        0xf0e10: 0xf0e10,
-        0xf0e11: 0xf0e11,
-        0xf0e12: 0xf0e12,
-        0xf0e13: 0xf0e13,
-        0xf0e14: 0xf0e14,
-        0xf0e15: 0xf0e15,
-        0xf0e16: 0xf0e16,
-        0xf0e17: 0xf0e17,
-        0xf0e18: 0xf0e18,
-        0xf0e19: 0xf0e19,
-        0xf0e1a: 0xf0e1a,
-        0xf0e1b: 0xf0e1b,
-        0xf0e1c: 0xf0e1c,
-        0xf0e1d: 0xf0e1d,
-        0xf0e1e: 0xf0e1e,
-        0xf0e1f: 0xf0e1f,
-        0xf0e20: 0xf0e20,
-        0xf0e21: 0xf0e21,
-        0xf0e22: 0xf0e22,
-        0xf0e23: 0xf0e23,
-        0xf0e24: 0xf0e24,
-        0xf0e25: 0xf0e25,
-        0xf0e26: 0xf0e26,
-        0xf0e27: 0xf0e27,
-        0xf0e28: 0xf0e28,
-        0xf0e29: 0xf0e29,
-        0xf0e2a: 0xf0e2a,
-        0xf0e2b: 0xf0e2b,
-        0xf0e2c: 0xf0e2c,
-        0xf0e2d: 0xf0e2d,
-        0xf0e2e: 0xf0e2e,
-        0xf0e2f: 0xf0e2f,
-        0xf0e30: 0xf0e30,
-        0xf0e31: 0xf0e31,
-        0xf0e32: 0xf0e32,
-        0xf0e33: 0xf0e33,
-        0xf0e34: 0xf0e34,
-        0xf0e35: 0xf0e35,
-        0xf0e36: 0xf0e36,
-        0xf0e37: 0xf0e37,
-        0xf0e38: 0xf0e38,
-        0xf0e39: 0xf0e39,
-        0xf0e3a: 0xf0e3a,
-        0xf0e3b: 0xf0e3b,
-        0xf0e3c: 0xf0e3c,
-        0xf0e3d: 0xf0e3d,
-        0xf0e3e: 0xf0e3e,
-        0xf0e3f: 0xf0e3f,
-        0xf0e40: 0xf0e40,
-        0xf0e41: 0xf0e41,
-        0xf0e42: 0xf0e42,
-        0xf0e43: 0xf0e43,
-        0xf0e44: 0xf0e44,
-        0xf0e45: 0xf0e45,
-        0xf0e46: 0xf0e46,
-        0xf0e47: 0xf0e47,
-        0xf0e48: 0xf0e48,
-        0xf0e49: 0xf0e49,
-        0xf0e4a: 0xf0e4a,
-        0xf0e4b: 0xf0e4b,
-        0xf0e4c: 0xf0e4c,
-        0xf0e4d: 0xf0e4d,
-        0xf0e4e: 0xf0e4e,
-        0xf0e4f: 0xf0e4f,
-        0xf0e50: 0xf0e50,
-        0xf0e51: 0xf0e51,
-        0xf0e52: 0xf0e52,
-        0xf0e53: 0xf0e53,
-        0xf0e54: 0xf0e54,
-        0xf0e55: 0xf0e55,
-        0xf0e56: 0xf0e56,
-        0xf0e57: 0xf0e57,
-        0xf0e58: 0xf0e58,
-        0xf0e59: 0xf0e59,
-        0xf0e5a: 0xf0e5a,
-        0xf0e5b: 0xf0e5b,
-        0xf0e5c: 0xf0e5c,
-        0xf0e5d: 0xf0e5d,
-        0xf0e5e: 0xf0e5e,
-        0xf0e5f: 0xf0e5f,
-        0xf0e60: 0xf0e60,
-        0xf0e61: 0xf0e61,
-        0xf0e62: 0xf0e62,
-        0xf0e63: 0xf0e63,
-        0xf0e64: 0xf0e64,
-        0xf0e65: 0xf0e65,
-        0xf0e66: 0xf0e66,
-        0xf0e67: 0xf0e67,
-        0xf0e68: 0xf0e68,
-        0xf0e69: 0xf0e69,
-        0xf0e6a: 0xf0e6a,
-        0xf0e6b: 0xf0e6b,
-        0xf0e6c: 0xf0e6c,
-        0xf0e6d: 0xf0e6d,
-        0xf0e6e: 0xf0e6e,
-        0xf0e6f: 0xf0e6f,
-        0xf0e70: 0xf0e70,
-        0xf0e71: 0xf0e71,
-        0xf0e72: 0xf0e72,
-        0xf0e73: 0xf0e73,
-        0xf0e74: 0xf0e74,
-        0xf0e75: 0xf0e75,
-        0xf0e76: 0xf0e76,
-        0xf0e77: 0xf0e77,
-        0xf0e78: 0xf0e78,
-        0xf0e79: 0xf0e79,
-        0xf0e7a: 0xf0e7a,
-        0xf0e7b: 0xf0e7b,
-        0xf0e7c: 0xf0e7c,
-        0xf0e7d: 0xf0e7d,
-        0xf0e7e: 0xf0e7e,
-        0xf0e7f: 0xf0e7f,
-        0xf0e80: 0xf0e80,
-        0xf0e81: 0xf0e81,
-        0xf0e82: 0xf0e82,
-        0xf0e83: 0xf0e83,
-        0xf0e84: 0xf0e84,
-        0xf0e85: 0xf0e85,
-        0xf0e86: 0xf0e86,
-        0xf0e87: 0xf0e87,
-        0xf0e88: 0xf0e88,
-        0xf0e89: 0xf0e89,
-        0xf0e8a: 0xf0e8a,
-        0xf0e8b: 0xf0e8b,
-        0xf0e8c: 0xf0e8c,
-        0xf0e8d: 0xf0e8d,
-        0xf0e8e: 0xf0e8e,
-        0xf0e8f: 0xf0e8f,
-        0xf0e90: 0xf0e90,
-        0xf0e91: 0xf0e91,
-        0xf0e92: 0xf0e92,
-        0xf0e93: 0xf0e93,
-        0xf0e94: 0xf0e94,
-        0xf0e95: 0xf0e95,
-        0xf0e96: 0xf0e96,
-        0xf0e97: 0xf0e97,
-        0xf0e98: 0xf0e98,
-        0xf0e99: 0xf0e99,
-        0xf0e9a: 0xf0e9a,
-        0xf0e9b: 0xf0e9b,
-        0xf0e9c: 0xf0e9c,
-        0xf0e9d: 0xf0e9d,
-        0xf0e9e: 0xf0e9e,
-        0xf0e9f: 0xf0e9f,
-        0xf0ea0: 0xf0ea0,
-        0xf0ea1: 0xf0ea1,
-        0xf0ea2: 0xf0ea2,
-        0xf0ea3: 0xf0ea3,
-        0xf0ea4: 0xf0ea4,
-        0xf0ea5: 0xf0ea5,
-        0xf0ea6: 0xf0ea6,
-        0xf0ea7: 0xf0ea7,
-        0xf0ea8: 0xf0ea8,
-        0xf0ea9: 0xf0ea9,
-        0xf0eaa: 0xf0eaa,
-        0xf0eab: 0xf0eab,
-        0xf0eac: 0xf0eac,
-        0xf0ead: 0xf0ead,
-        0xf0eae: 0xf0eae,
-        0xf0eaf: 0xf0eaf,
-        0xf0eb0: 0xf0eb0,
-        0xf0eb1: 0xf0eb1,
-        0xf0eb2: 0xf0eb2,
-        0xf0eb3: 0xf0eb3,
-        0xf0eb4: 0xf0eb4,
-        0xf0eb5: 0xf0eb5,
-        0xf0eb6: 0xf0eb6,
-        0xf0eb7: 0xf0eb7,
-        0xf0eb8: 0xf0eb8,
-        0xf0eb9: 0xf0eb9,
-        0xf0eba: 0xf0eba,
-        0xf0ebb: 0xf0ebb,
-        0xf0ebc: 0xf0ebc,
-        0xf0ebd: 0xf0ebd,
-        0xf0ebe: 0xf0ebe,
-        0xf0ebf: 0xf0ebf,
-        0xf0ec0: 0xf0ec0,
-        0xf0ec1: 0xf0ec1,
-        0xf0ec2: 0xf0ec2,
-        0xf0ec3: 0xf0ec3,
-        0xf0ec4: 0xf0ec4,
-        0xf0ec5: 0xf0ec5,
-        0xf0ec6: 0xf0ec6,
-        0xf0ec7: 0xf0ec7,
-        0xf0ec8: 0xf0ec8,
-        0xf0ec9: 0xf0ec9,
-        0xf0eca: 0xf0eca,
-        0xf0ecb: 0xf0ecb,
-        0xf0ecc: 0xf0ecc,
-        0xf0ecd: 0xf0ecd,
-        0xf0ece: 0xf0ece,
-        0xf0ecf: 0xf0ecf,
-        0xf0ed0: 0xf0ed0,
-        0xf0ed1: 0xf0ed1,
-        0xf0ed2: 0xf0ed2,
-        0xf0ed3: 0xf0ed3,
-        0xf0ed4: 0xf0ed4,
-        0xf0ed5: 0xf0ed5,
-        0xf0ed6: 0xf0ed6,
-        0xf0ed7: 0xf0ed7,
-        0xf0ed8: 0xf0ed8,
-        0xf0ed9: 0xf0ed9,
-        0xf0eda: 0xf0eda,
-        0xf0edb: 0xf0edb,
-        0xf0edc: 0xf0edc,
-        0xf0edd: 0xf0edd,
-        0xf0ede: 0xf0ede,
-        0xf0edf: 0xf0edf,
-        0xf0ee0: 0xf0ee0,
-        0xf0ee1: 0xf0ee1,
-        0xf0ee2: 0xf0ee2,
-        0xf0ee3: 0xf0ee3,
-        0xf0ee4: 0xf0ee4,
-        0xf0ee5: 0xf0ee5,
-        0xf0ee6: 0xf0ee6,
-        0xf0ee7: 0xf0ee7,
-        0xf0ee8: 0xf0ee8,
-        0xf0ee9: 0xf0ee9,
-        0xf0eea: 0xf0eea,
-        0xf0eeb: 0xf0eeb,
-        0xf0eec: 0xf0eec,
-        0xf0eed: 0xf0eed,
-        0xf0eee: 0xf0eee,
-        0xf0eef: 0xf0eef,
-        0xf0ef0: 0xf0ef0,
-        0xf0ef1: 0xf0ef1,
-        0xf0ef2: 0xf0ef2,
-        0xf0ef3: 0xf0ef3,
-        0xf0ef4: 0xf0ef4,
-        0xf0ef5: 0xf0ef5,
-        0xf0ef6: 0xf0ef6,
-        0xf0ef7: 0xf0ef7,
-        0xf0ef8: 0xf0ef8,
-        0xf0ef9: 0xf0ef9,
-        0xf0efa: 0xf0efa,
-        0xf0efb: 0xf0efb,
-        0xf0efc: 0xf0efc,
-        0xf0efd: 0xf0efd,
-        0xf0efe: 0xf0efe,
-        0xf0eff: 0xf0eff,
-        0xf0f00: 0xf0f00,
-        0xf0f01: 0xf0f01,
-        0xf0f02: 0xf0f02,
-        0xf0f03: 0xf0f03,
-        0xf0f04: 0xf0f04,
-        0xf0f05: 0xf0f05,
-        0xf0f06: 0xf0f06,
-        0xf0f07: 0xf0f07,
-        0xf0f08: 0xf0f08,
-        0xf0f09: 0xf0f09,
-        0xf0f0a: 0xf0f0a,
-        0xf0f0b: 0xf0f0b,
-        0xf0f0c: 0xf0f0c,
-        0xf0f0d: 0xf0f0d,
-        0xf0f0e: 0xf0f0e,
-        0xf0f0f: 0xf0f0f,
-        0xf0f10: 0xf0f10,
-        0xf0f11: 0xf0f11,
-        0xf0f12: 0xf0f12,
-        0xf0f13: 0xf0f13,
-        0xf0f14: 0xf0f14,
-        0xf0f15: 0xf0f15,
-        0xf0f16: 0xf0f16,
-        0xf0f17: 0xf0f17,
-        0xf0f18: 0xf0f18,
-        0xf0f19: 0xf0f19,
-        0xf0f1a: 0xf0f1a,
-        0xf0f1b: 0xf0f1b,
-        0xf0f1c: 0xf0f1c,
-        0xf0f1d: 0xf0f1d,
-        0xf0f1e: 0xf0f1e,
-        0xf0f1f: 0xf0f1f,
-        0xf0f20: 0xf0f20,
-        0xf0f21: 0xf0f21,
-        0xf0f22: 0xf0f22,
-        0xf0f23: 0xf0f23,
-        0xf0f24: 0xf0f24,
-        0xf0f25: 0xf0f25,
-        0xf0f26: 0xf0f26,
-        0xf0f27: 0xf0f27,
-        0xf0f28: 0xf0f28,
-        0xf0f29: 0xf0f29,
-        0xf0f2a: 0xf0f2a,
-        0xf0f2b: 0xf0f2b,
-        0xf0f2c: 0xf0f2c,
-        0xf0f2d: 0xf0f2d,
-        0xf0f2e: 0xf0f2e,
-        0xf0f2f: 0xf0f2f,
-        0xf0f30: 0xf0f30,
-        0xf0f31: 0xf0f31,
-        0xf0f32: 0xf0f32,
-        0xf0f33: 0xf0f33,
-        0xf0f34: 0xf0f34,
-        0xf0f35: 0xf0f35,
-        0xf0f36: 0xf0f36,
-        0xf0f37: 0xf0f37,
-        0xf0f38: 0xf0f38,
-        0xf0f39: 0xf0f39,
-        0xf0f3a: 0xf0f3a,
-        0xf0f3b: 0xf0f3b,
-        0xf0f3c: 0xf0f3c,
-        0xf0f3d: 0xf0f3d,
-        0xf0f3e: 0xf0f3e,
-        0xf0f3f: 0xf0f3f,
-        0xf0f40: 0xf0f40,
-        0xf0f41: 0xf0f41,
-        0xf0f42: 0xf0f42,
-        0xf0f43: 0xf0f43,
-        0xf0f44: 0xf0f44,
-        0xf0f45: 0xf0f45,
-        0xf0f46: 0xf0f46,
-        0xf0f47: 0xf0f47,
-        0xf0f48: 0xf0f48,
-        0xf0f49: 0xf0f49,
-        0xf0f4a: 0xf0f4a,
-        0xf0f4b: 0xf0f4b,
-        0xf0f4c: 0xf0f4c,
-        0xf0f4d: 0xf0f4d,
-        0xf0f4e: 0xf0f4e,
-        0xf0f4f: 0xf0f4f,
-        0xf0f50: 0xf0f50,
-        0xf0f51: 0xf0f51,
-        0xf0f52: 0xf0f52,
-        0xf0f53: 0xf0f53,
-        0xf0f54: 0xf0f54,
-        0xf0f55: 0xf0f55,
-        0xf0f56: 0xf0f56,
-        0xf0f57: 0xf0f57,
-        0xf0f58: 0xf0f58,
-        0xf0f59: 0xf0f59,
-        0xf0f5a: 0xf0f5a,
-        0xf0f5b: 0xf0f5b,
-        0xf0f5c: 0xf0f5c,
-        0xf0f5d: 0xf0f5d,
-        0xf0f5e: 0xf0f5e,
-        0xf0f5f: 0xf0f5f,
-        0xf0f60: 0xf0f60,
-        0xf0f61: 0xf0f61,
-        0xf0f62: 0xf0f62,
-        0xf0f63: 0xf0f63,
-        0xf0f64: 0xf0f64,
-        0xf0f65: 0xf0f65,
-        0xf0f66: 0xf0f66,
-        0xf0f67: 0xf0f67,
-        0xf0f68: 0xf0f68,
-        0xf0f69: 0xf0f69,
-        0xf0f6a: 0xf0f6a,
-        0xf0f6b: 0xf0f6b,
-        0xf0f6c: 0xf0f6c,
-        0xf0f6d: 0xf0f6d,
-        0xf0f6e: 0xf0f6e,
-        0xf0f6f: 0xf0f6f,
-        0xf0f70: 0xf0f70,
-        0xf0f71: 0xf0f71,
-        0xf0f72: 0xf0f72,
-        0xf0f73: 0xf0f73,
-        0xf0f74: 0xf0f74,
-        0xf0f75: 0xf0f75,
-        0xf0f76: 0xf0f76,
-        0xf0f77: 0xf0f77,
-        0xf0f78: 0xf0f78,
-        0xf0f79: 0xf0f79,
-        0xf0f7a: 0xf0f7a,
-        0xf0f7b: 0xf0f7b,
-        0xf0f7c: 0xf0f7c,
-        0xf0f7d: 0xf0f7d,
-        0xf0f7e: 0xf0f7e,
-        0xf0f7f: 0xf0f7f,
-        0xf0f80: 0xf0f80,
-        0xf0f81: 0xf0f81,
-        0xf0f82: 0xf0f82,
-        0xf0f83: 0xf0f83,
-        0xf0f84: 0xf0f84,
-        0xf0f85: 0xf0f85,
-        0xf0f86: 0xf0f86,
-        0xf0f87: 0xf0f87,
-        0xf0f88: 0xf0f88,
-        0xf0f89: 0xf0f89,
-        0xf0f8a: 0xf0f8a,
-        0xf0f8b: 0xf0f8b,
-        0xf0f8c: 0xf0f8c,
-        0xf0f8d: 0xf0f8d,
-        0xf0f8e: 0xf0f8e,
-        0xf0f8f: 0xf0f8f,
-        0xf0f90: 0xf0f90,
-        0xf0f91: 0xf0f91,
-        0xf0f92: 0xf0f92,
-        0xf0f93: 0xf0f93,
-        0xf0f94: 0xf0f94,
-        0xf0f95: 0xf0f95,
-        0xf0f96: 0xf0f96,
-        0xf0f97: 0xf0f97,
-        0xf0f98: 0xf0f98,
-        0xf0f99: 0xf0f99,
-        0xf0f9a: 0xf0f9a,
-        0xf0f9b: 0xf0f9b,
-        0xf0f9c: 0xf0f9c,
-        0xf0f9d: 0xf0f9d,
-        0xf0f9e: 0xf0f9e,
-        0xf0f9f: 0xf0f9f,
-        0xf0fa0: 0xf0fa0,
-        0xf0fa1: 0xf0fa1,
-        0xf0fa2: 0xf0fa2,
-        0xf0fa3: 0xf0fa3,
-        0xf0fa4: 0xf0fa4,
-        0xf0fa5: 0xf0fa5,
-        0xf0fa6: 0xf0fa6,
-        0xf0fa7: 0xf0fa7,
-        0xf0fa8: 0xf0fa8,
-        0xf0fa9: 0xf0fa9,
-        0xf0faa: 0xf0faa,
-        0xf0fab: 0xf0fab,
-        0xf0fac: 0xf0fac,
-        0xf0fad: 0xf0fad,
-        0xf0fae: 0xf0fae,
-        0xf0faf: 0xf0faf,
-        0xf0fb0: 0xf0fb0,
-        0xf0fb1: 0xf0fb1,
-        0xf0fb2: 0xf0fb2,
-        0xf0fb3: 0xf0fb3,
-        0xf0fb4: 0xf0fb4,
-        0xf0fb5: 0xf0fb5,
-        0xf0fb6: 0xf0fb6,
-        0xf0fb7: 0xf0fb7,
-        0xf0fb8: 0xf0fb8,
-        0xf0fb9: 0xf0fb9,
-        0xf0fba: 0xf0fba,
-        0xf0fbb: 0xf0fbb,
-        0xf0fbc: 0xf0fbc,
-        0xf0fbd: 0xf0fbd,
-        0xf0fbe: 0xf0fbe,
-        0xf0fbf: 0xf0fbf,
-        0xf0fc0: 0xf0fc0,
-        0xf0fc1: 0xf0fc1,
-        0xf0fc2: 0xf0fc2,
-        0xf0fc3: 0xf0fc3,
-        0xf0fc4: 0xf0fc4,
-        0xf0fc5: 0xf0fc5,
-        0xf0fc6: 0xf0fc6,
-        0xf0fc7: 0xf0fc7,
-        0xf0fc8: 0xf0fc8,
-        0xf0fc9: 0xf0fc9,
-        0xf0fca: 0xf0fca,
-        0xf0fcb: 0xf0fcb,
-        0xf0fcc: 0xf0fcc,
-        0xf0fcd: 0xf0fcd,
-        0xf0fce: 0xf0fce,
-        0xf0fcf: 0xf0fcf,
-        0xf0fd0: 0xf0fd0,
-        0xf0fd1: 0xf0fd1,
-        0xf0fd2: 0xf0fd2,
-        0xf0fd3: 0xf0fd3,
-        0xf0fd4: 0xf0fd4,
-        0xf0fd5: 0xf0fd5,
-        0xf0fd6: 0xf0fd6,
-        0xf0fd7: 0xf0fd7,
-        0xf0fd8: 0xf0fd8,
-        0xf0fd9: 0xf0fd9,
-        0xf0fda: 0xf0fda,
-        0xf0fdb: 0xf0fdb,
-        0xf0fdc: 0xf0fdc,
-        0xf0fdd: 0xf0fdd,
-        0xf0fde: 0xf0fde,
-        0xf0fdf: 0xf0fdf,
-        0xf0fe0: 0xf0fe0,
-        0xf0fe1: 0xf0fe1,
-        0xf0fe2: 0xf0fe2,
-        0xf0fe3: 0xf0fe3,
-        0xf0fe4: 0xf0fe4,
-        0xf0fe5: 0xf0fe5,
-        0xf0fe6: 0xf0fe6,
-        0xf0fe7: 0xf0fe7,
-        0xf0fe8: 0xf0fe8,
-        0xf0fe9: 0xf0fe9,
-        0xf0fea: 0xf0fea,
-        0xf0feb: 0xf0feb,
-        0xf0fec: 0xf0fec,
-        0xf0fed: 0xf0fed,
-        0xf0fee: 0xf0fee,
-        0xf0fef: 0xf0fef,
-        0xf0ff0: 0xf0ff0,
-        0xf0ff1: 0xf0ff1,
-        0xf0ff2: 0xf0ff2,
-        0xf0ff3: 0xf0ff3,
-        0xf0ff4: 0xf0ff4,
-        0xf0ff5: 0xf0ff5,
-        0xf0ff6: 0xf0ff6,
-        0xf0ff7: 0xf0ff7,
-        0xf0ff8: 0xf0ff8,
-        0xf0ff9: 0xf0ff9,
-        0xf0ffa: 0xf0ffa,
-        0xf0ffb: 0xf0ffb,
-        0xf0ffc: 0xf0ffc,
-        0xf0ffd: 0xf0ffd,
-        0xf0ffe: 0xf0ffe,
-        0xf0fff: 0xf0fff,
-        0xf1000: 0xf1000,
-        0xf1001: 0xf1001,
-        0xf1002: 0xf1002,
-        0xf1003: 0xf1003,
-        0xf1004: 0xf1004,
-        0xf1005: 0xf1005,
-        0xf1006: 0xf1006,
-        0xf1007: 0xf1007,
-        0xf1008: 0xf1008,
-        0xf1009: 0xf1009,
-        0xf100a: 0xf100a,
-        0xf100b: 0xf100b,
-        0xf100c: 0xf100c,
-        0xf100d: 0xf100d,
-        0xf100e: 0xf100e,
-        0xf100f: 0xf100f,
-        0xf1010: 0xf1010,
-        0xf1011: 0xf1011,
-        0xf1012: 0xf1012,
-        0xf1013: 0xf1013,
-        0xf1014: 0xf1014,
-        0xf1015: 0xf1015,
-        0xf1016: 0xf1016,
-        0xf1017: 0xf1017,
-        0xf1018: 0xf1018,
-        0xf1019: 0xf1019,
-        0xf101a: 0xf101a,
-        0xf101b: 0xf101b,
-        0xf101c: 0xf101c,
-        0xf101d: 0xf101d,
-        0xf101e: 0xf101e,
-        0xf101f: 0xf101f,
-        0xf1020: 0xf1020,
-        0xf1021: 0xf1021,
-        0xf1022: 0xf1022,
-        0xf1023: 0xf1023,
-        0xf1024: 0xf1024,
-        0xf1025: 0xf1025,
-        0xf1026: 0xf1026,
-        0xf1027: 0xf1027,
-        0xf1028: 0xf1028,
-        0xf1029: 0xf1029,
-        0xf102a: 0xf102a,
-        0xf102b: 0xf102b,
-        0xf102c: 0xf102c,
-        0xf102d: 0xf102d,
-        0xf102e: 0xf102e,
-        0xf102f: 0xf102f,
-        0xf1030: 0xf1030,
-        0xf1031: 0xf1031,
-        0xf1032: 0xf1032,
-        0xf1033: 0xf1033,
-        0xf1034: 0xf1034,
-        0xf1035: 0xf1035,
-        0xf1036: 0xf1036,
-        0xf1037: 0xf1037,
-        0xf1038: 0xf1038,
-        0xf1039: 0xf1039,
-        0xf103a: 0xf103a,
-        0xf103b: 0xf103b,
-        0xf103c: 0xf103c,
-        0xf103d: 0xf103d,
-        0xf103e: 0xf103e,
-        0xf103f: 0xf103f,
-        0xf1040: 0xf1040,
-        0xf1041: 0xf1041,
-        0xf1042: 0xf1042,
-        0xf1043: 0xf1043,
-        0xf1044: 0xf1044,
-        0xf1045: 0xf1045,
-        0xf1046: 0xf1046,
-        0xf1047: 0xf1047,
-        0xf1048: 0xf1048,
-        0xf1049: 0xf1049,
-        0xf104a: 0xf104a,
-        0xf104b: 0xf104b,
-        0xf104c: 0xf104c,
-        0xf104d: 0xf104d,
-        0xf104e: 0xf104e,
-        0xf104f: 0xf104f,
-        0xf1050: 0xf1050,
-        0xf1051: 0xf1051,
-        0xf1052: 0xf1052,
-        0xf1053: 0xf1053,
-        0xf1054: 0xf1054,
-        0xf1055: 0xf1055,
-        0xf1056: 0xf1056,
-        0xf1057: 0xf1057,
-        0xf1058: 0xf1058,
-        0xf1059: 0xf1059,
-        0xf105a: 0xf105a,
-        0xf105b: 0xf105b,
-        0xf105c: 0xf105c,
-        0xf105d: 0xf105d,
-        0xf105e: 0xf105e,
-        0xf105f: 0xf105f,
-        0xf1060: 0xf1060,
-        0xf1061: 0xf1061,
-        0xf1062: 0xf1062,
-        0xf1063: 0xf1063,
-        0xf1064: 0xf1064,
-        0xf1065: 0xf1065,
-        0xf1066: 0xf1066,
-        0xf1067: 0xf1067,
-        0xf1068: 0xf1068,
-        0xf1069: 0xf1069,
-        0xf106a: 0xf106a,
-        0xf106b: 0xf106b,
-        0xf106c: 0xf106c,
-        0xf106d: 0xf106d,
-        0xf106e: 0xf106e,
-        0xf106f: 0xf106f,
-        0xf1070: 0xf1070,
-        0xf1071: 0xf1071,
-        0xf1072: 0xf1072,
-        0xf1073: 0xf1073,
-        0xf1074: 0xf1074,
-        0xf1075: 0xf1075,
-        0xf1076: 0xf1076,
-        0xf1077: 0xf1077,
-        0xf1078: 0xf1078,
-        0xf1079: 0xf1079,
-        0xf107a: 0xf107a,
-        0xf107b: 0xf107b,
-        0xf107c: 0xf107c,
-        0xf107d: 0xf107d,
-        0xf107e: 0xf107e,
-        0xf107f: 0xf107f,
-        0xf1080: 0xf1080,
-        0xf1081: 0xf1081,
-        0xf1082: 0xf1082,
-        0xf1083: 0xf1083,
-        0xf1084: 0xf1084,
-        0xf1085: 0xf1085,
-        0xf1086: 0xf1086,
-        0xf1087: 0xf1087,
-        0xf1088: 0xf1088,
-        0xf1089: 0xf1089,
-        0xf108a: 0xf108a,
-        0xf108b: 0xf108b,
-        0xf108c: 0xf108c,
-        0xf108d: 0xf108d,
-        0xf108e: 0xf108e,
-        0xf108f: 0xf108f,
-        0xf1090: 0xf1090,
-        0xf1091: 0xf1091,
-        0xf1092: 0xf1092,
-        0xf1093: 0xf1093,
-        0xf1094: 0xf1094,
-        0xf1095: 0xf1095,
-        0xf1096: 0xf1096,
-        0xf1097: 0xf1097,
-        0xf1098: 0xf1098,
-        0xf1099: 0xf1099,
-        0xf109a: 0xf109a,
-        0xf109b: 0xf109b,
-        0xf109c: 0xf109c,
-        0xf109d: 0xf109d,
-        0xf109e: 0xf109e,
-        0xf109f: 0xf109f,
-        0xf10a0: 0xf10a0,
-        0xf10a1: 0xf10a1,
-        0xf10a2: 0xf10a2,
-        0xf10a3: 0xf10a3,
-        0xf10a4: 0xf10a4,
-        0xf10a5: 0xf10a5,
-        0xf10a6: 0xf10a6,
-        0xf10a7: 0xf10a7,
-        0xf10a8: 0xf10a8,
-        0xf10a9: 0xf10a9,
-        0xf10aa: 0xf10aa,
-        0xf10ab: 0xf10ab,
-        0xf10ac: 0xf10ac,
-        0xf10ad: 0xf10ad,
-        0xf10ae: 0xf10ae,
-        0xf10af: 0xf10af,
-        0xf10b0: 0xf10b0,
-        0xf10b1: 0xf10b1,
-        0xf10b2: 0xf10b2,
-        0xf10b3: 0xf10b3,
-        0xf10b4: 0xf10b4,
-        0xf10b5: 0xf10b5,
-        0xf10b6: 0xf10b6,
-        0xf10b7: 0xf10b7,
-        0xf10b8: 0xf10b8,
-        0xf10b9: 0xf10b9,
-        0xf10ba: 0xf10ba,
-        0xf10bb: 0xf10bb,
-        0xf10bc: 0xf10bc,
-        0xf10bd: 0xf10bd,
-        0xf10be: 0xf10be,
-        0xf10bf: 0xf10bf,
-        0xf10c0: 0xf10c0,
-        0xf10c1: 0xf10c1,
-        0xf10c2: 0xf10c2,
-        0xf10c3: 0xf10c3,
-        0xf10c4: 0xf10c4,
-        0xf10c5: 0xf10c5,
-        0xf10c6: 0xf10c6,
-        0xf10c7: 0xf10c7,
-        0xf10c8: 0xf10c8,
-        0xf10c9: 0xf10c9,
-        0xf10ca: 0xf10ca,
-        0xf10cb: 0xf10cb,
-        0xf10cc: 0xf10cc,
-        0xf10cd: 0xf10cd,
-        0xf10ce: 0xf10ce,
-        0xf10cf: 0xf10cf,
-        0xf10d0: 0xf10d0,
-        0xf10d1: 0xf10d1,
-        0xf10d2: 0xf10d2,
-        0xf10d3: 0xf10d3,
-        0xf10d4: 0xf10d4,
-        0xf10d5: 0xf10d5,
-        0xf10d6: 0xf10d6,
-        0xf10d7: 0xf10d7,
-        0xf10d8: 0xf10d8,
-        0xf10d9: 0xf10d9,
-        0xf10da: 0xf10da,
-        0xf10db: 0xf10db,
-        0xf10dc: 0xf10dc,
-        0xf10dd: 0xf10dd,
-        0xf10de: 0xf10de,
-        0xf10df: 0xf10df,
-        0xf10e0: 0xf10e0,
-        0xf10e1: 0xf10e1,
-        0xf10e2: 0xf10e2,
-        0xf10e3: 0xf10e3,
-        0xf10e4: 0xf10e4,
-        0xf10e5: 0xf10e5,
-        0xf10e6: 0xf10e6,
-        0xf10e7: 0xf10e7,
-        0xf10e8: 0xf10e8,
-        0xf10e9: 0xf10e9,
-        0xf10ea: 0xf10ea,
-        0xf10eb: 0xf10eb,
-        0xf10ec: 0xf10ec,
-        0xf10ed: 0xf10ed,
-        0xf10ee: 0xf10ee,
-        0xf10ef: 0xf10ef,
-        0xf10f0: 0xf10f0,
-        0xf10f1: 0xf10f1,
-        0xf10f2: 0xf10f2,
-        0xf10f3: 0xf10f3,
-        0xf10f4: 0xf10f4,
-        0xf10f5: 0xf10f5,
-        0xf10f6: 0xf10f6,
-        0xf10f7: 0xf10f7,
-        0xf10f8: 0xf10f8,
-        0xf10f9: 0xf10f9,
-        0xf10fa: 0xf10fa,
-        0xf10fb: 0xf10fb,
-        0xf10fc: 0xf10fc,
-        0xf10fd: 0xf10fd,
-        0xf10fe: 0xf10fe,
-        0xf10ff: 0xf10ff,
-        0xf1100: 0xf1100,
-        0xf1101: 0xf1101,
-        0xf1102: 0xf1102,
-        0xf1103: 0xf1103,
-        0xf1104: 0xf1104,
-        0xf1105: 0xf1105,
-        0xf1106: 0xf1106,
-        0xf1107: 0xf1107,
-        0xf1108: 0xf1108,
-        0xf1109: 0xf1109,
-        0xf110a: 0xf110a,
-        0xf110b: 0xf110b,
-        0xf110c: 0xf110c,
-        0xf110d: 0xf110d,
-        0xf110e: 0xf110e,
-        0xf110f: 0xf110f,
-        0xf1110: 0xf1110,
-        0xf1111: 0xf1111,
-        0xf1112: 0xf1112,
-        0xf1113: 0xf1113,
-        0xf1114: 0xf1114,
-        0xf1115: 0xf1115,
-        0xf1116: 0xf1116,
-        0xf1117: 0xf1117,
-        0xf1118: 0xf1118,
-        0xf1119: 0xf1119,
-        0xf111a: 0xf111a,
-        0xf111b: 0xf111b,
-        0xf111c: 0xf111c,
-        0xf111d: 0xf111d,
-        0xf111e: 0xf111e,
-        0xf111f: 0xf111f,
-        0xf1120: 0xf1120,
-        0xf1121: 0xf1121,
-        0xf1122: 0xf1122,
-        0xf1123: 0xf1123,
-        0xf1124: 0xf1124,
-        0xf1125: 0xf1125,
-        0xf1126: 0xf1126,
-        0xf1127: 0xf1127,
-        0xf1128: 0xf1128,
-        0xf1129: 0xf1129,
-        0xf112a: 0xf112a,
-        0xf112b: 0xf112b,
-        0xf112c: 0xf112c,
-        0xf112d: 0xf112d,
-        0xf112e: 0xf112e,
-        0xf112f: 0xf112f,
-        0xf1130: 0xf1130,
-        0xf1131: 0xf1131,
-        0xf1132: 0xf1132,
-        0xf1133: 0xf1133,
-        0xf1134: 0xf1134,
-        0xf1135: 0xf1135,
-        0xf1136: 0xf1136,
-        0xf1137: 0xf1137,
-        0xf1138: 0xf1138,
-        0xf1139: 0xf1139,
-        0xf113a: 0xf113a,
-        0xf113b: 0xf113b,
-        0xf113c: 0xf113c,
-        0xf113d: 0xf113d,
-        0xf113e: 0xf113e,
-        0xf113f: 0xf113f,
-        0xf1140: 0xf1140,
-        0xf1141: 0xf1141,
-        0xf1142: 0xf1142,
-        0xf1143: 0xf1143,
-        0xf1144: 0xf1144,
-        0xf1145: 0xf1145,
-        0xf1146: 0xf1146,
-        0xf1147: 0xf1147,
-        0xf1148: 0xf1148,
-        0xf1149: 0xf1149,
-        0xf114a: 0xf114a,
-        0xf114b: 0xf114b,
-        0xf114c: 0xf114c,
-        0xf114d: 0xf114d,
-        0xf114e: 0xf114e,
-        0xf114f: 0xf114f,
-        0xf1150: 0xf1150,
-        0xf1151: 0xf1151,
-        0xf1152: 0xf1152,
-        0xf1153: 0xf1153,
-        0xf1154: 0xf1154,
-        0xf1155: 0xf1155,
-        0xf1156: 0xf1156,
-        0xf1157: 0xf1157,
-        0xf1158: 0xf1158,
-        0xf1159: 0xf1159,
-        0xf115a: 0xf115a,
-        0xf115b: 0xf115b,
-        0xf115c: 0xf115c,
-        0xf115d: 0xf115d,
-        0xf115e: 0xf115e,
-        0xf115f: 0xf115f,
-        0xf1160: 0xf1160,
-        0xf1161: 0xf1161,
-        0xf1162: 0xf1162,
-        0xf1163: 0xf1163,
-        0xf1164: 0xf1164,
-        0xf1165: 0xf1165,
-        0xf1166: 0xf1166,
-        0xf1167: 0xf1167,
-        0xf1168: 0xf1168,
-        0xf1169: 0xf1169,
-        0xf116a: 0xf116a,
-        0xf116b: 0xf116b,
-        0xf116c: 0xf116c,
-        0xf116d: 0xf116d,
-        0xf116e: 0xf116e,
-        0xf116f: 0xf116f,
-        0xf1170: 0xf1170,
-        0xf1171: 0xf1171,
-        0xf1172: 0xf1172,
-        0xf1173: 0xf1173,
-        0xf1174: 0xf1174,
-        0xf1175: 0xf1175,
-        0xf1176: 0xf1176,
-        0xf1177: 0xf1177,
-        0xf1178: 0xf1178,
-        0xf1179: 0xf1179,
-        0xf117a: 0xf117a,
-        0xf117b: 0xf117b,
-        0xf117c: 0xf117c,
-        0xf117d: 0xf117d,
-        0xf117e: 0xf117e,
-        0xf117f: 0xf117f,
-        0xf1180: 0xf1180,
-        0xf1181: 0xf1181,
-        0xf1182: 0xf1182,
-        0xf1183: 0xf1183,
-        0xf1184: 0xf1184,
-        0xf1185: 0xf1185,
-        0xf1186: 0xf1186,
-        0xf1187: 0xf1187,
-        0xf1188: 0xf1188,
-        0xf1189: 0xf1189,
-        0xf118a: 0xf118a,
-        0xf118b: 0xf118b,
-        0xf118c: 0xf118c,
-        0xf118d: 0xf118d,
-        0xf118e: 0xf118e,
-        0xf118f: 0xf118f,
-        0xf1190: 0xf1190,
-        0xf1191: 0xf1191,
-        0xf1192: 0xf1192,
-        0xf1193: 0xf1193,
-        0xf1194: 0xf1194,
-        0xf1195: 0xf1195,
-        0xf1196: 0xf1196,
-        0xf1197: 0xf1197,
-        0xf1198: 0xf1198,
-        0xf1199: 0xf1199,
-        0xf119a: 0xf119a,
-        0xf119b: 0xf119b,
-        0xf119c: 0xf119c,
-        0xf119d: 0xf119d,
-        0xf119e: 0xf119e,
-        0xf119f: 0xf119f,
-        0xf11a0: 0xf11a0,
-        0xf11a1: 0xf11a1,
-        0xf11a2: 0xf11a2,
-        0xf11a3: 0xf11a3,
-        0xf11a4: 0xf11a4,
-        0xf11a5: 0xf11a5,
-        0xf11a6: 0xf11a6,
-        0xf11a7: 0xf11a7,
-        0xf11a8: 0xf11a8,
-        0xf11a9: 0xf11a9,
-        0xf11aa: 0xf11aa,
-        0xf11ab: 0xf11ab,
-        0xf11ac: 0xf11ac,
-        0xf11ad: 0xf11ad,
-        0xf11ae: 0xf11ae,
-        0xf11af: 0xf11af,
-        0xf11b0: 0xf11b0,
-        0xf11b1: 0xf11b1,
-        0xf11b2: 0xf11b2,
-        0xf11b3: 0xf11b3,
-        0xf11b4: 0xf11b4,
-        0xf11b5: 0xf11b5,
-        0xf11b6: 0xf11b6,
-        0xf11b7: 0xf11b7,
-        0xf11b8: 0xf11b8,
-        0xf11b9: 0xf11b9,
-        0xf11ba: 0xf11ba,
-        0xf11bb: 0xf11bb,
-        0xf11bc: 0xf11bc,
-        0xf11bd: 0xf11bd,
-        0xf11be: 0xf11be,
-        0xf11bf: 0xf11bf,
-        0xf11c0: 0xf11c0,
-        0xf11c1: 0xf11c1,
-        0xf11c2: 0xf11c2,
-        0xf11c3: 0xf11c3,
-        0xf11c4: 0xf11c4,
-        0xf11c5: 0xf11c5,
-        0xf11c6: 0xf11c6,
-        0xf11c7: 0xf11c7,
-        0xf11c8: 0xf11c8,
-        0xf11c9: 0xf11c9,
-        0xf11ca: 0xf11ca,
-        0xf11cb: 0xf11cb,
-        0xf11cc: 0xf11cc,
-        0xf11cd: 0xf11cd,
-        0xf11ce: 0xf11ce,
-        0xf11cf: 0xf11cf,
-        0xf11d0: 0xf11d0,
-        0xf11d1: 0xf11d1,
-        0xf11d2: 0xf11d2,
-        0xf11d3: 0xf11d3,
-        0xf11d4: 0xf11d4,
-        0xf11d5: 0xf11d5,
-        0xf11d6: 0xf11d6,
-        0xf11d7: 0xf11d7,
-        0xf11d8: 0xf11d8,
-        0xf11d9: 0xf11d9,
-        0xf11da: 0xf11da,
-        0xf11db: 0xf11db,
-        0xf11dc: 0xf11dc,
-        0xf11dd: 0xf11dd,
-        0xf11de: 0xf11de,
-        0xf11df: 0xf11df,
-        0xf11e0: 0xf11e0,
-        0xf11e1: 0xf11e1,
-        0xf11e2: 0xf11e2,
-        0xf11e3: 0xf11e3,
-        0xf11e4: 0xf11e4,
-        0xf11e5: 0xf11e5,
-        0xf11e6: 0xf11e6,
-        0xf11e7: 0xf11e7,
-        0xf11e8: 0xf11e8,
-        0xf11e9: 0xf11e9,
-        0xf11ea: 0xf11ea,
-        0xf11eb: 0xf11eb,
-        0xf11ec: 0xf11ec,
-        0xf11ed: 0xf11ed,
-        0xf11ee: 0xf11ee,
-        0xf11ef: 0xf11ef,
-        0xf11f0: 0xf11f0,
-        0xf11f1: 0xf11f1,
-        0xf11f2: 0xf11f2,
-        0xf11f3: 0xf11f3,
-        0xf11f4: 0xf11f4,
-        0xf11f5: 0xf11f5,
-        0xf11f6: 0xf11f6,
-        0xf11f7: 0xf11f7,
-        0xf11f8: 0xf11f8,
-        0xf11f9: 0xf11f9,
-        0xf11fa: 0xf11fa,
-        0xf11fb: 0xf11fb,
-        0xf11fc: 0xf11fc,
-        0xf11fd: 0xf11fd,
-        0xf11fe: 0xf11fe,
-        0xf11ff: 0xf11ff,
-        0xf1200: 0xf1200,
-        0xf1201: 0xf1201,
-        0xf1202: 0xf1202,
-        0xf1203: 0xf1203,
-        0xf1204: 0xf1204,
-        0xf1205: 0xf1205,
-        0xf1206: 0xf1206,
-        0xf1207: 0xf1207,
-        0xf1208: 0xf1208,
-        0xf1209: 0xf1209,
-        0xf120a: 0xf120a,
-        0xf120b: 0xf120b,
-        0xf120c: 0xf120c,
-        0xf120d: 0xf120d,
-        0xf120e: 0xf120e,
-        0xf120f: 0xf120f,
-        0xf1210: 0xf1210,
-        0xf1211: 0xf1211,
-        0xf1212: 0xf1212,
-        0xf1213: 0xf1213,
-        0xf1214: 0xf1214,
-        0xf1215: 0xf1215,
-        0xf1216: 0xf1216,
-        0xf1217: 0xf1217,
-        0xf1218: 0xf1218,
-        0xf1219: 0xf1219,
-        0xf121a: 0xf121a,
-        0xf121b: 0xf121b,
-        0xf121c: 0xf121c,
-        0xf121d: 0xf121d,
-        0xf121e: 0xf121e,
-        0xf121f: 0xf121f,
-        0xf1220: 0xf1220,
-        0xf1221: 0xf1221,
-        0xf1222: 0xf1222,
-        0xf1223: 0xf1223,
-        0xf1224: 0xf1224,
-        0xf1225: 0xf1225,
-        0xf1226: 0xf1226,
-        0xf1227: 0xf1227,
-        0xf1228: 0xf1228,
-        0xf1229: 0xf1229,
-        0xf122a: 0xf122a,
-        0xf122b: 0xf122b,
-        0xf122c: 0xf122c,
-        0xf122d: 0xf122d,
-        0xf122e: 0xf122e,
-        0xf122f: 0xf122f,
-        0xf1230: 0xf1230,
-        0xf1231: 0xf1231,
-        0xf1232: 0xf1232,
-        0xf1233: 0xf1233,
-        0xf1234: 0xf1234,
-        0xf1235: 0xf1235,
-        0xf1236: 0xf1236,
-        0xf1237: 0xf1237,
-        0xf1238: 0xf1238,
-        0xf1239: 0xf1239,
-        0xf123a: 0xf123a,
-        0xf123b: 0xf123b,
-        0xf123c: 0xf123c,
-        0xf123d: 0xf123d,
-        0xf123e: 0xf123e,
-        0xf123f: 0xf123f,
-        0xf1240: 0xf1240,
-        0xf1241: 0xf1241,
-        0xf1242: 0xf1242,
-        0xf1243: 0xf1243,
-        0xf1244: 0xf1244,
-        0xf1245: 0xf1245,
-        0xf1246: 0xf1246,
-        0xf1247: 0xf1247,
-        0xf1248: 0xf1248,
-        0xf1249: 0xf1249,
-        0xf124a: 0xf124a,
-        0xf124b: 0xf124b,
-        0xf124c: 0xf124c,
-        0xf124d: 0xf124d,
-        0xf124e: 0xf124e,
-        0xf124f: 0xf124f,
-        0xf1250: 0xf1250,
-        0xf1251: 0xf1251,
-        0xf1252: 0xf1252,
-        0xf1253: 0xf1253,
-        0xf1254: 0xf1254,
-        0xf1255: 0xf1255,
-        0xf1256: 0xf1256,
-        0xf1257: 0xf1257,
-        0xf1258: 0xf1258,
-        0xf1259: 0xf1259,
-        0xf125a: 0xf125a,
-        0xf125b: 0xf125b,
-        0xf125c: 0xf125c,
-        0xf125d: 0xf125d,
-        0xf125e: 0xf125e,
-        0xf125f: 0xf125f,
-        0xf1260: 0xf1260,
-        0xf1261: 0xf1261,
-        0xf1262: 0xf1262,
-        0xf1263: 0xf1263,
-        0xf1264: 0xf1264,
-        0xf1265: 0xf1265,
-        0xf1266: 0xf1266,
-        0xf1267: 0xf1267,
-        0xf1268: 0xf1268,
-        0xf1269: 0xf1269,
-        0xf126a: 0xf126a,
-        0xf126b: 0xf126b,
-        0xf126c: 0xf126c,
-        0xf126d: 0xf126d,
-        0xf126e: 0xf126e,
-        0xf126f: 0xf126f,
-        0xf1270: 0xf1270,
-        0xf1271: 0xf1271,
-        0xf1272: 0xf1272,
-        0xf1273: 0xf1273,
-        0xf1274: 0xf1274,
-        0xf1275: 0xf1275,
-        0xf1276: 0xf1276,
-        0xf1277: 0xf1277,
-        0xf1278: 0xf1278,
-        0xf1279: 0xf1279,
-        0xf127a: 0xf127a,
-        0xf127b: 0xf127b,
-        0xf127c: 0xf127c,
-        0xf127d: 0xf127d,
-        0xf127e: 0xf127e,
-        0xf127f: 0xf127f,
-        0xf1280: 0xf1280,
-        0xf1281: 0xf1281,
-        0xf1282: 0xf1282,
-        0xf1283: 0xf1283,
-        0xf1284: 0xf1284,
-        0xf1285: 0xf1285,
-        0xf1286: 0xf1286,
-        0xf1287: 0xf1287,
-        0xf1288: 0xf1288,
-        0xf1289: 0xf1289,
-        0xf128a: 0xf128a,
-        0xf128b: 0xf128b,
-        0xf128c: 0xf128c,
-        0xf128d: 0xf128d,
-        0xf128e: 0xf128e,
-        0xf128f: 0xf128f,
-        0xf1290: 0xf1290,
-        0xf1291: 0xf1291,
-        0xf1292: 0xf1292,
-        0xf1293: 0xf1293,
-        0xf1294: 0xf1294,
-        0xf1295: 0xf1295,
-        0xf1296: 0xf1296,
-        0xf1297: 0xf1297,
-        0xf1298: 0xf1298,
-        0xf1299: 0xf1299,
-        0xf129a: 0xf129a,
-        0xf129b: 0xf129b,
-        0xf129c: 0xf129c,
-        0xf129d: 0xf129d,
-        0xf129e: 0xf129e,
-        0xf129f: 0xf129f,
-        0xf12a0: 0xf12a0,
-        0xf12a1: 0xf12a1,
-        0xf12a2: 0xf12a2,
-        0xf12a3: 0xf12a3,
-        0xf12a4: 0xf12a4,
-        0xf12a5: 0xf12a5,
-        0xf12a6: 0xf12a6,
-        0xf12a7: 0xf12a7,
-        0xf12a8: 0xf12a8,
-        0xf12a9: 0xf12a9,
-        0xf12aa: 0xf12aa,
-        0xf12ab: 0xf12ab,
-        0xf12ac: 0xf12ac,
-        0xf12ad: 0xf12ad,
-        0xf12ae: 0xf12ae,
-        0xf12af: 0xf12af,
-        0xf12b0: 0xf12b0,
-        0xf12b1: 0xf12b1,
-        0xf12b2: 0xf12b2,
-        0xf12b3: 0xf12b3,
-        0xf12b4: 0xf12b4,
-        0xf12b5: 0xf12b5,
-        0xf12b6: 0xf12b6,
-        0xf12b7: 0xf12b7,
-        0xf12b8: 0xf12b8,
-        0xf12b9: 0xf12b9,
-        0xf12ba: 0xf12ba,
-        0xf12bb: 0xf12bb,
-        0xf12bc: 0xf12bc,
-        0xf12bd: 0xf12bd,
-        0xf12be: 0xf12be,
-        0xf12bf: 0xf12bf,
-        0xf12c0: 0xf12c0,
-        0xf12c1: 0xf12c1,
-        0xf12c2: 0xf12c2,
-        0xf12c3: 0xf12c3,
-        0xf12c4: 0xf12c4,
-        0xf12c5: 0xf12c5,
-        0xf12c6: 0xf12c6,
-        0xf12c7: 0xf12c7,
-        0xf12c8: 0xf12c8,
-        0xf12c9: 0xf12c9,
-        0xf12ca: 0xf12ca,
-        0xf12cb: 0xf12cb,
-        0xf12cc: 0xf12cc,
-        0xf12cd: 0xf12cd,
-        0xf12ce: 0xf12ce,
-        0xf12cf: 0xf12cf,
-        0xf12d0: 0xf12d0,
-        0xf12d1: 0xf12d1,
-        0xf12d2: 0xf12d2,
-        0xf12d3: 0xf12d3,
-        0xf12d4: 0xf12d4,
-        0xf12d5: 0xf12d5,
-        0xf12d6: 0xf12d6,
-        0xf12d7: 0xf12d7,
-        0xf12d8: 0xf12d8,
-        0xf12d9: 0xf12d9,
-        0xf12da: 0xf12da,
-        0xf12db: 0xf12db,
-        0xf12dc: 0xf12dc,
-        0xf12dd: 0xf12dd,
-        0xf12de: 0xf12de,
-        0xf12df: 0xf12df,
-        0xf12e0: 0xf12e0,
-        0xf12e1: 0xf12e1,
-        0xf12e2: 0xf12e2,
-        0xf12e3: 0xf12e3,
-        0xf12e4: 0xf12e4,
-        0xf12e5: 0xf12e5,
-        0xf12e6: 0xf12e6,
-        0xf12e7: 0xf12e7,
-        0xf12e8: 0xf12e8,
-        0xf12e9: 0xf12e9,
-        0xf12ea: 0xf12ea,
-        0xf12eb: 0xf12eb,
-        0xf12ec: 0xf12ec,
-        0xf12ed: 0xf12ed,
-        0xf12ee: 0xf12ee,
-        0xf12ef: 0xf12ef,
-        0xf12f0: 0xf12f0,
-        0xf12f1: 0xf12f1,
-        0xf12f2: 0xf12f2,
-        0xf12f3: 0xf12f3,
-        0xf12f4: 0xf12f4,
-        0xf12f5: 0xf12f5,
-        0xf12f6: 0xf12f6,
-        0xf12f7: 0xf12f7,
-        0xf12f8: 0xf12f8,
-        0xf12f9: 0xf12f9,
-        0xf12fa: 0xf12fa,
-        0xf12fb: 0xf12fb,
-        0xf12fc: 0xf12fc,
-        0xf12fd: 0xf12fd,
-        0xf12fe: 0xf12fe,
-        0xf12ff: 0xf12ff,
-        0xf1300: 0xf1300,
-        0xf1301: 0xf1301,
-        0xf1302: 0xf1302,
-        0xf1303: 0xf1303,
-        0xf1304: 0xf1304,
-        0xf1305: 0xf1305,
-        0xf1306: 0xf1306,
-        0xf1307: 0xf1307,
-        0xf1308: 0xf1308,
-        0xf1309: 0xf1309,
-        0xf130a: 0xf130a,
-        0xf130b: 0xf130b,
-        0xf130c: 0xf130c,
-        0xf130d: 0xf130d,
-        0xf130e: 0xf130e,
-        0xf130f: 0xf130f,
-        0xf1310: 0xf1310,
-        0xf1311: 0xf1311,
-        0xf1312: 0xf1312,
-        0xf1313: 0xf1313,
-        0xf1314: 0xf1314,
-        0xf1315: 0xf1315,
-        0xf1316: 0xf1316,
-        0xf1317: 0xf1317,
-        0xf1318: 0xf1318,
-        0xf1319: 0xf1319,
-        0xf131a: 0xf131a,
-        0xf131b: 0xf131b,
-        0xf131c: 0xf131c,
-        0xf131d: 0xf131d,
-        0xf131e: 0xf131e,
-        0xf131f: 0xf131f,
-        0xf1320: 0xf1320,
-        0xf1321: 0xf1321,
-        0xf1322: 0xf1322,
-        0xf1323: 0xf1323,
-        0xf1324: 0xf1324,
-        0xf1325: 0xf1325,
-        0xf1326: 0xf1326,
-        0xf1327: 0xf1327,
-        0xf1328: 0xf1328,
-        0xf1329: 0xf1329,
-        0xf132a: 0xf132a,
-        0xf132b: 0xf132b,
-        0xf132c: 0xf132c,
-        0xf132d: 0xf132d,
-        0xf132e: 0xf132e,
-        0xf132f: 0xf132f,
-        0xf1330: 0xf1330,
-        0xf1331: 0xf1331,
-        0xf1332: 0xf1332,
-        0xf1333: 0xf1333,
-        0xf1334: 0xf1334,
-        0xf1335: 0xf1335,
-        0xf1336: 0xf1336,
-        0xf1337: 0xf1337,
-        0xf1338: 0xf1338,
-        0xf1339: 0xf1339,
-        0xf133a: 0xf133a,
-        0xf133b: 0xf133b,
-        0xf133c: 0xf133c,
-        0xf133d: 0xf133d,
-        0xf133e: 0xf133e,
-        0xf133f: 0xf133f,
-        0xf1340: 0xf1340,
-        0xf1341: 0xf1341,
-        0xf1342: 0xf1342,
-        0xf1343: 0xf1343,
-        0xf1344: 0xf1344,
-        0xf1345: 0xf1345,
-        0xf1346: 0xf1346,
-        0xf1347: 0xf1347,
-        0xf1348: 0xf1348,
-        0xf1349: 0xf1349,
-        0xf134a: 0xf134a,
-        0xf134b: 0xf134b,
-        0xf134c: 0xf134c,
-        0xf134d: 0xf134d,
-        0xf134e: 0xf134e,
-        0xf134f: 0xf134f,
-        0xf1350: 0xf1350,
-        0xf1351: 0xf1351,
-        0xf1352: 0xf1352,
-        0xf1353: 0xf1353,
-        0xf1354: 0xf1354,
-        0xf1355: 0xf1355,
-        0xf1356: 0xf1356,
-        0xf1357: 0xf1357,
-        0xf1358: 0xf1358,
-        0xf1359: 0xf1359,
-        0xf135a: 0xf135a,
-        0xf135b: 0xf135b,
-        0xf135c: 0xf135c,
-        0xf135d: 0xf135d,
-        0xf135e: 0xf135e,
-        0xf135f: 0xf135f,
-        0xf1360: 0xf1360,
-        0xf1361: 0xf1361,
-        0xf1362: 0xf1362,
-        0xf1363: 0xf1363,
-        0xf1364: 0xf1364,
-        0xf1365: 0xf1365,
-        0xf1366: 0xf1366,
-        0xf1367: 0xf1367,
-        0xf1368: 0xf1368,
-        0xf1369: 0xf1369,
-        0xf136a: 0xf136a,
-        0xf136b: 0xf136b,
-        0xf136c: 0xf136c,
-        0xf136d: 0xf136d,
-        0xf136e: 0xf136e,
-        0xf136f: 0xf136f,
-        0xf1370: 0xf1370,
-        0xf1371: 0xf1371,
-        0xf1372: 0xf1372,
-        0xf1373: 0xf1373,
-        0xf1374: 0xf1374,
-        0xf1375: 0xf1375,
-        0xf1376: 0xf1376,
-        0xf1377: 0xf1377,
-        0xf1378: 0xf1378,
-        0xf1379: 0xf1379,
-        0xf137a: 0xf137a,
-        0xf137b: 0xf137b,
-        0xf137c: 0xf137c,
-        0xf137d: 0xf137d,
-        0xf137e: 0xf137e,
-        0xf137f: 0xf137f,
-        0xf1380: 0xf1380,
-        0xf1381: 0xf1381,
-        0xf1382: 0xf1382,
-        0xf1383: 0xf1383,
-        0xf1384: 0xf1384,
-        0xf1385: 0xf1385,
-        0xf1386: 0xf1386,
-        0xf1387: 0xf1387,
-        0xf1388: 0xf1388,
-        0xf1389: 0xf1389,
-        0xf138a: 0xf138a,
-        0xf138b: 0xf138b,
-        0xf138c: 0xf138c,
-        0xf138d: 0xf138d,
-        0xf138e: 0xf138e,
-        0xf138f: 0xf138f,
-        0xf1390: 0xf1390,
-        0xf1391: 0xf1391,
-        0xf1392: 0xf1392,
-        0xf1393: 0xf1393,
-        0xf1394: 0xf1394,
-        0xf1395: 0xf1395,
-        0xf1396: 0xf1396,
-        0xf1397: 0xf1397,
-        0xf1398: 0xf1398,
-        0xf1399: 0xf1399,
-        0xf139a: 0xf139a,
-        0xf139b: 0xf139b,
-        0xf139c: 0xf139c,
-        0xf139d: 0xf139d,
-        0xf139e: 0xf139e,
-        0xf139f: 0xf139f,
-        0xf13a0: 0xf13a0,
-        0xf13a1: 0xf13a1,
-        0xf13a2: 0xf13a2,
-        0xf13a3: 0xf13a3,
-        0xf13a4: 0xf13a4,
-        0xf13a5: 0xf13a5,
-        0xf13a6: 0xf13a6,
-        0xf13a7: 0xf13a7,
-        0xf13a8: 0xf13a8,
-        0xf13a9: 0xf13a9,
-        0xf13aa: 0xf13aa,
-        0xf13ab: 0xf13ab,
-        0xf13ac: 0xf13ac,
-        0xf13ad: 0xf13ad,
-        0xf13ae: 0xf13ae,
-        0xf13af: 0xf13af,
-        0xf13b0: 0xf13b0,
-        0xf13b1: 0xf13b1,
-        0xf13b2: 0xf13b2,
-        0xf13b3: 0xf13b3,
-        0xf13b4: 0xf13b4,
-        0xf13b5: 0xf13b5,
-        0xf13b6: 0xf13b6,
-        0xf13b7: 0xf13b7,
-        0xf13b8: 0xf13b8,
-        0xf13b9: 0xf13b9,
-        0xf13ba: 0xf13ba,
-        0xf13bb: 0xf13bb,
-        0xf13bc: 0xf13bc,
-        0xf13bd: 0xf13bd,
-        0xf13be: 0xf13be,
-        0xf13bf: 0xf13bf,
-        0xf13c0: 0xf13c0,
-        0xf13c1: 0xf13c1,
-        0xf13c2: 0xf13c2,
-        0xf13c3: 0xf13c3,
-        0xf13c4: 0xf13c4,
-        0xf13c5: 0xf13c5,
-        0xf13c6: 0xf13c6,
-        0xf13c7: 0xf13c7,
-        0xf13c8: 0xf13c8,
-        0xf13c9: 0xf13c9,
-        0xf13ca: 0xf13ca,
-        0xf13cb: 0xf13cb,
-        0xf13cc: 0xf13cc,
-        0xf13cd: 0xf13cd,
-        0xf13ce: 0xf13ce,
-        0xf13cf: 0xf13cf,
-        0xf13d0: 0xf13d0,
-        0xf13d1: 0xf13d1,
-        0xf13d2: 0xf13d2,
-        0xf13d3: 0xf13d3,
-        0xf13d4: 0xf13d4,
-        0xf13d5: 0xf13d5,
-        0xf13d6: 0xf13d6,
-        0xf13d7: 0xf13d7,
-        0xf13d8: 0xf13d8,
-        0xf13d9: 0xf13d9,
-        0xf13da: 0xf13da,
-        0xf13db: 0xf13db,
-        0xf13dc: 0xf13dc,
-        0xf13dd: 0xf13dd,
-        0xf13de: 0xf13de,
-        0xf13df: 0xf13df,
-        0xf13e0: 0xf13e0,
-        0xf13e1: 0xf13e1,
-        0xf13e2: 0xf13e2,
-        0xf13e3: 0xf13e3,
-        0xf13e4: 0xf13e4,
-        0xf13e5: 0xf13e5,
-        0xf13e6: 0xf13e6,
-        0xf13e7: 0xf13e7,
-        0xf13e8: 0xf13e8,
-        0xf13e9: 0xf13e9,
-        0xf13ea: 0xf13ea,
-        0xf13eb: 0xf13eb,
-        0xf13ec: 0xf13ec,
-        0xf13ed: 0xf13ed,
-        0xf13ee: 0xf13ee,
-        0xf13ef: 0xf13ef,
-        0xf13f0: 0xf13f0,
-        0xf13f1: 0xf13f1,
-        0xf13f2: 0xf13f2,
-        0xf13f3: 0xf13f3,
-        0xf13f4: 0xf13f4,
-        0xf13f5: 0xf13f5,
-        0xf13f6: 0xf13f6,
-        0xf13f7: 0xf13f7,
-        0xf13f8: 0xf13f8,
-        0xf13f9: 0xf13f9,
-        0xf13fa: 0xf13fa,
-        0xf13fb: 0xf13fb,
-        0xf13fc: 0xf13fc,
-        0xf13fd: 0xf13fd,
-        0xf13fe: 0xf13fe,
-        0xf13ff: 0xf13ff,
-        0xf1400: 0xf1400,
-        0xf1401: 0xf1401,
-        0xf1402: 0xf1402,
-        0xf1403: 0xf1403,
-        0xf1404: 0xf1404,
-        0xf1405: 0xf1405,
-        0xf1406: 0xf1406,
-        0xf1407: 0xf1407,
-        0xf1408: 0xf1408,
-        0xf1409: 0xf1409,
-        0xf140a: 0xf140a,
-        0xf140b: 0xf140b,
-        0xf140c: 0xf140c,
-        0xf140d: 0xf140d,
-        0xf140e: 0xf140e,
-        0xf140f: 0xf140f,
-        0xf1410: 0xf1410,
-        0xf1411: 0xf1411,
-        0xf1412: 0xf1412,
-        0xf1413: 0xf1413,
-        0xf1414: 0xf1414,
-        0xf1415: 0xf1415,
-        0xf1416: 0xf1416,
-        0xf1417: 0xf1417,
-        0xf1418: 0xf1418,
-        0xf1419: 0xf1419,
-        0xf141a: 0xf141a,
-        0xf141b: 0xf141b,
-        0xf141c: 0xf141c,
-        0xf141d: 0xf141d,
-        0xf141e: 0xf141e,
-        0xf141f: 0xf141f,
-        0xf1420: 0xf1420,
-        0xf1421: 0xf1421,
-        0xf1422: 0xf1422,
-        0xf1423: 0xf1423,
-        0xf1424: 0xf1424,
-        0xf1425: 0xf1425,
-        0xf1426: 0xf1426,
-        0xf1427: 0xf1427,
-        0xf1428: 0xf1428,
-        0xf1429: 0xf1429,
-        0xf142a: 0xf142a,
-        0xf142b: 0xf142b,
-        0xf142c: 0xf142c,
-        0xf142d: 0xf142d,
-        0xf142e: 0xf142e,
-        0xf142f: 0xf142f,
-        0xf1430: 0xf1430,
-        0xf1431: 0xf1431,
-        0xf1432: 0xf1432,
-        0xf1433: 0xf1433,
-        0xf1434: 0xf1434,
-        0xf1435: 0xf1435,
-        0xf1436: 0xf1436,
-        0xf1437: 0xf1437,
-        0xf1438: 0xf1438,
-        0xf1439: 0xf1439,
-        0xf143a: 0xf143a,
-        0xf143b: 0xf143b,
-        0xf143c: 0xf143c,
-        0xf143d: 0xf143d,
-        0xf143e: 0xf143e,
-        0xf143f: 0xf143f,
-        0xf1440: 0xf1440,
-        0xf1441: 0xf1441,
-        0xf1442: 0xf1442,
-        0xf1443: 0xf1443,
-        0xf1444: 0xf1444,
-        0xf1445: 0xf1445,
-        0xf1446: 0xf1446,
-        0xf1447: 0xf1447,
-        0xf1448: 0xf1448,
-        0xf1449: 0xf1449,
-        0xf144a: 0xf144a,
-        0xf144b: 0xf144b,
-        0xf144c: 0xf144c,
-        0xf144d: 0xf144d,
-        0xf144e: 0xf144e,
-        0xf144f: 0xf144f,
-        0xf1450: 0xf1450,
-        0xf1451: 0xf1451,
-        0xf1452: 0xf1452,
-        0xf1453: 0xf1453,
-        0xf1454: 0xf1454,
-        0xf1455: 0xf1455,
-        0xf1456: 0xf1456,
-        0xf1457: 0xf1457,
-        0xf1458: 0xf1458,
-        0xf1459: 0xf1459,
-        0xf145a: 0xf145a,
-        0xf145b: 0xf145b,
-        0xf145c: 0xf145c,
-        0xf145d: 0xf145d,
-        0xf145e: 0xf145e,
-        0xf145f: 0xf145f,
-        0xf1460: 0xf1460,
-        0xf1461: 0xf1461,
-        0xf1462: 0xf1462,
-        0xf1463: 0xf1463,
-        0xf1464: 0xf1464,
-        0xf1465: 0xf1465,
-        0xf1466: 0xf1466,
-        0xf1467: 0xf1467,
-        0xf1468: 0xf1468,
-        0xf1469: 0xf1469,
-        0xf146a: 0xf146a,
-        0xf146b: 0xf146b,
-        0xf146c: 0xf146c,
-        0xf146d: 0xf146d,
-        0xf146e: 0xf146e,
-        0xf146f: 0xf146f,
-        0xf1470: 0xf1470,
-        0xf1471: 0xf1471,
-        0xf1472: 0xf1472,
-        0xf1473: 0xf1473,
-        0xf1474: 0xf1474,
-        0xf1475: 0xf1475,
-        0xf1476: 0xf1476,
-        0xf1477: 0xf1477,
-        0xf1478: 0xf1478,
-        0xf1479: 0xf1479,
-        0xf147a: 0xf147a,
-        0xf147b: 0xf147b,
-        0xf147c: 0xf147c,
-        0xf147d: 0xf147d,
-        0xf147e: 0xf147e,
-        0xf147f: 0xf147f,
-        0xf1480: 0xf1480,
-        0xf1481: 0xf1481,
-        0xf1482: 0xf1482,
-        0xf1483: 0xf1483,
-        0xf1484: 0xf1484,
-        0xf1485: 0xf1485,
-        0xf1486: 0xf1486,
-        0xf1487: 0xf1487,
-        0xf1488: 0xf1488,
-        0xf1489: 0xf1489,
-        0xf148a: 0xf148a,
-        0xf148b: 0xf148b,
-        0xf148c: 0xf148c,
-        0xf148d: 0xf148d,
-        0xf148e: 0xf148e,
-        0xf148f: 0xf148f,
-        0xf1490: 0xf1490,
-        0xf1491: 0xf1491,
-        0xf1492: 0xf1492,
-        0xf1493: 0xf1493,
-        0xf1494: 0xf1494,
-        0xf1495: 0xf1495,
-        0xf1496: 0xf1496,
-        0xf1497: 0xf1497,
-        0xf1498: 0xf1498,
-        0xf1499: 0xf1499,
-        0xf149a: 0xf149a,
-        0xf149b: 0xf149b,
-        0xf149c: 0xf149c,
-        0xf149d: 0xf149d,
-        0xf149e: 0xf149e,
-        0xf149f: 0xf149f,
-        0xf14a0: 0xf14a0,
-        0xf14a1: 0xf14a1,
-        0xf14a2: 0xf14a2,
-        0xf14a3: 0xf14a3,
-        0xf14a4: 0xf14a4,
-        0xf14a5: 0xf14a5,
-        0xf14a6: 0xf14a6,
-        0xf14a7: 0xf14a7,
-        0xf14a8: 0xf14a8,
-        0xf14a9: 0xf14a9,
-        0xf14aa: 0xf14aa,
-        0xf14ab: 0xf14ab,
-        0xf14ac: 0xf14ac,
-        0xf14ad: 0xf14ad,
-        0xf14ae: 0xf14ae,
-        0xf14af: 0xf14af,
-        0xf14b0: 0xf14b0,
-        0xf14b1: 0xf14b1,
-        0xf14b2: 0xf14b2,
-        0xf14b3: 0xf14b3,
-        0xf14b4: 0xf14b4,
-        0xf14b5: 0xf14b5,
-        0xf14b6: 0xf14b6,
-        0xf14b7: 0xf14b7,
-        0xf14b8: 0xf14b8,
-        0xf14b9: 0xf14b9,
-        0xf14ba: 0xf14ba,
-        0xf14bb: 0xf14bb,
-        0xf14bc: 0xf14bc,
-        0xf14bd: 0xf14bd,
-        0xf14be: 0xf14be,
-        0xf14bf: 0xf14bf,
-        0xf14c0: 0xf14c0,
-        0xf14c1: 0xf14c1,
-        0xf14c2: 0xf14c2,
-        0xf14c3: 0xf14c3,
-        0xf14c4: 0xf14c4,
-        0xf14c5: 0xf14c5,
-        0xf14c6: 0xf14c6,
-        0xf14c7: 0xf14c7,
-        0xf14c8: 0xf14c8,
-        0xf14c9: 0xf14c9,
-        0xf14ca: 0xf14ca,
-        0xf14cb: 0xf14cb,
-        0xf14cc: 0xf14cc,
-        0xf14cd: 0xf14cd,
-        0xf14ce: 0xf14ce,
-        0xf14cf: 0xf14cf,
-        0xf14d0: 0xf14d0,
-        0xf14d1: 0xf14d1,
-        0xf14d2: 0xf14d2,
-        0xf14d3: 0xf14d3,
-        0xf14d4: 0xf14d4,
-        0xf14d5: 0xf14d5,
-        0xf14d6: 0xf14d6,
-        0xf14d7: 0xf14d7,
-        0xf14d8: 0xf14d8,
-        0xf14d9: 0xf14d9,
-        0xf14da: 0xf14da,
-        0xf14db: 0xf14db,
-        0xf14dc: 0xf14dc,
-        0xf14dd: 0xf14dd,
-        0xf14de: 0xf14de,
-        0xf14df: 0xf14df,
-        0xf14e0: 0xf14e0,
-        0xf14e1: 0xf14e1,
-        0xf14e2: 0xf14e2,
-        0xf14e3: 0xf14e3,
-        0xf14e4: 0xf14e4,
-        0xf14e5: 0xf14e5,
-        0xf14e6: 0xf14e6,
-        0xf14e7: 0xf14e7,
-        0xf14e8: 0xf14e8,
-        0xf14e9: 0xf14e9,
-        0xf14ea: 0xf14ea,
-        0xf14eb: 0xf14eb,
-        0xf14ec: 0xf14ec,
-        0xf14ed: 0xf14ed,
-        0xf14ee: 0xf14ee,
-        0xf14ef: 0xf14ef,
-        0xf14f0: 0xf14f0,
-        0xf14f1: 0xf14f1,
-        0xf14f2: 0xf14f2,
-        0xf14f3: 0xf14f3,
-        0xf14f4: 0xf14f4,
-        0xf14f5: 0xf14f5,
-        0xf14f6: 0xf14f6,
-        0xf14f7: 0xf14f7,
-        0xf14f8: 0xf14f8,
-        0xf14f9: 0xf14f9,
-        0xf14fa: 0xf14fa,
-        0xf14fb: 0xf14fb,
-        0xf14fc: 0xf14fc,
-        0xf14fd: 0xf14fd,
-        0xf14fe: 0xf14fe,
-        0xf14ff: 0xf14ff,
-        0xf1500: 0xf1500,
-        0xf1501: 0xf1501,
-        0xf1502: 0xf1502,
-        0xf1503: 0xf1503,
-        0xf1504: 0xf1504,
-        0xf1505: 0xf1505,
-        0xf1506: 0xf1506,
-        0xf1507: 0xf1507,
-        0xf1508: 0xf1508,
-        0xf1509: 0xf1509,
-        0xf150a: 0xf150a,
-        0xf150b: 0xf150b,
-        0xf150c: 0xf150c,
-        0xf150d: 0xf150d,
-        0xf150e: 0xf150e,
-        0xf150f: 0xf150f,
-        0xf1510: 0xf1510,
-        0xf1511: 0xf1511,
-        0xf1512: 0xf1512,
-        0xf1513: 0xf1513,
-        0xf1514: 0xf1514,
-        0xf1515: 0xf1515,
-        0xf1516: 0xf1516,
-        0xf1517: 0xf1517,
-        0xf1518: 0xf1518,
-        0xf1519: 0xf1519,
-        0xf151a: 0xf151a,
-        0xf151b: 0xf151b,
-        0xf151c: 0xf151c,
-        0xf151d: 0xf151d,
-        0xf151e: 0xf151e,
-        0xf151f: 0xf151f,
-        0xf1520: 0xf1520,
-        0xf1521: 0xf1521,
-        0xf1522: 0xf1522,
-        0xf1523: 0xf1523,
-        0xf1524: 0xf1524,
-        0xf1525: 0xf1525,
-        0xf1526: 0xf1526,
-        0xf1527: 0xf1527,
-        0xf1528: 0xf1528,
-        0xf1529: 0xf1529,
-        0xf152a: 0xf152a,
-        0xf152b: 0xf152b,
-        0xf152c: 0xf152c,
-        0xf152d: 0xf152d,
-        0xf152e: 0xf152e,
-        0xf152f: 0xf152f,
-        0xf1530: 0xf1530,
-        0xf1531: 0xf1531,
-        0xf1532: 0xf1532,
-        0xf1533: 0xf1533,
-        0xf1534: 0xf1534,
-        0xf1535: 0xf1535,
-        0xf1536: 0xf1536,
-        0xf1537: 0xf1537,
-        0xf1538: 0xf1538,
-        0xf1539: 0xf1539,
-        0xf153a: 0xf153a,
-        0xf153b: 0xf153b,
-        0xf153c: 0xf153c,
-        0xf153d: 0xf153d,
-        0xf153e: 0xf153e,
-        0xf153f: 0xf153f,
-        0xf1540: 0xf1540,
-        0xf1541: 0xf1541,
-        0xf1542: 0xf1542,
-        0xf1543: 0xf1543,
-        0xf1544: 0xf1544,
-        0xf1545: 0xf1545,
-        0xf1546: 0xf1546,
-        0xf1547: 0xf1547,
-        0xf1548: 0xf1548,
-        0xf1549: 0xf1549,
-        0xf154a: 0xf154a,
-        0xf154b: 0xf154b,
-        0xf154c: 0xf154c,
-        0xf154d: 0xf154d,
-        0xf154e: 0xf154e,
-        0xf154f: 0xf154f,
-        0xf1550: 0xf1550,
-        0xf1551: 0xf1551,
-        0xf1552: 0xf1552,
-        0xf1553: 0xf1553,
-        0xf1554: 0xf1554,
-        0xf1555: 0xf1555,
-        0xf1556: 0xf1556,
-        0xf1557: 0xf1557,
-        0xf1558: 0xf1558,
-        0xf1559: 0xf1559,
-        0xf155a: 0xf155a,
-        0xf155b: 0xf155b,
-        0xf155c: 0xf155c,
-        0xf155d: 0xf155d,
-        0xf155e: 0xf155e,
-        0xf155f: 0xf155f,
-        0xf1560: 0xf1560,
-        0xf1561: 0xf1561,
-        0xf1562: 0xf1562,
-        0xf1563: 0xf1563,
-        0xf1564: 0xf1564,
-        0xf1565: 0xf1565,
-        0xf1566: 0xf1566,
-        0xf1567: 0xf1567,
-        0xf1568: 0xf1568,
-        0xf1569: 0xf1569,
-        0xf156a: 0xf156a,
-        0xf156b: 0xf156b,
-        0xf156c: 0xf156c,
-        0xf156d: 0xf156d,
-        0xf156e: 0xf156e,
-        0xf156f: 0xf156f,
-        0xf1570: 0xf1570,
-        0xf1571: 0xf1571,
-        0xf1572: 0xf1572,
-        0xf1573: 0xf1573,
-        0xf1574: 0xf1574,
-        0xf1575: 0xf1575,
-        0xf1576: 0xf1576,
-        0xf1577: 0xf1577,
-        0xf1578: 0xf1578,
-        0xf1579: 0xf1579,
-        0xf157a: 0xf157a,
-        0xf157b: 0xf157b,
-        0xf157c: 0xf157c,
-        0xf157d: 0xf157d,
-        0xf157e: 0xf157e,
-        0xf157f: 0xf157f,
-        0xf1580: 0xf1580,
-        0xf1581: 0xf1581,
-        0xf1582: 0xf1582,
-        0xf1583: 0xf1583,
-        0xf1584: 0xf1584,
-        0xf1585: 0xf1585,
-        0xf1586: 0xf1586,
-        0xf1587: 0xf1587,
-        0xf1588: 0xf1588,
-        0xf1589: 0xf1589,
-        0xf158a: 0xf158a,
-        0xf158b: 0xf158b,
-        0xf158c: 0xf158c,
-        0xf158d: 0xf158d,
-        0xf158e: 0xf158e,
-        0xf158f: 0xf158f,
-        0xf1590: 0xf1590,
-        0xf1591: 0xf1591,
-        0xf1592: 0xf1592,
-        0xf1593: 0xf1593,
-        0xf1594: 0xf1594,
-        0xf1595: 0xf1595,
-        0xf1596: 0xf1596,
-        0xf1597: 0xf1597,
-        0xf1598: 0xf1598,
-        0xf1599: 0xf1599,
-        0xf159a: 0xf159a,
-        0xf159b: 0xf159b,
-        0xf159c: 0xf159c,
-        0xf159d: 0xf159d,
-        0xf159e: 0xf159e,
-        0xf159f: 0xf159f,
-        0xf15a0: 0xf15a0,
-        0xf15a1: 0xf15a1,
-        0xf15a2: 0xf15a2,
-        0xf15a3: 0xf15a3,
-        0xf15a4: 0xf15a4,
-        0xf15a5: 0xf15a5,
-        0xf15a6: 0xf15a6,
-        0xf15a7: 0xf15a7,
-        0xf15a8: 0xf15a8,
-        0xf15a9: 0xf15a9,
-        0xf15aa: 0xf15aa,
-        0xf15ab: 0xf15ab,
-        0xf15ac: 0xf15ac,
-        0xf15ad: 0xf15ad,
-        0xf15ae: 0xf15ae,
-        0xf15af: 0xf15af,
-        0xf15b0: 0xf15b0,
-        0xf15b1: 0xf15b1,
-        0xf15b2: 0xf15b2,
-        0xf15b3: 0xf15b3,
-        0xf15b4: 0xf15b4,
-        0xf15b5: 0xf15b5,
-        0xf15b6: 0xf15b6,
-        0xf15b7: 0xf15b7,
-        0xf15b8: 0xf15b8,
-        0xf15b9: 0xf15b9,
-        0xf15ba: 0xf15ba,
-        0xf15bb: 0xf15bb,
-        0xf15bc: 0xf15bc,
-        0xf15bd: 0xf15bd,
-        0xf15be: 0xf15be,
-        0xf15bf: 0xf15bf,
-        0xf15c0: 0xf15c0,
-        0xf15c1: 0xf15c1,
-        0xf15c2: 0xf15c2,
-        0xf15c3: 0xf15c3,
-        0xf15c4: 0xf15c4,
-        0xf15c5: 0xf15c5,
-        0xf15c6: 0xf15c6,
-        0xf15c7: 0xf15c7,
-        0xf15c8: 0xf15c8,
-        0xf15c9: 0xf15c9,
-        0xf15ca: 0xf15ca,
-        0xf15cb: 0xf15cb,
-        0xf15cc: 0xf15cc,
-        0xf15cd: 0xf15cd,
-        0xf15ce: 0xf15ce,
-        0xf15cf: 0xf15cf,
-        0xf15d0: 0xf15d0,
-        0xf15d1: 0xf15d1,
-        0xf15d2: 0xf15d2,
-        0xf15d3: 0xf15d3,
-        0xf15d4: 0xf15d4,
-        0xf15d5: 0xf15d5,
-        0xf15d6: 0xf15d6,
-        0xf15d7: 0xf15d7,
-        0xf15d8: 0xf15d8,
-        0xf15d9: 0xf15d9,
-        0xf15da: 0xf15da,
-        0xf15db: 0xf15db,
-        0xf15dc: 0xf15dc,
-        0xf15dd: 0xf15dd,
-        0xf15de: 0xf15de,
-        0xf15df: 0xf15df,
-        0xf15e0: 0xf15e0,
-        0xf15e1: 0xf15e1,
-        0xf15e2: 0xf15e2,
-        0xf15e3: 0xf15e3,
-        0xf15e4: 0xf15e4,
-        0xf15e5: 0xf15e5,
-        0xf15e6: 0xf15e6,
-        0xf15e7: 0xf15e7,
-        0xf15e8: 0xf15e8,
-        0xf15e9: 0xf15e9,
-        0xf15ea: 0xf15ea,
-        0xf15eb: 0xf15eb,
-        0xf15ec: 0xf15ec,
-        0xf15ed: 0xf15ed,
-        0xf15ee: 0xf15ee,
-        0xf15ef: 0xf15ef,
-        0xf15f0: 0xf15f0,
-        0xf15f1: 0xf15f1,
-        0xf15f2: 0xf15f2,
-        0xf15f3: 0xf15f3,
-        0xf15f4: 0xf15f4,
-        0xf15f5: 0xf15f5,
-        0xf15f6: 0xf15f6,
-        0xf15f7: 0xf15f7,
-        0xf15f8: 0xf15f8,
-        0xf15f9: 0xf15f9,
-        0xf15fa: 0xf15fa,
-        0xf15fb: 0xf15fb,
-        0xf15fc: 0xf15fc,
-        0xf15fd: 0xf15fd,
-        0xf15fe: 0xf15fe,
-        0xf15ff: 0xf15ff,
-        0xf1600: 0xf1600,
-        0xf1601: 0xf1601,
-        0xf1602: 0xf1602,
-        0xf1603: 0xf1603,
-        0xf1604: 0xf1604,
-        0xf1605: 0xf1605,
-        0xf1606: 0xf1606,
-        0xf1607: 0xf1607,
-        0xf1608: 0xf1608,
-        0xf1609: 0xf1609,
-        0xf160a: 0xf160a,
-        0xf160b: 0xf160b,
-        0xf160c: 0xf160c,
-        0xf160d: 0xf160d,
-        0xf160e: 0xf160e,
-        0xf160f: 0xf160f,
-        0xf1610: 0xf1610,
-        0xf1611: 0xf1611,
-        0xf1612: 0xf1612,
-        0xf1613: 0xf1613,
-        0xf1614: 0xf1614,
-        0xf1615: 0xf1615,
-        0xf1616: 0xf1616,
-        0xf1617: 0xf1617,
-        0xf1618: 0xf1618,
-        0xf1619: 0xf1619,
-        0xf161a: 0xf161a,
-        0xf161b: 0xf161b,
-        0xf161c: 0xf161c,
-        0xf161d: 0xf161d,
-        0xf161e: 0xf161e,
-        0xf161f: 0xf161f,
-        0xf1620: 0xf1620,
-        0xf1621: 0xf1621,
-        0xf1622: 0xf1622,
-        0xf1623: 0xf1623,
-        0xf1624: 0xf1624,
-        0xf1625: 0xf1625,
-        0xf1626: 0xf1626,
-        0xf1627: 0xf1627,
-        0xf1628: 0xf1628,
-        0xf1629: 0xf1629,
-        0xf162a: 0xf162a,
-        0xf162b: 0xf162b,
-        0xf162c: 0xf162c,
-        0xf162d: 0xf162d,
-        0xf162e: 0xf162e,
-        0xf162f: 0xf162f,
-        0xf1630: 0xf1630,
-        0xf1631: 0xf1631,
-        0xf1632: 0xf1632,
-        0xf1633: 0xf1633,
-        0xf1634: 0xf1634,
-        0xf1635: 0xf1635,
-        0xf1636: 0xf1636,
-        0xf1637: 0xf1637,
-        0xf1638: 0xf1638,
-        0xf1639: 0xf1639,
-        0xf163a: 0xf163a,
-        0xf163b: 0xf163b,
-        0xf163c: 0xf163c,
-        0xf163d: 0xf163d,
-        0xf163e: 0xf163e,
-        0xf163f: 0xf163f,
-        0xf1640: 0xf1640,
-        0xf1641: 0xf1641,
-        0xf1642: 0xf1642,
-        0xf1643: 0xf1643,
-        0xf1644: 0xf1644,
-        0xf1645: 0xf1645,
-        0xf1646: 0xf1646,
-        0xf1647: 0xf1647,
-        0xf1648: 0xf1648,
-        0xf1649: 0xf1649,
-        0xf164a: 0xf164a,
-        0xf164b: 0xf164b,
-        0xf164c: 0xf164c,
-        0xf164d: 0xf164d,
-        0xf164e: 0xf164e,
-        0xf164f: 0xf164f,
-        0xf1650: 0xf1650,
-        0xf1651: 0xf1651,
-        0xf1652: 0xf1652,
-        0xf1653: 0xf1653,
-        0xf1654: 0xf1654,
-        0xf1655: 0xf1655,
-        0xf1656: 0xf1656,
-        0xf1657: 0xf1657,
-        0xf1658: 0xf1658,
-        0xf1659: 0xf1659,
-        0xf165a: 0xf165a,
-        0xf165b: 0xf165b,
-        0xf165c: 0xf165c,
-        0xf165d: 0xf165d,
-        0xf165e: 0xf165e,
-        0xf165f: 0xf165f,
-        0xf1660: 0xf1660,
-        0xf1661: 0xf1661,
-        0xf1662: 0xf1662,
-        0xf1663: 0xf1663,
-        0xf1664: 0xf1664,
-        0xf1665: 0xf1665,
-        0xf1666: 0xf1666,
-        0xf1667: 0xf1667,
-        0xf1668: 0xf1668,
-        0xf1669: 0xf1669,
-        0xf166a: 0xf166a,
-        0xf166b: 0xf166b,
-        0xf166c: 0xf166c,
-        0xf166d: 0xf166d,
-        0xf166e: 0xf166e,
-        0xf166f: 0xf166f,
-        0xf1670: 0xf1670,
-        0xf1671: 0xf1671,
-        0xf1672: 0xf1672,
-        0xf1673: 0xf1673,
-        0xf1674: 0xf1674,
-        0xf1675: 0xf1675,
-        0xf1676: 0xf1676,
-        0xf1677: 0xf1677,
-        0xf1678: 0xf1678,
-        0xf1679: 0xf1679,
-        0xf167a: 0xf167a,
-        0xf167b: 0xf167b,
-        0xf167c: 0xf167c,
-        0xf167d: 0xf167d,
-        0xf167e: 0xf167e,
-        0xf167f: 0xf167f,
-        0xf1680: 0xf1680,
-        0xf1681: 0xf1681,
-        0xf1682: 0xf1682,
-        0xf1683: 0xf1683,
-        0xf1684: 0xf1684,
-        0xf1685: 0xf1685,
-        0xf1686: 0xf1686,
-        0xf1687: 0xf1687,
-        0xf1688: 0xf1688,
-        0xf1689: 0xf1689,
-        0xf168a: 0xf168a,
-        0xf168b: 0xf168b,
-        0xf168c: 0xf168c,
-        0xf168d: 0xf168d,
-        0xf168e: 0xf168e,
-        0xf168f: 0xf168f,
-        0xf1690: 0xf1690,
-        0xf1691: 0xf1691,
-        0xf1692: 0xf1692,
-        0xf1693: 0xf1693,
-        0xf1694: 0xf1694,
-        0xf1695: 0xf1695,
-        0xf1696: 0xf1696,
-        0xf1697: 0xf1697,
-        0xf1698: 0xf1698,
-        0xf1699: 0xf1699,
-        0xf169a: 0xf169a,
-        0xf169b: 0xf169b,
-        0xf169c: 0xf169c,
-        0xf169d: 0xf169d,
-        0xf169e: 0xf169e,
-        0xf169f: 0xf169f,
-        0xf16a0: 0xf16a0,
-        0xf16a1: 0xf16a1,
-        0xf16a2: 0xf16a2,
-        0xf16a3: 0xf16a3,
-        0xf16a4: 0xf16a4,
-        0xf16a5: 0xf16a5,
-        0xf16a6: 0xf16a6,
-        0xf16a7: 0xf16a7,
-        0xf16a8: 0xf16a8,
-        0xf16a9: 0xf16a9,
-        0xf16aa: 0xf16aa,
-        0xf16ab: 0xf16ab,
-        0xf16ac: 0xf16ac,
-        0xf16ad: 0xf16ad,
-        0xf16ae: 0xf16ae,
-        0xf16af: 0xf16af,
-        0xf16b0: 0xf16b0,
-        0xf16b1: 0xf16b1,
-        0xf16b2: 0xf16b2,
-        0xf16b3: 0xf16b3,
-        0xf16b4: 0xf16b4,
-        0xf16b5: 0xf16b5,
-        0xf16b6: 0xf16b6,
-        0xf16b7: 0xf16b7,
-        0xf16b8: 0xf16b8,
-        0xf16b9: 0xf16b9,
-        0xf16ba: 0xf16ba,
-        0xf16bb: 0xf16bb,
-        0xf16bc: 0xf16bc,
-        0xf16bd: 0xf16bd,
-        0xf16be: 0xf16be,
-        0xf16bf: 0xf16bf,
-        0xf16c0: 0xf16c0,
-        0xf16c1: 0xf16c1,
-        0xf16c2: 0xf16c2,
-        0xf16c3: 0xf16c3,
-        0xf16c4: 0xf16c4,
-        0xf16c5: 0xf16c5,
-        0xf16c6: 0xf16c6,
-        0xf16c7: 0xf16c7,
-        0xf16c8: 0xf16c8,
-        0xf16c9: 0xf16c9,
-        0xf16ca: 0xf16ca,
-        0xf16cb: 0xf16cb,
-        0xf16cc: 0xf16cc,
-        0xf16cd: 0xf16cd,
-        0xf16ce: 0xf16ce,
-        0xf16cf: 0xf16cf,
-        0xf16d0: 0xf16d0,
-        0xf16d1: 0xf16d1,
-        0xf16d2: 0xf16d2,
-        0xf16d3: 0xf16d3,
-        0xf16d4: 0xf16d4,
-        0xf16d5: 0xf16d5,
-        0xf16d6: 0xf16d6,
-        0xf16d7: 0xf16d7,
-        0xf16d8: 0xf16d8,
-        0xf16d9: 0xf16d9,
-        0xf16da: 0xf16da,
-        0xf16db: 0xf16db,
-        0xf16dc: 0xf16dc,
-        0xf16dd: 0xf16dd,
-        0xf16de: 0xf16de,
-        0xf16df: 0xf16df,
-        0xf16e0: 0xf16e0,
-        0xf16e1: 0xf16e1,
-        0xf16e2: 0xf16e2,
-        0xf16e3: 0xf16e3,
-        0xf16e4: 0xf16e4,
-        0xf16e5: 0xf16e5,
-        0xf16e6: 0xf16e6,
-        0xf16e7: 0xf16e7,
-        0xf16e8: 0xf16e8,
-        0xf16e9: 0xf16e9,
-        0xf16ea: 0xf16ea,
-        0xf16eb: 0xf16eb,
-        0xf16ec: 0xf16ec,
-        0xf16ed: 0xf16ed,
-        0xf16ee: 0xf16ee,
-        0xf16ef: 0xf16ef,
-        0xf16f0: 0xf16f0,
-        0xf16f1: 0xf16f1,
-        0xf16f2: 0xf16f2,
-        0xf16f3: 0xf16f3,
-        0xf16f4: 0xf16f4,
-        0xf16f5: 0xf16f5,
-        0xf16f6: 0xf16f6,
-        0xf16f7: 0xf16f7,
-        0xf16f8: 0xf16f8,
-        0xf16f9: 0xf16f9,
-        0xf16fa: 0xf16fa,
-        0xf16fb: 0xf16fb,
-        0xf16fc: 0xf16fc,
-        0xf16fd: 0xf16fd,
-        0xf16fe: 0xf16fe,
-        0xf16ff: 0xf16ff,
-        0xf1700: 0xf1700,
-        0xf1701: 0xf1701,
-        0xf1702: 0xf1702,
-        0xf1703: 0xf1703,
-        0xf1704: 0xf1704,
-        0xf1705: 0xf1705,
-        0xf1706: 0xf1706,
-        0xf1707: 0xf1707,
-        0xf1708: 0xf1708,
-        0xf1709: 0xf1709,
-        0xf170a: 0xf170a,
-        0xf170b: 0xf170b,
-        0xf170c: 0xf170c,
-        0xf170d: 0xf170d,
-        0xf170e: 0xf170e,
-        0xf170f: 0xf170f,
-        0xf1710: 0xf1710,
-        0xf1711: 0xf1711,
-        0xf1712: 0xf1712,
-        0xf1713: 0xf1713,
-        0xf1714: 0xf1714,
-        0xf1715: 0xf1715,
-        0xf1716: 0xf1716,
-        0xf1717: 0xf1717,
-        0xf1718: 0xf1718,
-        0xf1719: 0xf1719,
-        0xf171a: 0xf171a,
-        0xf171b: 0xf171b,
-        0xf171c: 0xf171c,
-        0xf171d: 0xf171d,
-        0xf171e: 0xf171e,
-        0xf171f: 0xf171f,
-        0xf1720: 0xf1720,
-        0xf1721: 0xf1721,
-        0xf1722: 0xf1722,
-        0xf1723: 0xf1723,
-        0xf1724: 0xf1724,
-        0xf1725: 0xf1725,
-        0xf1726: 0xf1726,
-        0xf1727: 0xf1727,
-        0xf1728: 0xf1728,
-        0xf1729: 0xf1729,
-        0xf172a: 0xf172a,
-        0xf172b: 0xf172b,
-        0xf172c: 0xf172c,
-        0xf172d: 0xf172d,
-        0xf172e: 0xf172e,
-        0xf172f: 0xf172f,
-        0xf1730: 0xf1730,
-        0xf1731: 0xf1731,
-        0xf1732: 0xf1732,
-        0xf1733: 0xf1733,
-        0xf1734: 0xf1734,
-        0xf1735: 0xf1735,
-        0xf1736: 0xf1736,
-        0xf1737: 0xf1737,
-        0xf1738: 0xf1738,
-        0xf1739: 0xf1739,
-        0xf173a: 0xf173a,
-        0xf173b: 0xf173b,
-        0xf173c: 0xf173c,
-        0xf173d: 0xf173d,
-        0xf173e: 0xf173e,
-        0xf173f: 0xf173f,
-        0xf1740: 0xf1740,
-        0xf1741: 0xf1741,
-        0xf1742: 0xf1742,
-        0xf1743: 0xf1743,
-        0xf1744: 0xf1744,
-        0xf1745: 0xf1745,
-        0xf1746: 0xf1746,
-        0xf1747: 0xf1747,
-        0xf1748: 0xf1748,
-        0xf1749: 0xf1749,
-        0xf174a: 0xf174a,
-        0xf174b: 0xf174b,
-        0xf174c: 0xf174c,
-        0xf174d: 0xf174d,
-        0xf174e: 0xf174e,
-        0xf174f: 0xf174f,
-        0xf1750: 0xf1750,
-        0xf1751: 0xf1751,
-        0xf1752: 0xf1752,
-        0xf1753: 0xf1753,
-        0xf1754: 0xf1754,
-        0xf1755: 0xf1755,
-        0xf1756: 0xf1756,
-        0xf1757: 0xf1757,
-        0xf1758: 0xf1758,
-        0xf1759: 0xf1759,
-        0xf175a: 0xf175a,
-        0xf175b: 0xf175b,
-        0xf175c: 0xf175c,
-        0xf175d: 0xf175d,
-        0xf175e: 0xf175e,
-        0xf175f: 0xf175f,
-        0xf1760: 0xf1760,
-        0xf1761: 0xf1761,
-        0xf1762: 0xf1762,
-        0xf1763: 0xf1763,
-        0xf1764: 0xf1764,
-        0xf1765: 0xf1765,
-        0xf1766: 0xf1766,
-        0xf1767: 0xf1767,
-        0xf1768: 0xf1768,
-        0xf1769: 0xf1769,
-        0xf176a: 0xf176a,
-        0xf176b: 0xf176b,
-        0xf176c: 0xf176c,
-        0xf176d: 0xf176d,
-        0xf176e: 0xf176e,
-        0xf176f: 0xf176f,
-        0xf1770: 0xf1770,
-        0xf1771: 0xf1771,
-        0xf1772: 0xf1772,
-        0xf1773: 0xf1773,
-        0xf1774: 0xf1774,
-        0xf1775: 0xf1775,
-        0xf1776: 0xf1776,
-        0xf1777: 0xf1777,
-        0xf1778: 0xf1778,
-        0xf1779: 0xf1779,
-        0xf177a: 0xf177a,
-        0xf177b: 0xf177b,
-        0xf177c: 0xf177c,
-        0xf177d: 0xf177d,
-        0xf177e: 0xf177e,
-        0xf177f: 0xf177f,
-        0xf1780: 0xf1780,
-        0xf1781: 0xf1781,
-        0xf1782: 0xf1782,
-        0xf1783: 0xf1783,
-        0xf1784: 0xf1784,
-        0xf1785: 0xf1785,
-        0xf1786: 0xf1786,
-        0xf1787: 0xf1787,
-        0xf1788: 0xf1788,
-        0xf1789: 0xf1789,
-        0xf178a: 0xf178a,
-        0xf178b: 0xf178b,
-        0xf178c: 0xf178c,
-        0xf178d: 0xf178d,
-        0xf178e: 0xf178e,
-        0xf178f: 0xf178f,
-        0xf1790: 0xf1790,
-        0xf1791: 0xf1791,
-        0xf1792: 0xf1792,
-        0xf1793: 0xf1793,
-        0xf1794: 0xf1794,
-        0xf1795: 0xf1795,
-        0xf1796: 0xf1796,
-        0xf1797: 0xf1797,
-        0xf1798: 0xf1798,
-        0xf1799: 0xf1799,
-        0xf179a: 0xf179a,
-        0xf179b: 0xf179b,
-        0xf179c: 0xf179c,
-        0xf179d: 0xf179d,
-        0xf179e: 0xf179e,
-        0xf179f: 0xf179f,
-        0xf17a0: 0xf17a0,
-        0xf17a1: 0xf17a1,
-        0xf17a2: 0xf17a2,
-        0xf17a3: 0xf17a3,
-        0xf17a4: 0xf17a4,
-        0xf17a5: 0xf17a5,
-        0xf17a6: 0xf17a6,
-        0xf17a7: 0xf17a7,
-        0xf17a8: 0xf17a8,
-        0xf17a9: 0xf17a9,
-        0xf17aa: 0xf17aa,
-        0xf17ab: 0xf17ab,
-        0xf17ac: 0xf17ac,
-        0xf17ad: 0xf17ad,
-        0xf17ae: 0xf17ae,
-        0xf17af: 0xf17af,
-        0xf17b0: 0xf17b0,
-        0xf17b1: 0xf17b1,
-        0xf17b2: 0xf17b2,
-        0xf17b3: 0xf17b3,
-        0xf17b4: 0xf17b4,
-        0xf17b5: 0xf17b5,
-        0xf17b6: 0xf17b6,
-        0xf17b7: 0xf17b7,
-        0xf17b8: 0xf17b8,
-        0xf17b9: 0xf17b9,
-        0xf17ba: 0xf17ba,
-        0xf17bb: 0xf17bb,
-        0xf17bc: 0xf17bc,
-        0xf17bd: 0xf17bd,
-        0xf17be: 0xf17be,
-        0xf17bf: 0xf17bf,
-        0xf17c0: 0xf17c0,
-        0xf17c1: 0xf17c1,
-        0xf17c2: 0xf17c2,
-        0xf17c3: 0xf17c3,
-        0xf17c4: 0xf17c4,
-        0xf17c5: 0xf17c5,
-        0xf17c6: 0xf17c6,
-        0xf17c7: 0xf17c7,
-        0xf17c8: 0xf17c8,
-        0xf17c9: 0xf17c9,
-        0xf17ca: 0xf17ca,
-        0xf17cb: 0xf17cb,
-        0xf17cc: 0xf17cc,
-        0xf17cd: 0xf17cd,
-        0xf17ce: 0xf17ce,
-        0xf17cf: 0xf17cf,
-        0xf17d0: 0xf17d0,
-        0xf17d1: 0xf17d1,
-        0xf17d2: 0xf17d2,
-        0xf17d3: 0xf17d3,
-        0xf17d4: 0xf17d4,
-        0xf17d5: 0xf17d5,
-        0xf17d6: 0xf17d6,
-        0xf17d7: 0xf17d7,
-        0xf17d8: 0xf17d8,
-        0xf17d9: 0xf17d9,
-        0xf17da: 0xf17da,
-        0xf17db: 0xf17db,
-        0xf17dc: 0xf17dc,
-        0xf17dd: 0xf17dd,
-        0xf17de: 0xf17de,
-        0xf17df: 0xf17df,
-        0xf17e0: 0xf17e0,
-        0xf17e1: 0xf17e1,
-        0xf17e2: 0xf17e2,
-        0xf17e3: 0xf17e3,
-        0xf17e4: 0xf17e4,
-        0xf17e5: 0xf17e5,
-        0xf17e6: 0xf17e6,
-        0xf17e7: 0xf17e7,
-        0xf17e8: 0xf17e8,
-        0xf17e9: 0xf17e9,
-        0xf17ea: 0xf17ea,
-        0xf17eb: 0xf17eb,
-        0xf17ec: 0xf17ec,
-        0xf17ed: 0xf17ed,
-        0xf17ee: 0xf17ee,
-        0xf17ef: 0xf17ef,
-        0xf17f0: 0xf17f0,
-        0xf17f1: 0xf17f1,
-        0xf17f2: 0xf17f2,
-        0xf17f3: 0xf17f3,
-        0xf17f4: 0xf17f4,
-        0xf17f5: 0xf17f5,
-        0xf17f6: 0xf17f6,
-        0xf17f7: 0xf17f7,
-        0xf17f8: 0xf17f8,
-        0xf17f9: 0xf17f9,
-        0xf17fa: 0xf17fa,
-        0xf17fb: 0xf17fb,
-        0xf17fc: 0xf17fc,
-        0xf17fd: 0xf17fd,
-        0xf17fe: 0xf17fe,
-        0xf17ff: 0xf17ff,
-        0xf1800: 0xf1800,
-        0xf1801: 0xf1801,
-        0xf1802: 0xf1802,
-        0xf1803: 0xf1803,
-        0xf1804: 0xf1804,
-        0xf1805: 0xf1805,
-        0xf1806: 0xf1806,
-        0xf1807: 0xf1807,
-        0xf1808: 0xf1808,
-        0xf1809: 0xf1809,
-        0xf180a: 0xf180a,
-        0xf180b: 0xf180b,
-        0xf180c: 0xf180c,
-        0xf180d: 0xf180d,
-        0xf180e: 0xf180e,
-        0xf180f: 0xf180f,
-        0xf1810: 0xf1810,
-        0xf1811: 0xf1811,
-        0xf1812: 0xf1812,
-        0xf1813: 0xf1813,
-        0xf1814: 0xf1814,
-        0xf1815: 0xf1815,
-        0xf1816: 0xf1816,
-        0xf1817: 0xf1817,
-        0xf1818: 0xf1818,
-        0xf1819: 0xf1819,
-        0xf181a: 0xf181a,
-        0xf181b: 0xf181b,
-        0xf181c: 0xf181c,
-        0xf181d: 0xf181d,
-        0xf181e: 0xf181e,
-        0xf181f: 0xf181f,
-        0xf1820: 0xf1820,
-        0xf1821: 0xf1821,
-        0xf1822: 0xf1822,
-        0xf1823: 0xf1823,
-        0xf1824: 0xf1824,
-        0xf1825: 0xf1825,
-        0xf1826: 0xf1826,
-        0xf1827: 0xf1827,
-        0xf1828: 0xf1828,
-        0xf1829: 0xf1829,
-        0xf182a: 0xf182a,
-        0xf182b: 0xf182b,
-        0xf182c: 0xf182c,
-        0xf182d: 0xf182d,
-        0xf182e: 0xf182e,
-        0xf182f: 0xf182f,
-        0xf1830: 0xf1830,
-        0xf1831: 0xf1831,
-        0xf1832: 0xf1832,
-        0xf1833: 0xf1833,
-        0xf1834: 0xf1834,
-        0xf1835: 0xf1835,
-        0xf1836: 0xf1836,
-        0xf1837: 0xf1837,
-        0xf1838: 0xf1838,
-        0xf1839: 0xf1839,
-        0xf183a: 0xf183a,
-        0xf183b: 0xf183b,
-        0xf183c: 0xf183c,
-        0xf183d: 0xf183d,
-        0xf183e: 0xf183e,
-        0xf183f: 0xf183f,
-        0xf1840: 0xf1840,
-        0xf1841: 0xf1841,
-        0xf1842: 0xf1842,
-        0xf1843: 0xf1843,
-        0xf1844: 0xf1844,
-        0xf1845: 0xf1845,
-        0xf1846: 0xf1846,
-        0xf1847: 0xf1847,
-        0xf1848: 0xf1848,
-        0xf1849: 0xf1849,
-        0xf184a: 0xf184a,
-        0xf184b: 0xf184b,
-        0xf184c: 0xf184c,
-        0xf184d: 0xf184d,
-        0xf184e: 0xf184e,
-        0xf184f: 0xf184f,
-        0xf1850: 0xf1850,
-        0xf1851: 0xf1851,
-        0xf1852: 0xf1852,
-        0xf1853: 0xf1853,
-        0xf1854: 0xf1854,
-        0xf1855: 0xf1855,
-        0xf1856: 0xf1856,
-        0xf1857: 0xf1857,
-        0xf1858: 0xf1858,
-        0xf1859: 0xf1859,
-        0xf185a: 0xf185a,
-        0xf185b: 0xf185b,
-        0xf185c: 0xf185c,
-        0xf185d: 0xf185d,
-        0xf185e: 0xf185e,
-        0xf185f: 0xf185f,
-        0xf1860: 0xf1860,
-        0xf1861: 0xf1861,
-        0xf1862: 0xf1862,
-        0xf1863: 0xf1863,
-        0xf1864: 0xf1864,
-        0xf1865: 0xf1865,
-        0xf1866: 0xf1866,
-        0xf1867: 0xf1867,
-        0xf1868: 0xf1868,
-        0xf1869: 0xf1869,
-        0xf186a: 0xf186a,
-        0xf186b: 0xf186b,
-        0xf186c: 0xf186c,
-        0xf186d: 0xf186d,
-        0xf186e: 0xf186e,
-        0xf186f: 0xf186f,
-        0xf1870: 0xf1870,
-        0xf1871: 0xf1871,
-        0xf1872: 0xf1872,
-        0xf1873: 0xf1873,
-        0xf1874: 0xf1874,
-        0xf1875: 0xf1875,
-        0xf1876: 0xf1876,
-        0xf1877: 0xf1877,
-        0xf1878: 0xf1878,
-        0xf1879: 0xf1879,
-        0xf187a: 0xf187a,
-        0xf187b: 0xf187b,
-        0xf187c: 0xf187c,
-        0xf187d: 0xf187d,
-        0xf187e: 0xf187e,
-        0xf187f: 0xf187f,
-        0xf1880: 0xf1880,
-        0xf1881: 0xf1881,
-        0xf1882: 0xf1882,
-        0xf1883: 0xf1883,
-        0xf1884: 0xf1884,
-        0xf1885: 0xf1885,
-        0xf1886: 0xf1886,
-        0xf1887: 0xf1887,
-        0xf1888: 0xf1888,
-        0xf1889: 0xf1889,
-        0xf188a: 0xf188a,
-        0xf188b: 0xf188b,
-        0xf188c: 0xf188c,
-        0xf188d: 0xf188d,
-        0xf188e: 0xf188e,
-        0xf188f: 0xf188f,
-        0xf1890: 0xf1890,
-        0xf1891: 0xf1891,
-        0xf1892: 0xf1892,
-        0xf1893: 0xf1893,
-        0xf1894: 0xf1894,
-        0xf1895: 0xf1895,
-        0xf1896: 0xf1896,
-        0xf1897: 0xf1897,
-        0xf1898: 0xf1898,
-        0xf1899: 0xf1899,
-        0xf189a: 0xf189a,
-        0xf189b: 0xf189b,
-        0xf189c: 0xf189c,
-        0xf189d: 0xf189d,
-        0xf189e: 0xf189e,
-        0xf189f: 0xf189f,
-        0xf18a0: 0xf18a0,
-        0xf18a1: 0xf18a1,
-        0xf18a2: 0xf18a2,
-        0xf18a3: 0xf18a3,
-        0xf18a4: 0xf18a4,
-        0xf18a5: 0xf18a5,
-        0xf18a6: 0xf18a6,
-        0xf18a7: 0xf18a7,
-        0xf18a8: 0xf18a8,
-        0xf18a9: 0xf18a9,
-        0xf18aa: 0xf18aa,
-        0xf18ab: 0xf18ab,
-        0xf18ac: 0xf18ac,
-        0xf18ad: 0xf18ad,
-        0xf18ae: 0xf18ae,
-        0xf18af: 0xf18af,
-        0xf18b0: 0xf18b0,
-        0xf18b1: 0xf18b1,
-        0xf18b2: 0xf18b2,
-        0xf18b3: 0xf18b3,
-        0xf18b4: 0xf18b4,
-        0xf18b5: 0xf18b5,
-        0xf18b6: 0xf18b6,
-        0xf18b7: 0xf18b7,
-        0xf18b8: 0xf18b8,
-        0xf18b9: 0xf18b9,
-        0xf18ba: 0xf18ba,
-        0xf18bb: 0xf18bb,
-        0xf18bc: 0xf18bc,
-        0xf18bd: 0xf18bd,
-        0xf18be: 0xf18be,
-        0xf18bf: 0xf18bf,
-        0xf18c0: 0xf18c0,
-        0xf18c1: 0xf18c1,
-        0xf18c2: 0xf18c2,
-        0xf18c3: 0xf18c3,
-        0xf18c4: 0xf18c4,
-        0xf18c5: 0xf18c5,
-        0xf18c6: 0xf18c6,
-        0xf18c7: 0xf18c7,
-        0xf18c8: 0xf18c8,
-        0xf18c9: 0xf18c9,
-        0xf18ca: 0xf18ca,
-        0xf18cb: 0xf18cb,
-        0xf18cc: 0xf18cc,
-        0xf18cd: 0xf18cd,
-        0xf18ce: 0xf18ce,
-        0xf18cf: 0xf18cf,
-        0xf18d0: 0xf18d0,
-        0xf18d1: 0xf18d1,
-        0xf18d2: 0xf18d2,
-        0xf18d3: 0xf18d3,
-        0xf18d4: 0xf18d4,
-        0xf18d5: 0xf18d5,
-        0xf18d6: 0xf18d6,
-        0xf18d7: 0xf18d7,
-        0xf18d8: 0xf18d8,
-        0xf18d9: 0xf18d9,
-        0xf18da: 0xf18da,
-        0xf18db: 0xf18db,
-        0xf18dc: 0xf18dc,
-        0xf18dd: 0xf18dd,
-        0xf18de: 0xf18de,
-        0xf18df: 0xf18df,
-        0xf18e0: 0xf18e0,
-        0xf18e1: 0xf18e1,
-        0xf18e2: 0xf18e2,
-        0xf18e3: 0xf18e3,
-        0xf18e4: 0xf18e4,
-        0xf18e5: 0xf18e5,
-        0xf18e6: 0xf18e6,
-        0xf18e7: 0xf18e7,
-        0xf18e8: 0xf18e8,
-        0xf18e9: 0xf18e9,
-        0xf18ea: 0xf18ea,
-        0xf18eb: 0xf18eb,
-        0xf18ec: 0xf18ec,
-        0xf18ed: 0xf18ed,
-        0xf18ee: 0xf18ee,
-        0xf18ef: 0xf18ef,
-        0xf18f0: 0xf18f0,
-        0xf18f1: 0xf18f1,
-        0xf18f2: 0xf18f2,
-        0xf18f3: 0xf18f3,
-        0xf18f4: 0xf18f4,
-        0xf18f5: 0xf18f5,
-        0xf18f6: 0xf18f6,
-        0xf18f7: 0xf18f7,
-        0xf18f8: 0xf18f8,
-        0xf18f9: 0xf18f9,
-        0xf18fa: 0xf18fa,
-        0xf18fb: 0xf18fb,
-        0xf18fc: 0xf18fc,
-        0xf18fd: 0xf18fd,
-        0xf18fe: 0xf18fe,
-        0xf18ff: 0xf18ff,
-        0xf1900: 0xf1900,
-        0xf1901: 0xf1901,
-        0xf1902: 0xf1902,
-        0xf1903: 0xf1903,
-        0xf1904: 0xf1904,
-        0xf1905: 0xf1905,
-        0xf1906: 0xf1906,
-        0xf1907: 0xf1907,
-        0xf1908: 0xf1908,
-        0xf1909: 0xf1909,
-        0xf190a: 0xf190a,
-        0xf190b: 0xf190b,
-        0xf190c: 0xf190c,
-        0xf190d: 0xf190d,
-        0xf190e: 0xf190e,
-        0xf190f: 0xf190f,
-        0xf1910: 0xf1910,
-        0xf1911: 0xf1911,
-        0xf1912: 0xf1912,
-        0xf1913: 0xf1913,
-        0xf1914: 0xf1914,
-        0xf1915: 0xf1915,
-        0xf1916: 0xf1916,
-        0xf1917: 0xf1917,
-        0xf1918: 0xf1918,
-        0xf1919: 0xf1919,
-        0xf191a: 0xf191a,
-        0xf191b: 0xf191b,
-        0xf191c: 0xf191c,
-        0xf191d: 0xf191d,
-        0xf191e: 0xf191e,
-        0xf191f: 0xf191f,
-        0xf1920: 0xf1920,
-        0xf1921: 0xf1921,
-        0xf1922: 0xf1922,
-        0xf1923: 0xf1923,
-        0xf1924: 0xf1924,
-        0xf1925: 0xf1925,
-        0xf1926: 0xf1926,
-        0xf1927: 0xf1927,
-        0xf1928: 0xf1928,
-        0xf1929: 0xf1929,
-        0xf192a: 0xf192a,
-        0xf192b: 0xf192b,
-        0xf192c: 0xf192c,
-        0xf192d: 0xf192d,
-        0xf192e: 0xf192e,
-        0xf192f: 0xf192f,
-        0xf1930: 0xf1930,
-        0xf1931: 0xf1931,
-        0xf1932: 0xf1932,
-        0xf1933: 0xf1933,
-        0xf1934: 0xf1934,
-        0xf1935: 0xf1935,
-        0xf1936: 0xf1936,
-        0xf1937: 0xf1937,
-        0xf1938: 0xf1938,
-        0xf1939: 0xf1939,
-        0xf193a: 0xf193a,
-        0xf193b: 0xf193b,
-        0xf193c: 0xf193c,
-        0xf193d: 0xf193d,
-        0xf193e: 0xf193e,
-        0xf193f: 0xf193f,
-        0xf1940: 0xf1940,
-        0xf1941: 0xf1941,
-        0xf1942: 0xf1942,
-        0xf1943: 0xf1943,
-        0xf1944: 0xf1944,
-        0xf1945: 0xf1945,
-        0xf1946: 0xf1946,
-        0xf1947: 0xf1947,
-        0xf1948: 0xf1948,
-        0xf1949: 0xf1949,
-        0xf194a: 0xf194a,
-        0xf194b: 0xf194b,
-        0xf194c: 0xf194c,
-        0xf194d: 0xf194d,
-        0xf194e: 0xf194e,
-        0xf194f: 0xf194f,
-        0xf1950: 0xf1950,
-        0xf1951: 0xf1951,
-        0xf1952: 0xf1952,
-        0xf1953: 0xf1953,
-        0xf1954: 0xf1954,
-        0xf1955: 0xf1955,
-        0xf1956: 0xf1956,
-        0xf1957: 0xf1957,
-        0xf1958: 0xf1958,
-        0xf1959: 0xf1959,
-        0xf195a: 0xf195a,
-        0xf195b: 0xf195b,
-        0xf195c: 0xf195c,
-        0xf195d: 0xf195d,
-        0xf195e: 0xf195e,
-        0xf195f: 0xf195f,
-        0xf1960: 0xf1960,
-        0xf1961: 0xf1961,
-        0xf1962: 0xf1962,
-        0xf1963: 0xf1963,
-        0xf1964: 0xf1964,
-        0xf1965: 0xf1965,
-        0xf1966: 0xf1966,
-        0xf1967: 0xf1967,
-        0xf1968: 0xf1968,
-        0xf1969: 0xf1969,
-        0xf196a: 0xf196a,
-        0xf196b: 0xf196b,
-        0xf196c: 0xf196c,
-        0xf196d: 0xf196d,
-        0xf196e: 0xf196e,
-        0xf196f: 0xf196f,
-        0xf1970: 0xf1970,
-        0xf1971: 0xf1971,
-        0xf1972: 0xf1972,
-        0xf1973: 0xf1973,
-        0xf1974: 0xf1974,
-        0xf1975: 0xf1975,
-        0xf1976: 0xf1976,
-        0xf1977: 0xf1977,
-        0xf1978: 0xf1978,
-        0xf1979: 0xf1979,
-        0xf197a: 0xf197a,
-        0xf197b: 0xf197b,
-        0xf197c: 0xf197c,
-        0xf197d: 0xf197d,
-        0xf197e: 0xf197e,
-        0xf197f: 0xf197f,
-        0xf1980: 0xf1980,
-        0xf1981: 0xf1981,
-        0xf1982: 0xf1982,
-        0xf1983: 0xf1983,
-        0xf1984: 0xf1984,
-        0xf1985: 0xf1985,
-        0xf1986: 0xf1986,
-        0xf1987: 0xf1987,
-        0xf1988: 0xf1988,
-        0xf1989: 0xf1989,
-        0xf198a: 0xf198a,
-        0xf198b: 0xf198b,
-        0xf198c: 0xf198c,
-        0xf198d: 0xf198d,
-        0xf198e: 0xf198e,
-        0xf198f: 0xf198f,
-        0xf1990: 0xf1990,
-        0xf1991: 0xf1991,
-        0xf1992: 0xf1992,
-        0xf1993: 0xf1993,
-        0xf1994: 0xf1994,
-        0xf1995: 0xf1995,
-        0xf1996: 0xf1996,
-        0xf1997: 0xf1997,
-        0xf1998: 0xf1998,
-        0xf1999: 0xf1999,
-        0xf199a: 0xf199a,
-        0xf199b: 0xf199b,
-        0xf199c: 0xf199c,
-        0xf199d: 0xf199d,
-        0xf199e: 0xf199e,
-        0xf199f: 0xf199f,
-        0xf19a0: 0xf19a0,
-        0xf19a1: 0xf19a1,
-        0xf19a2: 0xf19a2,
-        0xf19a3: 0xf19a3,
-        0xf19a4: 0xf19a4,
-        0xf19a5: 0xf19a5,
-        0xf19a6: 0xf19a6,
-        0xf19a7: 0xf19a7,
-        0xf19a8: 0xf19a8,
-        0xf19a9: 0xf19a9,
-        0xf19aa: 0xf19aa,
-        0xf19ab: 0xf19ab,
-        0xf19ac: 0xf19ac,
-        0xf19ad: 0xf19ad,
-        0xf19ae: 0xf19ae,
-        0xf19af: 0xf19af,
-        0xf19b0: 0xf19b0,
-        0xf19b1: 0xf19b1,
-        0xf19b2: 0xf19b2,
-        0xf19b3: 0xf19b3,
-        0xf19b4: 0xf19b4,
-        0xf19b5: 0xf19b5,
-        0xf19b6: 0xf19b6,
-        0xf19b7: 0xf19b7,
-        0xf19b8: 0xf19b8,
-        0xf19b9: 0xf19b9,
-        0xf19ba: 0xf19ba,
-        0xf19bb: 0xf19bb,
-        0xf19bc: 0xf19bc,
-        0xf19bd: 0xf19bd,
-        0xf19be: 0xf19be,
-        0xf19bf: 0xf19bf,
-        0xf19c0: 0xf19c0,
-        0xf19c1: 0xf19c1,
-        0xf19c2: 0xf19c2,
-        0xf19c3: 0xf19c3,
-        0xf19c4: 0xf19c4,
-        0xf19c5: 0xf19c5,
-        0xf19c6: 0xf19c6,
-        0xf19c7: 0xf19c7,
-        0xf19c8: 0xf19c8,
-        0xf19c9: 0xf19c9,
-        0xf19ca: 0xf19ca,
-        0xf19cb: 0xf19cb,
-        0xf19cc: 0xf19cc,
-        0xf19cd: 0xf19cd,
-        0xf19ce: 0xf19ce,
-        0xf19cf: 0xf19cf,
-        0xf19d0: 0xf19d0,
-        0xf19d1: 0xf19d1,
-        0xf19d2: 0xf19d2,
-        0xf19d3: 0xf19d3,
-        0xf19d4: 0xf19d4,
-        0xf19d5: 0xf19d5,
-        0xf19d6: 0xf19d6,
-        0xf19d7: 0xf19d7,
-        0xf19d8: 0xf19d8,
-        0xf19d9: 0xf19d9,
-        0xf19da: 0xf19da,
-        0xf19db: 0xf19db,
-        0xf19dc: 0xf19dc,
-        0xf19dd: 0xf19dd,
-        0xf19de: 0xf19de,
-        0xf19df: 0xf19df,
-        0xf19e0: 0xf19e0,
-        0xf19e1: 0xf19e1,
-        0xf19e2: 0xf19e2,
-        0xf19e3: 0xf19e3,
-        0xf19e4: 0xf19e4,
-        0xf19e5: 0xf19e5,
-        0xf19e6: 0xf19e6,
-        0xf19e7: 0xf19e7,
-        0xf19e8: 0xf19e8,
-        0xf19e9: 0xf19e9,
-        0xf19ea: 0xf19ea,
-        0xf19eb: 0xf19eb,
-        0xf19ec: 0xf19ec,
-        0xf19ed: 0xf19ed,
-        0xf19ee: 0xf19ee,
-        0xf19ef: 0xf19ef,
-        0xf19f0: 0xf19f0,
-        0xf19f1: 0xf19f1,
-        0xf19f2: 0xf19f2,
-        0xf19f3: 0xf19f3,
-        0xf19f4: 0xf19f4,
-        0xf19f5: 0xf19f5,
-        0xf19f6: 0xf19f6,
-        0xf19f7: 0xf19f7,
-        0xf19f8: 0xf19f8,
-        0xf19f9: 0xf19f9,
-        0xf19fa: 0xf19fa,
-        0xf19fb: 0xf19fb,
-        0xf19fc: 0xf19fc,
-        0xf19fd: 0xf19fd,
-        0xf19fe: 0xf19fe,
-        0xf19ff: 0xf19ff,
-        0xf1a00: 0xf1a00,
-        0xf1a01: 0xf1a01,
-        0xf1a02: 0xf1a02,
-        0xf1a03: 0xf1a03,
-        0xf1a04: 0xf1a04,
-        0xf1a05: 0xf1a05,
-        0xf1a06: 0xf1a06,
-        0xf1a07: 0xf1a07,
-        0xf1a08: 0xf1a08,
-        0xf1a09: 0xf1a09,
-        0xf1a0a: 0xf1a0a,
-        0xf1a0b: 0xf1a0b,
-        0xf1a0c: 0xf1a0c,
-        0xf1a0d: 0xf1a0d,
-        0xf1a0e: 0xf1a0e,
-        0xf1a0f: 0xf1a0f,
-        0xf1a10: 0xf1a10,
-        0xf1a11: 0xf1a11,
-        0xf1a12: 0xf1a12,
-        0xf1a13: 0xf1a13,
-        0xf1a14: 0xf1a14,
-        0xf1a15: 0xf1a15,
-        0xf1a16: 0xf1a16,
-        0xf1a17: 0xf1a17,
-        0xf1a18: 0xf1a18,
-        0xf1a19: 0xf1a19,
-        0xf1a1a: 0xf1a1a,
-        0xf1a1b: 0xf1a1b,
-        0xf1a1c: 0xf1a1c,
-        0xf1a1d: 0xf1a1d,
-        0xf1a1e: 0xf1a1e,
-        0xf1a1f: 0xf1a1f,
-        0xf1a20: 0xf1a20,
-        0xf1a21: 0xf1a21,
-        0xf1a22: 0xf1a22,
-        0xf1a23: 0xf1a23,
-        0xf1a24: 0xf1a24,
-        0xf1a25: 0xf1a25,
-        0xf1a26: 0xf1a26,
-        0xf1a27: 0xf1a27,
-        0xf1a28: 0xf1a28,
-        0xf1a29: 0xf1a29,
-        0xf1a2a: 0xf1a2a,
-        0xf1a2b: 0xf1a2b,
-        0xf1a2c: 0xf1a2c,
-        0xf1a2d: 0xf1a2d,
-        0xf1a2e: 0xf1a2e,
-        0xf1a2f: 0xf1a2f,
-        0xf1a30: 0xf1a30,
-        0xf1a31: 0xf1a31,
-        0xf1a32: 0xf1a32,
-        0xf1a33: 0xf1a33,
-        0xf1a34: 0xf1a34,
-        0xf1a35: 0xf1a35,
-        0xf1a36: 0xf1a36,
-        0xf1a37: 0xf1a37,
-        0xf1a38: 0xf1a38,
-        0xf1a39: 0xf1a39,
-        0xf1a3a: 0xf1a3a,
-        0xf1a3b: 0xf1a3b,
-        0xf1a3c: 0xf1a3c,
-        0xf1a3d: 0xf1a3d,
-        0xf1a3e: 0xf1a3e,
-        0xf1a3f: 0xf1a3f,
-        0xf1a40: 0xf1a40,
-        0xf1a41: 0xf1a41,
-        0xf1a42: 0xf1a42,
-        0xf1a43: 0xf1a43,
-        0xf1a44: 0xf1a44,
-        0xf1a45: 0xf1a45,
-        0xf1a46: 0xf1a46,
-        0xf1a47: 0xf1a47,
-        0xf1a48: 0xf1a48,
-        0xf1a49: 0xf1a49,
-        0xf1a4a: 0xf1a4a,
-        0xf1a4b: 0xf1a4b,
-        0xf1a4c: 0xf1a4c,
-        0xf1a4d: 0xf1a4d,
-        0xf1a4e: 0xf1a4e,
-        0xf1a4f: 0xf1a4f,
-        0xf1a50: 0xf1a50,
-        0xf1a51: 0xf1a51,
-        0xf1a52: 0xf1a52,
-        0xf1a53: 0xf1a53,
-        0xf1a54: 0xf1a54,
-        0xf1a55: 0xf1a55,
-        0xf1a56: 0xf1a56,
-        0xf1a57: 0xf1a57,
-        0xf1a58: 0xf1a58,
-        0xf1a59: 0xf1a59,
-        0xf1a5a: 0xf1a5a,
-        0xf1a5b: 0xf1a5b,
-        0xf1a5c: 0xf1a5c,
-        0xf1a5d: 0xf1a5d,
-        0xf1a5e: 0xf1a5e,
-        0xf1a5f: 0xf1a5f,
-        0xf1a60: 0xf1a60,
-        0xf1a61: 0xf1a61,
-        0xf1a62: 0xf1a62,
-        0xf1a63: 0xf1a63,
-        0xf1a64: 0xf1a64,
-        0xf1a65: 0xf1a65,
-        0xf1a66: 0xf1a66,
-        0xf1a67: 0xf1a67,
-        0xf1a68: 0xf1a68,
-        0xf1a69: 0xf1a69,
-        0xf1a6a: 0xf1a6a,
-        0xf1a6b: 0xf1a6b,
-        0xf1a6c: 0xf1a6c,
-        0xf1a6d: 0xf1a6d,
-        0xf1a6e: 0xf1a6e,
-        0xf1a6f: 0xf1a6f,
-        0xf1a70: 0xf1a70,
-        0xf1a71: 0xf1a71,
-        0xf1a72: 0xf1a72,
-        0xf1a73: 0xf1a73,
-        0xf1a74: 0xf1a74,
-        0xf1a75: 0xf1a75,
-        0xf1a76: 0xf1a76,
-        0xf1a77: 0xf1a77,
-        0xf1a78: 0xf1a78,
-        0xf1a79: 0xf1a79,
-        0xf1a7a: 0xf1a7a,
-        0xf1a7b: 0xf1a7b,
-        0xf1a7c: 0xf1a7c,
-        0xf1a7d: 0xf1a7d,
-        0xf1a7e: 0xf1a7e,
-        0xf1a7f: 0xf1a7f,
-        0xf1a80: 0xf1a80,
-        0xf1a81: 0xf1a81,
-        0xf1a82: 0xf1a82,
-        0xf1a83: 0xf1a83,
-        0xf1a84: 0xf1a84,
-        0xf1a85: 0xf1a85,
-        0xf1a86: 0xf1a86,
-        0xf1a87: 0xf1a87,
-        0xf1a88: 0xf1a88,
-        0xf1a89: 0xf1a89,
-        0xf1a8a: 0xf1a8a,
-        0xf1a8b: 0xf1a8b,
-        0xf1a8c: 0xf1a8c,
-        0xf1a8d: 0xf1a8d,
-        0xf1a8e: 0xf1a8e,
-        0xf1a8f: 0xf1a8f,
-        0xf1a90: 0xf1a90,
-        0xf1a91: 0xf1a91,
-        0xf1a92: 0xf1a92,
-        0xf1a93: 0xf1a93,
-        0xf1a94: 0xf1a94,
-        0xf1a95: 0xf1a95,
-        0xf1a96: 0xf1a96,
-        0xf1a97: 0xf1a97,
-        0xf1a98: 0xf1a98,
-        0xf1a99: 0xf1a99,
-        0xf1a9a: 0xf1a9a,
-        0xf1a9b: 0xf1a9b,
-        0xf1a9c: 0xf1a9c,
-        0xf1a9d: 0xf1a9d,
-        0xf1a9e: 0xf1a9e,
-        0xf1a9f: 0xf1a9f,
-        0xf1aa0: 0xf1aa0,
-        0xf1aa1: 0xf1aa1,
-        0xf1aa2: 0xf1aa2,
-        0xf1aa3: 0xf1aa3,
-        0xf1aa4: 0xf1aa4,
-        0xf1aa5: 0xf1aa5,
-        0xf1aa6: 0xf1aa6,
-        0xf1aa7: 0xf1aa7,
-        0xf1aa8: 0xf1aa8,
-        0xf1aa9: 0xf1aa9,
-        0xf1aaa: 0xf1aaa,
-        0xf1aab: 0xf1aab,
-        0xf1aac: 0xf1aac,
-        0xf1aad: 0xf1aad,
-        0xf1aae: 0xf1aae,
-        0xf1aaf: 0xf1aaf,
-        0xf1ab0: 0xf1ab0,
-        0xf1ab1: 0xf1ab1,
-        0xf1ab2: 0xf1ab2,
-        0xf1ab3: 0xf1ab3,
-        0xf1ab4: 0xf1ab4,
-        0xf1ab5: 0xf1ab5,
-        0xf1ab6: 0xf1ab6,
-        0xf1ab7: 0xf1ab7,
-        0xf1ab8: 0xf1ab8,
-        0xf1ab9: 0xf1ab9,
-        0xf1aba: 0xf1aba,
-        0xf1abb: 0xf1abb,
-        0xf1abc: 0xf1abc,
-        0xf1abd: 0xf1abd,
-        0xf1abe: 0xf1abe,
-        0xf1abf: 0xf1abf,
-        0xf1ac0: 0xf1ac0,
-        0xf1ac1: 0xf1ac1,
-        0xf1ac2: 0xf1ac2,
-        0xf1ac3: 0xf1ac3,
-        0xf1ac4: 0xf1ac4,
-        0xf1ac5: 0xf1ac5,
-        0xf1ac6: 0xf1ac6,
-        0xf1ac7: 0xf1ac7,
-        0xf1ac8: 0xf1ac8,
-        0xf1ac9: 0xf1ac9,
-        0xf1aca: 0xf1aca,
-        0xf1acb: 0xf1acb,
-        0xf1acc: 0xf1acc,
-        0xf1acd: 0xf1acd,
-        0xf1ace: 0xf1ace,
-        0xf1acf: 0xf1acf,
-        0xf1ad0: 0xf1ad0,
-        0xf1ad1: 0xf1ad1,
-        0xf1ad2: 0xf1ad2,
-        0xf1ad3: 0xf1ad3,
-        0xf1ad4: 0xf1ad4,
-        0xf1ad5: 0xf1ad5,
-        0xf1ad6: 0xf1ad6,
-        0xf1ad7: 0xf1ad7,
-        0xf1ad8: 0xf1ad8,
-        0xf1ad9: 0xf1ad9,
-        0xf1ada: 0xf1ada,
-        0xf1adb: 0xf1adb,
-        0xf1adc: 0xf1adc,
-        0xf1add: 0xf1add,
-        0xf1ade: 0xf1ade,
-        0xf1adf: 0xf1adf,
-        0xf1ae0: 0xf1ae0,
-        0xf1ae1: 0xf1ae1,
-        0xf1ae2: 0xf1ae2,
-        0xf1ae3: 0xf1ae3,
-        0xf1ae4: 0xf1ae4,
-        0xf1ae5: 0xf1ae5,
-        0xf1ae6: 0xf1ae6,
-        0xf1ae7: 0xf1ae7,
-        0xf1ae8: 0xf1ae8,
-        0xf1ae9: 0xf1ae9,
-        0xf1aea: 0xf1aea,
-        0xf1aeb: 0xf1aeb,
-        0xf1aec: 0xf1aec,
-        0xf1aed: 0xf1aed,
-        0xf1aee: 0xf1aee,
-        0xf1aef: 0xf1aef,
-        0xf1af0: 0xf1af0,
-    },
-    "Weather Icons": {
-        0xf000: 0xe300,
-        0xf001: 0xe301,
-        0xf002: 0xe302,
-        0xf003: 0xe303,
-        0xf004: 0xe304,
-        0xf005: 0xe305,
-        0xf006: 0xe306,
-        0xf007: 0xe307,
-        0xf008: 0xe308,
-        0xf009: 0xe309,
-        0xf00a: 0xe30a,
-        0xf00b: 0xe30b,
-        0xf00c: 0xe30c,
-        0xf00d: 0xe30d,
-        0xf00e: 0xe30e,
-        0xf010: 0xe30f,
-        0xf011: 0xe310,
-        0xf012: 0xe311,
-        0xf013: 0xe312,
-        0xf014: 0xe313,
-        0xf015: 0xe314,
-        0xf016: 0xe315,
-        0xf017: 0xe316,
-        0xf018: 0xe317,
-        0xf019: 0xe318,
-        0xf01a: 0xe319,
-        0xf01b: 0xe31a,
-        0xf01c: 0xe31b,
-        0xf01d: 0xe31c,
-        0xf01e: 0xe31d,
-        0xf021: 0xe31e,
-        0xf022: 0xe31f,
-        0xf023: 0xe320,
-        0xf024: 0xe321,
-        0xf025: 0xe322,
-        0xf026: 0xe323,
-        0xf027: 0xe324,
-        0xf028: 0xe325,
-        0xf029: 0xe326,
-        0xf02a: 0xe327,
-        0xf02b: 0xe328,
-        0xf02c: 0xe329,
-        0xf02d: 0xe32a,
-        0xf02e: 0xe32b,
-        0xf02f: 0xe32c,
-        0xf030: 0xe32d,
-        0xf031: 0xe32e,
-        0xf032: 0xe32f,
-        0xf033: 0xe330,
-        0xf034: 0xe331,
-        0xf035: 0xe332,
-        0xf036: 0xe333,
-        0xf037: 0xe334,
-        0xf038: 0xe335,
-        0xf039: 0xe336,
-        0xf03a: 0xe337,
-        0xf03b: 0xe338,
-        0xf03c: 0xe339,
-        0xf03d: 0xe33a,
-        0xf03e: 0xe33b,
-        0xf040: 0xe33c,
-        0xf041: 0xe33d,
-        0xf042: 0xe33e,
-        0xf043: 0xe33f,
-        0xf044: 0xe340,
-        0xf045: 0xe341,
-        0xf046: 0xe342,
-        0xf047: 0xe343,
-        0xf048: 0xe344,
-        0xf049: 0xe345,
-        0xf04a: 0xe346,
-        0xf04b: 0xe347,
-        0xf04c: 0xe348,
-        0xf04d: 0xe349,
-        0xf04e: 0xe34a,
-        0xf050: 0xe34b,
-        0xf051: 0xe34c,
-        0xf052: 0xe34d,
-        0xf053: 0xe34e,
-        0xf054: 0xe34f,
-        0xf055: 0xe350,
-        0xf056: 0xe351,
-        0xf057: 0xe352,
-        0xf058: 0xe353,
-        0xf059: 0xe354,
-        0xf05a: 0xe355,
-        0xf05b: 0xe356,
-        0xf05c: 0xe357,
-        0xf05d: 0xe358,
-        0xf05e: 0xe359,
-        0xf060: 0xe35a,
-        0xf061: 0xe35b,
-        0xf062: 0xe35c,
-        0xf063: 0xe35d,
-        0xf064: 0xe35e,
-        0xf065: 0xe35f,
-        0xf066: 0xe360,
-        0xf067: 0xe361,
-        0xf068: 0xe362,
-        0xf069: 0xe363,
-        0xf06a: 0xe364,
-        0xf06b: 0xe365,
-        0xf06c: 0xe366,
-        0xf06d: 0xe367,
-        0xf06e: 0xe368,
-        0xf070: 0xe369,
-        0xf071: 0xe36a,
-        0xf072: 0xe36b,
-        0xf073: 0xe36c,
-        0xf074: 0xe36d,
-        0xf075: 0xe36e,
-        0xf076: 0xe36f,
-        0xf077: 0xe370,
-        0xf078: 0xe371,
-        0xf079: 0xe372,
-        0xf07a: 0xe373,
-        0xf07b: 0xe374,
-        0xf07c: 0xe375,
-        0xf07d: 0xe376,
-        0xf07e: 0xe377,
-        0xf080: 0xe378,
-        0xf081: 0xe379,
-        0xf082: 0xe37a,
-        0xf083: 0xe37b,
-        0xf084: 0xe37c,
-        0xf085: 0xe37d,
-        0xf086: 0xe37e,
-        0xf087: 0xe37f,
-        0xf088: 0xe380,
-        0xf089: 0xe381,
-        0xf08a: 0xe382,
-        0xf08b: 0xe383,
-        0xf08c: 0xe384,
-        0xf08d: 0xe385,
-        0xf08e: 0xe386,
-        0xf08f: 0xe387,
-        0xf090: 0xe388,
-        0xf091: 0xe389,
-        0xf092: 0xe38a,
-        0xf093: 0xe38b,
-        0xf094: 0xe38c,
-        0xf095: 0xe38d,
-        0xf096: 0xe38e,
-        0xf097: 0xe38f,
-        0xf098: 0xe390,
-        0xf099: 0xe391,
-        0xf09a: 0xe392,
-        0xf09b: 0xe393,
-        0xf09c: 0xe394,
-        0xf09d: 0xe395,
-        0xf09e: 0xe396,
-        0xf09f: 0xe397,
-        0xf0a0: 0xe398,
-        0xf0a1: 0xe399,
-        0xf0a2: 0xe39a,
-        0xf0a3: 0xe39b,
-        0xf0a4: 0xe39c,
-        0xf0a5: 0xe39d,
-        0xf0a6: 0xe39e,
-        0xf0a7: 0xe39f,
-        0xf0a8: 0xe3a0,
-        0xf0a9: 0xe3a1,
-        0xf0aa: 0xe3a2,
-        0xf0ab: 0xe3a3,
-        0xf0ac: 0xe3a4,
-        0xf0ad: 0xe3a5,
-        0xf0ae: 0xe3a6,
-        0xf0af: 0xe3a7,
-        0xf0b0: 0xe3a8,
-        0xf0b1: 0xe3a9,
-        0xf0b2: 0xe3aa,
-        0xf0b3: 0xe3ab,
-        0xf0b4: 0xe3ac,
-        0xf0b5: 0xe3ad,
-        0xf0b6: 0xe3ae,
-        0xf0b7: 0xe3af,
-        0xf0b8: 0xe3b0,
-        0xf0b9: 0xe3b1,
-        0xf0ba: 0xe3b2,
-        0xf0bb: 0xe3b3,
-        0xf0bc: 0xe3b4,
-        0xf0bd: 0xe3b5,
-        0xf0be: 0xe3b6,
-        0xf0bf: 0xe3b7,
-        0xf0c0: 0xe3b8,
-        0xf0c1: 0xe3b9,
-        0xf0c2: 0xe3ba,
-        0xf0c3: 0xe3bb,
-        0xf0c4: 0xe3bc,
-        0xf0c5: 0xe3bd,
-        0xf0c6: 0xe3be,
-        0xf0c7: 0xe3bf,
-        0xf0c8: 0xe3c0,
-        0xf0c9: 0xe3c1,
-        0xf0ca: 0xe3c2,
-        0xf0cb: 0xe3c3,
-        0xf0cc: 0xe3c4,
-        0xf0cd: 0xe3c5,
-        0xf0ce: 0xe3c6,
-        0xf0cf: 0xe3c7,
-        0xf0d0: 0xe3c8,
-        0xf0d1: 0xe3c9,
-        0xf0d2: 0xe3ca,
-        0xf0d3: 0xe3cb,
-        0xf0d4: 0xe3cc,
-        0xf0d5: 0xe3cd,
-        0xf0d6: 0xe3ce,
-        0xf0d7: 0xe3cf,
-        0xf0d8: 0xe3d0,
-        0xf0d9: 0xe3d1,
-        0xf0da: 0xe3d2,
-        0xf0db: 0xe3d3,
-        0xf0dc: 0xe3d4,
-        0xf0dd: 0xe3d5,
-        0xf0de: 0xe3d6,
-        0xf0df: 0xe3d7,
-        0xf0e0: 0xe3d8,
-        0xf0e1: 0xe3d9,
-        0xf0e2: 0xe3da,
-        0xf0e3: 0xe3db,
-        0xf0e4: 0xe3dc,
-        0xf0e5: 0xe3dd,
-        0xf0e6: 0xe3de,
-        0xf0e7: 0xe3df,
-        0xf0e8: 0xe3e0,
-        0xf0e9: 0xe3e1,
-        0xf0ea: 0xe3e2,
-        0xf0eb: 0xe3e3,
-    },
-    "Font Logos": {
-        0xf300: 0xf300,
-        0xf301: 0xf301,
-        0xf302: 0xf302,
-        0xf303: 0xf303,
-        0xf304: 0xf304,
-        0xf305: 0xf305,
-        0xf306: 0xf306,
-        0xf307: 0xf307,
-        0xf308: 0xf308,
-        0xf309: 0xf309,
-        0xf30a: 0xf30a,
-        0xf30b: 0xf30b,
-        0xf30c: 0xf30c,
-        0xf30d: 0xf30d,
-        0xf30e: 0xf30e,
-        0xf30f: 0xf30f,
-        0xf310: 0xf310,
-        0xf311: 0xf311,
-        0xf312: 0xf312,
-        0xf313: 0xf313,
-        0xf314: 0xf314,
-        0xf315: 0xf315,
-        0xf316: 0xf316,
-        0xf317: 0xf317,
-        0xf318: 0xf318,
-        0xf319: 0xf319,
-        0xf31a: 0xf31a,
-        0xf31b: 0xf31b,
-        0xf31c: 0xf31c,
-        0xf31d: 0xf31d,
-        0xf31e: 0xf31e,
-        0xf31f: 0xf31f,
-        0xf320: 0xf320,
-        0xf321: 0xf321,
-        0xf322: 0xf322,
-        0xf323: 0xf323,
-        0xf324: 0xf324,
-        0xf325: 0xf325,
-        0xf326: 0xf326,
-        0xf327: 0xf327,
-        0xf328: 0xf328,
-        0xf329: 0xf329,
-        0xf32a: 0xf32a,
-        0xf32b: 0xf32b,
-        0xf32c: 0xf32c,
-        0xf32d: 0xf32d,
-        0xf32e: 0xf32e,
-        0xf32f: 0xf32f,
-        0xf330: 0xf330,
-        0xf331: 0xf331,
-        0xf332: 0xf332,
-        0xf333: 0xf333,
-        0xf334: 0xf334,
-        0xf335: 0xf335,
-        0xf336: 0xf336,
-        0xf337: 0xf337,
-        0xf338: 0xf338,
-        0xf339: 0xf339,
-        0xf33a: 0xf33a,
-        0xf33b: 0xf33b,
-        0xf33c: 0xf33c,
-        0xf33d: 0xf33d,
-        0xf33e: 0xf33e,
-        0xf33f: 0xf33f,
-        0xf340: 0xf340,
-        0xf341: 0xf341,
-        0xf342: 0xf342,
-        0xf343: 0xf343,
-        0xf344: 0xf344,
-        0xf345: 0xf345,
-        0xf346: 0xf346,
-        0xf347: 0xf347,
-        0xf348: 0xf348,
-        0xf349: 0xf349,
-        0xf34a: 0xf34a,
-        0xf34b: 0xf34b,
-        0xf34c: 0xf34c,
-        0xf34d: 0xf34d,
-        0xf34e: 0xf34e,
-        0xf34f: 0xf34f,
-        0xf350: 0xf350,
-        0xf351: 0xf351,
-        0xf352: 0xf352,
-        0xf353: 0xf353,
-        0xf354: 0xf354,
-        0xf355: 0xf355,
-        0xf356: 0xf356,
-        0xf357: 0xf357,
-        0xf358: 0xf358,
-        0xf359: 0xf359,
-        0xf35a: 0xf35a,
-        0xf35b: 0xf35b,
-        0xf35c: 0xf35c,
-        0xf35d: 0xf35d,
-        0xf35e: 0xf35e,
-        0xf35f: 0xf35f,
-        0xf360: 0xf360,
-        0xf361: 0xf361,
-        0xf362: 0xf362,
-        0xf363: 0xf363,
-        0xf364: 0xf364,
-        0xf365: 0xf365,
-        0xf366: 0xf366,
-        0xf367: 0xf367,
-        0xf368: 0xf368,
-        0xf369: 0xf369,
-        0xf36a: 0xf36a,
-        0xf36b: 0xf36b,
-        0xf36c: 0xf36c,
-        0xf36d: 0xf36d,
-        0xf36e: 0xf36e,
-        0xf36f: 0xf36f,
-        0xf370: 0xf370,
-        0xf371: 0xf371,
-        0xf372: 0xf372,
-        0xf373: 0xf373,
-        0xf374: 0xf374,
-        0xf375: 0xf375,
-        0xf376: 0xf376,
-        0xf377: 0xf377,
-        0xf378: 0xf378,
-        0xf379: 0xf379,
-        0xf37a: 0xf37a,
-        0xf37b: 0xf37b,
-        0xf37c: 0xf37c,
-        0xf37d: 0xf37d,
-        0xf37e: 0xf37e,
-        0xf37f: 0xf37f,
-        0xf380: 0xf380,
-        0xf381: 0xf381,
-    },
-    "Octicons": {
-        0xf000: 0xf400,
-        0xf001: 0xf401,
-        0xf002: 0xf402,
-        0xf005: 0xf403,
-        0xf006: 0xf404,
-        0xf007: 0xf405,
-        0xf008: 0xf406,
-        0xf009: 0xf407,
-        0xf00a: 0xf408,
-        0xf00b: 0xf409,
-        0xf00c: 0xf40a,
-        0xf00d: 0xf40b,
-        0xf00e: 0xf40c,
-        0xf010: 0xf40d,
-        0xf011: 0xf40e,
-        0xf012: 0xf40f,
-        0xf013: 0xf410,
-        0xf014: 0xf411,
-        0xf015: 0xf412,
-        0xf016: 0xf413,
-        0xf017: 0xf414,
-        0xf018: 0xf415,
-        0xf019: 0xf416,
-        0xf01f: 0xf417,
-        0xf020: 0xf418,
-        0xf023: 0xf419,
-        0xf024: 0xf41a,
-        0xf026: 0xf41b,
-        0xf027: 0xf41c,
-        0xf028: 0xf41d,
-        0xf02a: 0xf41e,
-        0xf02b: 0xf41f,
-        0xf02c: 0xf420,
-        0xf02d: 0xf421,
-        0xf02e: 0xf422,
-        0xf02f: 0xf423,
-        0xf030: 0xf424,
-        0xf031: 0xf425,
-        0xf032: 0xf426,
-        0xf033: 0xf427,
-        0xf034: 0xf428,
-        0xf035: 0xf429,
-        0xf036: 0xf42a,
-        0xf037: 0xf42b,
-        0xf038: 0xf42c,
-        0xf039: 0xf42d,
-        0xf03a: 0xf42e,
-        0xf03b: 0xf42f,
-        0xf03c: 0xf430,
-        0xf03d: 0xf431,
-        0xf03e: 0xf432,
-        0xf03f: 0xf433,
-        0xf040: 0xf434,
-        0xf041: 0xf435,
-        0xf042: 0xf436,
-        0xf043: 0xf437,
-        0xf044: 0xf438,
-        0xf045: 0xf439,
-        0xf046: 0xf43a,
-        0xf047: 0xf43b,
-        0xf048: 0xf43c,
-        0xf049: 0xf43d,
-        0xf04a: 0xf43e,
-        0xf04c: 0xf43f,
-        0xf04d: 0xf440,
-        0xf04e: 0xf441,
-        0xf04f: 0xf442,
-        0xf051: 0xf443,
-        0xf052: 0xf444,
-        0xf053: 0xf445,
-        0xf056: 0xf446,
-        0xf057: 0xf447,
-        0xf058: 0xf448,
-        0xf059: 0xf449,
-        0xf05a: 0xf44a,
-        0xf05b: 0xf44b,
-        0xf05c: 0xf44c,
-        0xf05d: 0xf44d,
-        0xf05e: 0xf44e,
-        0xf05f: 0xf44f,
-        0xf060: 0xf450,
-        0xf061: 0xf451,
-        0xf062: 0xf452,
-        0xf063: 0xf453,
-        0xf064: 0xf454,
-        0xf068: 0xf455,
-        0xf06a: 0xf456,
-        0xf06b: 0xf457,
-        0xf06c: 0xf458,
-        0xf06d: 0xf459,
-        0xf06e: 0xf45a,
-        0xf070: 0xf45b,
-        0xf071: 0xf45c,
-        0xf075: 0xf45d,
-        0xf076: 0xf45e,
-        0xf077: 0xf45f,
-        0xf078: 0xf460,
-        0xf07b: 0xf461,
-        0xf07c: 0xf462,
-        0xf07d: 0xf463,
-        0xf07e: 0xf464,
-        0xf07f: 0xf465,
-        0xf080: 0xf466,
-        0xf081: 0xf467,
-        0xf084: 0xf468,
-        0xf085: 0xf469,
-        0xf087: 0xf46a,
-        0xf088: 0xf46b,
-        0xf08c: 0xf46c,
-        0xf08d: 0xf46d,
-        0xf08f: 0xf46e,
-        0xf091: 0xf46f,
-        0xf092: 0xf470,
-        0xf094: 0xf471,
-        0xf096: 0xf472,
-        0xf097: 0xf473,
-        0xf099: 0xf474,
-        0xf09a: 0xf475,
-        0xf09c: 0xf476,
-        0xf09d: 0xf477,
-        0xf09f: 0xf478,
-        0xf0a0: 0xf479,
-        0xf0a1: 0xf47a,
-        0xf0a2: 0xf47b,
-        0xf0a3: 0xf47c,
-        0xf0a4: 0xf47d,
-        0xf0aa: 0xf47e,
-        0xf0ac: 0xf47f,
-        0xf0ad: 0xf480,
-        0xf0b0: 0xf481,
-        0xf0b1: 0xf482,
-        0xf0b2: 0xf483,
-        0xf0b6: 0xf484,
-        0xf0ba: 0xf485,
-        0xf0be: 0xf486,
-        0xf0c4: 0xf487,
-        0xf0c5: 0xf488,
-        0xf0c8: 0xf489,
-        0xf0c9: 0xf48a,
-        0xf0ca: 0xf48b,
-        0xf0cc: 0xf48c,
-        0xf0cf: 0xf48d,
-        0xf0d0: 0xf48e,
-        0xf0d1: 0xf48f,
-        0xf0d2: 0xf490,
-        0xf0d3: 0xf491,
-        0xf0d4: 0xf492,
-        0xf0d6: 0xf493,
-        0xf0d7: 0xf494,
-        0xf0d8: 0xf495,
-        0xf0da: 0xf496,
-        0xf0db: 0xf497,
-        0xf0dc: 0xf498,
-        0xf0dd: 0xf499,
-        0xf0de: 0xf49a,
-        0xf0e0: 0xf49b,
-        0xf0e1: 0xf49c,
-        0xf0e2: 0xf49d,
-        0xf0e3: 0xf49e,
-        0xf0e4: 0xf49f,
-        0xf0e5: 0xf4a0,
-        0xf0e6: 0xf4a1,
-        0xf0e7: 0xf4a2,
-        0xf0e8: 0xf4a3,
-        0xf101: 0xf4a4,
-        0xf102: 0xf4a5,
-        0xf103: 0xf4a6,
-        0xf104: 0xf4a7,
-        0xf105: 0xf4a8,
-        0x2665: 0x2665,
-        0x26a1: 0x26a1,
-        0xf27c: 0xf4a9,
-        0xf27d: 0xf4aa,
-        0xf27e: 0xf4ab,
-        0xf27f: 0xf4ac,
-        0xf280: 0xf4ad,
-        0xf281: 0xf4ae,
-        0xf282: 0xf4af,
-        0xf283: 0xf4b0,
-        0xf284: 0xf4b1,
-        0xf285: 0xf4b2,
-        0xf286: 0xf4b3,
-        0xf287: 0xf4b4,
-        0xf288: 0xf4b5,
-        0xf289: 0xf4b6,
-        0xf28a: 0xf4b7,
-        0xf28b: 0xf4b8,
-        0xf28c: 0xf4b9,
-        0xf28d: 0xf4ba,
-        0xf28e: 0xf4bb,
-        0xf28f: 0xf4bc,
-        0xf290: 0xf4bd,
-        0xf291: 0xf4be,
-        0xf292: 0xf4bf,
-        0xf293: 0xf4c0,
-        0xf294: 0xf4c1,
-        0xf295: 0xf4c2,
-        0xf296: 0xf4c3,
-        0xf297: 0xf4c4,
-        0xf298: 0xf4c5,
-        0xf299: 0xf4c6,
-        0xf29a: 0xf4c7,
-        0xf29b: 0xf4c8,
-        0xf29c: 0xf4c9,
-        0xf29d: 0xf4ca,
-        0xf29e: 0xf4cb,
-        0xf29f: 0xf4cc,
-        0xf2a0: 0xf4cd,
-        0xf2a1: 0xf4ce,
-        0xf2a2: 0xf4cf,
-        0xf2a3: 0xf4d0,
-        0xf2a4: 0xf4d1,
-        0xf2a5: 0xf4d2,
-        0xf2a6: 0xf4d3,
-        0xf2a7: 0xf4d4,
-        0xf2a8: 0xf4d5,
-        0xf2a9: 0xf4d6,
-        0xf2aa: 0xf4d7,
-        0xf2ab: 0xf4d8,
-        0xf2ac: 0xf4d9,
-        0xf2ad: 0xf4da,
-        0xf2ae: 0xf4db,
-        0xf2af: 0xf4dc,
-        0xf2b0: 0xf4dd,
-        0xf2b1: 0xf4de,
-        0xf2b2: 0xf4df,
-        0xf2b3: 0xf4e0,
-        0xf2b4: 0xf4e1,
-        0xf2b5: 0xf4e2,
-        0xf2b6: 0xf4e3,
-        0xf2b7: 0xf4e4,
-        0xf2b8: 0xf4e5,
-        0xf2b9: 0xf4e6,
-        0xf2ba: 0xf4e7,
-        0xf2bb: 0xf4e8,
-        0xf2bc: 0xf4e9,
-        0xf2bd: 0xf4ea,
-        0xf2be: 0xf4eb,
-        0xf2bf: 0xf4ec,
-        0xf2c0: 0xf4ed,
-        0xf2c1: 0xf4ee,
-        0xf2c2: 0xf4ef,
-        0xf2c3: 0xf4f0,
-        0xf2c4: 0xf4f1,
-        0xf2c5: 0xf4f2,
-        0xf2c6: 0xf4f3,
-        0xf2c7: 0xf4f4,
-        0xf2c8: 0xf4f5,
-        0xf2c9: 0xf4f6,
-        0xf2ca: 0xf4f7,
-        0xf2cb: 0xf4f8,
-        0xf2cc: 0xf4f9,
-        0xf2cd: 0xf4fa,
-        0xf2ce: 0xf4fb,
-        0xf2cf: 0xf4fc,
-        0xf2d0: 0xf4fd,
-        0xf2d1: 0xf4fe,
-        0xf2d2: 0xf4ff,
-        0xf2d3: 0xf500,
-        0xf2d4: 0xf501,
-        0xf2d5: 0xf502,
-        0xf2d6: 0xf503,
-        0xf2d7: 0xf504,
-        0xf2d8: 0xf505,
-        0xf2d9: 0xf506,
-        0xf2da: 0xf507,
-        0xf2db: 0xf508,
-        0xf2dc: 0xf509,
-        0xf2dd: 0xf50a,
-        0xf2de: 0xf50b,
-        0xf2df: 0xf50c,
-        0xf2e0: 0xf50d,
-        0xf2e1: 0xf50e,
-        0xf2e2: 0xf50f,
-        0xf2e3: 0xf510,
-        0xf2e4: 0xf511,
-        0xf2e5: 0xf512,
-        0xf2e6: 0xf513,
-        0xf2e7: 0xf514,
-        0xf2e8: 0xf515,
-        0xf2e9: 0xf516,
-        0xf2ea: 0xf517,
-        0xf2eb: 0xf518,
-        0xf2ec: 0xf519,
-        0xf2ed: 0xf51a,
-        0xf2ee: 0xf51b,
-        0xf2ef: 0xf51c,
-        0xf2f0: 0xf51d,
-        0xf2f1: 0xf51e,
-        0xf2f2: 0xf51f,
-        0xf2f3: 0xf520,
-        0xf2f4: 0xf521,
-        0xf2f5: 0xf522,
-        0xf2f6: 0xf523,
-        0xf2f7: 0xf524,
-        0xf2f8: 0xf525,
-        0xf2f9: 0xf526,
-        0xf2fa: 0xf527,
-        0xf2fb: 0xf528,
-        0xf2fc: 0xf529,
-        0xf2fd: 0xf52a,
-        0xf2fe: 0xf52b,
-        0xf2ff: 0xf52c,
-        0xf300: 0xf52d,
-        0xf301: 0xf52e,
-        0xf302: 0xf52f,
-        0xf303: 0xf530,
-        0xf304: 0xf531,
-        0xf305: 0xf532,
-        0xf306: 0xf533,
-    },
-    "Codicons": {
-        0xea60: 0xea60,
-        0xea61: 0xea61,
-        0xea62: 0xea62,
-        0xea63: 0xea63,
-        0xea64: 0xea64,
-        0xea65: 0xea65,
-        0xea66: 0xea66,
-        0xea67: 0xea67,
-        0xea68: 0xea68,
-        0xea69: 0xea69,
-        0xea6a: 0xea6a,
-        0xea6b: 0xea6b,
-        0xea6c: 0xea6c,
-        0xea6d: 0xea6d,
-        0xea6e: 0xea6e,
-        0xea6f: 0xea6f,
-        0xea70: 0xea70,
-        0xea71: 0xea71,
-        0xea72: 0xea72,
-        0xea73: 0xea73,
-        0xea74: 0xea74,
-        0xea75: 0xea75,
-        0xea76: 0xea76,
-        0xea77: 0xea77,
-        0xea78: 0xea78,
-        0xea79: 0xea79,
-        0xea7a: 0xea7a,
-        0xea7b: 0xea7b,
-        0xea7c: 0xea7c,
-        0xea7d: 0xea7d,
-        0xea7e: 0xea7e,
-        0xea7f: 0xea7f,
-        0xea80: 0xea80,
-        0xea81: 0xea81,
-        0xea82: 0xea82,
-        0xea83: 0xea83,
-        0xea84: 0xea84,
-        0xea85: 0xea85,
-        0xea86: 0xea86,
-        0xea87: 0xea87,
-        0xea88: 0xea88,
-        0xea8a: 0xea8a,
-        0xea8b: 0xea8b,
-        0xea8c: 0xea8c,
-        0xea8f: 0xea8f,
-        0xea90: 0xea90,
-        0xea91: 0xea91,
-        0xea92: 0xea92,
-        0xea93: 0xea93,
-        0xea94: 0xea94,
-        0xea95: 0xea95,
-        0xea96: 0xea96,
-        0xea97: 0xea97,
-        0xea98: 0xea98,
-        0xea99: 0xea99,
-        0xea9a: 0xea9a,
-        0xea9b: 0xea9b,
-        0xea9c: 0xea9c,
-        0xea9d: 0xea9d,
-        0xea9e: 0xea9e,
-        0xea9f: 0xea9f,
-        0xeaa0: 0xeaa0,
-        0xeaa1: 0xeaa1,
-        0xeaa2: 0xeaa2,
-        0xeaa3: 0xeaa3,
-        0xeaa4: 0xeaa4,
-        0xeaa5: 0xeaa5,
-        0xeaa6: 0xeaa6,
-        0xeaa7: 0xeaa7,
-        0xeaa8: 0xeaa8,
-        0xeaa9: 0xeaa9,
-        0xeaaa: 0xeaaa,
-        0xeaab: 0xeaab,
-        0xeaac: 0xeaac,
-        0xeaad: 0xeaad,
-        0xeaae: 0xeaae,
-        0xeaaf: 0xeaaf,
-        0xeab0: 0xeab0,
-        0xeab1: 0xeab1,
-        0xeab2: 0xeab2,
-        0xeab3: 0xeab3,
-        0xeab4: 0xeab4,
-        0xeab5: 0xeab5,
-        0xeab6: 0xeab6,
-        0xeab7: 0xeab7,
-        0xeab8: 0xeab8,
-        0xeab9: 0xeab9,
-        0xeaba: 0xeaba,
-        0xeabb: 0xeabb,
-        0xeabc: 0xeabc,
-        0xeabd: 0xeabd,
-        0xeabe: 0xeabe,
-        0xeabf: 0xeabf,
-        0xeac0: 0xeac0,
-        0xeac1: 0xeac1,
-        0xeac2: 0xeac2,
-        0xeac3: 0xeac3,
-        0xeac4: 0xeac4,
-        0xeac5: 0xeac5,
-        0xeac6: 0xeac6,
-        0xeac7: 0xeac7,
-        0xeac9: 0xeac9,
-        0xeacc: 0xeacc,
-        0xeacd: 0xeacd,
-        0xeace: 0xeace,
-        0xeacf: 0xeacf,
-        0xead0: 0xead0,
-        0xead1: 0xead1,
-        0xead2: 0xead2,
-        0xead3: 0xead3,
-        0xead4: 0xead4,
-        0xead5: 0xead5,
-        0xead6: 0xead6,
-        0xead7: 0xead7,
-        0xead8: 0xead8,
-        0xead9: 0xead9,
-        0xeada: 0xeada,
-        0xeadb: 0xeadb,
-        0xeadc: 0xeadc,
-        0xeadd: 0xeadd,
-        0xeade: 0xeade,
-        0xeadf: 0xeadf,
-        0xeae0: 0xeae0,
-        0xeae1: 0xeae1,
-        0xeae2: 0xeae2,
-        0xeae3: 0xeae3,
-        0xeae4: 0xeae4,
-        0xeae5: 0xeae5,
-        0xeae6: 0xeae6,
-        0xeae7: 0xeae7,
-        0xeae8: 0xeae8,
-        0xeae9: 0xeae9,
-        0xeaea: 0xeaea,
-        0xeaeb: 0xeaeb,
-        0xeaec: 0xeaec,
-        0xeaed: 0xeaed,
-        0xeaee: 0xeaee,
-        0xeaef: 0xeaef,
-        0xeaf0: 0xeaf0,
-        0xeaf1: 0xeaf1,
-        0xeaf2: 0xeaf2,
-        0xeaf3: 0xeaf3,
-        0xeaf4: 0xeaf4,
-        0xeaf5: 0xeaf5,
-        0xeaf6: 0xeaf6,
-        0xeaf7: 0xeaf7,
-        0xeaf8: 0xeaf8,
-        0xeaf9: 0xeaf9,
-        0xeafa: 0xeafa,
-        0xeafb: 0xeafb,
-        0xeafc: 0xeafc,
-        0xeafd: 0xeafd,
-        0xeafe: 0xeafe,
-        0xeaff: 0xeaff,
-        0xeb00: 0xeb00,
-        0xeb01: 0xeb01,
-        0xeb02: 0xeb02,
-        0xeb03: 0xeb03,
-        0xeb04: 0xeb04,
-        0xeb05: 0xeb05,
-        0xeb06: 0xeb06,
-        0xeb07: 0xeb07,
-        0xeb08: 0xeb08,
-        0xeb09: 0xeb09,
-        0xeb0b: 0xeb0b,
-        0xeb0c: 0xeb0c,
-        0xeb0d: 0xeb0d,
-        0xeb0e: 0xeb0e,
-        0xeb0f: 0xeb0f,
-        0xeb10: 0xeb10,
-        0xeb11: 0xeb11,
-        0xeb12: 0xeb12,
-        0xeb13: 0xeb13,
-        0xeb14: 0xeb14,
-        0xeb15: 0xeb15,
-        0xeb16: 0xeb16,
-        0xeb17: 0xeb17,
-        0xeb18: 0xeb18,
-        0xeb19: 0xeb19,
-        0xeb1a: 0xeb1a,
-        0xeb1b: 0xeb1b,
-        0xeb1c: 0xeb1c,
-        0xeb1d: 0xeb1d,
-        0xeb1e: 0xeb1e,
-        0xeb1f: 0xeb1f,
-        0xeb20: 0xeb20,
-        0xeb21: 0xeb21,
-        0xeb22: 0xeb22,
-        0xeb23: 0xeb23,
-        0xeb24: 0xeb24,
-        0xeb25: 0xeb25,
-        0xeb26: 0xeb26,
-        0xeb27: 0xeb27,
-        0xeb28: 0xeb28,
-        0xeb29: 0xeb29,
-        0xeb2a: 0xeb2a,
-        0xeb2b: 0xeb2b,
-        0xeb2c: 0xeb2c,
-        0xeb2d: 0xeb2d,
-        0xeb2e: 0xeb2e,
-        0xeb2f: 0xeb2f,
-        0xeb30: 0xeb30,
-        0xeb31: 0xeb31,
-        0xeb32: 0xeb32,
-        0xeb33: 0xeb33,
-        0xeb34: 0xeb34,
-        0xeb35: 0xeb35,
-        0xeb36: 0xeb36,
-        0xeb37: 0xeb37,
-        0xeb38: 0xeb38,
-        0xeb39: 0xeb39,
-        0xeb3a: 0xeb3a,
-        0xeb3b: 0xeb3b,
-        0xeb3c: 0xeb3c,
-        0xeb3d: 0xeb3d,
-        0xeb3e: 0xeb3e,
-        0xeb3f: 0xeb3f,
-        0xeb40: 0xeb40,
-        0xeb41: 0xeb41,
-        0xeb42: 0xeb42,
-        0xeb43: 0xeb43,
-        0xeb44: 0xeb44,
-        0xeb45: 0xeb45,
-        0xeb46: 0xeb46,
-        0xeb47: 0xeb47,
-        0xeb48: 0xeb48,
-        0xeb49: 0xeb49,
-        0xeb4a: 0xeb4a,
-        0xeb4b: 0xeb4b,
-        0xeb4c: 0xeb4c,
-        0xeb4d: 0xeb4d,
-        0xeb4e: 0xeb4e,
-        0xeb50: 0xeb50,
-        0xeb51: 0xeb51,
-        0xeb52: 0xeb52,
-        0xeb53: 0xeb53,
-        0xeb54: 0xeb54,
-        0xeb55: 0xeb55,
-        0xeb56: 0xeb56,
-        0xeb57: 0xeb57,
-        0xeb58: 0xeb58,
-        0xeb59: 0xeb59,
-        0xeb5a: 0xeb5a,
-        0xeb5b: 0xeb5b,
-        0xeb5c: 0xeb5c,
-        0xeb5d: 0xeb5d,
-        0xeb5e: 0xeb5e,
-        0xeb5f: 0xeb5f,
-        0xeb60: 0xeb60,
-        0xeb61: 0xeb61,
-        0xeb62: 0xeb62,
-        0xeb63: 0xeb63,
-        0xeb64: 0xeb64,
-        0xeb65: 0xeb65,
-        0xeb66: 0xeb66,
-        0xeb67: 0xeb67,
-        0xeb68: 0xeb68,
-        0xeb69: 0xeb69,
-        0xeb6a: 0xeb6a,
-        0xeb6b: 0xeb6b,
-        0xeb6c: 0xeb6c,
-        0xeb6d: 0xeb6d,
-        0xeb6e: 0xeb6e,
-        0xeb6f: 0xeb6f,
-        0xeb70: 0xeb70,
-        0xeb71: 0xeb71,
-        0xeb72: 0xeb72,
-        0xeb73: 0xeb73,
-        0xeb74: 0xeb74,
-        0xeb75: 0xeb75,
-        0xeb76: 0xeb76,
-        0xeb77: 0xeb77,
-        0xeb78: 0xeb78,
-        0xeb79: 0xeb79,
-        0xeb7a: 0xeb7a,
-        0xeb7b: 0xeb7b,
-        0xeb7c: 0xeb7c,
-        0xeb7d: 0xeb7d,
-        0xeb7e: 0xeb7e,
-        0xeb7f: 0xeb7f,
-        0xeb80: 0xeb80,
-        0xeb81: 0xeb81,
-        0xeb82: 0xeb82,
-        0xeb83: 0xeb83,
-        0xeb84: 0xeb84,
-        0xeb85: 0xeb85,
-        0xeb86: 0xeb86,
-        0xeb87: 0xeb87,
-        0xeb88: 0xeb88,
-        0xeb89: 0xeb89,
-        0xeb8a: 0xeb8a,
-        0xeb8b: 0xeb8b,
-        0xeb8c: 0xeb8c,
-        0xeb8d: 0xeb8d,
-        0xeb8e: 0xeb8e,
-        0xeb8f: 0xeb8f,
-        0xeb90: 0xeb90,
-        0xeb91: 0xeb91,
-        0xeb92: 0xeb92,
-        0xeb93: 0xeb93,
-        0xeb94: 0xeb94,
-        0xeb95: 0xeb95,
-        0xeb96: 0xeb96,
-        0xeb97: 0xeb97,
-        0xeb98: 0xeb98,
-        0xeb99: 0xeb99,
-        0xeb9a: 0xeb9a,
-        0xeb9b: 0xeb9b,
-        0xeb9c: 0xeb9c,
-        0xeb9d: 0xeb9d,
-        0xeb9e: 0xeb9e,
-        0xeb9f: 0xeb9f,
-        0xeba0: 0xeba0,
-        0xeba1: 0xeba1,
-        0xeba2: 0xeba2,
-        0xeba3: 0xeba3,
-        0xeba4: 0xeba4,
-        0xeba5: 0xeba5,
-        0xeba6: 0xeba6,
-        0xeba7: 0xeba7,
-        0xeba8: 0xeba8,
-        0xeba9: 0xeba9,
-        0xebaa: 0xebaa,
-        0xebab: 0xebab,
-        0xebac: 0xebac,
-        0xebad: 0xebad,
-        0xebae: 0xebae,
-        0xebaf: 0xebaf,
-        0xebb0: 0xebb0,
-        0xebb1: 0xebb1,
-        0xebb2: 0xebb2,
-        0xebb3: 0xebb3,
-        0xebb4: 0xebb4,
-        0xebb5: 0xebb5,
-        0xebb6: 0xebb6,
-        0xebb7: 0xebb7,
-        0xebb8: 0xebb8,
-        0xebb9: 0xebb9,
-        0xebba: 0xebba,
-        0xebbb: 0xebbb,
-        0xebbc: 0xebbc,
-        0xebbd: 0xebbd,
-        0xebbe: 0xebbe,
-        0xebbf: 0xebbf,
-        0xebc0: 0xebc0,
-        0xebc1: 0xebc1,
-        0xebc2: 0xebc2,
-        0xebc3: 0xebc3,
-        0xebc4: 0xebc4,
-        0xebc5: 0xebc5,
-        0xebc6: 0xebc6,
-        0xebc7: 0xebc7,
-        0xebc8: 0xebc8,
-        0xebc9: 0xebc9,
-        0xebca: 0xebca,
-        0xebcb: 0xebcb,
-        0xebcc: 0xebcc,
-        0xebcd: 0xebcd,
-        0xebce: 0xebce,
-        0xebcf: 0xebcf,
-        0xebd0: 0xebd0,
-        0xebd1: 0xebd1,
-        0xebd2: 0xebd2,
-        0xebd3: 0xebd3,
-        0xebd4: 0xebd4,
-        0xebd5: 0xebd5,
-        0xebd6: 0xebd6,
-        0xebd7: 0xebd7,
-        0xebd8: 0xebd8,
-        0xebd9: 0xebd9,
-        0xebda: 0xebda,
-        0xebdb: 0xebdb,
-        0xebdc: 0xebdc,
-        0xebdd: 0xebdd,
-        0xebde: 0xebde,
-        0xebdf: 0xebdf,
-        0xebe0: 0xebe0,
-        0xebe1: 0xebe1,
-        0xebe2: 0xebe2,
-        0xebe3: 0xebe3,
-        0xebe4: 0xebe4,
-        0xebe5: 0xebe5,
-        0xebe6: 0xebe6,
-        0xebe7: 0xebe7,
-        0xebe8: 0xebe8,
-        0xebe9: 0xebe9,
-        0xebea: 0xebea,
-        0xebeb: 0xebeb,
-        0xebec: 0xebec,
-        0xebed: 0xebed,
-        0xebee: 0xebee,
-        0xebef: 0xebef,
-        0xebf0: 0xebf0,
-        0xebf1: 0xebf1,
-        0xebf2: 0xebf2,
-        0xebf3: 0xebf3,
-        0xebf4: 0xebf4,
-        0xebf5: 0xebf5,
-        0xebf6: 0xebf6,
-        0xebf7: 0xebf7,
-        0xebf8: 0xebf8,
-        0xebf9: 0xebf9,
-        0xebfa: 0xebfa,
-        0xebfb: 0xebfb,
-        0xebfc: 0xebfc,
-        0xebfd: 0xebfd,
-        0xebfe: 0xebfe,
-        0xebff: 0xebff,
-        0xec00: 0xec00,
-        0xec01: 0xec01,
-        0xec02: 0xec02,
-        0xec03: 0xec03,
-        0xec04: 0xec04,
-        0xec05: 0xec05,
-        0xec06: 0xec06,
-        0xec07: 0xec07,
-        0xec08: 0xec08,
-        0xec09: 0xec09,
-        0xec0a: 0xec0a,
-        0xec0b: 0xec0b,
-        0xec0c: 0xec0c,
-        0xec0d: 0xec0d,
-        0xec0e: 0xec0e,
-        0xec0f: 0xec0f,
-        0xec10: 0xec10,
-        0xec11: 0xec11,
-        0xec12: 0xec12,
-        0xec13: 0xec13,
-        0xec14: 0xec14,
-        0xec15: 0xec15,
-        0xec16: 0xec16,
-        0xec17: 0xec17,
-        0xec18: 0xec18,
-        0xec19: 0xec19,
-        0xec1a: 0xec1a,
-        0xec1b: 0xec1b,
-        0xec1c: 0xec1c,
-        0xec1d: 0xec1d,
-        0xec1e: 0xec1e,
-    },
+
+# Digest of the patch set definitions the tables were extracted with, see
+# codepoint_tables_digest, and of each symbol font they were extracted from.
+digest = "a5067fd780e8171b1e68dab83756f8c78b94e9afa292cb747532e14b82f8e0b2"
+source_digests = {}
+
+ranges = {
+    "Seti-UI + Custom": array(
+        "L",
+        [
+            0xe4fa, 0xe5b8, 0xe5fa,
+        ],
+    ),
+    "Heavy Angle Brackets": array(
+        "L",
+        [
+            0x276c, 0x2771, 0x276c,
+        ],
+    ),
+    "Progress Indicators": array(
+        "L",
+        [
+            0xee00, 0xee0b, 0xee00,
+        ],
+    ),
+    "Devicons": array(
+        "L",
+        [
+            0xe600, 0xe7ef, 0xe700,
+        ],
+    ),
+    "Powerline Symbols": array(
+        "L",
+        [
+            0xe0a0, 0xe0a2, 0xe0a0,
+            0xe0b0, 0xe0b3, 0xe0b0,
+        ],
+    ),
+    "Powerline Extra Symbols": array(
+        "L",
+        [
+            0x2630, 0x2630, 0x2630,
+            0xe0a3, 0xe0a3, 0xe0a3,
+            0xe0b4, 0xe0c8, 0xe0b4,
+            0xe0ca, 0xe0ca, 0xe0ca,
+            0xe0cc, 0xe0d2, 0xe0cc,
+            0xe0d4, 0xe0d4, 0xe0d4,
+            0xe0d6, 0xe0d7, 0xe0d6,
+        ],
+    ),
+    "Pomicons": array(
+        "L",
+        [
+            0xe000, 0xe00a, 0xe000,
+        ],
+    ),
+    "Font Awesome": array(
+        "L",
+        [
+            0xed00, 0xedff, 0xed00,
+            0xee0c, 0xefce, 0xee0c,
+            0xf000, 0xf2ff, 0xf000,
+        ],
+    ),
+    "Font Awesome Extension": array(
+        "L",
+        [
+            0xe000, 0xe0a9, 0xe200,
+        ],
+    ),
+    "Power Symbols": array(
+        "L",
+        [
+            0x23fb, 0x23fe, 0x23fb,
+            0x2b58, 0x2b58, 0x2b58,
+        ],
+    ),
+    "Material": array(
+        "L",
+        [
+            0xf0001, 0xf1af0, 0xf0001,
+        ],
+    ),
+    "Weather Icons": array(
+        "L",
+        [
+            0xf000, 0xf00e, 0xe300,
+            0xf010, 0xf01e, 0xe30f,
+            0xf021, 0xf03e, 0xe31e,
+            0xf040, 0xf04e, 0xe33c,
+            0xf050, 0xf05e, 0xe34b,
+            0xf060, 0xf06e, 0xe35a,
+            0xf070, 0xf07e, 0xe369,
+            0xf080, 0xf0eb, 0xe378,
+        ],
+    ),
+    "Font Logos": array(
+        "L",
+        [
+            0xf300, 0xf381, 0xf300,
+        ],
+    ),
+    "Octicons": array(
+        "L",
+        [
+            0x2665, 0x2665, 0x2665,
+            0x26a1, 0x26a1, 0x26a1,
+            0xf000, 0xf002, 0xf400,
+            0xf005, 0xf00e, 0xf403,
+            0xf010, 0xf019, 0xf40d,
+            0xf01f, 0xf020, 0xf417,
+            0xf023, 0xf024, 0xf419,
+            0xf026, 0xf028, 0xf41b,
+            0xf02a, 0xf04a, 0xf41e,
+            0xf04c, 0xf04f, 0xf43f,
+            0xf051, 0xf053, 0xf443,
+            0xf056, 0xf064, 0xf446,
+            0xf068, 0xf068, 0xf455,
+            0xf06a, 0xf06e, 0xf456,
+            0xf070, 0xf071, 0xf45b,
+            0xf075, 0xf078, 0xf45d,
+            0xf07b, 0xf081, 0xf461,
+            0xf084, 0xf085, 0xf468,
+            0xf087, 0xf088, 0xf46a,
+            0xf08c, 0xf08d, 0xf46c,
+            0xf08f, 0xf08f, 0xf46e,
+            0xf091, 0xf092, 0xf46f,
+            0xf094, 0xf094, 0xf471,
+            0xf096, 0xf097, 0xf472,
+            0xf099, 0xf09a, 0xf474,
+            0xf09c, 0xf09d, 0xf476,
+            0xf09f, 0xf0a4, 0xf478,
+            0xf0aa, 0xf0aa, 0xf47e,
+            0xf0ac, 0xf0ad, 0xf47f,
+            0xf0b0, 0xf0b2, 0xf481,
+            0xf0b6, 0xf0b6, 0xf484,
+            0xf0ba, 0xf0ba, 0xf485,
+            0xf0be, 0xf0be, 0xf486,
+            0xf0c4, 0xf0c5, 0xf487,
+            0xf0c8, 0xf0ca, 0xf489,
+            0xf0cc, 0xf0cc, 0xf48c,
+            0xf0cf, 0xf0d4, 0xf48d,
+            0xf0d6, 0xf0d8, 0xf493,
+            0xf0da, 0xf0de, 0xf496,
+            0xf0e0, 0xf0e8, 0xf49b,
+            0xf101, 0xf105, 0xf4a4,
+            0xf27c, 0xf306, 0xf4a9,
+        ],
+    ),
+    "Codicons": array(
+        "L",
+        [
+            0xea60, 0xea88, 0xea60,
+            0xea8a, 0xea8c, 0xea8a,
+            0xea8f, 0xeac7, 0xea8f,
+            0xeac9, 0xeac9, 0xeac9,
+            0xeacc, 0xeb09, 0xeacc,
+            0xeb0b, 0xeb4e, 0xeb0b,
+            0xeb50, 0xec1e, 0xeb50,
+        ],
+    ),
 }
+
+
+class CodepointTable(Mapping[int, int]):
+    """Read-only dict view of the codepoint table of a patch set."""
+
+    def __init__(self, ranges: array) -> None:
+        self._ranges = ranges
+        self._starts = ranges[0::3]
+
+    def __getitem__(self, cp: int) -> int:
+        i = bisect_right(self._starts, cp) - 1
+        if i >= 0 and cp <= self._ranges[3 * i + 1]:
+            return self._ranges[3 * i + 2] + cp - self._starts[i]
+        raise KeyError(cp)
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(0, len(self._ranges), 3):
+            yield from range(self._ranges[i], self._ranges[i + 1] + 1)
+
+    def __len__(self) -> int:
+        return sum(
+            self._ranges[i + 1] - self._ranges[i] + 1
+            for i in range(0, len(self._ranges), 3)
+        )
+
+
+cp_tables = {name: CodepointTable(table) for name, table in ranges.items()}
+
+
+def lookup(set_name: str, cp: int) -> int | None:
+    """Get the Nerd Font codepoint of `cp` in the original font of a patch set."""
+    return cp_tables[set_name].get(cp)
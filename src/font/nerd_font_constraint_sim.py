@@ -0,0 +1,730 @@
+"""
+This file simulates how the renderer applies the Nerd Font constraints generated
+by nerd_font_codegen.py, so that changes to them can be checked without building
+Ghostty and looking at the result. It is a NumPy port of
+`RenderOptions.Constraint.constrain` in face.zig and of the bits of the
+FreeType face that surround it. It places every constrained glyph of the
+Symbols Nerd Font at every cell size in a sweep, for constraint widths 1 and 2,
+in a few batched array passes.
+
+It flags two kinds of problems:
+
+- overflow, where a glyph sticks out of the cells available to it by more than
+  `--tolerance` pixels, beyond what negative padding asks for;
+- misalignment, where a stretched glyph, which is meant to connect to its
+  neighbors, stops short of a cell edge by less than a pixel, leaving a seam.
+
+The cell metrics are derived like Metrics.calc does, from the vertical metrics
+of a primary font (JetBrains Mono by default), scaled so that the face is
+exactly as high as the cell. The face is taken to be exactly as wide as the
+cell, so that every combination of cell width and height can be swept, as if
+set with `adjust-cell-width`.
+
+Pass `--check` to instead verify the simulator against the expectations of the
+"Constraints" test in face.zig.
+
+This script requires Python 3.12 or greater, the `fontTools` and `numpy` python
+modules, and has to live next to nerd_font_codegen.py. Like it, it takes the
+path to a copy of the SymbolsNerdFont (not Mono!) font as its first argument.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import redirect_stdout
+from fontTools.ttLib import TTFont
+from io import StringIO
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+import nerd_font_codegen as codegen
+from embedded_metrics_codegen import vertical_metrics
+
+SIZES = {"none": 0, "fit": 1, "cover": 2, "fit_cover1": 3, "stretch": 4}
+ALIGNS = {"none": 0, "start": 1, "end": 2, "center": 3, "center1": 4}
+HEIGHTS = {"cell": 0, "icon": 1}
+
+NONE = 0
+FIT, COVER, FIT_COVER1, STRETCH = 1, 2, 3, 4
+START, END, CENTER, CENTER1 = 1, 2, 3, 4
+ICON = 1
+
+# The fields of a Constraint and their defaults, see face.zig.
+CONSTRAINT_DEFAULTS: dict[str, float] = {
+    "size": SIZES["none"],
+    "align_vertical": ALIGNS["none"],
+    "align_horizontal": ALIGNS["none"],
+    "pad_top": 0.0,
+    "pad_left": 0.0,
+    "pad_right": 0.0,
+    "pad_bottom": 0.0,
+    "relative_width": 1.0,
+    "relative_height": 1.0,
+    "relative_x": 0.0,
+    "relative_y": 0.0,
+    "max_xy_ratio": np.nan,
+    "max_constraint_width": 2,
+    "height": HEIGHTS["cell"],
+}
+
+# Glyphs placed in a batch of cell sizes at once, times the number of sizes.
+BATCH_ELEMENTS = 1 << 20
+
+
+class Constraints(NamedTuple):
+    """Constraint fields, one array element per glyph."""
+
+    size: np.ndarray
+    align_vertical: np.ndarray
+    align_horizontal: np.ndarray
+    pad_top: np.ndarray
+    pad_left: np.ndarray
+    pad_right: np.ndarray
+    pad_bottom: np.ndarray
+    relative_width: np.ndarray
+    relative_height: np.ndarray
+    relative_x: np.ndarray
+    relative_y: np.ndarray
+    # NaN where there is no maximum.
+    max_xy_ratio: np.ndarray
+    max_constraint_width: np.ndarray
+    height: np.ndarray
+
+
+class Boxes(NamedTuple):
+    """Glyph boxes in pixels, relative to the bottom left of the cell, like
+    `GlyphSize` in face.zig."""
+
+    width: np.ndarray
+    height: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+
+class Metrics(NamedTuple):
+    """The fields of Metrics that constraints depend on."""
+
+    cell_width: np.ndarray
+    cell_height: np.ndarray
+    cell_baseline: np.ndarray
+    icon_height: np.ndarray
+    icon_height_single: np.ndarray
+    face_width: np.ndarray
+    face_height: np.ndarray
+    face_y: np.ndarray
+
+
+class FaceMetrics(NamedTuple):
+    """Vertical metrics of the primary font, in ems."""
+
+    ascent: float
+    descent: float
+    line_gap: float
+    cap_height: float
+
+    @property
+    def line_height(self) -> float:
+        return self.ascent - self.descent + self.line_gap
+
+
+def zig_round(x: np.ndarray) -> np.ndarray:
+    """Round half away from zero, like @round, unlike np.round."""
+    return np.copysign(np.floor(np.abs(x) + 0.5), x)
+
+
+def parse_constraint(c: codegen.ZigConstraint) -> dict[str, float]:
+    """Turn a constraint as emitted into numbers, filling in the defaults."""
+    fields = CONSTRAINT_DEFAULTS.copy()
+    for field, value in c.items():
+        if field == "size":
+            fields[field] = SIZES[str(value).lstrip(".")]
+        elif field.startswith("align_"):
+            fields[field] = ALIGNS[str(value).lstrip(".")]
+        elif field == "height":
+            fields[field] = HEIGHTS[str(value).lstrip(".")]
+        else:
+            fields[field] = float(value)
+    return fields
+
+
+def constraint_arrays(constraints: Iterable[codegen.ZigConstraint]) -> Constraints:
+    rows = [parse_constraint(c) for c in constraints]
+    return Constraints(
+        *(
+            np.array([row[field] for row in rows], dtype=np.float64)
+            for field in Constraints._fields
+        )
+    )
+
+
+def face_metrics(font: TTFont) -> FaceMetrics:
+    """Read the vertical metrics the FreeType face would use, in ems."""
+    upm = font["head"].unitsPerEm
+    ascent, descent, line_gap = vertical_metrics(font)
+    os2 = font["OS/2"] if "OS/2" in font else None
+    cap_height = os2.sCapHeight if os2 is not None and os2.version >= 2 else 0
+    if cap_height <= 0:
+        cap_height = 0.75 * ascent
+    return FaceMetrics(ascent / upm, descent / upm, line_gap / upm, cap_height / upm)
+
+
+def metrics_sweep(
+    face: FaceMetrics, widths: range, heights: range
+) -> tuple[Metrics, np.ndarray]:
+    """The metrics of every combination of cell width and height, along with
+    the pixels per em of each, as arrays of shape (1, sizes)."""
+    cell_width, cell_height = (
+        a.reshape(1, -1).astype(np.float64)
+        for a in np.meshgrid(np.array(widths), np.array(heights), indexing="ij")
+    )
+    px_per_em = cell_height / face.line_height
+    face_width = cell_width
+    face_height = face.line_height * px_per_em
+    # See Metrics.calc.
+    face_baseline = face.line_gap * px_per_em / 2 - face.descent * px_per_em
+    cell_baseline = zig_round(face_baseline - (cell_height - face_height) / 2)
+    return (
+        Metrics(
+            cell_width,
+            cell_height,
+            cell_baseline,
+            face_height,
+            (2 * face.cap_height * px_per_em + face_height) / 3,
+            face_width,
+            face_height,
+            cell_baseline - face_baseline,
+        ),
+        px_per_em,
+    )
+
+
+def scale_factors(
+    c: Constraints,
+    group: Boxes,
+    m: Metrics,
+    pads: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    min_constraint_width: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """See `Constraint.scale_factors`."""
+    pad_top, pad_left, pad_right, pad_bottom = pads
+    multi_cell = min_constraint_width > 1
+    icon_height = np.where(multi_cell, m.icon_height, m.icon_height_single)
+    height = np.where(c.height == ICON, icon_height, m.face_height)
+    pad_height_factor = 1 - (pad_bottom + pad_top)
+    width_factor = (min_constraint_width - (pad_left + pad_right)) * m.face_width
+    width_factor = width_factor / group.width
+    height_factor = pad_height_factor * height / group.height
+
+    # The single-cell factor that fit_cover1 falls back to.
+    single_height_factor = np.minimum(
+        (1 - (pad_left + pad_right)) * m.face_width / group.width,
+        pad_height_factor
+        * np.where(c.height == ICON, m.icon_height_single, m.face_height)
+        / group.height,
+    )
+
+    fit = np.minimum(1, np.minimum(width_factor, height_factor))
+    cover = np.minimum(width_factor, height_factor)
+    fit_cover1 = np.where(
+        multi_cell & (cover > 1), np.maximum(1, single_height_factor), cover
+    )
+    sizes = [c.size == FIT, c.size == COVER, c.size == FIT_COVER1, c.size == STRETCH]
+    height_factor = np.select(sizes, [fit, cover, fit_cover1, height_factor], 1.0)
+    width_factor = np.select(sizes, [fit, cover, fit_cover1, width_factor], 1.0)
+
+    # Reduce aspect ratio if required. NaN compares false, so glyphs without
+    # a maximum are left alone.
+    max_width = group.height * height_factor * c.max_xy_ratio
+    width_factor = np.where(
+        (c.size != NONE) & (group.width * width_factor > max_width),
+        max_width / group.width,
+        width_factor,
+    )
+    return width_factor, height_factor
+
+
+def constrain(
+    c: Constraints, glyph: Boxes, metrics: Metrics, constraint_width: int
+) -> Boxes:
+    """See `Constraint.constrain`. `c` and `glyph` have one row per glyph, and
+    `metrics` one column per cell size."""
+    stretch = c.size == STRETCH
+    # Stretched glyphs are scaled and aligned to the grid rather than the face,
+    # and don't get negative padding.
+    m = metrics._replace(
+        face_width=np.where(stretch, metrics.cell_width, metrics.face_width),
+        face_height=np.where(stretch, metrics.cell_height, metrics.face_height),
+        face_y=np.where(stretch, 0.0, metrics.face_y),
+    )
+    pads = tuple(
+        np.where(stretch, np.maximum(0, pad), pad)
+        for pad in (c.pad_top, c.pad_left, c.pad_right, c.pad_bottom)
+    )
+    pad_top, pad_left, pad_right, pad_bottom = pads
+
+    min_constraint_width = np.where(
+        stretch & (m.face_width > 0.9 * m.face_height),
+        1,
+        np.minimum(c.max_constraint_width, constraint_width),
+    )
+
+    group_width = glyph.width / c.relative_width
+    group_height = glyph.height / c.relative_height
+    group = Boxes(
+        group_width,
+        group_height,
+        glyph.x - group_width * c.relative_x,
+        glyph.y - group_height * c.relative_y,
+    )
+
+    width_factor, height_factor = scale_factors(
+        c, group, m, pads, min_constraint_width
+    )
+    center_x = group.x + group.width / 2
+    center_y = group.y + group.height / 2
+    width = group.width * width_factor
+    height = group.height * height_factor
+    x = center_x - width / 2
+    y = center_y - height / 2
+
+    # See `Constraint.aligned_y`.
+    start_y = m.face_y + pad_bottom * m.face_height
+    end_y = m.face_y + (m.face_height - height - pad_top * m.face_height)
+    middle_y = (start_y + end_y) / 2
+    # Without a prescribed alignment the group is kept inside the padded
+    # face, or centered if it doesn't fit.
+    kept_y = np.where(
+        end_y < start_y, middle_y, np.maximum(start_y, np.minimum(y, end_y))
+    )
+    aligned_y = np.select(
+        [
+            c.align_vertical == NONE,
+            c.align_vertical == START,
+            c.align_vertical == END,
+        ],
+        [
+            kept_y,
+            start_y,
+            end_y,
+        ],
+        middle_y,
+    )
+    y = np.where((c.size == NONE) & (c.align_vertical == NONE), y, aligned_y)
+
+    # See `Constraint.aligned_x`.
+    full_face_span = m.face_width + (min_constraint_width - 1) * m.cell_width
+    start_x = pad_left * m.face_width
+    end_x = full_face_span - width - pad_right * m.face_width
+    end1_x = m.face_width - width - pad_right * m.face_width
+    aligned_x = np.select(
+        [
+            c.align_horizontal == NONE,
+            c.align_horizontal == START,
+            c.align_horizontal == END,
+            c.align_horizontal == CENTER,
+        ],
+        [
+            np.maximum(start_x, np.minimum(x, end_x)),
+            start_x,
+            np.maximum(start_x, end_x),
+            np.maximum(start_x, (start_x + end_x) / 2),
+        ],
+        np.maximum(start_x, (start_x + end1_x) / 2),
+    )
+    x = np.where((c.size == NONE) & (c.align_horizontal == NONE), x, aligned_x)
+
+    constrained = Boxes(
+        width_factor * glyph.width,
+        height_factor * glyph.height,
+        x + width * c.relative_x,
+        y + height * c.relative_y,
+    )
+    does_anything = (
+        (c.size != NONE) | (c.align_horizontal != NONE) | (c.align_vertical != NONE)
+    )
+    return Boxes(
+        *(
+            np.where(does_anything, new, old)
+            for new, old in zip(constrained, glyph)
+        )
+    )
+
+
+def render(
+    c: Constraints, glyph: Boxes, metrics: Metrics, constraint_width: int
+) -> Boxes:
+    """Constrain the glyphs like the FreeType face does when rendering them,
+    which also re-centers non-stretched glyphs in cells wider than the face."""
+    box = constrain(c, glyph, metrics, constraint_width)
+    shift = np.where(
+        (c.size != STRETCH) & (metrics.face_width < metrics.cell_width),
+        zig_round((metrics.cell_width - metrics.face_width) / 2),
+        0.0,
+    )
+    return box._replace(x=box.x + shift)
+
+
+def find_problems(
+    c: Constraints,
+    box: Boxes,
+    metrics: Metrics,
+    constraint_width: int,
+    tolerance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Masks of the overflowing and misaligned glyphs, see the module doc."""
+    stretch = c.size == STRETCH
+    face_width = np.where(stretch, metrics.cell_width, metrics.face_width)
+    face_height = np.where(stretch, metrics.cell_height, metrics.face_height)
+    # Negative padding asks for overflow, except on stretched glyphs.
+    allowed = [
+        np.where(stretch, 0.0, np.maximum(0, -pad)) * size
+        for pad, size in (
+            (c.pad_left, face_width),
+            (c.pad_right, face_width),
+            (c.pad_bottom, face_height),
+            (c.pad_top, face_height),
+        )
+    ]
+    right = constraint_width * metrics.cell_width
+    gaps = [
+        box.x,
+        right - (box.x + box.width),
+        box.y,
+        metrics.cell_height - (box.y + box.height),
+    ]
+    shape = np.broadcast_shapes(box.x.shape, metrics.cell_width.shape)
+    overflow = np.zeros(shape, dtype=bool)
+    misaligned = overflow.copy()
+    for gap, allowance in zip(gaps, allowed):
+        overflow |= gap < -(allowance + tolerance)
+        misaligned |= stretch & (gap > tolerance) & (gap < 1)
+    return overflow, misaligned
+
+
+class Problem(NamedTuple):
+    codepoint: int
+    constraint_width: int
+    kind: str
+    cell_sizes: list[tuple[int, int]]
+
+
+def sweep(
+    codepoints: np.ndarray,
+    c: Constraints,
+    bounds: np.ndarray,
+    units_per_em: int,
+    face: FaceMetrics,
+    widths: range,
+    heights: range,
+    tolerance: float,
+) -> list[Problem]:
+    """Place every glyph at every cell size, returning its problems.
+
+    `bounds` are the outline bounds of the glyphs in font units, one
+    (xMin, yMin, xMax, yMax) row per glyph."""
+    metrics, px_per_em = metrics_sweep(face, widths, heights)
+    sizes = list(
+        zip(metrics.cell_width[0].astype(int), metrics.cell_height[0].astype(int))
+    )
+    c = Constraints(*(field.reshape(-1, 1) for field in c))
+    x_min, y_min, x_max, y_max = (column.reshape(-1, 1) for column in bounds.T)
+
+    found: dict[tuple[int, int, str], list[tuple[int, int]]] = defaultdict(list)
+    batch = max(1, BATCH_ELEMENTS // max(1, len(codepoints)))
+    for start in range(0, len(sizes), batch):
+        chunk = slice(start, start + batch)
+        m = Metrics(*(a[:, chunk] for a in metrics))
+        scale = px_per_em[:, chunk] / units_per_em
+        glyph = Boxes(
+            (x_max - x_min) * scale,
+            (y_max - y_min) * scale,
+            x_min * scale,
+            y_min * scale + m.cell_baseline,
+        )
+        # The face renders glyphs smaller than a quarter pixel as nothing.
+        visible = (glyph.width >= 0.25) & (glyph.height >= 0.25)
+        for constraint_width in (1, 2):
+            box = render(c, glyph, m, constraint_width)
+            overflow, misaligned = find_problems(
+                c, box, m, constraint_width, tolerance
+            )
+            for kind, mask in (("overflow", overflow), ("misaligned", misaligned)):
+                for i, j in zip(*np.nonzero(mask & visible)):
+                    found[int(codepoints[i]), constraint_width, kind].append(
+                        sizes[start + j]
+                    )
+
+    return [
+        Problem(cp, constraint_width, kind, cell_sizes)
+        for (cp, constraint_width, kind), cell_sizes in sorted(found.items())
+    ]
+
+
+def load_constrained_glyphs(
+    nerd_font_path: Path, glyphdir: Path | None, jobs: int, cache: bool
+) -> tuple[np.ndarray, Constraints, np.ndarray, int]:
+    """Run the codegen pipeline up to the constraint groups, returning the
+    codepoints of the constrained glyphs with an outline, their constraints,
+    their bounds in font units and the units per em of the font."""
+    project_root = Path(__file__).resolve().parents[2]
+    patcher_path = project_root / "vendor" / "nerd-fonts" / "font-patcher.py"
+    cache_path = codegen.BOUNDS_CACHE_PATH if cache else None
+    with TTFont(nerd_font_path, lazy=True) as nerd_font, redirect_stdout(StringIO()):
+        patch_sets, nf_version = codegen.load_patch_sets(
+            patcher_path, codegen.PATCH_SETS_CACHE_PATH if cache else None
+        )
+        cp_tables = codegen.generate_codepoint_tables(
+            patch_sets,
+            nerd_font,
+            nf_version,
+            codegen.symbol_font_source(glyphdir, nf_version),
+        )
+        groups = codegen.generate_constraint_groups(
+            patch_sets, nerd_font, cp_tables, nerd_font_path, jobs, cache_path
+        )
+        cmap = nerd_font.getBestCmap()
+        glyph_bounds = codegen.measure_glyphs(
+            nerd_font_path,
+            (cmap[cp] for codepoints, _ in groups for cp in codepoints),
+            jobs,
+            cache_path,
+        )
+        units_per_em = nerd_font["head"].unitsPerEm
+
+    codepoints: list[int] = []
+    constraints: list[codegen.ZigConstraint] = []
+    bounds: list[codegen.GlyphBounds] = []
+    for group, constraint in groups:
+        for cp in group:
+            if cmap[cp] in glyph_bounds:
+                codepoints.append(cp)
+                constraints.append(constraint)
+                bounds.append(glyph_bounds[cmap[cp]])
+    return (
+        np.array(codepoints),
+        constraint_arrays(constraints),
+        np.array(bounds, dtype=np.float64).reshape(-1, 4),
+        units_per_em,
+    )
+
+
+# The metrics of the "Constraints" test in face.zig.
+FACE_ZIG_METRICS = Metrics(
+    *(
+        np.array([[value]], dtype=np.float64)
+        for value in (10, 22, 5, 21.12, 44.48 / 3.0, 9.6, 21.12, 0.2)
+    )
+)
+
+# The constraints, glyphs, constraint widths and expected results of the
+# "Constraints" test in face.zig. The Nerd Font constraints are those of
+# 0xEA61 and 0xE0C0 in nerd_font_attributes.zig.
+FACE_ZIG_CASES: list[tuple[str, codegen.ZigConstraint, tuple, int, tuple]] = [
+    ("none", {}, (6.784, 15.28, 1.408, 4.84), 1, (6.784, 15.28, 1.408, 4.84)),
+    ("none", {}, (6.784, 15.28, 1.408, 4.84), 2, (6.784, 15.28, 1.408, 4.84)),
+    ("fit", {"size": ".fit"}, (10.272, 10.272, 2.864, 5.304), 1, (9.6, 9.6, 0, 5.64)),
+    (
+        "fit",
+        {"size": ".fit"},
+        (10.272, 10.272, 2.864, 5.304),
+        2,
+        (10.272, 10.272, 2.864, 5.304),
+    ),
+    (
+        "emoji",
+        {
+            "size": ".cover",
+            "align_horizontal": ".center",
+            "align_vertical": ".center",
+            "pad_left": 0.025,
+            "pad_right": 0.025,
+        },
+        (20, 20, 0.46, 1),
+        2,
+        (18.72, 18.72, 0.44, 1.4),
+    ),
+    *(
+        (
+            "0xea61",
+            {
+                "size": ".fit_cover1",
+                "height": ".icon",
+                "align_horizontal": ".center1",
+                "align_vertical": ".center1",
+                "relative_width": 0.7513020833333334,
+                "relative_height": 0.9291573452647278,
+                "relative_x": 0.0846354166666667,
+                "relative_y": 0.0708426547352722,
+            },
+            (9.015625, 13.015625, 3.015625, 3.76525),
+            constraint_width,
+            expected,
+        )
+        for constraint_width, expected in (
+            (1, (7.2125, 10.4125, 0.8125, 5.950695224719102)),
+            (2, (9.015625, 13.015625, 1.015625, 4.7483690308988775)),
+        )
+    ),
+    *(
+        (
+            "0xe0c0",
+            {
+                "size": ".stretch",
+                "align_horizontal": ".start",
+                "align_vertical": ".center1",
+                "pad_left": -0.025,
+                "pad_right": -0.025,
+                "pad_top": -0.005,
+                "pad_bottom": -0.005,
+            },
+            (16.796875, 16.46875, -0.796875, 1.7109375),
+            constraint_width,
+            (10 * constraint_width, 22, 0, 0),
+        )
+        for constraint_width in (1, 2)
+    ),
+]
+
+
+def check_face_zig_cases() -> bool:
+    """Check the simulator against the "Constraints" test in face.zig."""
+    ok = True
+    for name, constraint, glyph, constraint_width, expected in FACE_ZIG_CASES:
+        box = constrain(
+            constraint_arrays([constraint]),
+            Boxes(*(np.array([value], dtype=np.float64) for value in glyph)),
+            FACE_ZIG_METRICS,
+            constraint_width,
+        )
+        actual = tuple(float(value.item()) for value in box)
+        if not np.allclose(actual, expected):
+            print(
+                f"Error: {name} at constraint width {constraint_width}: "
+                f"expected {expected}, got {actual}"
+            )
+            ok = False
+    print(f"Info: Checked {len(FACE_ZIG_CASES)} cases from face.zig")
+    return ok
+
+
+def parse_range(value: str) -> range:
+    start, _, end = value.partition(":")
+    return range(int(start), int(end or start) + 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate the Nerd Font constraints across cell sizes."
+    )
+    parser.add_argument(
+        "nerd_font",
+        type=Path,
+        nargs="?",
+        help="path to a copy of the SymbolsNerdFont (not Mono!) font",
+    )
+    parser.add_argument(
+        "--primary",
+        type=Path,
+        default=Path(__file__).with_name("res") / "JetBrainsMonoNerdFont-Regular.ttf",
+        help="font to derive the cell metrics from (default: JetBrains Mono)",
+    )
+    parser.add_argument(
+        "--widths",
+        type=parse_range,
+        default=range(6, 41),
+        metavar="MIN:MAX",
+        help="cell widths to sweep, in pixels (default: 6:40)",
+    )
+    parser.add_argument(
+        "--heights",
+        type=parse_range,
+        default=range(12, 81),
+        metavar="MIN:MAX",
+        help="cell heights to sweep, in pixels (default: 12:80)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1 / 64,
+        help="distance in pixels below which glyph edges count as touching "
+        "(default: 1/64)",
+    )
+    parser.add_argument(
+        "--glyphdir",
+        type=Path,
+        help="read the symbol fonts from here, see nerd_font_codegen.py",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes to measure glyph outlines with "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't use or update the caches of nerd_font_codegen.py",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="check the simulator against the constraint tests in face.zig, "
+        "then exit",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="number of problems to list (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check_face_zig_cases() else 1)
+    if args.nerd_font is None:
+        parser.error("the path to the Symbols Nerd Font is required")
+
+    codepoints, constraints, bounds, units_per_em = load_constrained_glyphs(
+        args.nerd_font, args.glyphdir, args.jobs, not args.no_cache
+    )
+    with TTFont(args.primary, lazy=True) as primary:
+        face = face_metrics(primary)
+
+    start = time.perf_counter()
+    problems = sweep(
+        codepoints,
+        constraints,
+        bounds,
+        units_per_em,
+        face,
+        args.widths,
+        args.heights,
+        args.tolerance,
+    )
+    elapsed = time.perf_counter() - start
+
+    cell_sizes = len(args.widths) * len(args.heights)
+    print(
+        f"Info: Placed {len(codepoints)} glyphs at {cell_sizes} cell sizes and "
+        f"2 constraint widths in {elapsed:.1f}s"
+    )
+    for kind in ("overflow", "misaligned"):
+        of_kind = [problem for problem in problems if problem.kind == kind]
+        print(
+            f"Info: {len({problem.codepoint for problem in of_kind})} glyphs "
+            f"{'overflow' if kind == 'overflow' else 'are misaligned'} at some size"
+        )
+    for problem in sorted(problems, key=lambda p: -len(p.cell_sizes))[: args.limit]:
+        width, height = problem.cell_sizes[0]
+        print(
+            f"Error: {problem.codepoint:#x} {problem.kind} at constraint width "
+            f"{problem.constraint_width} in {len(problem.cell_sizes)} cell sizes, "
+            f"such as {width}x{height}"
+        )
+    sys.exit(1 if problems else 0)
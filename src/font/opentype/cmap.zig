@@ -0,0 +1,239 @@
+const std = @import("std");
+const sfnt = @import("sfnt.zig");
+
+/// Character to Glyph Index Mapping Table
+///
+/// This struct is focused purely on the operations we need for Ghostty,
+/// namely to be able to look up the glyph index of a codepoint in the
+/// Unicode subtable of a font. Only the format 4 and format 12 subtables
+/// are supported, which is what every font we embed uses. This struct isn't
+/// meant to be a general purpose cmap table reader.
+///
+/// References:
+/// - https://learn.microsoft.com/en-us/typography/opentype/spec/cmap
+pub const Cmap = struct {
+    /// The format of the selected subtable, 4 or 12.
+    format: sfnt.uint16,
+
+    /// The bytes of the selected subtable.
+    data: []const u8,
+
+    /// For format 4, the number of segments.
+    /// For format 12, the number of groups.
+    len: u32,
+
+    /// The (platformID, encodingID) pairs of the Unicode subtables,
+    /// in order of preference. This is the same order as FontTools'
+    /// `getBestCmap`, full repertoire subtables first.
+    const preferred = [_][2]sfnt.uint16{
+        .{ 3, 10 },
+        .{ 0, 6 },
+        .{ 0, 4 },
+        .{ 3, 1 },
+        .{ 0, 3 },
+        .{ 0, 2 },
+        .{ 0, 1 },
+        .{ 0, 0 },
+    };
+
+    /// Parse the table from raw data, selecting the
+    /// preferred Unicode subtable of a supported format.
+    pub fn init(data: []const u8) error{
+        EndOfStream,
+        CmapVersionNotSupported,
+        NoUnicodeSubtable,
+    }!Cmap {
+        var fbs = std.io.fixedBufferStream(data);
+        const reader = fbs.reader();
+
+        if (try reader.readInt(sfnt.uint16, .big) != 0) {
+            return error.CmapVersionNotSupported;
+        }
+
+        const num_tables = try reader.readInt(sfnt.uint16, .big);
+        const records = data[4..];
+        if (records.len < @as(usize, num_tables) * 8) return error.EndOfStream;
+
+        for (preferred) |ids| {
+            for (0..num_tables) |i| {
+                const record = records[i * 8 ..][0..8];
+                if (std.mem.readInt(sfnt.uint16, record[0..2], .big) != ids[0] or
+                    std.mem.readInt(sfnt.uint16, record[2..4], .big) != ids[1])
+                    continue;
+
+                const offset = std.mem.readInt(sfnt.Offset32, record[4..8], .big);
+                if (try subtable(data, offset)) |table| return table;
+            }
+        }
+
+        return error.NoUnicodeSubtable;
+    }
+
+    /// Parse the subtable at the provided offset,
+    /// or return null if its format isn't supported.
+    fn subtable(data: []const u8, offset: u32) error{EndOfStream}!?Cmap {
+        if (offset > data.len) return error.EndOfStream;
+        var fbs = std.io.fixedBufferStream(data[offset..]);
+        const reader = fbs.reader();
+
+        switch (try reader.readInt(sfnt.uint16, .big)) {
+            4 => {
+                const length = try reader.readInt(sfnt.uint16, .big);
+                _ = try reader.readInt(sfnt.uint16, .big); // language
+                const seg_count = try reader.readInt(sfnt.uint16, .big) / 2;
+                if (length > data.len - offset or length < 16 + @as(u32, seg_count) * 8)
+                    return error.EndOfStream;
+                return .{
+                    .format = 4,
+                    .data = data[offset..][0..length],
+                    .len = seg_count,
+                };
+            },
+
+            12 => {
+                _ = try reader.readInt(sfnt.uint16, .big); // reserved
+                const length = try reader.readInt(sfnt.uint32, .big);
+                _ = try reader.readInt(sfnt.uint32, .big); // language
+                const num_groups = try reader.readInt(sfnt.uint32, .big);
+                if (length > data.len - offset or length < 16 + @as(u64, num_groups) * 12)
+                    return error.EndOfStream;
+                return .{
+                    .format = 12,
+                    .data = data[offset..][0..length],
+                    .len = num_groups,
+                };
+            },
+
+            else => return null,
+        }
+    }
+
+    /// Returns the glyph index of the provided codepoint, or null if
+    /// the font has no glyph for it. Like FreeType, a mapping to the
+    /// missing glyph (glyph 0) is reported as no glyph.
+    pub fn glyphIndex(self: Cmap, cp: u32) ?u32 {
+        const glyph = switch (self.format) {
+            4 => self.glyphIndex4(cp),
+            12 => self.glyphIndex12(cp),
+            else => unreachable,
+        };
+        return if (glyph == 0) null else glyph;
+    }
+
+    /// Returns an iterator over the codepoint ranges of the subtable, the
+    /// segments of format 4 or the groups of format 12, in ascending order.
+    /// Codepoints outside of these ranges have no glyph.
+    pub fn ranges(self: Cmap) RangeIterator {
+        return .{ .cmap = self };
+    }
+
+    pub const RangeIterator = struct {
+        cmap: Cmap,
+        i: u32 = 0,
+
+        /// Returns the next inclusive range of codepoints.
+        pub fn next(self: *RangeIterator) ?[2]u32 {
+            if (self.i == self.cmap.len) return null;
+            defer self.i += 1;
+            return switch (self.cmap.format) {
+                4 => .{
+                    self.cmap.read(sfnt.uint16, self.cmap.startCodes() + self.i * 2),
+                    self.cmap.read(sfnt.uint16, end_codes + self.i * 2),
+                },
+                12 => .{
+                    self.cmap.read(sfnt.uint32, 16 + self.i * 12),
+                    self.cmap.read(sfnt.uint32, 16 + self.i * 12 + 4),
+                },
+                else => unreachable,
+            };
+        }
+    };
+
+    /// The offset of the endCode array of a format 4 subtable.
+    const end_codes = 14;
+
+    /// The offset of the startCode array of a format 4 subtable, which
+    /// is followed by the idDelta and idRangeOffset arrays.
+    fn startCodes(self: Cmap) u32 {
+        return end_codes + self.len * 2 + 2;
+    }
+
+    fn glyphIndex4(self: Cmap, cp: u32) u32 {
+        if (cp > 0xFFFF) return 0;
+
+        const seg_count = self.len;
+        const start_codes = self.startCodes();
+        const id_deltas = start_codes + seg_count * 2;
+        const id_range_offsets = id_deltas + seg_count * 2;
+
+        // Find the first segment whose end code is at least cp.
+        var lo: u32 = 0;
+        var hi: u32 = seg_count;
+        while (lo < hi) {
+            const mid = lo + (hi - lo) / 2;
+            if (self.read(sfnt.uint16, end_codes + mid * 2) < cp) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        if (lo == seg_count) return 0;
+
+        const start = self.read(sfnt.uint16, start_codes + lo * 2);
+        if (cp < start) return 0;
+
+        const delta = self.read(sfnt.uint16, id_deltas + lo * 2);
+        const range_offset_pos = id_range_offsets + lo * 2;
+        const range_offset = self.read(sfnt.uint16, range_offset_pos);
+        if (range_offset == 0) return (cp +% delta) & 0xFFFF;
+
+        // The range offset is relative to its own position in the table.
+        const pos = range_offset_pos + range_offset + (cp - start) * 2;
+        if (pos + 2 > self.data.len) return 0;
+        const glyph = self.read(sfnt.uint16, pos);
+        if (glyph == 0) return 0;
+        return (glyph +% delta) & 0xFFFF;
+    }
+
+    fn glyphIndex12(self: Cmap, cp: u32) u32 {
+        var lo: u32 = 0;
+        var hi: u32 = self.len;
+        while (lo < hi) {
+            const mid = lo + (hi - lo) / 2;
+            const group = 16 + mid * 12;
+            if (cp < self.read(sfnt.uint32, group)) {
+                hi = mid;
+            } else if (cp > self.read(sfnt.uint32, group + 4)) {
+                lo = mid + 1;
+            } else {
+                const start = self.read(sfnt.uint32, group);
+                return self.read(sfnt.uint32, group + 8) + (cp - start);
+            }
+        }
+        return 0;
+    }
+
+    fn read(self: Cmap, comptime T: type, pos: u32) T {
+        return std.mem.readInt(T, self.data[pos..][0..@sizeOf(T)], .big);
+    }
+};
+
+test "cmap" {
+    const testing = std.testing;
+    const alloc = testing.allocator;
+    const test_font = @import("../embedded.zig").julia_mono;
+
+    const font = try sfnt.SFNT.init(test_font, alloc);
+    defer font.deinit(alloc);
+
+    const cmap = try Cmap.init(font.getTable("cmap").?);
+
+    try testing.expectEqual(12, cmap.format);
+    try testing.expectEqual(3, cmap.glyphIndex(' '));
+    try testing.expectEqual(4, cmap.glyphIndex('A'));
+    try testing.expectEqual(null, cmap.glyphIndex(0xE000));
+
+    var it = cmap.ranges();
+    try testing.expectEqual([2]u32{ 0x0D, 0x0D }, it.next().?);
+    try testing.expectEqual([2]u32{ 0x20, 0x20 }, it.next().?);
+}
@@ -0,0 +1,334 @@
+"""
+This file analyzes an arbitrary symbol font the way nerd_font_codegen.py analyzes
+the Symbols Nerd Font, and writes the resulting constraints to a compact binary
+file that SymbolConstraints.zig reads at runtime. This lets icon fonts mapped
+with `font-codepoint-map` be scaled and aligned as consistently as the Nerd Font
+symbols, with group-relative metrics computed once ahead of time rather than
+glyphs being fit one at a time.
+
+What to do with the glyphs is described like a font-patcher patch set, in an
+optional JSON spec:
+
+    {
+        "default": {"align": "c", "valign": "c", "stretch": "pa", "params": {}},
+        "attributes": {
+            "0xE0B0-0xE0B3": {"align": "l", "valign": "c", "stretch": "^xy",
+                              "params": {"overlap": 0.02}}
+        },
+        "scale_groups": [["0xE0B0-0xE0B3"], ["0xF000", "0xF001", "0xF00A"]]
+    }
+
+Without a spec every glyph gets the Nerd Font default attributes, those in the
+example. Pass `--group-runs` to also put runs of consecutive codepoints whose
+glyphs have the same advance width and vertical extent in a scale group, which
+finds families of glyphs designed to line up, like progress bars and spinners.
+
+The file is little endian and consists of
+- a header: the magic "GSFC", the format version, the number of ranges, the
+  number of constraints and the SHA-256 digest of the analyzed font,
+- sorted, non-overlapping (start, end, constraint index) codepoint ranges,
+- zero padding up to a multiple of 8 bytes,
+- the deduplicated constraints, as fixed-size records, see `pack_constraint`
+  in nerd_font_codegen.py.
+
+Everything is fixed-size and aligned, so it can be used straight from a memory
+map. Pass `--check` to decode the written file and verify it against the
+analysis.
+
+Ghostty doesn't load these files at runtime yet, only SymbolConstraints.zig can
+read them. Applying them to the faces loaded for `font-codepoint-map` is left
+for a follow-up.
+
+This script requires Python 3.12 or greater and the `fontTools` python module,
+and has to live next to nerd_font_codegen.py.
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+from fontTools.ttLib import TTFont
+from pathlib import Path
+from typing import Any
+
+import nerd_font_codegen as codegen
+from nerd_font_codegen import (
+    PatchSet,
+    PatchSetAttributeEntry,
+    PatchSetAttributes,
+    ZigConstraint,
+)
+
+MAGIC = b"GSFC"
+VERSION = 1
+HEADER = struct.Struct("<4sIII32s")
+
+# The attributes of most Nerd Font symbols.
+DEFAULT_ATTRIBUTES: PatchSetAttributeEntry = {
+    "align": "c",
+    "valign": "c",
+    "stretch": "pa",
+    "params": {},
+}
+
+
+def parse_codepoints(value: str) -> list[int]:
+    """Parse a codepoint like "0xE000", or an inclusive range like
+    "0xE000-0xE0FF"."""
+    start, _, end = value.partition("-")
+    return list(range(int(start, 0), int(end or start, 0) + 1))
+
+
+def load_spec(path: Path | None) -> dict[str, Any]:
+    if path is None:
+        return {}
+    spec = json.loads(path.read_text(encoding="utf-8"))
+    unknown = spec.keys() - {"default", "attributes", "scale_groups"}
+    if unknown:
+        unknown_keys = ", ".join(sorted(unknown))
+        raise ValueError(f"Unknown keys in {path.name}: {unknown_keys}")
+    return spec
+
+
+def glyph_runs(
+    font: TTFont,
+    codepoints: list[int],
+    glyph_bounds: dict[str, codegen.GlyphBounds],
+) -> list[list[int]]:
+    """Runs of at least two consecutive codepoints whose glyphs have the same
+    advance width and vertical extent."""
+    cmap = font.getBestCmap()
+    metrics = font["hmtx"].metrics
+    runs: list[list[int]] = []
+    run: list[int] = []
+    key = None
+    for cp in codepoints:
+        bounds = glyph_bounds.get(cmap[cp])
+        this_key = (
+            None if bounds is None else (metrics[cmap[cp]][0], bounds[1], bounds[3])
+        )
+        if this_key is not None and run and run[-1] == cp - 1 and this_key == key:
+            run.append(cp)
+            continue
+        if len(run) > 1:
+            runs.append(run)
+        run = [] if this_key is None else [cp]
+        key = this_key
+    if len(run) > 1:
+        runs.append(run)
+    return runs
+
+
+def analyze(
+    font_path: Path,
+    spec: dict[str, Any],
+    codepoint_filter: set[int] | None = None,
+    group_runs: bool = False,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    mode: codegen.BoundsMode = "exact",
+) -> list[tuple[list[int], ZigConstraint]]:
+    """Compute the constraint groups of the glyphs of the font at `font_path`
+    by describing them as a single exact patch set, and running that through
+    the analysis of nerd_font_codegen.py."""
+    with TTFont(font_path, lazy=True) as font:
+        cmap = font.getBestCmap()
+        codepoints = sorted(
+            cp for cp in cmap if codepoint_filter is None or cp in codepoint_filter
+        )
+        if not codepoints:
+            raise ValueError(f"{font_path.name} maps none of the codepoints")
+
+        attributes: PatchSetAttributes = {
+            "default": spec.get("default", DEFAULT_ATTRIBUTES)
+        }
+        for key, entry in spec.get("attributes", {}).items():
+            for cp in parse_codepoints(key):
+                attributes[cp] = entry
+
+        scale_groups: list[list[int] | range] = [
+            [cp for value in group for cp in parse_codepoints(value)]
+            for group in spec.get("scale_groups", [])
+        ]
+        if group_runs:
+            glyph_bounds = codegen.measure_glyphs(
+                font_path, (cmap[cp] for cp in codepoints), jobs, cache_path, mode
+            )
+            grouped = {cp for group in scale_groups for cp in group}
+            scale_groups += [
+                run
+                for run in glyph_runs(font, codepoints, glyph_bounds)
+                if grouped.isdisjoint(run)
+            ]
+
+        patch_set: PatchSet = {
+            "Name": font_path.name,
+            "Filename": font_path.name,
+            "Exact": True,
+            "SymStart": codepoints[0],
+            "SymEnd": codepoints[-1],
+            "SrcStart": None,
+            "ScaleRules": (
+                {"ShiftMode": "", "ScaleGroups": scale_groups}
+                if scale_groups
+                else None
+            ),
+            "Attributes": attributes,
+        }
+        cp_table = {cp: cp for cp in codepoints}
+        return codegen.generate_constraint_groups(
+            [patch_set],
+            font,
+            {patch_set["Name"]: cp_table},
+            font_path,
+            jobs,
+            cache_path,
+            mode,
+        )
+
+
+def encode_constraint_file(
+    groups: list[tuple[list[int], ZigConstraint]], font_digest: bytes
+) -> bytes:
+    ranges = codegen.merge_constraint_ranges(groups, symbols=False)
+    data = bytearray(
+        HEADER.pack(MAGIC, VERSION, len(ranges), len(groups), font_digest)
+    )
+    for r in ranges:
+        data += codegen.BLOB_RANGE.pack(*r)
+    # Align the constraints, which start with bytes but end in doubles.
+    data += bytes(-len(data) % 8)
+    for _, constraint in groups:
+        data += codegen.pack_constraint(constraint)
+    return bytes(data)
+
+
+def decode_constraint_file(data: bytes) -> tuple[bytes, dict[int, bytes]]:
+    """Decode a constraint file into the font digest and the packed constraint
+    of each codepoint."""
+    magic, version, range_count, constraint_count, font_digest = HEADER.unpack_from(
+        data
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} symbol constraint file")
+    ranges_end = HEADER.size + range_count * codegen.BLOB_RANGE.size
+    constraints_offset = ranges_end + -ranges_end % 8
+    size = codegen.BLOB_CONSTRAINT.size
+    if len(data) != constraints_offset + constraint_count * size:
+        raise ValueError("Truncated symbol constraint file")
+
+    constraints: dict[int, bytes] = {}
+    for start, end, index in codegen.BLOB_RANGE.iter_unpack(
+        data[HEADER.size : ranges_end]
+    ):
+        offset = constraints_offset + index * size
+        for cp in range(start, end + 1):
+            constraints[cp] = data[offset : offset + size]
+    return font_digest, constraints
+
+
+def check_constraint_file(
+    data: bytes, groups: list[tuple[list[int], ZigConstraint]], font_digest: bytes
+) -> bool:
+    """Check that `data` maps exactly the codepoints of `groups` to their
+    constraints."""
+    digest, constraints = decode_constraint_file(data)
+    expected = {
+        cp: codegen.pack_constraint(constraint)
+        for codepoints, constraint in groups
+        for cp in codepoints
+    }
+    differing = [
+        cp
+        for cp in expected.keys() | constraints.keys()
+        if expected.get(cp) != constraints.get(cp)
+    ]
+    if digest != font_digest:
+        print("Error: The font digest doesn't match")
+    for cp in sorted(differing)[:5]:
+        print(f"Error: The constraint of {cp:#x} doesn't match")
+    return digest == font_digest and not differing
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Precompute the constraints of the glyphs of a symbol font."
+    )
+    parser.add_argument("font", type=Path, help="path to the symbol font")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="where to write the constraints (default: next to the font, with "
+        "the extension .constraints)",
+    )
+    parser.add_argument(
+        "--spec",
+        type=Path,
+        help="JSON file with the default attributes, attributes per codepoint "
+        "and scale groups, in font-patcher terms",
+    )
+    parser.add_argument(
+        "--codepoints",
+        type=lambda value: {
+            cp for part in value.split(",") for cp in parse_codepoints(part)
+        },
+        metavar="RANGES",
+        help="only analyze these comma-separated codepoints or ranges, like "
+        "0xE000-0xF8FF (default: every codepoint the font maps)",
+    )
+    parser.add_argument(
+        "--group-runs",
+        action="store_true",
+        help="put runs of consecutive glyphs with the same advance width and "
+        "vertical extent in a scale group",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes to measure glyph outlines with "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"measure every glyph outline even if it is in "
+        f"{codegen.BOUNDS_CACHE_PATH.name}",
+    )
+    parser.add_argument(
+        "--fast-bounds",
+        action="store_true",
+        help="use the bounding boxes stored in the font, see nerd_font_codegen.py",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="decode the written file and check it against the analysis",
+    )
+    args = parser.parse_args()
+
+    groups = analyze(
+        args.font,
+        load_spec(args.spec),
+        args.codepoints,
+        args.group_runs,
+        args.jobs,
+        None if args.no_cache else codegen.BOUNDS_CACHE_PATH,
+        "fast" if args.fast_bounds else "exact",
+    )
+    font_digest = bytes.fromhex(codegen.file_digest(args.font))
+    data = encode_constraint_file(groups, font_digest)
+    output = args.output or args.font.with_suffix(".constraints")
+    codegen.write_if_changed(output, data)
+    print(
+        f"Info: Wrote {len(groups)} constraints for "
+        f"{sum(len(codepoints) for codepoints, _ in groups)} codepoints to "
+        f"{output} ({len(data)} bytes)"
+    )
+
+    if args.check:
+        ok = check_constraint_file(output.read_bytes(), groups, font_digest)
+        sys.exit(0 if ok else 1)
@@ -7,6 +7,7 @@ const renderer = @import("../renderer.zig");
 const shaderpkg = renderer.Renderer.API.shaders;
 const ArrayListCollection = @import("../datastruct/array_list_collection.zig").ArrayListCollection;
 const symbols = @import("../unicode/symbols_table.zig").table;
+const mayBeDoubleWidth = @import("../font/nerd_font_attributes.zig").mayBeDoubleWidth;
 
 /// The possible cell content keys that exist.
 pub const Key = enum {
@@ -250,10 +251,17 @@ pub fn isSymbol(cp: u21) bool {
 
 /// Returns the appropriate `constraint_width` for
 /// the provided cell when rendering its glyph(s).
+///
+/// `runtime_constraint` is the constraint loaded at runtime for the face of
+/// the glyph, see SymbolConstraints, or null if the glyph is constrained by
+/// its built-in symbol class. `mayBeDoubleWidth` only knows the built-in
+/// classes, so a glyph with a runtime constraint may span two cells whenever
+/// that constraint allows it.
 pub fn constraintWidth(
     raw_slice: []const terminal.page.Cell,
     x: usize,
     cols: usize,
+    runtime_constraint: ?font.face.RenderOptions.Constraint,
 ) u2 {
     const cell = raw_slice[x];
     const cp = cell.codepoint();
@@ -266,8 +274,11 @@ pub fn constraintWidth(
 
     // We allow "symbol-like" glyphs to extend to 2 cells wide if there's
     // space, and if the previous glyph wasn't also a symbol. So if this
-    // codepoint isn't a symbol then we can return the grid width.
-    if (!isSymbol(cp)) return grid_width;
+    // codepoint isn't a symbol, or it's a Nerd Font glyph whose constraint
+    // limits it to a single cell anyway, then we can return the grid width.
+    if (runtime_constraint) |constraint| {
+        if (constraint.max_constraint_width < 2) return grid_width;
+    } else if (!mayBeDoubleWidth(cp)) return grid_width;
 
     // If we are at the end of the screen it must be constrained to one cell.
     if (x == cols - 1) return 1;
@@ -506,6 +517,43 @@ test "Contents with zero-sized screen" {
     try testing.expect(c.getCursorGlyph() == null);
 }
 
+test "symbol class matches isSymbol" {
+    if (std.valgrind.runningOnValgrind() > 0) return error.SkipZigTest;
+
+    const testing = std.testing;
+    const attrs = @import("../font/nerd_font_attributes.zig");
+
+    for (0..std.math.maxInt(u21)) |i| {
+        const cp: u21 = @intCast(i);
+        switch (attrs.getSymbolClass(cp)) {
+            .none => try testing.expect(!isSymbol(cp)),
+            .symbol => try testing.expect(isSymbol(cp)),
+            // Nerd Font glyphs include a few codepoints outside
+            // of the symbol blocks, such as the power symbols.
+            .nerd_font => {},
+        }
+    }
+}
+
+test "mayBeDoubleWidth matches isSymbol and Nerd Font constraints" {
+    if (std.valgrind.runningOnValgrind() > 0) return error.SkipZigTest;
+
+    const testing = std.testing;
+    const getConstraint = @import("../font/nerd_font_attributes.zig").getConstraint;
+
+    for (0..std.math.maxInt(u21)) |i| {
+        const cp: u21 = @intCast(i);
+        const single_width = if (getConstraint(cp)) |c|
+            c.max_constraint_width == 1
+        else
+            false;
+        try testing.expectEqual(
+            isSymbol(cp) and !single_width,
+            mayBeDoubleWidth(cp),
+        );
+    }
+}
+
 test "Cell constraint widths" {
     const testing = std.testing;
     const alloc = testing.allocator;
@@ -534,6 +582,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
 
@@ -546,6 +595,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
 
@@ -558,6 +608,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
     // symbol->no-break space: 1
@@ -569,6 +620,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
 
@@ -581,6 +633,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             3,
             state.cols,
+            null,
         ));
     }
 
@@ -593,6 +646,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             1,
             state.cols,
+            null,
         ));
     }
 
@@ -605,11 +659,13 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
         try testing.expectEqual(1, constraintWidth(
             state.row_data.get(0).cells.items(.raw),
             1,
             state.cols,
+            null,
         ));
     }
 
@@ -622,11 +678,13 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
         try testing.expectEqual(2, constraintWidth(
             state.row_data.get(0).cells.items(.raw),
             2,
             state.cols,
+            null,
         ));
     }
 
@@ -639,6 +697,7 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
 
@@ -651,30 +710,84 @@ test "Cell constraint widths" {
             state.row_data.get(0).cells.items(.raw),
             1,
             state.cols,
+            null,
         ));
     }
 
-    // powerline->nothing: 2  (dedicated test because powerline is special-cased in cellpkg)
+    // powerline->nothing: 1  (its Nerd Font constraint limits this powerline glyph to one cell)
     {
         t.fullReset();
         try s.nextSlice("");
         try state.update(alloc, &t);
-        try testing.expectEqual(2, constraintWidth(
+        try testing.expectEqual(1, constraintWidth(
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            null,
         ));
     }
 
-    // powerline->space: 2  (dedicated test because powerline is special-cased in cellpkg)
+    // powerline->space: 1  (its Nerd Font constraint limits this powerline glyph to one cell)
     {
         t.fullReset();
         try s.nextSlice(" z");
         try state.update(alloc, &t);
+        try testing.expectEqual(1, constraintWidth(
+            state.row_data.get(0).cells.items(.raw),
+            0,
+            state.cols,
+            null,
+        ));
+    }
+    // runtime constraints replace the built-in classes, so they decide
+    // whether a glyph may span two cells even if it's not a symbol
+    {
+        const double: font.face.RenderOptions.Constraint = .{
+            .size = .fit,
+            .max_constraint_width = 2,
+        };
+        const single: font.face.RenderOptions.Constraint = .{
+            .size = .fit,
+            .max_constraint_width = 1,
+        };
+
+        // character->space: 1 without, 2 with a constraint allowing it
+        t.fullReset();
+        try s.nextSlice("z z");
+        try state.update(alloc, &t);
+        try testing.expectEqual(1, constraintWidth(
+            state.row_data.get(0).cells.items(.raw),
+            0,
+            state.cols,
+            null,
+        ));
         try testing.expectEqual(2, constraintWidth(
             state.row_data.get(0).cells.items(.raw),
             0,
             state.cols,
+            double,
+        ));
+
+        // powerline->nothing: 2 with a constraint allowing it
+        t.fullReset();
+        try s.nextSlice("");
+        try state.update(alloc, &t);
+        try testing.expectEqual(2, constraintWidth(
+            state.row_data.get(0).cells.items(.raw),
+            0,
+            state.cols,
+            double,
+        ));
+
+        // symbol->nothing: 1 with a constraint limiting it
+        t.fullReset();
+        try s.nextSlice("");
+        try state.update(alloc, &t);
+        try testing.expectEqual(1, constraintWidth(
+            state.row_data.get(0).cells.items(.raw),
+            0,
+            state.cols,
+            single,
         ));
     }
 }
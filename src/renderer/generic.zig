@@ -27,7 +27,7 @@ const ArenaAllocator = std.heap.ArenaAllocator;
 const Terminal = terminal.Terminal;
 const Health = renderer.Health;
 
-const getConstraint = @import("../font/nerd_font_attributes.zig").getConstraint;
+const getSymbolClass = @import("../font/nerd_font_attributes.zig").getSymbolClass;
 
 const FileType = @import("../file_type.zig").FileType;
 
@@ -3136,14 +3136,14 @@ pub fn Renderer(comptime GraphicsAPI: type) type {
                     // If there's no Nerd Font constraint for this codepoint
                     // then, if it's a symbol, we constrain it to fit inside
                     // its cell(s), we don't modify the alignment at all.
-                    .constraint = getConstraint(cp) orelse
-                        if (cellpkg.isSymbol(cp)) .{
-                            .size = .fit,
-                        } else .none,
+                    // This is a single lookup covering both cases.
+                    .constraint = getSymbolClass(cp).constraint(),
+                    // No symbol constraints are loaded at runtime yet.
                     .constraint_width = constraintWidth(
                         cell_raws,
                         x,
                         cols,
+                        null,
                     ),
                 },
             );